@@ -190,13 +190,34 @@ class CommandHandler:
             input_directory=args.input_dir,
             model=args.model,
             engine=args.engine,
-            speaker_preset=args.speaker_preset
+            speaker_preset=args.speaker_preset,
+            reprocess=getattr(args, 'reprocess', False)
         )
         
         # Print results
         self.ui.print_processing_result(result, "batch")
         
         return ExitCodes.SUCCESS if result['success'] else ExitCodes.ERROR
+    
+    def handle_autotune(self, args) -> int:
+        """Handle autotune command"""
+        from src.core.logic.autotuner import run_autotune
+        
+        result = run_autotune(
+            self.app.config_manager,
+            audio_path=args.audio,
+            model_name=args.model,
+            worker_counts=args.workers,
+            beam_sizes=args.beam_sizes,
+            max_rss_mb=args.max_rss_mb,
+            output_dir=args.output_dir,
+            write_profile=not args.dry_run
+        )
+        
+        # Print results
+        self.ui.print_autotune_result(result)
+        
+        return ExitCodes.SUCCESS if result['success'] else ExitCodes.ERROR
 
 
 class ApplicationOrchestrator:
@@ -222,7 +243,8 @@ class ApplicationOrchestrator:
             else:
                 environment = Environment.BASE
             
-            self.config_manager = ConfigManager(config_dir, environment)
+            # The host profile is layered under a configuration file the user chose
+            self.config_manager = ConfigManager(config_dir, environment, explicit_config=True)
         else:
             # Use default config directory
             self.config_manager = ConfigManager()
@@ -269,6 +291,10 @@ class ApplicationOrchestrator:
                 raise RuntimeError("Application not initialized")
             
             with self.app:
+                # Start model warm-up first so it overlaps with cleanup and input validation
+                if args.command in ('single', 'batch'):
+                    self.app.start_model_warmup(getattr(args, 'model', None), batch=args.command == 'batch')
+                
                 # Print banner
                 if self.ui:
                     self.ui.print_banner()
@@ -304,6 +330,9 @@ class ApplicationOrchestrator:
                 elif args.command == 'batch':
                     return self._handle_batch(args)
                 
+                elif args.command == 'autotune':
+                    return self._handle_autotune(args)
+                
                 # If we get here, command was not recognized
                 if self.ui:
                     self.ui.print_error_message(f"Unknown command: {args.command}")
@@ -339,6 +368,11 @@ class ApplicationOrchestrator:
         """Handle batch command with null check"""
         return self.command_handler.handle_batch(args)  # type: ignore
     
+    @require_component('command_handler')
+    def _handle_autotune(self, args) -> int:
+        """Handle autotune command with null check"""
+        return self.command_handler.handle_autotune(args)  # type: ignore
+    
     def _handle_interrupt(self) -> int:
         """Handle keyboard interrupt with proper UI"""
         logger = logging.getLogger(__name__)
@@ -6,84 +6,62 @@ This will cache the CTranslate2 optimized model locally for faster subsequent us
 
 import os
 import sys
+import argparse
 import logging
 from pathlib import Path
-import tempfile
-import shutil
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from definition import MODELS_DIR
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def download_ct2_model():
-    """Download and cache the ivrit-ai/whisper-large-v3-ct2 model"""
+MODEL_NAME = "ivrit-ai/whisper-large-v3-ct2"
+
+def download_ct2_model(models_dir: str = MODELS_DIR, manifest_path: str = None, revision: str = "main",
+                       workers: int = 8, force: bool = False):
+    """Download the ivrit-ai/whisper-large-v3-ct2 model into the models directory
     
-    model_name = "ivrit-ai/whisper-large-v3-ct2"
+    Files are fetched as parallel range segments, resumed after interruption,
+    verified against the manifest's SHA256 checksums and installed atomically
+    at models/ivrit-ai/whisper-large-v3-ct2, where ModelManager looks for them.
+    """
+    from src.utils.model_downloader import ModelDownloadError, ModelDownloadManager, ModelManifest
     
     try:
-        logger.info(f"🔄 Starting download of {model_name}...")
+        logger.info(f"🔄 Starting download of {MODEL_NAME}...")
         logger.info("This may take several minutes depending on your internet connection.")
         
-        # Import required libraries
-        try:
-            import ctranslate2
-            import faster_whisper
-            from huggingface_hub import snapshot_download
-            logger.info("✅ Required libraries loaded successfully!")
-        except ImportError as e:
-            logger.error(f"❌ Missing required library: {e}")
-            logger.error("Please install with: pip install ctranslate2 faster-whisper")
-            return False
+        if manifest_path:
+            manifest = ModelManifest.from_file(manifest_path)
+            logger.info(f"📋 Using manifest: {manifest_path}")
+        else:
+            manifest = ModelManifest.from_huggingface(MODEL_NAME, revision=revision)
+            logger.info(f"📋 Built manifest from Hugging Face ({len(manifest.files)} files, revision {revision})")
         
-        # Create cache directory
-        cache_dir = Path.home() / ".cache" / "huggingface" / "hub"
-        cache_dir.mkdir(parents=True, exist_ok=True)
+        headers = {}
+        token = os.environ.get('HF_TOKEN')
+        if token:
+            headers['Authorization'] = f'Bearer {token}'
         
-        # Download the model using huggingface_hub
-        logger.info("📥 Downloading CTranslate2 model from Hugging Face...")
-        try:
-            model_path = snapshot_download(
-                repo_id=model_name,
-                cache_dir=cache_dir,
-                local_files_only=False,
-                resume_download=True
-            )
-            logger.info(f"✅ Model downloaded to: {model_path}")
-        except Exception as e:
-            logger.error(f"❌ Error downloading from Hugging Face: {e}")
-            logger.info("🔄 Trying alternative download method...")
-            
-            # Alternative: Use faster-whisper to download
-            try:
-                from faster_whisper import WhisperModel
-                logger.info("📥 Downloading using faster-whisper...")
-                model = WhisperModel(model_name, device="cpu")
-                logger.info("✅ Model downloaded successfully with faster-whisper!")
-                model_path = model.model_path
-            except Exception as e2:
-                logger.error(f"❌ Alternative download failed: {e2}")
-                return False
+        manager = ModelDownloadManager(models_dir, max_workers=workers, headers=headers)
+        model_path = manager.download(manifest, force=force)
+        logger.info(f"✅ Model installed at: {model_path}")
         
         # Test the model
-        logger.info("🧪 Testing CTranslate2 model functionality...")
-        
         try:
-            # Test with faster-whisper (which uses CTranslate2 backend)
-            from faster_whisper import WhisperModel
-            test_model = WhisperModel(model_name, device="cpu")
-            
-            # Get model info
-            logger.info(f"📊 Model: {model_name}")
-            logger.info(f"📁 Model path: {model_path}")
+            import ctranslate2
+            logger.info("🧪 Testing CTranslate2 model functionality...")
+            test_model = ctranslate2.models.Whisper(str(model_path), device="cpu", compute_type="int8")
+            logger.info(f"📊 Model: {MODEL_NAME}")
             logger.info(f"🔧 Backend: CTranslate2")
-            logger.info(f"💻 Device: CPU")
-            
-            # Test basic functionality (without actual audio)
             logger.info("🧪 Model loaded successfully and ready for transcription!")
-            
-            # Clean up test model
             del test_model
-            
+        except ImportError:
+            logger.info("ℹ️ ctranslate2 not installed - skipping model load test")
         except Exception as e:
             logger.warning(f"⚠️ Model test warning: {e}")
             logger.info("Model downloaded but test failed - this might be normal")
@@ -92,6 +70,10 @@ def download_ct2_model():
         
         return True
         
+    except ModelDownloadError as e:
+        logger.error(f"❌ Download failed: {e}")
+        logger.info("🔁 Re-run the script to resume from the segments already downloaded")
+        return False
     except Exception as e:
         logger.error(f"❌ Error downloading CTranslate2 model: {e}")
         return False
@@ -101,9 +83,7 @@ def verify_dependencies():
     logger.info("🔍 Verifying dependencies...")
     
     required_packages = [
-        ("ctranslate2", "CTranslate2 optimization library"),
-        ("faster_whisper", "Faster Whisper with CTranslate2 backend"),
-        ("huggingface_hub", "Hugging Face model hub client"),
+        ("requests", "HTTP client for model downloads"),
     ]
     
     missing_packages = []
@@ -125,8 +105,19 @@ def verify_dependencies():
     logger.info("✅ All dependencies verified!")
     return True
 
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description=f"Download {MODEL_NAME}")
+    parser.add_argument('--models-dir', default=MODELS_DIR, help='Directory to install the model into')
+    parser.add_argument('--manifest', help='JSON manifest of files, URLs and SHA256 checksums')
+    parser.add_argument('--revision', default='main', help='Hugging Face revision to download')
+    parser.add_argument('--workers', type=int, default=8, help='Parallel download segments')
+    parser.add_argument('--force', action='store_true', help='Reinstall even if the model exists')
+    return parser.parse_args()
+
 def main():
     """Main function"""
+    args = parse_args()
     print("🎤 Ivrit CTranslate2 Model Downloader")
     print("=" * 60)
     print("Model: ivrit-ai/whisper-large-v3-ct2")
@@ -139,7 +130,7 @@ def main():
         sys.exit(1)
     
     # Download the model
-    success = download_ct2_model()
+    success = download_ct2_model(args.models_dir, args.manifest, args.revision, args.workers, args.force)
     
     if success:
         print("\n✅ Download completed successfully!")
@@ -157,7 +148,7 @@ def main():
         print("\n🔧 Troubleshooting:")
         print("  1. Check your internet connection")
         print("  2. Verify you have enough disk space")
-        print("  3. Install missing dependencies: pip install ctranslate2 faster-whisper")
+        print("  3. Re-run the script - completed segments are kept and the download resumes")
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -12,6 +12,7 @@ from typing import Dict, Optional, Any
 
 from src.core.logic.error_handler import ErrorHandler
 from src.core.logic.performance_tracker import PerformanceTracker
+from src.core.logic.thread_budget import configure_thread_budget
 
 from src.core.orchestrator.transcription_service import TranscriptionService
 from src.core.processors.input_processor import InputProcessor
@@ -26,6 +27,7 @@ from src.core.factories.pipeline_factory import PipelineFactory
 from src.core.factories.output_strategy_factory import OutputStrategyFactory
 from src.output_data.utils.data_utils import DataUtils
 from src.core.engines.utilities.cleanup_manager import CleanupManager
+from src.utils.lazy_provider import LazyProvider
 import traceback
 
 # Import definition paths
@@ -62,6 +64,9 @@ class TranscriptionApplication:
         # Ensure configuration sections are initialized
         self._ensure_config_initialized()
         
+        # Split the cores between workers, CTranslate2 and BLAS/OpenMP before any of them start
+        self.thread_layout = configure_thread_budget(self.config_manager)
+        
         # Generate session ID
         self.current_session_id = self._generate_session_id()
         
@@ -85,9 +90,16 @@ class TranscriptionApplication:
         # Initialize specialized processors with ConfigManager injection
         self.input_processor = InputProcessor(self.config_manager, self.output_manager)
         self.output_processor = OutputProcessor(self.config_manager, self.output_manager)
-        self.transcription_service = TranscriptionService(
-            self.config_manager, 
-            self.output_manager
+        # The transcription orchestrator (engine, services, model code) is built on first use,
+        # so status, consolidation and export commands never construct it
+        self._transcription_service_provider = LazyProvider(
+            lambda: TranscriptionService(self.config_manager, self.output_manager),
+            name="transcription orchestrator"
+        )
+        self._pipeline_providers: Dict[str, LazyProvider] = {}
+        # Pipelines transcribe with the application's orchestrator, so a warmed-up engine is the one used
+        self._pipeline_orchestrator_provider = LazyProvider(
+            lambda: self.transcription_service, name="transcription orchestrator"
         )
         
         # Initialize services
@@ -109,6 +121,61 @@ class TranscriptionApplication:
         # Verify config manager injection throughout the application
         self._verify_config_injection()
     
+    @property
+    def transcription_service(self) -> TranscriptionService:
+        """Transcription orchestrator, created on first use"""
+        return self._transcription_service_provider.get()
+    
+    @transcription_service.setter
+    def transcription_service(self, service: TranscriptionService) -> None:
+        self._transcription_service_provider = LazyProvider.of(service, name="transcription orchestrator")
+    
+    def start_model_warmup(self, model_name: Optional[str] = None, batch: bool = False) -> bool:
+        """
+        Start loading and warming up the transcription model in the background
+        
+        Opt-in via system.model_warmup. Call it as early as possible for commands that
+        transcribe, so model load overlaps with input discovery and validation.
+        The model is warmed in this process's engine, which the single-file path and
+        the in-process batch pipeline share; batches run in worker processes load
+        their own models, so nothing is warmed for them.
+        
+        Args:
+            model_name: Model to warm up (defaults to transcription.default_model)
+            batch: Whether the warm-up is for a batch pipeline run
+            
+        Returns:
+            True if a warm-up was started
+        """
+        system_config = getattr(self.config_manager.config, 'system', None)
+        if not getattr(system_config, 'model_warmup', False):
+            return False
+        
+        if batch and self._get_pipeline("batch_processing").uses_worker_processes():
+            logger.info("ℹ️ Batch files are transcribed in worker processes, skipping model warm-up")
+            return False
+        
+        transcription_config = getattr(self.config_manager.config, 'transcription', None)
+        model_name = model_name or getattr(transcription_config, 'default_model', None)
+        if not model_name:
+            logger.warning("⚠️ Model warm-up enabled but no model configured, skipping")
+            return False
+        
+        try:
+            self.transcription_service.transcription_engine.start_warmup(model_name)
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ Could not start model warm-up: {e}")
+            return False
+    
+    def _get_pipeline(self, operation_type: str):
+        """Get the shared pipeline for an operation type, creating it on first use"""
+        if operation_type not in self._pipeline_providers:
+            self._pipeline_providers[operation_type] = PipelineFactory.create_pipeline_provider(
+                operation_type, self.config_manager, self.output_manager, self._pipeline_orchestrator_provider
+            )
+        return self._pipeline_providers[operation_type].get()
+    
     def _ensure_config_initialized(self):
         """Ensure all required configuration sections are initialized"""
         # Initialize output configuration if not present
@@ -367,60 +434,23 @@ class TranscriptionApplication:
         start_time = time.time()
         
         try:
+            # Without --input-dir the configured input directory is the batch
+            if not input_directory:
+                input_config = getattr(self.config_manager.config, 'input', None)
+                input_directory = getattr(input_config, 'directory', None) or None
+            
             # Create processing context
             context = ProcessingContext(
                 session_id=self.current_session_id,
                 operation_type="batch_processing",
                 parameters={
-                    # For unit tests, if no input_directory is provided, use InputProcessor discovery
                     'input_directory': input_directory,
                     **kwargs
                 }
             )
             
-            # Create batch pipeline
-            pipeline = PipelineFactory.create_pipeline_from_operation(
-                "batch_processing",
-                self.config_manager,
-                self.output_manager
-            )
-            
-            # If tests expect using InputProcessor discovery when no input_directory provided
-            if not input_directory:
-                files = self.input_processor.discover_files(self.config_manager.config.input.directory if self.config_manager.config and self.config_manager.config.input else '')
-                if not files:
-                    return {'success': False, 'error': 'No audio files found'}
-                # Process each file as tests expect
-                total_files = len(files)
-                successful = 0
-                results = []
-                for f in files:
-                    input_result = self.input_processor.process_input(f)
-                    if not input_result.get('success'):
-                        continue
-                    transcribe_result = self.transcription_service.transcribe(
-                        {'file_path': f},
-                        model=self.config_manager.config.transcription.default_model if self.config_manager.config and self.config_manager.config.transcription else None,
-                        engine=self.config_manager.config.transcription.default_engine if self.config_manager.config and self.config_manager.config.transcription else None
-                    )
-                    if not transcribe_result.get('success'):
-                        continue
-                    output_result = self.output_processor.process_output(
-                        input_metadata=input_result,
-                        transcription_result=transcribe_result
-                    )
-                    if output_result.get('success'):
-                        successful += 1
-                        results.append(output_result)
-                return {
-                    'success': successful == total_files,
-                    'total_files': total_files,
-                    'successful_files': successful,
-                    'failed_files': total_files - successful,
-                    'results': results
-                }
-            # Otherwise, process via pipeline
-            result = pipeline.process(context)
+            # Process via the batch pipeline
+            result = self._get_pipeline("batch_processing").process(context)
             
             # Track performance
             processing_time = time.time() - start_time
@@ -584,8 +614,10 @@ class TranscriptionApplication:
             'error_handler_ready': self.error_handler is not None,
             'input_processor_ready': self.input_processor is not None,
             'output_processor_ready': self.output_processor is not None,
-            'transcription_orchestrator_ready': self.transcription_service is not None,
+            'transcription_orchestrator_ready': self._transcription_service_provider is not None,
+            'transcription_orchestrator_initialized': self._transcription_service_provider.is_initialized,
             'audio_client_ready': getattr(self, '_audio_client', None) is not None,
+            'thread_layout': self.thread_layout.to_dict(),
             'timestamp': datetime.now().isoformat()
         }
         
@@ -651,7 +683,7 @@ class TranscriptionApplication:
         components = [
             ('input_processor', self.input_processor),
             ('output_processor', self.output_processor),
-            ('transcription_service', self.transcription_service),
+            ('transcription_service', self._transcription_service_provider.peek()),
             ('error_handler', self.error_handler),
             ('performance_tracker', self.performance_tracker),
             ('logging_service', self.logging_service),
@@ -659,6 +691,9 @@ class TranscriptionApplication:
         ]
         
         for name, component in components:
+            if component is None:
+                # Lazily built components are verified by construction when first used
+                continue
             if hasattr(component, 'config_manager'):
                 if component.config_manager is not self.config_manager:
                     raise ValueError(f"Component {name} must use the same config manager instance")
@@ -8,12 +8,14 @@ import logging
 import os
 import tempfile
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from src.core.engines.utilities.model_manager import ModelManager
 from src.core.engines.utilities.cleanup_manager import CleanupManager
+from src.core.engines.utilities.model_warmup import ModelWarmup
 from src.core.interfaces.transcription_engine_interface import ITranscriptionEngine
 from src.core.engines.base_interface import TranscriptionEngine
 from src.core.engines.strategies.transcription_strategy_factory import TranscriptionStrategyFactory
+from src.core.logic.memory_governor import MemoryGovernor
 from src.models import (
     TranscriptionResult, 
     TranscriptionSegment, 
@@ -66,6 +68,12 @@ class ConsolidatedTranscriptionEngine(ITranscriptionEngine, TranscriptionEngine)
         # Initialize cleanup manager
         self._cleanup_manager = CleanupManager(config_manager=config_manager)
         
+        # Optional background warm-up of the first model
+        self._warmup: Optional[ModelWarmup] = None
+        
+        # Model of the transcription in progress, kept when caches shrink
+        self._active_model_name: Optional[str] = None
+        
         logger.info("🚀 Refactored Consolidated Transcription Engine initialized")
         logger.info("✅ Using existing services without code duplication")
     
@@ -91,7 +99,11 @@ class ConsolidatedTranscriptionEngine(ITranscriptionEngine, TranscriptionEngine)
     def _init_transcription_strategies(self) -> None:
         """Initialize transcription strategies using existing factory"""
         try:
-            self._strategy_factory = TranscriptionStrategyFactory(self.config_manager)
+            # One governor for every file this engine transcribes; it evicts models other than the active one
+            self.memory_governor = MemoryGovernor(self.config_manager)
+            self.memory_governor.register_cache_shrinker(self._shrink_model_cache)
+            self._strategy_factory = TranscriptionStrategyFactory(self.config_manager,
+                                                                  memory_governor=self.memory_governor)
             logger.info("🔧 Transcription strategies initialized using existing factory")
         except Exception as e:
             logger.error(f"❌ Error initializing transcription strategies: {e}")
@@ -114,6 +126,7 @@ class ConsolidatedTranscriptionEngine(ITranscriptionEngine, TranscriptionEngine)
                 return self._create_error_result(audio_file_path, model_name, "Audio file not found")
             
             # Use existing transcription strategy factory
+            self._active_model_name = model_name
             strategy = self._strategy_factory.create_strategy(audio_file_path)
             transcription_result = strategy.execute(audio_file_path, model_name, self)
             
@@ -142,6 +155,11 @@ class ConsolidatedTranscriptionEngine(ITranscriptionEngine, TranscriptionEngine)
             logger.error(error_msg)
             raise RuntimeError(error_msg)
     
+    def _shrink_model_cache(self) -> None:
+        """Release cached models other than the one in use (hard memory pressure)"""
+        if hasattr(self.model_manager, 'evict_models'):
+            self.model_manager.evict_models(keep=self._active_model_name)
+    
     def _apply_speaker_diarization(self, audio_file_path: str, transcription_result) -> 'TranscriptionResult':
         """Apply speaker diarization using existing services"""
         # For now, use basic enhancement since the orchestrator requires a speaker service
@@ -195,6 +213,9 @@ class ConsolidatedTranscriptionEngine(ITranscriptionEngine, TranscriptionEngine)
         logger.info(f"🔍 Transcribing chunk {chunk_count}")
         
         try:
+            # Let a background warm-up of this model finish instead of loading it again
+            self._wait_for_warmup(model_name)
+            
             # Use existing model manager
             processor, model = self.model_manager.get_or_load_model(model_name)
             language = self._get_language_config()
@@ -265,6 +286,93 @@ class ConsolidatedTranscriptionEngine(ITranscriptionEngine, TranscriptionEngine)
                 speaker_count=0
             )
     
+    def transcribe_windows(self, windows: List[Any], model_name: str) -> List[str]:
+        """
+        Transcribe several audio windows with one batched generate call
+
+        The windows may come from different files; each gets its own prompt
+        and its own decoded text.
+
+        Args:
+            windows: 16 kHz mono float32 waveforms of at most 30 seconds
+            model_name: Model to transcribe with
+
+        Returns:
+            Filtered text of each window, in input order
+        """
+        import ctranslate2
+        import numpy as np
+
+        if not windows:
+            return []
+
+        self._wait_for_warmup(model_name)
+        processor, model = self.model_manager.get_or_load_model(model_name)
+        language = self._get_language_config()
+
+        features = processor(list(windows), sampling_rate=16000, return_tensors="np").input_features
+        features = ctranslate2.StorageView.from_array(np.ascontiguousarray(features, dtype=np.float32))
+        prompts = self._get_hebrew_ct2_prompts(processor, language)
+        generation_params = self._build_ct2_generation_params(self._get_ct2_config(), language)
+
+        generation_results = model.generate(features, prompts=prompts * len(windows), **generation_params)
+
+        texts = []
+        for generation_result in generation_results:
+            try:
+                raw_text = self._decode_ct2_result([generation_result], processor)
+            except Exception as e:
+                # Silence decodes to no tokens, which is not an error for a single window
+                logger.debug(f"⚠️ Window produced no text: {e}")
+                raw_text = ""
+            texts.append(self.text_processor.filter_language_only(raw_text, language) if raw_text else raw_text)
+        logger.info(f"✅ Transcribed {len(windows)} windows in one batch")
+        return texts
+
+    def start_warmup(self, model_name: str) -> ModelWarmup:
+        """
+        Load and warm up a model in a background thread
+        
+        Args:
+            model_name: Model to warm up
+            
+        Returns:
+            ModelWarmup whose future completes when the model is ready
+        """
+        if self._warmup is None or self._warmup.model_name != model_name:
+            self._warmup = ModelWarmup(model_name, self.warm_up)
+            self._warmup.start()
+        return self._warmup
+    
+    def warm_up(self, model_name: str) -> float:
+        """
+        Load a model and run a tiny synthetic decode to fault in weights
+        
+        Args:
+            model_name: Model to warm up
+            
+        Returns:
+            Time spent on the synthetic decode in seconds
+        """
+        import numpy as np
+        
+        processor, model = self.model_manager.get_or_load_model(model_name)
+        started = time.time()
+        
+        # One second of silence exercises feature extraction, the encoder and a few decoder steps
+        silence = np.zeros(16000, dtype=np.float32)
+        features = self._prepare_ct2_features(processor, silence)
+        prompts = self._get_hebrew_ct2_prompts(processor, self._get_language_config())
+        max_length = (len(prompts[0]) if prompts else 0) + 4
+        model.generate(features, prompts=prompts, beam_size=1, max_length=max_length)
+        return time.time() - started
+    
+    def _wait_for_warmup(self, model_name: str) -> None:
+        """Wait for a pending warm-up of the requested model"""
+        warmup = self._warmup
+        if warmup is not None and warmup.model_name == model_name and not warmup.future.done():
+            warmup.wait()
+    
     def _execute_transcription(self, audio_chunk, processor, model, language: str) -> str:
         """Execute transcription using CTranslate2 only"""
         logger.info(f"🔍 Model type detection: {type(model)}")
@@ -308,33 +416,7 @@ class ConsolidatedTranscriptionEngine(ITranscriptionEngine, TranscriptionEngine)
         # generate(features, prompts, *, suppress_tokens, beam_size, max_length, etc.)
         logger.info(f"🔍 Calling CTranslate2 generate with: features={type(features)}, prompts={hebrew_prompts}")
         
-        # Build generation parameters with correct CTranslate2 parameter names
-        generation_params = {
-            'beam_size': config['beam_size'],
-            'max_length': config['max_length'],
-            'sampling_temperature': config['temperature'] if config['temperature'] > 0 else 1.0
-        }
-        
-        # Add optional parameters if they exist in config
-        if 'no_speech_threshold' in config:
-            generation_params['no_speech_threshold'] = config['no_speech_threshold']
-        if 'log_prob_threshold' in config:
-            generation_params['log_prob_threshold'] = config['log_prob_threshold']
-        if 'compression_ratio_threshold' in config:
-            generation_params['compression_ratio_threshold'] = config['compression_ratio_threshold']
-        if 'condition_on_previous_text' in config:
-            generation_params['condition_on_previous_text'] = config['condition_on_previous_text']
-        
-        # Add suppress tokens to help avoid junk tokens like <|jw|>
-        suppress_tokens = []
-        if self.text_processor:
-            suppress_tokens.extend(self.text_processor.get_language_suppression_tokens(language))
-        
-        # Add specific problematic tokens to suppress
-        # Token 50356 is the <|jw|> token we saw in the debug output
-        suppress_tokens.extend([50356])  # Suppress <|jw|> token specifically
-        
-        generation_params['suppress_tokens'] = suppress_tokens
+        generation_params = self._build_ct2_generation_params(config, language)
         
         logger.info(f"🔍 GENERATION DEBUG: Parameters: {generation_params}")
         
@@ -375,6 +457,38 @@ class ConsolidatedTranscriptionEngine(ITranscriptionEngine, TranscriptionEngine)
             raise
     
     
+    def _build_ct2_generation_params(self, config: Dict[str, Any], language: str) -> Dict[str, Any]:
+        """Build CTranslate2 generate() parameters from the CTranslate2 configuration"""
+        # Build generation parameters with correct CTranslate2 parameter names
+        generation_params = {
+            'beam_size': config['beam_size'],
+            'max_length': config['max_length'],
+            'sampling_temperature': config['temperature'] if config['temperature'] > 0 else 1.0
+        }
+        
+        # Add optional parameters if they exist in config
+        if 'no_speech_threshold' in config:
+            generation_params['no_speech_threshold'] = config['no_speech_threshold']
+        if 'log_prob_threshold' in config:
+            generation_params['log_prob_threshold'] = config['log_prob_threshold']
+        if 'compression_ratio_threshold' in config:
+            generation_params['compression_ratio_threshold'] = config['compression_ratio_threshold']
+        if 'condition_on_previous_text' in config:
+            generation_params['condition_on_previous_text'] = config['condition_on_previous_text']
+        
+        # Add suppress tokens to help avoid junk tokens like <|jw|>
+        suppress_tokens = []
+        if self.text_processor:
+            suppress_tokens.extend(self.text_processor.get_language_suppression_tokens(language))
+        
+        # Add specific problematic tokens to suppress
+        # Token 50356 is the <|jw|> token we saw in the debug output
+        suppress_tokens.extend([50356])  # Suppress <|jw|> token specifically
+        
+        generation_params['suppress_tokens'] = suppress_tokens
+        
+        return generation_params
+    
     def _prepare_ct2_features(self, processor, audio_chunk):
         """Prepare audio features for CTranslate2 using proper WhisperProcessor"""
         import ctranslate2
@@ -683,7 +797,8 @@ class ConsolidatedTranscriptionEngine(ITranscriptionEngine, TranscriptionEngine)
             return False
     
     def cleanup_models(self) -> None:
-        """Clean up loaded models and free memory"""
+        """Clean up loaded models, chunk worker processes and free memory"""
+        self._strategy_factory.shutdown()
         self.model_manager.cleanup_models()
     
     def get_engine_info(self) -> Dict[str, Any]:
@@ -5,6 +5,7 @@ Follows SOLID principles with dependency injection
 """
 
 import logging
+import threading
 import time
 from typing import TYPE_CHECKING, List, Optional, Dict, Any
 import os # Added for os.path.join
@@ -13,6 +14,10 @@ import time # Added for timestamp handling
 
 from src.core.engines.strategies.base_strategy import BaseTranscriptionStrategy
 from src.models.speaker_models import TranscriptionResult, TranscriptionSegment
+from src.logging.progress_events import ProgressEvent, ProgressEventType, get_progress_event_bus
+from src.core.services.chunk_execution_backends import chunk_result_to_dict
+from src.core.logic.memory_governor import MemoryGovernor
+from src.core.logic.audio_probe import get_audio_probe
 
 if TYPE_CHECKING:
     from src.core.engines.base_interface import TranscriptionEngine
@@ -23,8 +28,16 @@ logger = logging.getLogger(__name__)
 class ChunkedTranscriptionStrategy(BaseTranscriptionStrategy):
     """Strategy for chunked transcription of large files using overlapping chunks"""
     
-    def __init__(self, config_manager):
-        """Initialize the strategy with ConfigManager dependency injection"""
+    def __init__(self, config_manager, execution_backend=None, memory_governor: Optional[MemoryGovernor] = None):
+        """
+        Initialize the strategy with ConfigManager dependency injection
+        
+        Args:
+            config_manager: Configuration manager
+            execution_backend: Shared chunk execution backend; without one the strategy
+                creates its own and stops it when the file is done
+            memory_governor: Engine-wide memory governor; without one the strategy creates its own
+        """
         super().__init__(config_manager)
         
         # Get chunk duration from ConfigManager
@@ -63,6 +76,20 @@ class ChunkedTranscriptionStrategy(BaseTranscriptionStrategy):
         self.engine = None
         self.transcription_engine = None
         
+        # Progress events are published in-process; monitors subscribe to the bus
+        self.progress_event_bus = get_progress_event_bus()
+        self._current_job_id = None
+        self._current_model_name = None
+        
+        # Memory hygiene is applied only when RSS crosses configured thresholds
+        self.memory_governor = memory_governor
+        if self.memory_governor is None:
+            self.memory_governor = MemoryGovernor(self.config_manager)
+            self.memory_governor.register_cache_shrinker(self._shrink_engine_caches)
+        # Chunks of this file admitted by the governor and not yet finished
+        self._admitted_chunks = 0
+        self._admitted_lock = threading.Lock()
+        
         # Get sample rate from configuration or use None to detect from audio file
         self.sample_rate = self._get_config_value('sample_rate', None)
         
@@ -75,6 +102,9 @@ class ChunkedTranscriptionStrategy(BaseTranscriptionStrategy):
         # Initialize output strategy with dependency injection
         self._initialize_output_strategy()
         
+        # Select thread or process backend for chunk execution
+        self._initialize_execution_backend(execution_backend)
+        
         logger.info(f"✅ ChunkedTranscriptionStrategy initialized successfully")
         logger.info(f"   🎯 Chunk duration: {self.chunk_duration_seconds}s")
         logger.info(f"   🎵 Sample rate: {self.sample_rate}Hz (will be detected from audio file if not specified)")
@@ -118,12 +148,33 @@ class ChunkedTranscriptionStrategy(BaseTranscriptionStrategy):
             # Create output strategy using factory with dependency injection
             self.output_strategy = OutputStrategyFactory.create_merged_output_strategy(self.config_manager)
             
+            # Partial transcript service shares the deduplicator so the prefix matches the final output
+            from ...services.partial_transcript_service import PartialTranscriptService
+            self.partial_transcript_service = PartialTranscriptService(
+                self.config_manager, self.output_strategy.deduplicator
+            )
+            
             logger.info("✅ Output strategy injected successfully with dependency injection")
             
         except Exception as e:
             logger.error(f"❌ Error injecting output strategy: {e}")
             raise RuntimeError(f"Failed to inject output strategy: {e}")
     
+    def _initialize_execution_backend(self, execution_backend=None):
+        """Use the injected chunk execution backend or create one from configuration"""
+        self._owns_execution_backend = execution_backend is None
+        if execution_backend is not None:
+            self.chunk_execution_backend = execution_backend
+            return
+        try:
+            from ...factories.chunk_execution_backend_factory import ChunkExecutionBackendFactory
+            
+            self.chunk_execution_backend = ChunkExecutionBackendFactory.create_backend(self.config_manager)
+            
+        except Exception as e:
+            logger.error(f"❌ Error creating chunk execution backend: {e}")
+            raise RuntimeError(f"Failed to create chunk execution backend: {e}")
+    
     def _print_progress_bar(self, current: int, total: int, prefix: str = "Progress", suffix: str = "", length: int = 50):
         """Print a progress bar to the console"""
         try:
@@ -248,9 +299,24 @@ class ChunkedTranscriptionStrategy(BaseTranscriptionStrategy):
         except Exception:
             return default_value
     
+    def _publish_progress(self, event_type: ProgressEventType, chunk_info: Optional[Dict[str, Any]] = None, **kwargs) -> None:
+        """Publish a progress event for the current job"""
+        if chunk_info is not None:
+            kwargs.setdefault('chunk_number', chunk_info.get('chunk_number'))
+            kwargs.setdefault('start_time', chunk_info.get('start'))
+            kwargs.setdefault('end_time', chunk_info.get('end'))
+        self.progress_event_bus.publish(ProgressEvent(
+            event_type=event_type,
+            job_id=self._current_job_id or "unknown",
+            **kwargs
+        ))
+    
     def execute(self, audio_file_path: str, model_name: str, engine: 'TranscriptionEngine') -> TranscriptionResult:
         """Execute chunked transcription strategy"""
         start_time = time.time()
+        self._current_job_id = audio_file_path
+        self._current_model_name = model_name
+        self.engine = engine
         
         # Clean up any existing chunks before starting using dedicated CleanupService
         try:
@@ -277,99 +343,86 @@ class ChunkedTranscriptionStrategy(BaseTranscriptionStrategy):
             
             # Log chunking strategy header
             self._log_chunk_progress_header(total_chunks, audio_duration)
+            self._publish_progress(ProgressEventType.JOB_STARTED, total_chunks=total_chunks)
+            self.partial_transcript_service.start_job(audio_file_path, total_chunks)
             
             # Initialize progress tracking
             completed_chunks = 0
             failed_chunks = 0
             
-            # Process each chunk using the injected DirectTranscriptionStrategy
+            # Process chunks through the configured execution backend (in-process or worker processes)
             all_segments = []
-            for chunk_index, chunk_info in enumerate(chunks):
-                chunk_num = chunk_info['chunk_number']
-                chunk_start_time_individual = time.time()
-                
-                # Log detailed chunk processing start
-                self._log_chunk_processing_start(chunk_index, total_chunks, chunk_info)
-                
-                # Mark chunk as processing started
-                self._mark_chunk_processing_started(chunk_info)
-                
-                # Process the chunk using the injected DirectTranscriptionStrategy
-                chunk_result = self._process_chunk_with_direct_strategy(
+            chunk_outcomes = self.chunk_execution_backend.execute_chunks(
+                chunks, audio_file_path, model_name,
+                process_chunk=lambda chunk_info: self._process_chunk_with_direct_strategy(
                     chunk_info, model_name, engine, audio_file_path
-                )
-                
-                # Verify chunk result before continuing
-                if chunk_result is None:
-                    failed_chunks += 1
-                    chunk_processing_time = time.time() - chunk_start_time_individual
-                    self._log_chunk_processing_result(chunk_index, total_chunks, chunk_info, chunk_processing_time, False)
-                    self._mark_chunk_failed(chunk_info, "Chunk processing failed due to unknown error.")
-                    logger.error(f"🛑 Breaking chunk processing due to failure in chunk {chunk_num}")
-                    break
-                
-                # Check if chunk has error message
-                if isinstance(chunk_result, dict) and chunk_result.get('error_message'):
-                    failed_chunks += 1
-                    error_msg = chunk_result['error_message']
-                    chunk_processing_time = time.time() - chunk_start_time_individual
-                    self._log_chunk_processing_result(chunk_index, total_chunks, chunk_info, chunk_processing_time, False)
-                    self._mark_chunk_failed(chunk_info, error_msg)
-                    logger.error(f"🛑 Breaking chunk processing due to error in chunk {chunk_num}")
-                    break
-                
-                # Check if chunk result indicates failure
-                if isinstance(chunk_result, dict) and chunk_result.get('status') == 'error':
-                    failed_chunks += 1
-                    error_msg = chunk_result.get('error_message', 'Unknown error')
-                    chunk_processing_time = time.time() - chunk_start_time_individual
-                    self._log_chunk_processing_result(chunk_index, total_chunks, chunk_info, chunk_processing_time, False)
-                    self._mark_chunk_failed(chunk_info, error_msg)
-                    logger.error(f"🛑 Breaking chunk processing due to error status in chunk {chunk_num}")
-                    break
-                
-                # Check JSON file for errors as additional verification
-                if self.chunk_processing_service.check_chunk_errors(chunk_info):
-                    failed_chunks += 1
-                    chunk_processing_time = time.time() - chunk_start_time_individual
-                    self._log_chunk_processing_result(chunk_index, total_chunks, chunk_info, chunk_processing_time, False)
-                    self._mark_chunk_failed(chunk_info, "Chunk processing failed due to JSON error.")
-                    logger.error(f"🛑 Breaking chunk processing due to JSON error in chunk {chunk_num}")
-                    break
-                
-                # Update progress after processing
-                chunk_processing_time = time.time() - chunk_start_time_individual
-                
-                # Process chunk result
-                if isinstance(chunk_result, dict) and 'segments' in chunk_result:
-                    completed_chunks += 1
-                    segments = chunk_result['segments']
-                    all_segments.extend(segments)
-                    text_content = " ".join([seg.get('text', '') for seg in segments if seg.get('text')])
-                    self._log_chunk_processing_result(chunk_index, total_chunks, chunk_info, chunk_processing_time, True, len(text_content))
-                    self._mark_chunk_completed(chunk_info, text_content)
-                else:
-                    failed_chunks += 1
-                    self._log_chunk_processing_result(chunk_index, total_chunks, chunk_info, chunk_processing_time, False)
-                    self._mark_chunk_failed(chunk_info, "Chunk processing failed due to no segments.")
-                
-                # Log overall progress summary
-                elapsed_time = time.time() - start_time
-                estimated_total_time = (elapsed_time / (chunk_index + 1)) * total_chunks if chunk_index > 0 else 0
-                estimated_remaining = estimated_total_time - elapsed_time
-                self._log_overall_progress(completed_chunks, total_chunks, failed_chunks, elapsed_time, estimated_remaining)
-                
-                # Print progress bar
-                self._print_progress_bar(completed_chunks + failed_chunks, total_chunks, "Chunk Processing", f"{completed_chunks}/{total_chunks}")
+                ),
+                on_chunk_started=lambda chunk_index, chunk_info: self._start_chunk(chunk_index, total_chunks, chunk_info),
+                on_chunk_finished=lambda chunk_index, chunk_info: self._finish_chunk()
+            )
+            try:
+                for chunk_index, chunk_info, chunk_result, chunk_processing_time in chunk_outcomes:
+                    chunk_num = chunk_info['chunk_number']
+                    
+                    # Verify chunk result before continuing
+                    error_msg = self._get_chunk_failure(chunk_info, chunk_result)
+                    if error_msg:
+                        failed_chunks += 1
+                        self._log_chunk_processing_result(chunk_index, total_chunks, chunk_info, chunk_processing_time, False)
+                        self._mark_chunk_failed(chunk_info, error_msg)
+                        logger.error(f"🛑 Breaking chunk processing due to failure in chunk {chunk_num}: {error_msg}")
+                        break
+                    
+                    # Process chunk result
+                    if isinstance(chunk_result, dict) and 'segments' in chunk_result:
+                        completed_chunks += 1
+                        segments = chunk_result['segments']
+                        all_segments.extend(segments)
+                        text_content = " ".join([seg.get('text', '') for seg in segments if seg.get('text')])
+                        self._log_chunk_processing_result(chunk_index, total_chunks, chunk_info, chunk_processing_time, True, len(text_content))
+                        self._mark_chunk_completed(chunk_info, text_content, chunk_processing_time)
+                        
+                        # Extend the deduplicated transcript prefix and periodically publish it
+                        self.partial_transcript_service.add_chunk_result(chunk_index, segments, chunk_info['end'])
+                        self.partial_transcript_service.maybe_flush()
+                    else:
+                        failed_chunks += 1
+                        self._log_chunk_processing_result(chunk_index, total_chunks, chunk_info, chunk_processing_time, False)
+                        self._mark_chunk_failed(chunk_info, "Chunk processing failed due to no segments.")
+                    
+                    # Log overall progress summary
+                    processed_chunks = completed_chunks + failed_chunks
+                    elapsed_time = time.time() - start_time
+                    estimated_total_time = (elapsed_time / processed_chunks) * total_chunks if processed_chunks > 1 else 0
+                    estimated_remaining = estimated_total_time - elapsed_time
+                    self._log_overall_progress(completed_chunks, total_chunks, failed_chunks, elapsed_time, estimated_remaining)
+                    
+                    # Print progress bar
+                    self._print_progress_bar(processed_chunks, total_chunks, "Chunk Processing", f"{completed_chunks}/{total_chunks}")
+            finally:
+                chunk_outcomes.close()
+                self._release_admitted_chunks()
             
             # Log final results
             total_time = time.time() - start_time
+            self.partial_transcript_service.finalize()
             
             if all_segments:
                 self._log_final_summary(total_time, completed_chunks, failed_chunks, len(all_segments), audio_duration)
-                return self._create_final_result(audio_file_path, all_segments, start_time, model_name)
+                logger.info(f"🧠 Memory governor: {self.memory_governor.get_stats()}")
+                self._publish_progress(ProgressEventType.JOB_COMPLETED, total_chunks=total_chunks,
+                                       processing_time=total_time, success=True)
+                # The prefix already holds every completed chunk, deduplicated incrementally
+                deduplicated_segments = None
+                if self.partial_transcript_service.completed_prefix_chunks == completed_chunks:
+                    deduplicated_segments = self.partial_transcript_service.get_segments()
+                return self._create_final_result(audio_file_path, all_segments, start_time, model_name,
+                                                 deduplicated_segments)
             else:
                 self._log_error_summary(total_time, "No segments generated", completed_chunks, failed_chunks)
+                self._publish_progress(ProgressEventType.JOB_COMPLETED, total_chunks=total_chunks,
+                                       processing_time=total_time, success=False,
+                                       error_message="No segments generated")
                 return self._create_error_result(audio_file_path, "No segments generated")
                 
         except Exception as e:
@@ -378,7 +431,60 @@ class ChunkedTranscriptionStrategy(BaseTranscriptionStrategy):
             completed_chunks = getattr(self, 'completed_chunks', 0)
             failed_chunks = getattr(self, 'failed_chunks', 0)
             self._log_error_summary(total_time, str(e), completed_chunks, failed_chunks)
+            self._publish_progress(ProgressEventType.JOB_COMPLETED, processing_time=total_time,
+                                   success=False, error_message=str(e))
             return self._create_error_result(audio_file_path, str(e))
+        finally:
+            # A backend created for this file alone must not leave its workers running
+            if self._owns_execution_backend:
+                self.chunk_execution_backend.shutdown()
+    
+    def _shrink_engine_caches(self) -> None:
+        """Release cached models other than the one in use (hard memory pressure)"""
+        model_manager = getattr(self.engine, 'model_manager', None)
+        if model_manager is not None and hasattr(model_manager, 'evict_models'):
+            model_manager.evict_models(keep=self._current_model_name)
+    
+    def _start_chunk(self, chunk_index: int, total_chunks: int, chunk_info: Dict[str, Any]) -> None:
+        """Admit, log and mark the start of a chunk"""
+        self.memory_governor.wait_for_admission()
+        with self._admitted_lock:
+            self._admitted_chunks += 1
+        self.memory_governor.work_started()
+        self._log_chunk_processing_start(chunk_index, total_chunks, chunk_info)
+        self._mark_chunk_processing_started(chunk_info)
+    
+    def _finish_chunk(self) -> None:
+        """Tell the governor an admitted chunk no longer holds memory"""
+        with self._admitted_lock:
+            if self._admitted_chunks == 0:
+                return
+            self._admitted_chunks -= 1
+        self.memory_governor.work_finished()
+    
+    def _release_admitted_chunks(self) -> None:
+        """Release chunks that were dispatched but cancelled when processing stopped early"""
+        with self._admitted_lock:
+            remaining, self._admitted_chunks = self._admitted_chunks, 0
+        for _ in range(remaining):
+            self.memory_governor.work_finished()
+    
+    def _get_chunk_failure(self, chunk_info: Dict[str, Any], chunk_result: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Return an error message if the chunk result indicates failure"""
+        if chunk_result is None:
+            return "Chunk processing failed due to unknown error."
+        
+        # Check if chunk has error message or error status
+        if isinstance(chunk_result, dict) and chunk_result.get('error_message'):
+            return chunk_result['error_message']
+        if isinstance(chunk_result, dict) and chunk_result.get('status') == 'error':
+            return chunk_result.get('error_message', 'Unknown error')
+        
+        # Check JSON file for errors as additional verification
+        if self.chunk_processing_service.check_chunk_errors(chunk_info):
+            return "Chunk processing failed due to JSON error."
+        
+        return None
     
     def _process_chunk_with_direct_strategy(self, chunk_info: Dict[str, Any], model_name: str, engine, audio_file_path: str) -> Optional[Dict[str, Any]]:
         """Process a single chunk using the injected DirectTranscriptionStrategy"""
@@ -401,52 +507,24 @@ class ChunkedTranscriptionStrategy(BaseTranscriptionStrategy):
                 logger.error(f"❌ Audio chunk file not found: {audio_chunk_path}")
                 return None
             
-            # Clean model memory before processing this chunk (but don't reload the model)
-            if hasattr(engine, 'cleanup_memory_only'):
-                engine.cleanup_memory_only()
-                logger.debug(f"🧹 Model memory cleaned for chunk {chunk_number}")
-            else:
-                # If memory-only cleanup is not available, just log a warning but don't reload the model
-                logger.warning(f"⚠️ Memory-only cleanup not available for chunk {chunk_number} - model will remain loaded")
-            
             # Use the injected DirectTranscriptionStrategy to process this chunk
             # This ensures we get exactly the same transcription logic and results
             logger.info(f"🎯 Processing chunk {chunk_number} with DirectTranscriptionStrategy")
             chunk_result = self.direct_transcription_strategy.execute(audio_chunk_path, model_name, engine)
             
+            # Reclaim memory only if this chunk pushed RSS over a threshold
+            self.memory_governor.check()
+            
             if not chunk_result or not chunk_result.success:
                 logger.warning(f"⚠️ Chunk transcription failed: {chunk_info['filename']}")
                 return None
             
-            # Convert TranscriptionResult to the expected dict format for consistency
-            if hasattr(chunk_result, 'speakers') and chunk_result.speakers:
-                segments = []
-                for speaker_id, speaker_segments in chunk_result.speakers.items():
-                    for segment in speaker_segments:
-                        # Adjust segment timing to match the chunk's position in the full audio
-                        adjusted_start = segment.start + chunk_start
-                        adjusted_end = segment.end + chunk_start
-                        
-                        segments.append({
-                            'start': adjusted_start,
-                            'end': adjusted_end,
-                            'text': segment.text,
-                            'speaker': speaker_id
-                        })
-                
-                # Get the full text from the chunk result
-                full_text = chunk_result.full_text if hasattr(chunk_result, 'full_text') else ' '.join([seg.get('text', '') for seg in segments])
-                
-                logger.info(f"✅ Chunk {chunk_number} processed successfully: {len(segments)} segments, {len(full_text)} characters")
-                
-                return {
-                    'segments': segments,
-                    'success': True,
-                    'text': full_text,
-                    'chunk_number': chunk_number,
-                    'chunk_start': chunk_start,
-                    'chunk_end': chunk_end
-                }
+            # Convert TranscriptionResult to the expected dict format (segments shifted to absolute time)
+            result_dict = chunk_result_to_dict(chunk_result, chunk_info)
+            if result_dict:
+                logger.info(f"✅ Chunk {chunk_number} processed successfully: {len(result_dict['segments'])} segments, "
+                            f"{len(result_dict['text'])} characters")
+                return result_dict
             else:
                 logger.warning(f"⚠️ No segments found in chunk result: {chunk_info['filename']}")
                 return None
@@ -457,21 +535,23 @@ class ChunkedTranscriptionStrategy(BaseTranscriptionStrategy):
     
     def _get_audio_duration(self, audio_file_path: str) -> float:
         """Get audio file duration"""
-        try:
-            import librosa
-            duration = librosa.get_duration(path=audio_file_path)
-            return duration
-        except Exception as e:
-            logger.warning(f"⚠️ Could not get audio duration: {e}")
+        duration = get_audio_probe().get_duration(audio_file_path)
+        if duration is None:
+            logger.warning(f"⚠️ Could not get audio duration: {audio_file_path}")
             return 30.0  # Default fallback
+        return duration
     
-    def _create_final_result(self, audio_file_path: str, segments: List[Dict[str, Any]], start_time: float, model_name: str) -> TranscriptionResult:
+    def _create_final_result(self, audio_file_path: str, segments: List[Dict[str, Any]], start_time: float, model_name: str,
+                             deduplicated_segments: Optional[List[Dict[str, Any]]] = None) -> TranscriptionResult:
         """Create final transcription result using injected output strategy with intelligent deduplication"""
         processing_time = time.time() - start_time
         
-        # Use injected output strategy to create final result
-        full_text = self.output_strategy.create_final_output(segments)
-        deduplicated_segments = self.output_strategy.create_segmented_output(segments)
+        if deduplicated_segments is None:
+            # Use injected output strategy to create final result
+            full_text = self.output_strategy.create_final_output(segments)
+            deduplicated_segments = self.output_strategy.create_segmented_output(segments)
+        else:
+            full_text = " ".join(seg.get('text', '') for seg in deduplicated_segments if seg.get('text')).strip()
         
         logger.info(f"✅ Output strategy processed: {len(segments)} → {len(deduplicated_segments)} segments")
         logger.info(f"✅ Final text created: {len(full_text)} characters")
@@ -567,8 +647,10 @@ class ChunkedTranscriptionStrategy(BaseTranscriptionStrategy):
             f"Transcription started for chunk {chunk_info['chunk_number']}",
             processing_started=time.time()
         )
+        self._publish_progress(ProgressEventType.CHUNK_STARTED, chunk_info)
     
-    def _mark_chunk_completed(self, chunk_info: Dict[str, Any], transcription_text: str) -> None:
+    def _mark_chunk_completed(self, chunk_info: Dict[str, Any], transcription_text: str,
+                              processing_time: Optional[float] = None) -> None:
         """Mark chunk as completed with transcription results"""
         self._update_chunk_json_progress(
             chunk_info, 
@@ -579,6 +661,8 @@ class ChunkedTranscriptionStrategy(BaseTranscriptionStrategy):
             words_estimated=len(transcription_text.split()),
             processing_completed=time.time()
         )
+        self._publish_progress(ProgressEventType.CHUNK_COMPLETED, chunk_info, text=transcription_text,
+                               processing_time=processing_time, success=True)
     
     def _mark_chunk_failed(self, chunk_info: Dict[str, Any], error_message: str) -> None:
         """Mark chunk as failed with error message"""
@@ -589,6 +673,8 @@ class ChunkedTranscriptionStrategy(BaseTranscriptionStrategy):
             error_message=error_message,
             processing_completed=time.time()
         )
+        self._publish_progress(ProgressEventType.CHUNK_FAILED, chunk_info, success=False,
+                               error_message=error_message)
     
     def get_strategy_name(self) -> str:
         """Get the name of this strategy"""
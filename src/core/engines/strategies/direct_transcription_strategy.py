@@ -53,9 +53,10 @@ class DirectTranscriptionStrategy(BaseTranscriptionStrategy):
             raise
     
     def _load_audio(self, audio_file_path: str):
-        """Load audio file"""
-        import librosa
-        return librosa.load(audio_file_path, sr=16000, mono=True)
+        """Load audio file as 16 kHz mono float32 (prefetched by the batch when available)"""
+        from src.core.services.audio_prefetch_service import load_audio_buffer
+        audio_buffer = load_audio_buffer(audio_file_path)
+        return audio_buffer.window(), audio_buffer.sample_rate
     
     def _transcribe_audio(self, audio_data, sample_rate, engine, model_name: str) -> 'TranscriptionResult':
         """Transcribe audio data - now returns TranscriptionResult"""
@@ -5,11 +5,14 @@ Factory for creating transcription strategies
 
 import logging
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from src.core.engines.strategies.base_strategy import BaseTranscriptionStrategy
+from src.core.logic.audio_probe import AudioProbe, get_audio_probe
 
 if TYPE_CHECKING:
+    from src.core.logic.memory_governor import MemoryGovernor
+    from src.core.services.chunk_execution_backends import ChunkExecutionBackend
     from src.core.engines.strategies.direct_transcription_strategy import DirectTranscriptionStrategy
     from src.core.engines.strategies.chunked_transcription_strategy import ChunkedTranscriptionStrategy
     from src.core.engines.strategies.existing_chunks_strategy import ExistingChunksStrategy
@@ -20,19 +23,45 @@ logger = logging.getLogger(__name__)
 class TranscriptionStrategyFactory:
     """Factory for creating appropriate transcription strategies"""
     
-    def __init__(self, config_manager, app_config=None):
+    # Whisper decodes a single 30 second window; longer audio must be chunked
+    DEFAULT_DIRECT_MAX_DURATION_SECONDS = 30.0
+    # Size rule used only when the duration cannot be probed
+    FALLBACK_LARGE_FILE_MB = 100
+    
+    def __init__(self, config_manager, app_config=None, audio_probe: Optional[AudioProbe] = None,
+                 memory_governor: Optional['MemoryGovernor'] = None):
         self.config_manager = config_manager
         self.config = config_manager.config if config_manager else None
         self.app_config = app_config
+        self.audio_probe = audio_probe or get_audio_probe()
+        # Engine-wide governor so admission sees every chunk in flight, not just one file's
+        self.memory_governor = memory_governor
+        # Chunk worker pools outlive single files; created on the first long file
+        self._chunk_execution_backend: Optional['ChunkExecutionBackend'] = None
+    
+    def get_chunk_execution_backend(self) -> 'ChunkExecutionBackend':
+        """Get the chunk execution backend shared by every chunked file of this factory"""
+        if self._chunk_execution_backend is None:
+            from src.core.factories.chunk_execution_backend_factory import ChunkExecutionBackendFactory
+            self._chunk_execution_backend = ChunkExecutionBackendFactory.create_backend(self.config_manager)
+        return self._chunk_execution_backend
+    
+    def shutdown(self) -> None:
+        """Stop the shared chunk execution backend"""
+        if self._chunk_execution_backend is not None:
+            self._chunk_execution_backend.shutdown()
+            self._chunk_execution_backend = None
     
     def create_strategy(self, audio_file_path: str) -> 'BaseTranscriptionStrategy':
         """Create appropriate transcription strategy based on file characteristics"""
         try:
-            # Check file size first (for chunked transcription)
-            if self._is_large_file(audio_file_path):
+            # Check duration first (for chunked transcription)
+            if self._requires_chunking(audio_file_path):
                 from .chunked_transcription_strategy import ChunkedTranscriptionStrategy
-                logger.info(f"📁 Large file detected ({self._get_file_size_mb(audio_file_path):.1f}MB), using ChunkedTranscriptionStrategy")
-                return ChunkedTranscriptionStrategy(self.config_manager)
+                logger.info(f"📁 Long audio detected ({self._describe_file(audio_file_path)}), using ChunkedTranscriptionStrategy")
+                return ChunkedTranscriptionStrategy(self.config_manager,
+                                                    execution_backend=self.get_chunk_execution_backend(),
+                                                    memory_governor=self.memory_governor)
             # Then check if there are existing chunks (for resuming interrupted processing)
             elif self._has_existing_chunks():
                 from .existing_chunks_strategy import ExistingChunksStrategy
@@ -40,7 +69,7 @@ class TranscriptionStrategyFactory:
                 return ExistingChunksStrategy(self.config_manager)
             else:
                 from .direct_transcription_strategy import DirectTranscriptionStrategy
-                logger.info("📁 Small file, using DirectTranscriptionStrategy")
+                logger.info(f"📁 Short audio ({self._describe_file(audio_file_path)}), using DirectTranscriptionStrategy")
                 return DirectTranscriptionStrategy(self.config_manager)
         except Exception as e:
             logger.error(f"❌ Error creating transcription strategy: {e}")
@@ -51,10 +80,30 @@ class TranscriptionStrategyFactory:
         chunks_dir = Path("examples/audio/voice/audio_chunks")
         return chunks_dir.exists() and any(chunks_dir.glob("audio_chunk_*.wav"))
     
+    def _get_direct_max_duration(self) -> float:
+        """Get the longest duration the direct strategy can transcribe in one window"""
+        chunking = getattr(self.config, 'chunking', None) if self.config else None
+        value = getattr(chunking, 'max_chunk_duration', None) if chunking is not None else None
+        return float(value) if isinstance(value, (int, float)) and value > 0 else self.DEFAULT_DIRECT_MAX_DURATION_SECONDS
+    
+    def _requires_chunking(self, audio_file_path: str) -> bool:
+        """Determine if audio is long enough to require chunking"""
+        duration = self.audio_probe.get_duration(audio_file_path)
+        if duration is not None:
+            return duration > self._get_direct_max_duration()
+        logger.warning(f"⚠️ Could not probe duration of {audio_file_path}, falling back to file size")
+        return self._is_large_file(audio_file_path)
+    
+    def _describe_file(self, audio_file_path: str) -> str:
+        """Describe file duration and size for logging"""
+        duration = self.audio_probe.get_duration(audio_file_path)
+        duration_text = f"{duration:.1f}s, " if duration is not None else ""
+        return f"{duration_text}{self._get_file_size_mb(audio_file_path):.1f}MB"
+    
     def _is_large_file(self, audio_file_path: str) -> bool:
         """Determine if file is large enough to require chunking"""
         file_size_mb = self._get_file_size_mb(audio_file_path)
-        return file_size_mb > 100
+        return file_size_mb > self.FALLBACK_LARGE_FILE_MB
     
     def _get_file_size_mb(self, audio_file_path: str) -> float:
         """Get file size in MB"""
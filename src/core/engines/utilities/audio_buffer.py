@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Audio Buffer
+Holds decoded audio as 16 kHz mono int16 and produces float32 windows on demand
+"""
+
+import logging
+from typing import Any, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+INT16_SCALE = 32768.0
+
+# Frames decoded per block when streaming a file into the buffer
+DEFAULT_BLOCK_FRAMES = 1 << 20
+
+
+def float_to_int16(audio: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Convert float samples in [-1, 1] to int16 with clipping
+
+    Args:
+        audio: Float samples
+        out: Optional int16 array to write into
+
+    Returns:
+        int16 samples
+    """
+    scaled = np.multiply(audio, INT16_SCALE, dtype=np.float32)
+    np.clip(scaled, -INT16_SCALE, INT16_SCALE - 1, out=scaled)
+    if out is None:
+        return scaled.astype(np.int16)
+    np.copyto(out, scaled, casting='unsafe')
+    return out
+
+
+def _downmix(audio: np.ndarray) -> np.ndarray:
+    """Average the channels of a (frames, channels) block into float32 mono"""
+    if audio.ndim == 1:
+        return audio
+    return audio.mean(axis=1, dtype=np.float32)
+
+
+class AudioBuffer:
+    """
+    Decoded audio stored as 16 kHz mono int16
+
+    Two bytes per sample instead of the four (float32) or eight (float64) the
+    audio libraries return, held in a single array for the lifetime of a job.
+    Float32 is only materialized per window, right before feature extraction,
+    and chunk WAV files are written straight from the int16 samples.
+    """
+
+    sample_rate = SAMPLE_RATE
+
+    def __init__(self, samples: np.ndarray, source: Optional[str] = None):
+        """
+        Initialize buffer
+
+        Args:
+            samples: 16 kHz mono int16 samples
+            source: Path or description of the audio source
+        """
+        if samples.dtype != np.int16 or samples.ndim != 1:
+            raise ValueError(f"AudioBuffer needs 1-D int16 samples, got {samples.dtype} with shape {samples.shape}")
+        self.samples = samples
+        self.source = source
+
+    @classmethod
+    def from_array(cls, audio: Any, sample_rate: int = SAMPLE_RATE, source: Optional[str] = None,
+                   channels_first: bool = False) -> 'AudioBuffer':
+        """
+        Create a buffer from a decoded waveform
+
+        Args:
+            audio: Float or int16 samples, mono or multi-channel
+            sample_rate: Sample rate of the waveform
+            source: Path or description of the audio source
+            channels_first: True for librosa's (channels, frames) layout, False for soundfile's (frames, channels)
+
+        Returns:
+            AudioBuffer
+        """
+        if isinstance(audio, AudioBuffer):
+            return audio
+        audio = np.asarray(audio)
+        if audio.ndim > 1:
+            audio = _downmix(audio.T if channels_first else audio)
+
+        if audio.dtype == np.int16 and sample_rate == SAMPLE_RATE:
+            return cls(np.ascontiguousarray(audio), source)
+        if audio.dtype == np.int16:
+            audio = audio.astype(np.float32) / INT16_SCALE
+        if sample_rate != SAMPLE_RATE:
+            import librosa
+            audio = librosa.resample(np.asarray(audio, dtype=np.float32), orig_sr=sample_rate, target_sr=SAMPLE_RATE)
+        return cls(float_to_int16(audio), source)
+
+    @classmethod
+    def from_file(cls, audio_file_path: str, block_frames: int = DEFAULT_BLOCK_FRAMES) -> 'AudioBuffer':
+        """
+        Decode an audio file into a buffer
+
+        Files soundfile can read are decoded block by block, downmixed and
+        resampled as a stream, so no full-length float copy of the recording
+        is ever held. Other formats fall back to librosa.
+
+        Args:
+            audio_file_path: Audio file path
+            block_frames: Frames decoded per block
+
+        Returns:
+            AudioBuffer
+        """
+        try:
+            import soundfile as sf
+            with sf.SoundFile(audio_file_path) as audio_file:
+                buffer = cls._stream_from_soundfile(audio_file, block_frames, audio_file_path)
+            logger.info(f"✅ Audio loaded: {buffer.duration:.1f}s as 16 kHz mono int16 ({buffer.nbytes / (1024 * 1024):.1f} MB)")
+            return buffer
+        except ImportError:
+            logger.debug("⚠️ soundfile not available, decoding with librosa")
+        except RuntimeError as e:
+            logger.debug(f"⚠️ soundfile cannot decode {audio_file_path} ({e}), decoding with librosa")
+
+        import librosa
+        audio, _ = librosa.load(audio_file_path, sr=SAMPLE_RATE, mono=True)
+        buffer = cls.from_array(audio, SAMPLE_RATE, source=audio_file_path)
+        logger.info(f"✅ Audio loaded: {buffer.duration:.1f}s as 16 kHz mono int16 ({buffer.nbytes / (1024 * 1024):.1f} MB)")
+        return buffer
+
+    @classmethod
+    def _stream_from_soundfile(cls, audio_file: Any, block_frames: int, source: str) -> 'AudioBuffer':
+        resampler = None
+        if audio_file.samplerate != SAMPLE_RATE:
+            try:
+                import soxr
+                resampler = soxr.ResampleStream(audio_file.samplerate, SAMPLE_RATE, 1, dtype='float32')
+            except ImportError:
+                # Without a streaming resampler, decode fully and resample in one pass
+                audio = audio_file.read(dtype='float32', always_2d=True)
+                return cls.from_array(_downmix(audio), audio_file.samplerate, source=source)
+
+        # Preallocate from the frame count plus resampler slack; the unused tail is at most one block
+        capacity = int(audio_file.frames * SAMPLE_RATE / audio_file.samplerate) + block_frames + 1
+        samples = np.empty(capacity, dtype=np.int16)
+        filled = 0
+        while True:
+            block = audio_file.read(block_frames, dtype='float32', always_2d=True)
+            last = len(block) < block_frames
+            mono = _downmix(block)
+            if resampler is not None:
+                mono = resampler.resample_chunk(mono, last=last)
+            if filled + len(mono) > len(samples):
+                samples = np.resize(samples, filled + len(mono))
+            float_to_int16(mono, out=samples[filled:filled + len(mono)])
+            filled += len(mono)
+            if last:
+                break
+        return cls(samples[:filled], source)
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds"""
+        return len(self.samples) / SAMPLE_RATE
+
+    @property
+    def nbytes(self) -> int:
+        return self.samples.nbytes
+
+    def _sample_range(self, start_time: float, end_time: Optional[float]) -> slice:
+        start = min(len(self.samples), max(0, int(start_time * SAMPLE_RATE)))
+        end = len(self.samples) if end_time is None else min(len(self.samples), max(start, int(end_time * SAMPLE_RATE)))
+        return slice(start, end)
+
+    def int16_window(self, start_time: float = 0.0, end_time: Optional[float] = None) -> np.ndarray:
+        """
+        Get a window of int16 samples (a view, no copy)
+
+        Args:
+            start_time: Window start in seconds
+            end_time: Window end in seconds (None for the end of the audio)
+
+        Returns:
+            int16 view of the window
+        """
+        return self.samples[self._sample_range(start_time, end_time)]
+
+    def window(self, start_time: float = 0.0, end_time: Optional[float] = None) -> np.ndarray:
+        """
+        Get a window as float32 in [-1, 1] for feature extraction
+
+        Args:
+            start_time: Window start in seconds
+            end_time: Window end in seconds (None for the end of the audio)
+
+        Returns:
+            New float32 array holding only this window
+        """
+        return np.multiply(self.int16_window(start_time, end_time), 1.0 / INT16_SCALE, dtype=np.float32)
+
+    def write_wav(self, file_path: str, start_time: float = 0.0, end_time: Optional[float] = None) -> None:
+        """
+        Write a window as a 16-bit PCM WAV file
+
+        Args:
+            file_path: Target WAV path
+            start_time: Window start in seconds
+            end_time: Window end in seconds (None for the end of the audio)
+        """
+        import soundfile as sf
+        sf.write(file_path, self.int16_window(start_time, end_time), SAMPLE_RATE, subtype='PCM_16')
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Lightweight Whisper Processor
+Tokenizer and feature extraction for CTranslate2 models without transformers
+"""
+
+import logging
+import os
+import re
+from typing import Any, List, Optional, Tuple, Union
+
+from src.core.engines.utilities.whisper_feature_extractor import WhisperFeatureExtractorNumpy
+
+logger = logging.getLogger(__name__)
+
+TOKENIZER_FILE = "tokenizer.json"
+PREPROCESSOR_CONFIG_FILE = "preprocessor_config.json"
+
+# Language names accepted by WhisperTokenizer in addition to language codes
+LANGUAGE_NAMES = {
+    'hebrew': 'he', 'english': 'en', 'arabic': 'ar', 'russian': 'ru',
+    'french': 'fr', 'german': 'de', 'spanish': 'es', 'yiddish': 'yi'
+}
+
+TIMESTAMP_PATTERN = re.compile(r"<\|\d+\.\d+\|>")
+
+
+class WhisperTokenizerAdapter:
+    """
+    Whisper tokenizer backed directly by the `tokenizers` library
+
+    Loads the model's tokenizer.json and exposes the subset of the
+    WhisperTokenizer API used for decoding: decode with skip_special_tokens,
+    encode, token/id lookup and forced decoder prompt ids.
+    """
+
+    def __init__(self, tokenizer: Any):
+        """
+        Initialize tokenizer adapter
+
+        Args:
+            tokenizer: tokenizers.Tokenizer instance
+        """
+        self._tokenizer = tokenizer
+        added_tokens = tokenizer.get_added_tokens_decoder() if hasattr(tokenizer, 'get_added_tokens_decoder') else {}
+        self.all_special_ids = sorted(token_id for token_id, token in added_tokens.items() if getattr(token, 'special', False))
+        self.timestamp_begin = tokenizer.token_to_id("<|0.00|>")
+
+    @classmethod
+    def from_file(cls, tokenizer_path: str) -> 'WhisperTokenizerAdapter':
+        """Load the adapter from a tokenizer.json file"""
+        from tokenizers import Tokenizer
+        return cls(Tokenizer.from_file(tokenizer_path))
+
+    def encode(self, text: str, add_special_tokens: bool = True) -> List[int]:
+        """Encode text to token ids"""
+        return self._tokenizer.encode(text, add_special_tokens=add_special_tokens).ids
+
+    def decode(self, token_ids: Any, skip_special_tokens: bool = False, **kwargs) -> str:
+        """
+        Decode token ids to text
+
+        Args:
+            token_ids: Sequence of token ids (a nested batch of one is flattened)
+            skip_special_tokens: Drop special and timestamp tokens
+
+        Returns:
+            Decoded text
+        """
+        ids = [int(token_id) for token_id in self._flatten(token_ids)]
+        if skip_special_tokens and self.timestamp_begin is not None:
+            ids = [token_id for token_id in ids if token_id < self.timestamp_begin]
+        text = self._tokenizer.decode(ids, skip_special_tokens=skip_special_tokens)
+        if skip_special_tokens:
+            text = TIMESTAMP_PATTERN.sub("", text)
+        return text
+
+    def batch_decode(self, sequences: List[Any], skip_special_tokens: bool = False, **kwargs) -> List[str]:
+        """Decode a batch of token id sequences"""
+        return [self.decode(sequence, skip_special_tokens=skip_special_tokens) for sequence in sequences]
+
+    def convert_tokens_to_ids(self, tokens: Union[str, List[str]]) -> Union[Optional[int], List[Optional[int]]]:
+        """Look up the id of a token or a list of tokens"""
+        if isinstance(tokens, str):
+            return self._tokenizer.token_to_id(tokens)
+        return [self._tokenizer.token_to_id(token) for token in tokens]
+
+    def convert_ids_to_tokens(self, ids: Union[int, List[int]]) -> Union[Optional[str], List[Optional[str]]]:
+        """Look up the token of an id or a list of ids"""
+        if isinstance(ids, int):
+            return self._tokenizer.id_to_token(ids)
+        return [self._tokenizer.id_to_token(int(token_id)) for token_id in ids]
+
+    def get_decoder_prompt_ids(self, task: Optional[str] = None, language: Optional[str] = None,
+                               no_timestamps: bool = True) -> List[Tuple[int, int]]:
+        """
+        Get forced decoder ids following <|startoftranscript|>
+
+        Returns:
+            List of (position, token_id) pairs, as WhisperTokenizer returns them
+        """
+        forced_tokens = []
+        if language:
+            code = LANGUAGE_NAMES.get(language.lower(), language.lower())
+            forced_tokens.append(self._require_token(f"<|{code}|>"))
+        if task:
+            forced_tokens.append(self._require_token(f"<|{task}|>"))
+        if no_timestamps:
+            forced_tokens.append(self._require_token("<|notimestamps|>"))
+        return [(position + 1, token_id) for position, token_id in enumerate(forced_tokens)]
+
+    def _require_token(self, token: str) -> int:
+        token_id = self._tokenizer.token_to_id(token)
+        if token_id is None:
+            raise ValueError(f"Token {token} is not in the tokenizer vocabulary")
+        return token_id
+
+    @staticmethod
+    def _flatten(token_ids: Any) -> List[Any]:
+        if hasattr(token_ids, 'tolist'):
+            token_ids = token_ids.tolist()
+        if token_ids and isinstance(token_ids[0], (list, tuple)):
+            return [token_id for sequence in token_ids for token_id in sequence]
+        return list(token_ids)
+
+
+class LightweightWhisperProcessor:
+    """
+    Drop-in replacement for transformers WhisperProcessor
+
+    Combines WhisperTokenizerAdapter with the NumPy feature extractor, so a
+    CTranslate2 model can be served without importing transformers (and torch).
+    """
+
+    def __init__(self, tokenizer: WhisperTokenizerAdapter, feature_extractor: WhisperFeatureExtractorNumpy):
+        self.tokenizer = tokenizer
+        self.feature_extractor = feature_extractor
+
+    @staticmethod
+    def is_supported(model_path: str) -> bool:
+        """Check that a model directory has the files the lightweight processor needs"""
+        return (os.path.isfile(os.path.join(model_path, TOKENIZER_FILE)) and
+                os.path.isfile(os.path.join(model_path, PREPROCESSOR_CONFIG_FILE)))
+
+    @classmethod
+    def from_pretrained(cls, model_path: str) -> 'LightweightWhisperProcessor':
+        """
+        Load the processor from a local model directory
+
+        Args:
+            model_path: Directory containing tokenizer.json and preprocessor_config.json
+
+        Returns:
+            LightweightWhisperProcessor instance
+        """
+        if not cls.is_supported(model_path):
+            raise FileNotFoundError(f"{TOKENIZER_FILE} and {PREPROCESSOR_CONFIG_FILE} are required in {model_path}")
+        tokenizer = WhisperTokenizerAdapter.from_file(os.path.join(model_path, TOKENIZER_FILE))
+        feature_extractor = WhisperFeatureExtractorNumpy.from_pretrained(model_path)
+        return cls(tokenizer, feature_extractor)
+
+    def __call__(self, audio: Any, sampling_rate: Optional[int] = None, return_tensors: str = "np", **kwargs) -> Any:
+        """Compute input features for audio"""
+        return self.feature_extractor(audio, sampling_rate=sampling_rate, return_tensors=return_tensors)
+
+    def decode(self, token_ids: Any, skip_special_tokens: bool = False, **kwargs) -> str:
+        """Decode token ids to text"""
+        return self.tokenizer.decode(token_ids, skip_special_tokens=skip_special_tokens)
+
+    def batch_decode(self, sequences: List[Any], skip_special_tokens: bool = False, **kwargs) -> List[str]:
+        """Decode a batch of token id sequences"""
+        return self.tokenizer.batch_decode(sequences, skip_special_tokens=skip_special_tokens)
+
+    def get_decoder_prompt_ids(self, task: Optional[str] = None, language: Optional[str] = None,
+                               no_timestamps: bool = True) -> List[Tuple[int, int]]:
+        """Get forced decoder ids following <|startoftranscript|>"""
+        return self.tokenizer.get_decoder_prompt_ids(task=task, language=language, no_timestamps=no_timestamps)
@@ -8,12 +8,19 @@ import logging
 import gc
 import os
 import json
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Tuple, Optional
 
-# Model loading imports
-from ctranslate2.models import Whisper
-from transformers import WhisperProcessor
+from src.core.engines.utilities.lightweight_processor import LightweightWhisperProcessor
+from src.core.engines.utilities.model_prefetch import PageCachePrefetch
+from src.core.logic.cpu_placement import shared_model_affinity
+from src.core.logic.thread_budget import get_thread_layout
+from src.utils.dependency_manager import get_dependency_manager
+
+# ctranslate2 and transformers are imported when a model is loaded, not at module import,
+# so commands that never transcribe do not pay their import time
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +42,9 @@ class ModelManager:
         self._model_cache = {}
         self._processor_cache = {}
         self._config_manager = config_manager
+        # Serializes loads so a background warm-up and a transcription never load the same model twice
+        self._load_lock = threading.RLock()
+        self._load_timings: Dict[str, Dict[str, float]] = {}
         
         # Models path must come from ConfigManager
         if config_manager is None:
@@ -154,10 +164,12 @@ class ModelManager:
     def get_or_load_model(self, model_name: str) -> Tuple[Any, Any]:
         """Get cached model or load it with optimized settings"""
         if model_name not in self._model_cache:
-            logger.info(f"Loading model: {model_name}")
-            processor, model = self._load_model(model_name)
-            self._model_cache[model_name] = model
-            self._processor_cache[model_name] = processor
+            with self._load_lock:
+                if model_name not in self._model_cache:
+                    logger.info(f"Loading model: {model_name}")
+                    processor, model = self._load_model(model_name)
+                    self._processor_cache[model_name] = processor
+                    self._model_cache[model_name] = model
         
         return self._processor_cache[model_name], self._model_cache[model_name]
     
@@ -171,72 +183,135 @@ class ModelManager:
             raise ValueError(f"Only CTranslate2 models are supported. Got: {model_name}")
     
     def _load_ct2_model(self, model_name: str, is_ct2_model: bool) -> Tuple[Any, Any]:
-        """Load CTranslate2 model from local models directory"""
+        """Load CTranslate2 model from local models directory
+        
+        The weights are prefetched into the page cache and the processor is loaded
+        on a second thread while CTranslate2 loads the model.
+        """
         start_time = time.time()
         logger.info(f"🚀 Starting CTranslate2 model load: {model_name}")
         
-        # Try to load from local models directory first
-        # For CTranslate2 models, check if the model-specific directory contains the required files
-        model_path = None
-        
         # Construct model path using ConfigManager models_path
-        if self._models_path:
-            model_path = os.path.join(self._models_path, model_name)
-            logger.info(f"🔍 Checking for local model at: {model_path}")
+        if not self._models_path:
+            raise ValueError("No models path configured in ConfigManager. Cannot load CTranslate2 model.")
+        
+        model_path = os.path.join(self._models_path, model_name)
+        model_bin_path = os.path.join(model_path, "model.bin")
+        logger.info(f"🔍 Checking for local model at: {model_path}")
+        if not (os.path.exists(model_path) and os.path.exists(model_bin_path)):
+            raise FileNotFoundError(f"Local CTranslate2 model not found at {model_path}. Model must be available locally.")
+        
+        logger.info(f"📁 Loading CTranslate2 model from local path: {model_path}")
+        logger.info(f"📊 Model file size: {os.path.getsize(model_bin_path) / (1024**3):.2f} GB")
+        
+        device, compute_type = self._get_ct2_device_settings()
+        intra_threads, inter_threads = self._get_ct2_thread_settings()
+        processor_source = self._get_processor_source(model_name, is_ct2_model, model_path)
+        timings: Dict[str, float] = {}
+        
+        with PageCachePrefetch(model_bin_path) as prefetch:
+            timings['prefetch_issue'] = prefetch.stats['issue_seconds']
             
-            if os.path.exists(model_path) and os.path.exists(os.path.join(model_path, "model.bin")):
-                logger.info(f"📁 Loading CTranslate2 model from local path: {model_path}")
-                logger.info(f"📊 Model file size: {os.path.getsize(os.path.join(model_path, 'model.bin')) / (1024**3):.2f} GB")
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="processor-load") as executor:
+                processor_future = executor.submit(self._load_processor_timed, model_name, processor_source)
                 
-                # Get device and compute_type from configuration
-                device = "cpu"  # default
-                compute_type = "float32"  # default
+                model_start = time.time()
+                from ctranslate2.models import Whisper
+                with shared_model_affinity():
+                    model = Whisper(model_path, device=device, compute_type=compute_type,
+                                    intra_threads=intra_threads, inter_threads=inter_threads)
+                timings['ct2_model'] = time.time() - model_start
+                logger.info(f"✅ CTranslate2 model loaded successfully from local path in {timings['ct2_model']:.2f}s")
                 
-                try:
-                    if hasattr(self._config_manager.config.transcription, 'ctranslate2_optimization'):
-                        ct2_config = self._config_manager.config.transcription.ctranslate2_optimization
-                        device = getattr(ct2_config, 'device', 'cpu')
-                        compute_type = getattr(ct2_config, 'compute_type', 'float32')
-                        logger.info(f"🔧 Using device: {device}, compute_type: {compute_type}")
-                except Exception as e:
-                    logger.warning(f"⚠️ Could not read device config, using defaults: {e}")
-                
-                model = Whisper(model_path, device=device, compute_type=compute_type)
-                logger.info(f"✅ CTranslate2 model loaded successfully from local path in {time.time() - start_time:.2f}s")
-            else:
-                raise FileNotFoundError(f"Local CTranslate2 model not found at {model_path}. Model must be available locally.")
-        else:
-            raise ValueError("No models path configured in ConfigManager. Cannot load CTranslate2 model.")
+                processor_wait_start = time.time()
+                processor, timings['processor'] = processor_future.result()
+                timings['processor_wait'] = time.time() - processor_wait_start
+        
+        timings['total'] = time.time() - start_time
+        self._load_timings[model_name] = timings
         
-        # Load processor - prioritize local files when available
+        logger.info(f"🎯 Total model loading time: {timings['total']:.2f}s "
+                    f"(model {timings['ct2_model']:.2f}s ∥ processor {timings['processor']:.2f}s, "
+                    f"waited {timings['processor_wait']:.2f}s for processor, "
+                    f"readahead issue {timings['prefetch_issue']:.3f}s)")
+        logger.info(f"📈 Model cache status: {len(self._model_cache)} models cached")
+        
+        return processor, model
+    
+    def _get_ct2_device_settings(self) -> Tuple[str, str]:
+        """Get device and compute_type from configuration"""
+        device = "cpu"  # default
+        compute_type = "float32"  # default
+        
+        try:
+            if hasattr(self._config_manager.config.transcription, 'ctranslate2_optimization'):
+                ct2_config = self._config_manager.config.transcription.ctranslate2_optimization
+                device = getattr(ct2_config, 'device', 'cpu')
+                compute_type = getattr(ct2_config, 'compute_type', 'float32')
+                logger.info(f"🔧 Using device: {device}, compute_type: {compute_type}")
+        except Exception as e:
+            logger.warning(f"⚠️ Could not read device config, using defaults: {e}")
+        
+        return device, compute_type
+    
+    def _get_ct2_thread_settings(self) -> Tuple[int, int]:
+        """Get CTranslate2 intra/inter threads from the process thread budget"""
+        layout = get_thread_layout(self._config_manager)
+        logger.info(f"🧵 CTranslate2 threads: intra={layout.ct2_intra_threads}, inter={layout.ct2_inter_threads}")
+        return layout.ct2_intra_threads, layout.ct2_inter_threads
+    
+    def _load_processor_timed(self, model_name: str, processor_source: str) -> Tuple[Any, float]:
+        """Load the processor and return it with its load time"""
         processor_start = time.time()
-        logger.info(f"🔧 Loading WhisperProcessor for: {model_name}")
-        processor_source = self._get_processor_source(model_name, is_ct2_model, model_path)
+        processor = self._load_processor(model_name, processor_source)
+        processor_time = time.time() - processor_start
+        logger.info(f"✅ Processor loaded in {processor_time:.2f}s")
+        return processor, processor_time
+    
+    def _load_processor(self, model_name: str, processor_source: str) -> Any:
+        """Load the processor for token decoding and feature extraction, prioritizing local files
+        
+        The tokenizers-backed lightweight processor is used when the library and the
+        model's tokenizer.json are available; otherwise WhisperProcessor is loaded.
+        """
+        logger.info(f"🔧 Loading processor for: {model_name}")
         logger.info(f"📡 Processor source: {processor_source}")
         
-        # Load WhisperProcessor for token decoding (required for both regular and CTranslate2 models)
+        processor = self._load_lightweight_processor(processor_source)
+        if processor is not None:
+            return processor
+        
+        from transformers import WhisperProcessor
         try:
             processor = WhisperProcessor.from_pretrained(processor_source)
             logger.info(f"✅ WhisperProcessor loaded successfully from: {processor_source}")
+            return processor
         except Exception as e:
             logger.error(f"❌ Failed to load WhisperProcessor from {processor_source}: {e}")
             # Try fallback to original model name
             try:
                 processor = WhisperProcessor.from_pretrained(model_name)
                 logger.info(f"✅ WhisperProcessor loaded from fallback: {model_name}")
+                return processor
             except Exception as fallback_error:
                 logger.error(f"❌ Failed to load WhisperProcessor fallback: {fallback_error}")
                 raise ValueError(f"Unable to load WhisperProcessor for {model_name}")
-        
-        logger.info(f"✅ WhisperProcessor loaded in {time.time() - processor_start:.2f}s")
-        
-        total_time = time.time() - start_time
-        logger.info(f"🎯 Total model loading time: {total_time:.2f}s")
-        logger.info(f"📈 Model cache status: {len(self._model_cache)} models cached")
-        
-        return processor, model
     
-
+    def _load_lightweight_processor(self, processor_source: str) -> Optional[Any]:
+        """Load the tokenizers-backed processor, or return None to fall back to transformers"""
+        if not get_dependency_manager().is_available('tokenizers'):
+            logger.info("ℹ️ tokenizers not available, using WhisperProcessor")
+            return None
+        if not LightweightWhisperProcessor.is_supported(processor_source):
+            logger.info(f"ℹ️ No tokenizer.json/preprocessor_config.json in {processor_source}, using WhisperProcessor")
+            return None
+        try:
+            processor = LightweightWhisperProcessor.from_pretrained(processor_source)
+            logger.info(f"✅ Lightweight processor loaded from: {processor_source}")
+            return processor
+        except Exception as e:
+            logger.warning(f"⚠️ Lightweight processor failed to load, falling back to WhisperProcessor: {e}")
+            return None
     
     def _get_processor_source(self, model_name: str, is_ct2_model: bool, model_path: Optional[str] = None) -> str:
         """Get appropriate processor source for model - must use ConfigManager configuration"""
@@ -292,12 +367,34 @@ class ModelManager:
         gc.collect()
         logger.info("✅ Model cleanup completed - all models unloaded")
     
+    def evict_models(self, keep: Optional[str] = None) -> int:
+        """Unload cached models except the one named in keep
+        
+        Args:
+            keep: Model name to keep loaded
+            
+        Returns:
+            Number of models evicted
+        """
+        evicted = 0
+        for model_name in list(self._model_cache.keys()):
+            if model_name == keep:
+                continue
+            logger.info(f"🔄 Evicting cached model under memory pressure: {model_name}")
+            model = self._model_cache.pop(model_name)
+            self._processor_cache.pop(model_name, None)
+            if hasattr(model, 'unload_model'):
+                model.unload_model()
+            evicted += 1
+        return evicted
+    
     def get_cache_info(self) -> Dict[str, Any]:
         """Get information about model cache"""
         return {
             "loaded_models_count": len(self._model_cache),
             "processor_cache_size": len(self._processor_cache),
-            "cached_models": list(self._model_cache.keys())
+            "cached_models": list(self._model_cache.keys()),
+            "load_timings": {name: dict(timings) for name, timings in self._load_timings.items()}
         }
     
     def is_model_cached(self, model_name: str) -> bool:
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Model Warm-up Utility
+Loads and warms up a transcription model in the background
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ModelWarmup:
+    """
+    Runs a model warm-up in a background thread and exposes it as a future
+
+    The warm-up callable loads the model and runs a tiny synthetic decode, so
+    weights are paged in and first-call kernels are initialized while the
+    application is still parsing arguments and validating input. Callers that
+    need the model wait on the future instead of loading it themselves.
+    """
+
+    def __init__(self, model_name: str, warm_up: Callable[[str], Any]):
+        """
+        Initialize model warm-up
+
+        Args:
+            model_name: Model to warm up
+            warm_up: Callable that loads and exercises the model
+        """
+        self.model_name = model_name
+        self._warm_up = warm_up
+        self.future: Future = Future()
+        self._thread: Optional[threading.Thread] = None
+        self.started_at: Optional[float] = None
+        self.duration: Optional[float] = None
+
+    def start(self) -> Future:
+        """Start the warm-up thread (idempotent)"""
+        if self._thread is None:
+            self.started_at = time.time()
+            self._thread = threading.Thread(target=self._run, name="model-warmup", daemon=True)
+            self._thread.start()
+            logger.info(f"🔥 Warming up model {self.model_name} in the background")
+        return self.future
+
+    def _run(self) -> None:
+        if not self.future.set_running_or_notify_cancel():
+            return
+        try:
+            result = self._warm_up(self.model_name)
+        except BaseException as e:
+            self.duration = time.time() - self.started_at
+            logger.warning(f"⚠️ Model warm-up failed after {self.duration:.1f}s: {e}")
+            self.future.set_exception(e)
+            return
+        self.duration = time.time() - self.started_at
+        logger.info(f"✅ Model {self.model_name} warmed up in {self.duration:.1f}s")
+        self.future.set_result(result)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the warm-up to finish
+
+        A failed warm-up is not an error for the caller: the model is then
+        loaded on the regular path, which reports the real failure.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if the warm-up completed successfully
+        """
+        if self._thread is None:
+            return False
+        waited_from = time.time()
+        try:
+            self.future.result(timeout=timeout)
+        except Exception:
+            return False
+        waited = time.time() - waited_from
+        if waited > 0.1:
+            logger.info(f"⏳ Waited {waited:.1f}s for model warm-up to finish")
+        return True
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get warm-up status for logging and statistics"""
+        if self._thread is None:
+            state = 'not_started'
+        elif not self.future.done():
+            state = 'running'
+        elif self.future.exception() is not None:
+            state = 'failed'
+        else:
+            state = 'completed'
+        return {'model_name': self.model_name, 'state': state, 'duration': self.duration}
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Whisper Feature Extractor
+NumPy implementation of Whisper log-mel input features
+"""
+
+import json
+import logging
+import os
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def _hertz_to_mel(frequencies: np.ndarray) -> np.ndarray:
+    """Slaney mel scale: linear below 1 kHz, logarithmic above"""
+    min_log_hertz = 1000.0
+    min_log_mel = 15.0
+    logstep = 27.0 / np.log(6.4)
+    mels = 3.0 * frequencies / 200.0
+    log_region = frequencies >= min_log_hertz
+    mels[log_region] = min_log_mel + np.log(frequencies[log_region] / min_log_hertz) * logstep
+    return mels
+
+
+def _mel_to_hertz(mels: np.ndarray) -> np.ndarray:
+    """Inverse of the Slaney mel scale"""
+    min_log_hertz = 1000.0
+    min_log_mel = 15.0
+    logstep = np.log(6.4) / 27.0
+    frequencies = 200.0 * mels / 3.0
+    log_region = mels >= min_log_mel
+    frequencies[log_region] = min_log_hertz * np.exp(logstep * (mels[log_region] - min_log_mel))
+    return frequencies
+
+
+def mel_filter_bank(num_frequency_bins: int, num_mel_filters: int, sampling_rate: int,
+                    min_frequency: float = 0.0, max_frequency: float = 8000.0) -> np.ndarray:
+    """
+    Build a Slaney-normalized triangular mel filter bank
+
+    Returns:
+        Array of shape (num_frequency_bins, num_mel_filters)
+    """
+    mel_min = _hertz_to_mel(np.array([min_frequency], dtype=np.float64))[0]
+    mel_max = _hertz_to_mel(np.array([max_frequency], dtype=np.float64))[0]
+    filter_freqs = _mel_to_hertz(np.linspace(mel_min, mel_max, num_mel_filters + 2))
+    fft_freqs = np.linspace(0, sampling_rate // 2, num_frequency_bins)
+
+    filter_diff = np.diff(filter_freqs)
+    slopes = np.expand_dims(filter_freqs, 0) - np.expand_dims(fft_freqs, 1)
+    down_slopes = -slopes[:, :-2] / filter_diff[:-1]
+    up_slopes = slopes[:, 2:] / filter_diff[1:]
+    filters = np.maximum(np.zeros(1), np.minimum(down_slopes, up_slopes))
+
+    enorm = 2.0 / (filter_freqs[2:num_mel_filters + 2] - filter_freqs[:num_mel_filters])
+    return filters * np.expand_dims(enorm, 0)
+
+
+class FeatureBatch:
+    """Minimal stand-in for the transformers BatchFeature returned by processors"""
+
+    def __init__(self, input_features: np.ndarray):
+        self.input_features = input_features
+
+    def __getitem__(self, key: str) -> Any:
+        return getattr(self, key)
+
+
+class WhisperFeatureExtractorNumpy:
+    """
+    Computes Whisper log-mel spectrogram features without transformers
+
+    Mirrors WhisperFeatureExtractor: audio is zero-padded or truncated to the
+    30 second window, transformed with a periodic Hann STFT (center, reflect
+    padding), projected on a Slaney mel filter bank, log10-compressed, clamped
+    to 8 below the maximum and scaled as (x + 4) / 4.
+    """
+
+    def __init__(self, feature_size: int = 80, sampling_rate: int = 16000, hop_length: int = 160,
+                 chunk_length: int = 30, n_fft: int = 400):
+        """
+        Initialize feature extractor
+
+        Args:
+            feature_size: Number of mel bins (80, or 128 for large-v3 models)
+            sampling_rate: Expected audio sample rate
+            hop_length: STFT hop in samples
+            chunk_length: Window length in seconds
+            n_fft: STFT size
+        """
+        self.feature_size = feature_size
+        self.sampling_rate = sampling_rate
+        self.hop_length = hop_length
+        self.chunk_length = chunk_length
+        self.n_fft = n_fft
+        self.n_samples = chunk_length * sampling_rate
+        self.window = np.hanning(n_fft + 1)[:-1]
+        self.mel_filters = mel_filter_bank(1 + n_fft // 2, feature_size, sampling_rate)
+
+    @classmethod
+    def from_pretrained(cls, model_path: str) -> 'WhisperFeatureExtractorNumpy':
+        """Create an extractor from a model directory's preprocessor_config.json"""
+        with open(os.path.join(model_path, "preprocessor_config.json"), 'r', encoding='utf-8') as f:
+            config: Dict[str, Any] = json.load(f)
+        return cls(
+            feature_size=config.get('feature_size', 80),
+            sampling_rate=config.get('sampling_rate', 16000),
+            hop_length=config.get('hop_length', 160),
+            chunk_length=config.get('chunk_length', 30),
+            n_fft=config.get('n_fft', 400)
+        )
+
+    def extract(self, audio: np.ndarray) -> np.ndarray:
+        """
+        Compute log-mel features for one waveform
+
+        Returns:
+            Array of shape (feature_size, chunk_length * sampling_rate / hop_length)
+        """
+        waveform = np.asarray(audio, dtype=np.float32).reshape(-1)
+        if len(waveform) >= self.n_samples:
+            waveform = waveform[:self.n_samples]
+        else:
+            waveform = np.pad(waveform, (0, self.n_samples - len(waveform)))
+
+        padded = np.pad(waveform.astype(np.float64), self.n_fft // 2, mode='reflect')
+        num_frames = 1 + (len(padded) - self.n_fft) // self.hop_length
+        frames = np.lib.stride_tricks.as_strided(
+            padded, shape=(num_frames, self.n_fft),
+            strides=(padded.strides[0] * self.hop_length, padded.strides[0])
+        )
+        power = np.abs(np.fft.rfft(frames * self.window, n=self.n_fft)) ** 2
+
+        mel_spec = np.maximum(1e-10, self.mel_filters.T @ power.T)
+        log_spec = np.log10(mel_spec)[:, :-1]
+        log_spec = np.maximum(log_spec, log_spec.max() - 8.0)
+        return ((log_spec + 4.0) / 4.0).astype(np.float32)
+
+    def __call__(self, audio: Any, sampling_rate: Optional[int] = None, return_tensors: str = "np", **kwargs) -> FeatureBatch:
+        """Compute a batch of features (a single waveform or a list of waveforms)"""
+        if sampling_rate is not None and sampling_rate != self.sampling_rate:
+            raise ValueError(f"Audio must be sampled at {self.sampling_rate} Hz, got {sampling_rate} Hz")
+        is_batched = isinstance(audio, (list, tuple)) and len(audio) > 0 and np.ndim(audio[0]) > 0
+        waveforms = audio if is_batched else [audio]
+        return FeatureBatch(np.stack([self.extract(waveform) for waveform in waveforms]))
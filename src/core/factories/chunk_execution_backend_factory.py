@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Chunk Execution Backend Factory
+Creates the thread or process backend used by chunked transcription
+"""
+
+import logging
+
+from src.core.logic.cpu_placement import plan_worker_placements
+from src.core.logic.thread_budget import get_thread_layout
+from src.core.services.chunk_execution_backends import (
+    ChunkExecutionBackend,
+    ThreadChunkExecutionBackend,
+    ProcessChunkExecutionBackend
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ChunkExecutionBackendFactory:
+    """Factory for creating chunk execution backends from configuration"""
+
+    SUPPORTED_BACKENDS = ('thread', 'process')
+
+    @staticmethod
+    def create_backend(config_manager) -> ChunkExecutionBackend:
+        """
+        Create the chunk execution backend selected in the chunking config
+        
+        Args:
+            config_manager: Configuration manager instance
+            
+        Returns:
+            ChunkExecutionBackend implementation
+        """
+        chunking = getattr(config_manager.config, 'chunking', None)
+        backend_name = str(getattr(chunking, 'execution_backend', None) or 'thread').lower()
+        # The thread budget caps chunk workers so concurrent decodes never exceed the cores
+        max_workers = get_thread_layout(config_manager).chunk_workers
+
+        if backend_name not in ChunkExecutionBackendFactory.SUPPORTED_BACKENDS:
+            logger.warning(f"⚠️ Unknown chunk execution backend '{backend_name}', using 'thread'")
+            backend_name = 'thread'
+
+        if backend_name == 'process':
+            start_method = getattr(chunking, 'process_start_method', None) or 'spawn'
+            backend = ProcessChunkExecutionBackend(config_manager, max_workers=max_workers, start_method=start_method,
+                                                   placements=plan_worker_placements(config_manager, max_workers))
+        else:
+            backend = ThreadChunkExecutionBackend(max_workers=max_workers)
+
+        logger.info(f"🔧 Chunk execution backend: {backend.get_backend_info()}")
+        return backend
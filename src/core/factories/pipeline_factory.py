@@ -3,13 +3,14 @@ Pipeline Factory
 Factory for creating appropriate processing pipelines based on operation type
 """
 
-from typing import Dict, Any, Type
+from typing import Dict, Any, Optional, Type
 from enum import Enum
 
 from src.core.processors.processing_pipeline import ProcessingPipeline
 from src.core.processors.audio_file_processor import AudioFileProcessor
 from src.core.processors.processing_pipeline import BatchProcessingPipeline, AudioFileProcessingPipeline
 from src.utils.config_manager import ConfigManager
+from src.utils.lazy_provider import LazyProvider
 from src.output_data import OutputManager
 
 
@@ -43,7 +44,8 @@ class PipelineFactory:
     @classmethod
     def create_pipeline(cls, pipeline_type: PipelineType, 
                        config_manager: ConfigManager, 
-                       output_manager: OutputManager) -> ProcessingPipeline:
+                       output_manager: OutputManager,
+                       transcription_orchestrator_provider: Optional[LazyProvider] = None) -> ProcessingPipeline:
         """
         Create a processing pipeline of the specified type with validation
         
@@ -51,6 +53,8 @@ class PipelineFactory:
             pipeline_type: Type of pipeline to create
             config_manager: Configuration manager instance
             output_manager: Output manager instance
+            transcription_orchestrator_provider: Orchestrator to transcribe with (e.g. the
+                application's, so a warmed-up engine is reused); None builds one per pipeline
             
         Returns:
             ProcessingPipeline instance
@@ -65,7 +69,9 @@ class PipelineFactory:
             pipeline_class = cls._pipelines[pipeline_type]
             # If the selected class is the abstract base, fallback to the concrete implementation
             if pipeline_class is AudioFileProcessingPipeline:
-                pipeline = AudioFileProcessor(config_manager, output_manager)
+                pipeline = AudioFileProcessor(config_manager, output_manager, transcription_orchestrator_provider)
+            elif issubclass(pipeline_class, BatchProcessingPipeline):
+                pipeline = pipeline_class(config_manager, output_manager, transcription_orchestrator_provider)
             else:
                 pipeline = pipeline_class(config_manager, output_manager)
             
@@ -98,16 +104,42 @@ class PipelineFactory:
         Returns:
             ProcessingPipeline instance
         """
-        # Map operation types to pipeline types
+        return cls.create_pipeline(cls._get_pipeline_type(operation_type), config_manager, output_manager)
+    
+    @classmethod
+    def create_pipeline_provider(cls, operation_type: str,
+                                 config_manager: ConfigManager,
+                                 output_manager: OutputManager,
+                                 transcription_orchestrator_provider: Optional[LazyProvider] = None) -> LazyProvider:
+        """
+        Create a provider that builds the pipeline for an operation on first use
+        
+        Args:
+            operation_type: Type of operation to perform
+            config_manager: Configuration manager instance
+            output_manager: Output manager instance
+            transcription_orchestrator_provider: Orchestrator the pipeline transcribes with
+            
+        Returns:
+            LazyProvider of a ProcessingPipeline instance
+        """
+        pipeline_type = cls._get_pipeline_type(operation_type)
+        return LazyProvider(
+            lambda: cls.create_pipeline(pipeline_type, config_manager, output_manager,
+                                        transcription_orchestrator_provider),
+            name=f"{pipeline_type.value} pipeline"
+        )
+    
+    @staticmethod
+    def _get_pipeline_type(operation_type: str) -> PipelineType:
+        """Map an operation type to its pipeline type"""
         operation_to_pipeline = {
             'single_file_processing': PipelineType.AUDIO_FILE,
             'audio_transcription': PipelineType.AUDIO_FILE,
             'batch_processing': PipelineType.BATCH,
             'batch': PipelineType.BATCH,
         }
-        
-        pipeline_type = operation_to_pipeline.get(operation_type, PipelineType.AUDIO_FILE)
-        return cls.create_pipeline(pipeline_type, config_manager, output_manager)
+        return operation_to_pipeline.get(operation_type, PipelineType.AUDIO_FILE)
     
     @classmethod
     def register_pipeline(cls, pipeline_type: PipelineType, 
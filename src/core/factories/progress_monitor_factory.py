@@ -3,15 +3,20 @@
 Factory for creating progress monitors based on configuration
 """
 
+import os
+
 from src.utils.config_manager import ConfigManager
 from src.core.interfaces.transcription_protocols import ProgressMonitorProtocol
-from src.core.models.simple_progress_monitor import SimpleProgressMonitor
-from src.core.models.advanced_progress_monitor import AdvancedProgressMonitor
+from src.logging.progress_monitor import (
+    ProgressMonitor, ProgressMetricsExporter, StatusFileWriter, TerminalProgressRenderer
+)
 
 
 class ProgressMonitorFactory:
     """Factory for creating progress monitors based on configuration"""
 
+    STATUS_FILE_NAME = "transcription_status.json"
+
     @staticmethod
     def create_monitor(config_manager: ConfigManager) -> ProgressMonitorProtocol:
         """
@@ -24,9 +29,12 @@ class ProgressMonitorFactory:
             ProgressMonitorProtocol implementation
         """
         config = config_manager.config
+        subscribers = [ProgressMetricsExporter()]
 
-        # Check if advanced progress monitoring is enabled
+        # Advanced monitoring adds the terminal view and a pollable status file
         if hasattr(config, 'system') and config.system and getattr(config.system, 'advanced_monitoring', False):
-            return AdvancedProgressMonitor(config_manager)
-        else:
-            return SimpleProgressMonitor(config_manager)
+            temp_dir = config_manager.get_directory_paths().get('temp_dir', 'output/temp')
+            subscribers.append(TerminalProgressRenderer())
+            subscribers.append(StatusFileWriter(os.path.join(temp_dir, ProgressMonitorFactory.STATUS_FILE_NAME)))
+
+        return ProgressMonitor(subscribers=subscribers)
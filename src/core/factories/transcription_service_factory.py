@@ -4,10 +4,11 @@ Factory for creating transcription services based on configuration
 Follows Factory Pattern and Dependency Injection principles
 """
 
+from typing import Optional
+
 from src.core.interfaces.transcription_protocols import TranscriptionServiceProtocol
-from src.core.models.basic_transcription_service import BasicTranscriptionService
-from src.core.models.enhanced_transcription_service import EnhancedTranscriptionService
 from src.core.factories.engine_selection_factory import EngineSelectionStrategyFactory
+from src.utils.lazy_provider import LazyProvider
 
 
 class TranscriptionServiceFactory:
@@ -26,6 +27,9 @@ class TranscriptionServiceFactory:
         Returns:
             TranscriptionServiceProtocol implementation
         """
+        from src.core.models.basic_transcription_service import BasicTranscriptionService
+        from src.core.models.enhanced_transcription_service import EnhancedTranscriptionService
+
         config = config_manager.config
 
         # Create engine selection strategy
@@ -49,3 +53,24 @@ class TranscriptionServiceFactory:
                 transcription_engine,
                 engine_selection_strategy
             )
+
+    @staticmethod
+    def create_service_provider(config_manager, output_manager,
+                                engine_provider: Optional[LazyProvider] = None) -> LazyProvider:
+        """
+        Create a provider that builds the transcription service on first use
+
+        Args:
+            config_manager: Configuration manager instance
+            output_manager: Output manager instance
+            engine_provider: Provider of the transcription engine to inject
+
+        Returns:
+            LazyProvider of a TranscriptionServiceProtocol implementation
+        """
+        return LazyProvider(
+            lambda: TranscriptionServiceFactory.create_service(
+                config_manager, output_manager, engine_provider.get() if engine_provider else None
+            ),
+            name="transcription service"
+        )
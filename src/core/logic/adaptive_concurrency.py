@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Adaptive Concurrency
+AIMD controller that sizes the number of active workers from observed
+throughput, per-job latency, CPU oversubscription and memory pressure
+"""
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from src.core.logic.memory_governor import MemoryGovernor, MemoryPressure
+
+logger = logging.getLogger(__name__)
+
+# Completions per evaluation window
+DEFAULT_WINDOW_SIZE = 4
+# Latency above the best observed latency times this factor counts as degradation
+DEFAULT_LATENCY_TOLERANCE = 1.5
+DEFAULT_DECREASE_FACTOR = 0.7
+# Runnable threads per core above which the CPU counts as oversubscribed
+DEFAULT_LOAD_THRESHOLD = 1.0
+# Relative throughput gain that justifies another worker
+THROUGHPUT_GAIN = 0.05
+# Windows without a change before probing one more worker, in case capacity was freed
+PROBE_AFTER_HOLDS = 5
+# Per-window growth of the latency baseline, so it follows lasting changes
+BASELINE_AGING = 1.02
+
+
+def read_system_load() -> Optional[float]:
+    """
+    Runnable threads per core
+
+    Uses the one-minute load average, which unlike utilization keeps rising
+    above 1 once more threads want a core than there are cores, falling back
+    to psutil's utilization since the previous call.
+
+    Returns:
+        Load per core, or None if it cannot be determined
+    """
+    try:
+        return os.getloadavg()[0] / (os.cpu_count() or 1)
+    except (OSError, AttributeError):
+        pass
+    try:
+        import psutil
+        return psutil.cpu_percent(interval=None) / 100.0
+    except Exception:
+        return None
+
+
+@dataclass
+class ConcurrencyDecision:
+    """One limit adjustment"""
+    limit: int
+    action: str
+    reason: str
+    throughput: float
+    latency: float
+    timestamp: float
+
+
+class AdaptiveConcurrencyController:
+    """
+    Additive-increase, multiplicative-decrease control of active workers
+
+    Workers take a slot before each job and report the job's latency when
+    they give it back, normalized by the audio seconds it covered, so long
+    and short files compare. Every window of completions the controller
+    compares the window's throughput and latency with earlier windows:
+    throughput that improved earns one more slot; latency beyond the best
+    seen latency or memory pressure cut the limit by the decrease factor;
+    otherwise the limit holds, with an occasional probe upward in case
+    other tenants left. CPU-bound workers keep every core busy by design, so
+    a busy CPU alone is not degradation: an oversubscribed CPU cuts the
+    limit only when throughput fell with it, and only stops the probing
+    otherwise. Extra workers only wait for a slot, so a pool can be sized
+    for the ceiling.
+    """
+
+    def __init__(self, max_limit: int, min_limit: int = 1, initial_limit: Optional[int] = None,
+                 window_size: int = DEFAULT_WINDOW_SIZE, decrease_factor: float = DEFAULT_DECREASE_FACTOR,
+                 latency_tolerance: float = DEFAULT_LATENCY_TOLERANCE, load_threshold: float = DEFAULT_LOAD_THRESHOLD,
+                 memory_governor: Optional[MemoryGovernor] = None,
+                 load_reader: Callable[[], Optional[float]] = read_system_load,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize controller
+
+        Args:
+            max_limit: Most concurrent jobs
+            min_limit: Fewest concurrent jobs
+            initial_limit: Starting limit (defaults to half the maximum)
+            window_size: Completions per evaluation
+            decrease_factor: Multiplier applied on degradation
+            latency_tolerance: Allowed latency relative to the best window
+            load_threshold: Load per core that counts as oversubscribed
+            memory_governor: Source of memory pressure (none checks no memory)
+            load_reader: Returns the load per core
+            clock: Monotonic time source
+        """
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.limit = max(self.min_limit, min(self.max_limit, initial_limit or max(1, self.max_limit // 2)))
+        self.window_size = max(1, window_size)
+        self.decrease_factor = min(0.95, max(0.1, decrease_factor))
+        self.latency_tolerance = max(1.0, latency_tolerance)
+        self.load_threshold = load_threshold
+        self.memory_governor = memory_governor
+        self.load_reader = load_reader
+        self.clock = clock
+
+        self._condition = threading.Condition()
+        self._active = 0
+        self._window_latencies: List[float] = []
+        self._window_work = 0.0
+        self._window_started = clock()
+        self._previous_throughput: Optional[float] = None
+        self._baseline_latency: Optional[float] = None
+        self._holds = 0
+        self.decisions: List[ConcurrencyDecision] = []
+        self.stats: Dict[str, Any] = {'completed': 0, 'increases': 0, 'decreases': 0, 'peak_active': 0}
+        if self.load_reader is not None:
+            # Starts psutil's utilization interval
+            self.load_reader()
+        logger.info(f"🎚️ Adaptive concurrency: starting at {self.limit} of {self.max_limit} workers")
+
+    def acquire(self) -> float:
+        """
+        Wait for a free slot under the current limit
+
+        Returns:
+            Start time to pass to release()
+        """
+        with self._condition:
+            while self._active >= self.limit:
+                self._condition.wait()
+            self._active += 1
+            self.stats['peak_active'] = max(self.stats['peak_active'], self._active)
+        return self.clock()
+
+    def try_acquire(self) -> Optional[float]:
+        """
+        Take a slot only if one is free under the current limit
+
+        For callers that cannot block because they release slots themselves.
+
+        Returns:
+            Start time to pass to release(), or None if the limit is reached
+        """
+        with self._condition:
+            if self._active >= self.limit:
+                return None
+            self._active += 1
+            self.stats['peak_active'] = max(self.stats['peak_active'], self._active)
+        return self.clock()
+
+    def release(self, started: float, work_units: float = 1.0, success: bool = True) -> None:
+        """
+        Give back a slot and record the job
+
+        Args:
+            started: Value returned by acquire()
+            work_units: Size of the job (audio seconds, or 1 per job)
+            success: Failed jobs free their slot but are not measured
+        """
+        latency = self.clock() - started
+        with self._condition:
+            self._active = max(0, self._active - 1)
+            if success and work_units > 0:
+                self.stats['completed'] += 1
+                self._window_latencies.append(latency / work_units)
+                self._window_work += work_units
+                if len(self._window_latencies) >= self.window_size:
+                    self._evaluate_window()
+            self._condition.notify_all()
+
+    @contextmanager
+    def slot(self, work_units: float = 1.0) -> Iterator[None]:
+        """Hold a slot for the duration of a job"""
+        started = self.acquire()
+        success = False
+        try:
+            yield
+            success = True
+        finally:
+            self.release(started, work_units, success)
+
+    def _evaluate_window(self) -> None:
+        """Adjust the limit from the finished window (called with the lock held)"""
+        now = self.clock()
+        elapsed = max(1e-6, now - self._window_started)
+        throughput = self._window_work / elapsed
+        latencies = sorted(self._window_latencies)
+        latency = latencies[len(latencies) // 2]
+        self._window_latencies = []
+        self._window_work = 0.0
+        self._window_started = now
+
+        if self._baseline_latency is None:
+            self._baseline_latency = latency
+        else:
+            self._baseline_latency = min(latency, self._baseline_latency * BASELINE_AGING)
+
+        load = self.load_reader() if self.load_reader is not None else None
+        oversubscribed = load is not None and load >= self.load_threshold
+        reason = self._degradation_reason(latency, throughput, load if oversubscribed else None)
+        if reason:
+            self._set_limit(max(self.min_limit, int(self.limit * self.decrease_factor)), 'decrease', reason,
+                            throughput, latency, now)
+        elif self._previous_throughput is None or throughput >= self._previous_throughput * (1 + THROUGHPUT_GAIN):
+            self._set_limit(min(self.max_limit, self.limit + 1), 'increase', 'throughput improved',
+                            throughput, latency, now)
+        elif not oversubscribed and self._holds + 1 >= PROBE_AFTER_HOLDS:
+            self._set_limit(min(self.max_limit, self.limit + 1), 'increase', 'probing for capacity',
+                            throughput, latency, now)
+        else:
+            self._holds += 1
+        self._previous_throughput = throughput
+
+    def _degradation_reason(self, latency: float, throughput: float,
+                            oversubscribed_load: Optional[float]) -> Optional[str]:
+        if self.memory_governor is not None and self.memory_governor.get_pressure() != MemoryPressure.NORMAL:
+            return 'memory pressure'
+        # More runnable threads than cores only hurts once it costs throughput
+        if (oversubscribed_load is not None and self._previous_throughput is not None
+                and throughput < self._previous_throughput * (1 - THROUGHPUT_GAIN)):
+            return f"CPU oversubscribed ({oversubscribed_load:.1f} runnable per core) and throughput fell"
+        if latency > self._baseline_latency * self.latency_tolerance:
+            return f"latency {latency / self._baseline_latency:.1f}x the best window"
+        return None
+
+    def _set_limit(self, limit: int, action: str, reason: str, throughput: float, latency: float, now: float) -> None:
+        self._holds = 0
+        if limit == self.limit:
+            return
+        logger.info(f"🎚️ Concurrency {self.limit} → {limit}: {reason}")
+        self.limit = limit
+        self.stats['increases' if action == 'increase' else 'decreases'] += 1
+        self.decisions.append(ConcurrencyDecision(limit, action, reason, throughput, latency, now))
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._condition:
+            return {**self.stats, 'limit': self.limit, 'max_limit': self.max_limit}
+
+
+def create_adaptive_concurrency(config_manager: Any, max_limit: int,
+                                initial_limit: Optional[int] = None) -> Optional[AdaptiveConcurrencyController]:
+    """
+    Create a controller if batch.adaptive_concurrency is enabled
+
+    Args:
+        config_manager: Configuration manager (system.memory_* limits feed the memory governor)
+        max_limit: Most concurrent jobs
+        initial_limit: Starting limit
+
+    Returns:
+        AdaptiveConcurrencyController, or None when disabled
+    """
+    batch = getattr(getattr(config_manager, 'config', None), 'batch', None)
+    if getattr(batch, 'adaptive_concurrency', False) is not True:
+        return None
+    return AdaptiveConcurrencyController(max_limit, initial_limit=initial_limit,
+                                         memory_governor=MemoryGovernor(config_manager))
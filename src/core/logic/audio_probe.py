@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""
+Audio Probe
+Reads audio header metadata once and caches it per file version
+"""
+
+import logging
+import os
+import struct
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Any, BinaryIO, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# MPEG audio lookup tables indexed by [version][layer]
+_MP3_BITRATES = {
+    (1, 1): [0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448],
+    (1, 2): [0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384],
+    (1, 3): [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    (2, 1): [0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256],
+    (2, 2): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+    (2, 3): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+_MP3_SAMPLE_RATES = {1: [44100, 48000, 32000], 2: [22050, 24000, 16000], 2.5: [11025, 12000, 8000]}
+
+_WAV_CODECS = {1: 'pcm', 3: 'pcm_float', 6: 'alaw', 7: 'ulaw', 0xFFFE: 'pcm'}
+
+
+@dataclass
+class AudioMetadata:
+    """Header metadata of an audio file"""
+    file_path: str
+    file_size: int
+    mtime: float
+    duration: Optional[float] = None
+    sample_rate: Optional[int] = None
+    channels: Optional[int] = None
+    codec: Optional[str] = None
+    bit_depth: Optional[int] = None
+    probe_method: str = "header"
+
+    @property
+    def has_duration(self) -> bool:
+        """Whether the duration is known"""
+        return self.duration is not None and self.duration > 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert metadata to a dictionary"""
+        return asdict(self)
+
+
+class AudioProbe:
+    """
+    Cheap audio metadata reader shared by validation, routing and strategies
+
+    WAV, FLAC, MP3 and MP4/M4A headers are parsed directly (a few KB read,
+    no decoding). Other containers fall back to soundfile and finally librosa.
+    Results are cached by (path, mtime, size), so a modified file is re-probed.
+    """
+
+    def __init__(self, max_cache_entries: int = 1024):
+        """
+        Initialize audio probe
+
+        Args:
+            max_cache_entries: Maximum number of cached probe results
+        """
+        self.max_cache_entries = max_cache_entries
+        self._cache: 'OrderedDict[Tuple[str, float, int], Optional[AudioMetadata]]' = OrderedDict()
+        self._lock = threading.RLock()
+        self.stats: Dict[str, int] = {'probes': 0, 'cache_hits': 0, 'failures': 0}
+
+    def probe(self, file_path: str) -> Optional[AudioMetadata]:
+        """
+        Get metadata of an audio file
+
+        Args:
+            file_path: Path to the audio file
+
+        Returns:
+            AudioMetadata, or None if the file is missing or unreadable
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+
+        cache_key = (os.path.abspath(file_path), stat.st_mtime, stat.st_size)
+        with self._lock:
+            if cache_key in self._cache:
+                self._cache.move_to_end(cache_key)
+                self.stats['cache_hits'] += 1
+                return self._cache[cache_key]
+
+        metadata = self._probe_file(file_path, stat.st_size, stat.st_mtime)
+
+        with self._lock:
+            self.stats['probes'] += 1
+            if metadata is None:
+                self.stats['failures'] += 1
+            self._cache[cache_key] = metadata
+            while len(self._cache) > self.max_cache_entries:
+                self._cache.popitem(last=False)
+        return metadata
+
+    def get_duration(self, file_path: str) -> Optional[float]:
+        """
+        Get the duration of an audio file in seconds
+
+        Returns:
+            Duration, or None if it cannot be determined
+        """
+        metadata = self.probe(file_path)
+        return metadata.duration if metadata and metadata.has_duration else None
+
+    def clear_cache(self) -> None:
+        """Drop all cached probe results"""
+        with self._lock:
+            self._cache.clear()
+
+    def _probe_file(self, file_path: str, file_size: int, mtime: float) -> Optional[AudioMetadata]:
+        """Probe a file with the header parsers, then library fallbacks"""
+        metadata = AudioMetadata(file_path=str(file_path), file_size=file_size, mtime=mtime)
+        try:
+            with open(file_path, 'rb') as f:
+                head = f.read(12)
+                f.seek(0)
+                parser = self._select_header_parser(head)
+                if parser and parser(f, metadata) and metadata.has_duration:
+                    return metadata
+        except (OSError, struct.error, ValueError, IndexError) as e:
+            logger.debug(f"Header probe failed for {file_path}: {e}")
+
+        for fallback in (self._probe_with_soundfile, self._probe_with_librosa):
+            try:
+                if fallback(file_path, metadata):
+                    return metadata
+            except Exception as e:
+                logger.debug(f"{fallback.__name__} failed for {file_path}: {e}")
+
+        # Header fields without a duration are still useful to validation
+        return metadata if metadata.codec else None
+
+    def _select_header_parser(self, head: bytes):
+        """Pick the header parser matching the file signature"""
+        if head[:4] in (b'RIFF', b'RF64') and head[8:12] == b'WAVE':
+            return self._parse_wav
+        if head[:4] == b'fLaC':
+            return self._parse_flac
+        if head[4:8] == b'ftyp':
+            return self._parse_mp4
+        if head[:3] == b'ID3' or (len(head) > 1 and head[0] == 0xFF and head[1] & 0xE0 == 0xE0):
+            return self._parse_mp3
+        return None
+
+    def _parse_wav(self, f: BinaryIO, metadata: AudioMetadata) -> bool:
+        """Parse RIFF/WAVE fmt and data chunk headers"""
+        f.seek(12)
+        byte_rate = None
+        while True:
+            chunk_header = f.read(8)
+            if len(chunk_header) < 8:
+                break
+            chunk_id, chunk_size = struct.unpack('<4sI', chunk_header)
+            if chunk_id == b'fmt ':
+                fmt = f.read(chunk_size)
+                format_tag, channels, sample_rate, byte_rate, _, bits = struct.unpack('<HHIIHH', fmt[:16])
+                metadata.codec = _WAV_CODECS.get(format_tag, f"wav_0x{format_tag:04x}")
+                metadata.channels = channels
+                metadata.sample_rate = sample_rate
+                metadata.bit_depth = bits
+                if chunk_size % 2:
+                    f.seek(1, os.SEEK_CUR)
+                continue
+            if chunk_id == b'data':
+                data_size = chunk_size
+                if data_size in (0, 0xFFFFFFFF):
+                    # Streamed or RF64 files: the data runs to the end of the file
+                    data_size = metadata.file_size - f.tell()
+                if byte_rate:
+                    metadata.duration = data_size / byte_rate
+                break
+            f.seek(chunk_size + (chunk_size % 2), os.SEEK_CUR)
+        return metadata.codec is not None
+
+    def _parse_flac(self, f: BinaryIO, metadata: AudioMetadata) -> bool:
+        """Parse the FLAC STREAMINFO block"""
+        f.seek(4)
+        block_header = f.read(4)
+        if len(block_header) < 4 or block_header[0] & 0x7F != 0:
+            return False
+        info = f.read(34)
+        if len(info) < 34:
+            return False
+        packed = int.from_bytes(info[10:18], 'big')
+        sample_rate = packed >> 44
+        channels = ((packed >> 41) & 0x7) + 1
+        bits = ((packed >> 36) & 0x1F) + 1
+        total_samples = packed & 0xFFFFFFFFF
+
+        metadata.codec = 'flac'
+        metadata.sample_rate = sample_rate
+        metadata.channels = channels
+        metadata.bit_depth = bits
+        if sample_rate and total_samples:
+            metadata.duration = total_samples / sample_rate
+        return True
+
+    def _parse_mp3(self, f: BinaryIO, metadata: AudioMetadata) -> bool:
+        """Parse the first MPEG frame and its Xing/Info or VBRI header"""
+        audio_start = 0
+        tag_header = f.read(10)
+        if tag_header[:3] == b'ID3' and len(tag_header) == 10:
+            size_bytes = tag_header[6:10]
+            tag_size = (size_bytes[0] << 21) | (size_bytes[1] << 14) | (size_bytes[2] << 7) | size_bytes[3]
+            audio_start = 10 + tag_size + (10 if tag_header[5] & 0x10 else 0)
+
+        f.seek(audio_start)
+        window = f.read(64 * 1024)
+        for offset in range(len(window) - 4):
+            if window[offset] != 0xFF or window[offset + 1] & 0xE0 != 0xE0:
+                continue
+            frame = self._parse_mp3_frame_header(window[offset:offset + 4])
+            if frame is None:
+                continue
+
+            version, layer, bitrate, sample_rate, channels = frame
+            samples_per_frame = 384 if layer == 1 else (1152 if layer == 2 or version == 1 else 576)
+            metadata.codec = f"mp{layer}" if layer != 3 else 'mp3'
+            metadata.sample_rate = sample_rate
+            metadata.channels = channels
+
+            frame_bytes = window[offset:offset + 200]
+            side_info = (32 if channels == 2 else 17) if version == 1 else (17 if channels == 2 else 9)
+            xing_offset = 4 + side_info
+            frame_count = None
+            tag = frame_bytes[xing_offset:xing_offset + 4]
+            if tag in (b'Xing', b'Info'):
+                flags = struct.unpack('>I', frame_bytes[xing_offset + 4:xing_offset + 8])[0]
+                if flags & 0x1:
+                    frame_count = struct.unpack('>I', frame_bytes[xing_offset + 8:xing_offset + 12])[0]
+            elif frame_bytes[36:40] == b'VBRI':
+                frame_count = struct.unpack('>I', frame_bytes[50:54])[0]
+
+            if frame_count:
+                metadata.duration = frame_count * samples_per_frame / sample_rate
+            elif bitrate:
+                # Constant bitrate: size of the audio payload over the bitrate
+                audio_bytes = metadata.file_size - (audio_start + offset)
+                if self._has_id3v1_tag(f, metadata.file_size):
+                    audio_bytes -= 128
+                metadata.duration = audio_bytes * 8 / (bitrate * 1000)
+            return True
+        return False
+
+    def _parse_mp3_frame_header(self, header: bytes) -> Optional[Tuple[float, int, int, int, int]]:
+        """Decode an MPEG audio frame header into (version, layer, kbps, sample_rate, channels)"""
+        if len(header) < 4:
+            return None
+        version_bits = (header[1] >> 3) & 0x3
+        layer_bits = (header[1] >> 1) & 0x3
+        bitrate_index = header[2] >> 4
+        sample_rate_index = (header[2] >> 2) & 0x3
+        if version_bits == 1 or layer_bits == 0 or bitrate_index == 0xF or sample_rate_index == 3:
+            return None
+
+        version = {3: 1, 2: 2, 0: 2.5}[version_bits]
+        layer = 4 - layer_bits
+        bitrate = _MP3_BITRATES[(1 if version == 1 else 2, layer)][bitrate_index]
+        sample_rate = _MP3_SAMPLE_RATES[version][sample_rate_index]
+        channels = 1 if (header[3] >> 6) == 3 else 2
+        return version, layer, bitrate, sample_rate, channels
+
+    def _has_id3v1_tag(self, f: BinaryIO, file_size: int) -> bool:
+        """Check for a trailing 128-byte ID3v1 tag"""
+        if file_size < 128:
+            return False
+        f.seek(file_size - 128)
+        return f.read(3) == b'TAG'
+
+    def _parse_mp4(self, f: BinaryIO, metadata: AudioMetadata) -> bool:
+        """Parse the moov box (mvhd duration and first audio sample description)"""
+        moov = self._find_box(f, 0, metadata.file_size, b'moov')
+        if moov is None:
+            return False
+        moov_start, moov_end = moov
+        f.seek(moov_start)
+        moov_data = f.read(moov_end - moov_start)
+
+        mvhd = self._find_box_in_bytes(moov_data, b'mvhd')
+        if mvhd is not None:
+            version = mvhd[0]
+            if version == 1:
+                timescale, duration = struct.unpack('>IQ', mvhd[20:32])
+            else:
+                timescale, duration = struct.unpack('>II', mvhd[12:20])
+            if timescale:
+                metadata.duration = duration / timescale
+
+        metadata.codec = 'mp4'
+        stsd = self._find_box_in_bytes(moov_data, b'stsd', nested=(b'trak', b'mdia', b'minf', b'stbl'))
+        if stsd is not None and len(stsd) >= 44:
+            # Full box header + entry count, then an AudioSampleEntry
+            entry = stsd[8:]
+            metadata.codec = entry[4:8].decode('latin-1').strip() or 'mp4'
+            metadata.channels = struct.unpack('>H', entry[24:26])[0]
+            metadata.bit_depth = struct.unpack('>H', entry[26:28])[0] or None
+            metadata.sample_rate = struct.unpack('>I', entry[32:36])[0] >> 16
+        return True
+
+    def _find_box(self, f: BinaryIO, start: int, end: int, box_type: bytes) -> Optional[Tuple[int, int]]:
+        """Find a top-level box in a file and return its payload range"""
+        position = start
+        while position + 8 <= end:
+            f.seek(position)
+            header = f.read(16)
+            if len(header) < 8:
+                return None
+            size, found_type = struct.unpack('>I4s', header[:8])
+            header_size = 8
+            if size == 1:
+                size = struct.unpack('>Q', header[8:16])[0]
+                header_size = 16
+            elif size == 0:
+                size = end - position
+            if size < header_size:
+                return None
+            if found_type == box_type:
+                return position + header_size, position + size
+            position += size
+        return None
+
+    def _find_box_in_bytes(self, data: bytes, box_type: bytes, nested: Tuple[bytes, ...] = ()) -> Optional[bytes]:
+        """Find a box payload within an in-memory container, descending through nested boxes"""
+        position = 0
+        path = list(nested)
+        while position + 8 <= len(data):
+            size, found_type = struct.unpack('>I4s', data[position:position + 8])
+            if size < 8:
+                return None
+            payload = data[position + 8:position + size]
+            if path and found_type == path[0]:
+                found = self._find_box_in_bytes(payload, box_type, tuple(path[1:]))
+                if found is not None:
+                    return found
+            elif not path and found_type == box_type:
+                return payload
+            position += size
+        return None
+
+    def _probe_with_soundfile(self, file_path: str, metadata: AudioMetadata) -> bool:
+        """Fallback probe via libsndfile headers"""
+        import soundfile as sf
+
+        info = sf.info(file_path)
+        metadata.duration = float(info.duration)
+        metadata.sample_rate = int(info.samplerate)
+        metadata.channels = int(info.channels)
+        metadata.codec = metadata.codec or str(info.format).lower()
+        metadata.probe_method = "soundfile"
+        return metadata.has_duration
+
+    def _probe_with_librosa(self, file_path: str, metadata: AudioMetadata) -> bool:
+        """Last-resort probe via librosa (may decode the file)"""
+        import librosa
+
+        metadata.duration = float(librosa.get_duration(path=file_path))
+        metadata.probe_method = "librosa"
+        return metadata.has_duration
+
+
+_audio_probe: Optional[AudioProbe] = None
+_audio_probe_lock = threading.Lock()
+
+
+def get_audio_probe() -> AudioProbe:
+    """Get the process-wide audio probe"""
+    global _audio_probe
+    if _audio_probe is None:
+        with _audio_probe_lock:
+            if _audio_probe is None:
+                _audio_probe = AudioProbe()
+    return _audio_probe
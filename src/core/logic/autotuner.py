@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""
+Autotuner
+Benchmarks short decodes over a small grid of thread, worker and beam settings
+on the current host and writes the fastest as a host profile
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.core.logic.memory_governor import read_memory_limit_bytes, read_rss_bytes
+from src.core.logic.thread_budget import _read_option, detect_available_cores
+from src.utils.atomic_file_writer import write_json_atomically
+from src.utils.host_profile import HOST_PROFILE_METADATA_KEY, HOST_PROFILE_PREFIX, host_fingerprint, host_profile_filename
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+WINDOW_SECONDS = 30
+
+# BatchConfig and the thread budget never run more workers than this
+MAX_WORKERS = 16
+
+
+@dataclass(frozen=True)
+class AutotuneCandidate:
+    """One point of the tuning grid"""
+    workers: int
+    intra_threads: int
+    beam_size: int
+
+    @property
+    def inter_threads(self) -> int:
+        """Concurrent decodes share one model, so each worker gets a CTranslate2 replica slot"""
+        return self.workers
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'workers': self.workers, 'intra_threads': self.intra_threads,
+                'inter_threads': self.inter_threads, 'beam_size': self.beam_size}
+
+
+@dataclass
+class AutotuneMeasurement:
+    """Result of benchmarking one candidate"""
+    candidate: AutotuneCandidate
+    audio_seconds: float = 0.0
+    wall_seconds: float = 0.0
+    peak_rss_mb: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def throughput(self) -> float:
+        """Seconds of audio decoded per wall-clock second"""
+        return self.audio_seconds / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = {**self.candidate.to_dict(), 'throughput': round(self.throughput, 3),
+                  'wall_seconds': round(self.wall_seconds, 3), 'peak_rss_mb': round(self.peak_rss_mb, 1)}
+        if self.error:
+            result['error'] = self.error
+        return result
+
+
+def build_autotune_grid(total_cores: int, worker_counts: Optional[Sequence[int]] = None,
+                        beam_sizes: Sequence[int] = (5,)) -> List[AutotuneCandidate]:
+    """
+    Build the tuning grid
+
+    Each worker count gets an equal share of the cores as CTranslate2 intra threads.
+    Candidates are ordered by worker count so a benchmark reloads the model only
+    when the thread settings change.
+
+    Args:
+        total_cores: Cores available to the process
+        worker_counts: Concurrent decodes to try (defaults to powers of two up to the core count)
+        beam_sizes: Beam sizes to try
+
+    Returns:
+        List of AutotuneCandidate
+    """
+    total_cores = max(1, total_cores)
+    if worker_counts is None:
+        worker_counts = [1]
+        while worker_counts[-1] * 2 <= min(total_cores, MAX_WORKERS):
+            worker_counts.append(worker_counts[-1] * 2)
+    workers = sorted({min(max(1, count), total_cores, MAX_WORKERS) for count in worker_counts})
+    return [AutotuneCandidate(workers=count, intra_threads=max(1, total_cores // count), beam_size=beam)
+            for count in workers for beam in sorted(set(beam_sizes))]
+
+
+class PeakRssSampler:
+    """Samples the process RSS on a background thread and keeps the peak"""
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.peak_bytes = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample(self) -> None:
+        while True:
+            self.peak_bytes = max(self.peak_bytes, read_rss_bytes())
+            if self._stop.wait(self.interval):
+                break
+
+    def __enter__(self) -> 'PeakRssSampler':
+        self.peak_bytes = read_rss_bytes()
+        self._thread = threading.Thread(target=self._sample, name="rss-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.peak_bytes = max(self.peak_bytes, read_rss_bytes())
+
+    @property
+    def peak_mb(self) -> float:
+        return self.peak_bytes / (1024 * 1024)
+
+
+def synthetic_speech(seconds: float = WINDOW_SECONDS, seed: int = 0) -> np.ndarray:
+    """
+    Generate a speech-like test signal
+
+    Voiced harmonics with a wandering pitch, syllable-rate amplitude modulation
+    and background noise. The encoder cost matches real audio; the decoder may
+    stop earlier than on real speech, so sample audio gives more faithful results.
+
+    Returns:
+        float32 waveform at 16 kHz
+    """
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    pitch = 140 + 40 * np.sin(2 * np.pi * 0.7 * t) + 15 * np.sin(2 * np.pi * 3.1 * t)
+    phase = 2 * np.pi * np.cumsum(pitch) / SAMPLE_RATE
+    voiced = sum(np.sin(harmonic * phase) / harmonic for harmonic in range(1, 8))
+    envelope = np.clip(np.sin(2 * np.pi * 4.0 * t + rng.uniform(0, np.pi)), 0, None) ** 2
+    signal = voiced * envelope + 0.02 * rng.standard_normal(len(t))
+    return (0.3 * signal / np.max(np.abs(signal))).astype(np.float32)
+
+
+def load_benchmark_audio(audio_path: Optional[str] = None) -> Tuple[np.ndarray, str]:
+    """
+    Load one 30 second window of benchmark audio
+
+    Args:
+        audio_path: Sample audio file (synthetic audio is used when None)
+
+    Returns:
+        Tuple of (16 kHz mono float32 waveform, description of the source)
+    """
+    if audio_path is None:
+        return synthetic_speech(), 'synthetic'
+    import librosa
+    audio, _ = librosa.load(audio_path, sr=SAMPLE_RATE, mono=True, duration=WINDOW_SECONDS)
+    return audio.astype(np.float32), os.path.basename(audio_path)
+
+
+class CT2DecodeBenchmark:
+    """
+    Times concurrent decodes of one audio window with a CTranslate2 Whisper model
+
+    The model is reloaded whenever a candidate needs different thread settings,
+    since CTranslate2 fixes intra/inter threads at load time.
+    """
+
+    def __init__(self, model_path: str, audio: np.ndarray, device: str = 'cpu', compute_type: str = 'float32',
+                 language: str = 'he', max_length: int = 128, windows_per_worker: int = 2):
+        """
+        Initialize benchmark
+
+        Args:
+            model_path: CTranslate2 Whisper model directory
+            audio: 16 kHz waveform of one window
+            device: CTranslate2 device
+            compute_type: CTranslate2 compute type
+            language: Decoding language
+            max_length: Token limit per decode (keeps runs short and comparable)
+            windows_per_worker: Windows each worker decodes per measurement
+        """
+        self.model_path = model_path
+        self.audio = audio
+        self.device = device
+        self.compute_type = compute_type
+        self.max_length = max_length
+        self.windows_per_worker = windows_per_worker
+        self.prompt = ['<|startoftranscript|>', f'<|{language}|>', '<|transcribe|>', '<|notimestamps|>']
+        self._model = None
+        self._model_threads: Optional[Tuple[int, int]] = None
+        self._features = None
+
+    def _load(self, intra_threads: int, inter_threads: int) -> Any:
+        if self._model_threads == (intra_threads, inter_threads):
+            return self._model
+        import ctranslate2
+        from ctranslate2.models import Whisper
+        from src.core.engines.utilities.whisper_feature_extractor import WhisperFeatureExtractorNumpy
+
+        self._model = None
+        self._model = Whisper(self.model_path, device=self.device, compute_type=self.compute_type,
+                              intra_threads=intra_threads, inter_threads=inter_threads)
+        self._model_threads = (intra_threads, inter_threads)
+
+        if self._features is None:
+            try:
+                extractor = WhisperFeatureExtractorNumpy.from_pretrained(self.model_path)
+            except OSError:
+                extractor = WhisperFeatureExtractorNumpy(feature_size=getattr(self._model, 'n_mels', 80))
+            features = np.ascontiguousarray(extractor.extract(self.audio)[np.newaxis, :, :])
+            self._features = ctranslate2.StorageView.from_array(features)
+        return self._model
+
+    def __call__(self, candidate: AutotuneCandidate) -> Tuple[float, float]:
+        """
+        Decode workers × windows_per_worker windows with the candidate's settings
+
+        Returns:
+            Tuple of (audio seconds decoded, wall seconds)
+        """
+        model = self._load(candidate.intra_threads, candidate.inter_threads)
+        # Untimed decode so lazy initialization is not billed to the candidate
+        model.generate(self._features, prompts=[self.prompt], beam_size=1, max_length=len(self.prompt) + 4)
+
+        windows = candidate.workers * self.windows_per_worker
+        started = time.time()
+        with ThreadPoolExecutor(max_workers=candidate.workers, thread_name_prefix="autotune") as executor:
+            futures = [executor.submit(model.generate, self._features, prompts=[self.prompt],
+                                       beam_size=candidate.beam_size, max_length=self.max_length)
+                       for _ in range(windows)]
+            for future in futures:
+                future.result()
+        return windows * len(self.audio) / SAMPLE_RATE, time.time() - started
+
+
+class Autotuner:
+    """Runs a benchmark over a candidate grid and selects the fastest setting that fits in memory"""
+
+    def __init__(self, benchmark: Callable[[AutotuneCandidate], Tuple[float, float]],
+                 max_rss_mb: Optional[float] = None):
+        """
+        Initialize autotuner
+
+        Args:
+            benchmark: Callable returning (audio seconds, wall seconds) for a candidate
+            max_rss_mb: Peak RSS a candidate may reach (None for no limit)
+        """
+        self.benchmark = benchmark
+        self.max_rss_mb = max_rss_mb
+
+    def run(self, candidates: Sequence[AutotuneCandidate]) -> List[AutotuneMeasurement]:
+        """
+        Benchmark every candidate
+
+        A failing candidate (e.g. out of memory) is recorded with its error
+        and the remaining candidates still run.
+
+        Returns:
+            One AutotuneMeasurement per candidate
+        """
+        measurements = []
+        for index, candidate in enumerate(candidates, 1):
+            measurement = AutotuneMeasurement(candidate=candidate)
+            try:
+                with PeakRssSampler() as sampler:
+                    measurement.audio_seconds, measurement.wall_seconds = self.benchmark(candidate)
+                measurement.peak_rss_mb = sampler.peak_mb
+                logger.info(f"⏱️ Autotune {index}/{len(candidates)}: workers={candidate.workers} "
+                            f"intra={candidate.intra_threads} beam={candidate.beam_size} → "
+                            f"{measurement.throughput:.2f}x realtime, peak RSS {measurement.peak_rss_mb:.0f} MB")
+            except Exception as e:
+                measurement.error = str(e)
+                logger.warning(f"⚠️ Autotune {index}/{len(candidates)} failed for {candidate.to_dict()}: {e}")
+            measurements.append(measurement)
+        return measurements
+
+    def select_best(self, measurements: Sequence[AutotuneMeasurement]) -> Optional[AutotuneMeasurement]:
+        """
+        Select the highest-throughput measurement within the memory limit
+
+        Ties go to fewer workers, which need less memory.
+
+        Returns:
+            Best measurement, or None if no candidate succeeded within the limit
+        """
+        eligible = [m for m in measurements if m.error is None and m.throughput > 0
+                    and (self.max_rss_mb is None or m.peak_rss_mb <= self.max_rss_mb)]
+        if not eligible:
+            return None
+        return max(eligible, key=lambda m: (round(m.throughput, 3), -m.candidate.workers))
+
+
+def build_host_profile(best: AutotuneMeasurement, measurements: Sequence[AutotuneMeasurement],
+                       total_cores: int, audio_source: str) -> Dict[str, Any]:
+    """
+    Build a host profile from the selected measurement
+
+    Only the measured settings are written: CTranslate2 threads, beam size and
+    the number of concurrent chunk decodes. Backends and batch settings stay
+    as configured, so the profile never turns off batch parallelism.
+
+    Returns:
+        Configuration overrides plus tuning metadata
+    """
+    candidate = best.candidate
+    return {
+        'transcription': {
+            'beam_size': candidate.beam_size,
+            'ctranslate2_optimization': {
+                'beam_size': candidate.beam_size,
+                'cpu_threads': candidate.intra_threads,
+                'intra_threads': candidate.intra_threads,
+                'inter_threads': candidate.inter_threads
+            }
+        },
+        'chunking': {
+            'max_chunk_workers': candidate.workers
+        },
+        HOST_PROFILE_METADATA_KEY: {
+            'host': host_fingerprint(),
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'total_cores': total_cores,
+            'audio': audio_source,
+            'best': best.to_dict(),
+            'measurements': [m.to_dict() for m in measurements]
+        }
+    }
+
+
+def run_autotune(config_manager: Any, audio_path: Optional[str] = None, model_name: Optional[str] = None,
+                 worker_counts: Optional[Sequence[int]] = None, beam_sizes: Optional[Sequence[int]] = None,
+                 max_rss_mb: Optional[float] = None, output_dir: Optional[str] = None,
+                 write_profile: bool = True) -> Dict[str, Any]:
+    """
+    Tune the current host and write its profile
+
+    Args:
+        config_manager: Configuration manager (model, compute type and beam size defaults)
+        audio_path: Sample audio (synthetic audio when None)
+        model_name: CTranslate2 model to benchmark (defaults to transcription.default_model)
+        worker_counts: Concurrent decodes to try
+        beam_sizes: Beam sizes to try (defaults to the configured beam size)
+        max_rss_mb: Peak RSS limit (defaults to 80% of the memory limit, if there is one)
+        output_dir: Profile directory (defaults to the configuration directory)
+        write_profile: False to only report the measurements
+
+    Returns:
+        Dictionary with the measurements, the selected settings and the profile path
+    """
+    from src.core.engines.utilities.model_manager import ModelManager
+
+    config = config_manager.config
+    transcription = getattr(config, 'transcription', None)
+    ct2_config = getattr(transcription, 'ctranslate2_optimization', None)
+    total_cores = _read_option(getattr(config, 'system', None), 'thread_budget_cores', int) or detect_available_cores()
+    model_name = model_name or getattr(transcription, 'default_model', None)
+    beam_sizes = beam_sizes or [getattr(transcription, 'beam_size', None) or 5]
+    if max_rss_mb is None and read_memory_limit_bytes() > 0:
+        max_rss_mb = 0.8 * read_memory_limit_bytes() / (1024 * 1024)
+
+    audio, audio_source = load_benchmark_audio(audio_path)
+    model_path = os.path.join(ModelManager(config_manager).get_models_path(), model_name)
+    benchmark = CT2DecodeBenchmark(
+        model_path, audio,
+        device=_read_option(ct2_config, 'device', str) or 'cpu',
+        compute_type=_read_option(ct2_config, 'compute_type', str) or 'float32',
+        language=getattr(transcription, 'language', None) or 'he'
+    )
+
+    candidates = build_autotune_grid(total_cores, worker_counts, beam_sizes)
+    logger.info(f"🔧 Autotuning {model_name} on {total_cores} cores with {audio_source} audio: {len(candidates)} candidate(s)")
+    tuner = Autotuner(benchmark, max_rss_mb=max_rss_mb)
+    measurements = tuner.run(candidates)
+    best = tuner.select_best(measurements)
+
+    result: Dict[str, Any] = {
+        'success': best is not None,
+        'host': host_fingerprint(),
+        'measurements': [m.to_dict() for m in measurements],
+        'best': best.to_dict() if best else None,
+        'profile_path': None
+    }
+    if best is None:
+        result['error'] = 'No candidate completed within the memory limit'
+        return result
+
+    if write_profile:
+        filename = host_profile_filename() or f"{HOST_PROFILE_PREFIX}{host_fingerprint()}.json"
+        profile_path = Path(output_dir or config_manager.config_dir) / filename
+        write_json_atomically(profile_path, build_host_profile(best, measurements, total_cores, audio_source))
+        result['profile_path'] = str(profile_path)
+        logger.info(f"💾 Host profile written: {profile_path}")
+    return result
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Batch Scheduler
+Orders batch work by expected audio duration so parallel workers finish
+together
+"""
+
+import heapq
+import logging
+import os
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.core.logic.audio_probe import AudioProbe, get_audio_probe
+
+logger = logging.getLogger(__name__)
+
+# Bytes per second of audio assumed when a file's header cannot be read (128 kbps)
+FALLBACK_BYTES_PER_SECOND = 16000
+
+# Streamed files sorted together when batch.discovery_order_window is 0 and the
+# policy reorders files; large enough to pull long files ahead, small enough
+# that the first file starts after probing a few headers
+DEFAULT_ORDER_WINDOW = 64
+
+
+class SchedulingPolicy(Enum):
+    """Order in which batch work is handed to workers"""
+    FIFO = "fifo"  # Discovery order
+    LPT = "lpt"  # Longest processing time first: shortest makespan
+    SJF = "sjf"  # Shortest job first: earliest first results
+
+
+@dataclass
+class WorkUnit:
+    """A file processed by one worker"""
+    file_path: str
+    file_index: int
+    duration: float
+    duration_known: bool = True
+
+    @property
+    def cost(self) -> float:
+        """Expected processing cost, proportional to the file's audio duration"""
+        return self.duration
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'file': self.file_path, 'duration': self.duration}
+
+
+def estimate_makespan(costs: Iterable[float], workers: int) -> float:
+    """
+    Wall time of handing work to the first free worker in the given order
+
+    Args:
+        costs: Work costs in submission order
+        workers: Number of workers
+
+    Returns:
+        Expected time until the last worker finishes
+    """
+    loads = [0.0] * max(1, workers)
+    for cost in costs:
+        heapq.heapreplace(loads, loads[0] + cost)
+    return max(loads)
+
+
+class BatchScheduler:
+    """
+    Plans the order of batch work from header-probed durations
+
+    Worker pools start queued work in submission order, so a batch in
+    discovery order that ends with a two-hour recording keeps one worker busy
+    long after the others are done. Longest-first ordering bounds that tail;
+    shortest-first returns the most finished files early. Durations come
+    from the cached header probe, falling back to file size, so planning
+    never decodes audio.
+    """
+
+    def __init__(self, policy: str = SchedulingPolicy.LPT.value, audio_probe: Optional[AudioProbe] = None):
+        """
+        Initialize scheduler
+
+        Args:
+            policy: 'fifo', 'lpt' or 'sjf'
+            audio_probe: Header probe (defaults to the shared probe)
+        """
+        try:
+            self.policy = SchedulingPolicy(policy)
+        except ValueError:
+            logger.warning(f"⚠️ Unknown scheduling policy '{policy}', keeping discovery order")
+            self.policy = SchedulingPolicy.FIFO
+        self.audio_probe = audio_probe or get_audio_probe()
+
+    def estimate_duration(self, file_path: str) -> Tuple[float, bool]:
+        """
+        Expected audio duration of a file
+
+        Returns:
+            Tuple of (seconds, whether the duration came from the header)
+        """
+        duration = self.audio_probe.get_duration(file_path)
+        if duration is not None:
+            return duration, True
+        try:
+            return os.path.getsize(file_path) / FALLBACK_BYTES_PER_SECOND, False
+        except OSError:
+            return 0.0, False
+
+    def sort_key(self, file_path: str) -> float:
+        """Sort key of a file under the policy, for ordering streamed files within windows"""
+        duration, _ = self.estimate_duration(file_path)
+        return -duration if self.policy == SchedulingPolicy.LPT else duration
+
+    def window_key(self, workers: int) -> Optional[Callable[[str], float]]:
+        """
+        Sort key for ordering streamed files within windows
+
+        Returns:
+            The policy's key, or None when the policy keeps discovery order for this many workers
+        """
+        if self.policy == SchedulingPolicy.SJF or (self.policy == SchedulingPolicy.LPT and workers > 1):
+            return self.sort_key
+        return None
+
+    def plan(self, audio_files: List[str], workers: int) -> List[WorkUnit]:
+        """
+        Build the submission order of a batch
+
+        Args:
+            audio_files: Files in discovery order
+            workers: Number of parallel workers
+
+        Returns:
+            Work units in submission order; each refers back to its discovery position by file_index
+        """
+        units = []
+        for index, file_path in enumerate(audio_files):
+            duration, known = self.estimate_duration(file_path)
+            units.append(WorkUnit(file_path=file_path, file_index=index, duration=duration, duration_known=known))
+
+        fifo_makespan = estimate_makespan((unit.cost for unit in units), workers)
+        units = self.order(units, workers)
+        if self.policy != SchedulingPolicy.FIFO and len(units) > 1:
+            planned_makespan = estimate_makespan((unit.cost for unit in units), workers)
+            logger.info(f"🗓️ Scheduled {len(units)} work units ({self.policy.value}) for {workers} workers: "
+                        f"expected makespan {planned_makespan:.0f}s of audio (discovery order {fifo_makespan:.0f}s)")
+        return units
+
+    def order(self, units: List[WorkUnit], workers: int) -> List[WorkUnit]:
+        """
+        Order work units under the policy
+
+        Longest-first only pays off with several workers, so a single worker
+        keeps discovery order under LPT. Ties keep discovery order.
+        """
+        if self.policy == SchedulingPolicy.SJF:
+            return sorted(units, key=lambda unit: unit.cost)
+        if self.policy == SchedulingPolicy.LPT and workers > 1:
+            return sorted(units, key=lambda unit: -unit.cost)
+        return list(units)
+
+
+def create_batch_scheduler(config_manager: Any) -> BatchScheduler:
+    """
+    Create a scheduler from the batch section (batch.scheduling_policy)
+
+    Args:
+        config_manager: Configuration manager
+
+    Returns:
+        BatchScheduler
+    """
+    batch = getattr(getattr(config_manager, 'config', None), 'batch', None)
+    policy = getattr(batch, 'scheduling_policy', None)
+    return BatchScheduler(policy=policy if isinstance(policy, str) else SchedulingPolicy.LPT.value)
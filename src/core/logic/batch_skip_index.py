@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Batch Skip Index
+Remembers which input files a batch already transcribed, so re-runs over the
+same directory skip finished files instead of transcribing them again
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+INDEX_DIR_NAME = '.batch_index'
+HASH_BLOCK_SIZE = 1 << 20
+
+# Parameters that change what a transcription produces
+PROFILE_PARAMETERS = ('model', 'engine', 'speaker_preset')
+PROFILE_TRANSCRIPTION_OPTIONS = ('default_model', 'default_engine', 'language', 'beam_size')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS completed_files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    content_hash TEXT,
+    decode_profile TEXT NOT NULL,
+    output_files TEXT NOT NULL,
+    completed_at TEXT NOT NULL
+)
+"""
+
+
+@dataclass
+class CompletedFile:
+    """Index entry of a transcribed input file"""
+    path: str
+    size: int
+    mtime_ns: int
+    decode_profile: str
+    content_hash: Optional[str] = None
+    output_files: List[str] = field(default_factory=list)
+    completed_at: str = ''
+
+
+def hash_file(file_path: str) -> str:
+    """SHA-256 of a file's content"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def build_decode_profile(config_manager: Any, parameters: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Describe the settings that determine a file's transcription
+
+    A file transcribed under another model, engine, language or beam size is
+    not considered done.
+
+    Args:
+        config_manager: Configuration manager
+        parameters: Batch parameters (model, engine and speaker_preset override the config)
+
+    Returns:
+        Short, stable profile hash
+    """
+    parameters = parameters or {}
+    transcription = getattr(getattr(config_manager, 'config', None), 'transcription', None)
+    profile = {name: str(getattr(transcription, name, None)) for name in PROFILE_TRANSCRIPTION_OPTIONS}
+    profile.update({name: str(parameters.get(name)) for name in PROFILE_PARAMETERS})
+    return hashlib.sha1(json.dumps(profile, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+
+def extract_output_files(result: Any) -> List[str]:
+    """
+    Collect output file paths from a processing result
+
+    Reads the result's 'output_files' mapping, whose values are either paths
+    or per-format save results with a file_path.
+
+    Args:
+        result: Processing result dictionary
+
+    Returns:
+        Output file paths
+    """
+    output_files = result.get('output_files') if isinstance(result, dict) else None
+    if not isinstance(output_files, dict):
+        return []
+
+    paths = []
+    for saved in output_files.values():
+        if isinstance(saved, str):
+            paths.append(saved)
+        elif isinstance(saved, dict) and saved.get('success', True) and isinstance(saved.get('file_path'), str):
+            paths.append(saved['file_path'])
+    return sorted(set(paths))
+
+
+class BatchSkipIndex:
+    """
+    Persistent index of completed input files, one SQLite database per input directory
+
+    Entries are keyed by path and hold the file's size, modification time,
+    optional content hash, the decode profile and the output files written
+    for it. All entries are read into memory when the index opens, so each
+    skip check is a dictionary lookup plus a stat call. Completions are
+    written in their own transaction, so an interrupted batch never leaves a
+    half-written entry.
+    """
+
+    def __init__(self, index_path: str, verify_hash: bool = False):
+        """
+        Initialize skip index
+
+        Args:
+            index_path: SQLite database path (created if missing)
+            verify_hash: Also compare content hashes (reads each unchanged file once per check)
+        """
+        self.index_path = Path(index_path)
+        self.verify_hash = verify_hash
+        self._lock = threading.Lock()
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.index_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+        self._entries: Dict[str, CompletedFile] = {}
+        for row in self._conn.execute(
+                "SELECT path, size, mtime_ns, decode_profile, content_hash, output_files, completed_at FROM completed_files"):
+            entry = CompletedFile(*row[:5], output_files=json.loads(row[5]), completed_at=row[6])
+            self._entries[entry.path] = entry
+        logger.info(f"📇 Skip index {self.index_path.name}: {len(self._entries)} completed file(s)")
+
+    @staticmethod
+    def path_for(input_directory: str, index_dir: str) -> Path:
+        """Index database path for an input directory"""
+        input_path = os.path.abspath(input_directory)
+        key = hashlib.sha1(input_path.encode('utf-8')).hexdigest()[:12]
+        name = Path(input_path).name or 'root'
+        return Path(index_dir) / f"{name}-{key}.sqlite"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_entry(self, file_path: str) -> Optional[CompletedFile]:
+        return self._entries.get(os.path.abspath(file_path))
+
+    def is_complete(self, file_path: str, decode_profile: str, stat_result: Optional[os.stat_result] = None) -> bool:
+        """
+        Check whether a file was already transcribed and its outputs are intact
+
+        Args:
+            file_path: Input file
+            decode_profile: Profile of the current run (see build_decode_profile)
+            stat_result: os.stat result of the file, if the caller already has it
+
+        Returns:
+            True if the file can be skipped
+        """
+        entry = self._entries.get(os.path.abspath(file_path))
+        if entry is None or entry.decode_profile != decode_profile:
+            return False
+        try:
+            stat_result = stat_result or os.stat(file_path)
+        except OSError:
+            return False
+        if stat_result.st_size != entry.size or stat_result.st_mtime_ns != entry.mtime_ns:
+            return False
+        if not all(self._is_valid_output(path) for path in entry.output_files):
+            return False
+        if self.verify_hash and entry.content_hash:
+            try:
+                return hash_file(file_path) == entry.content_hash
+            except OSError:
+                return False
+        return True
+
+    @staticmethod
+    def _is_valid_output(path: str) -> bool:
+        try:
+            return os.path.getsize(path) > 0
+        except OSError:
+            return False
+
+    def filter_pending(self, file_paths: Iterable[str], decode_profile: str) -> List[str]:
+        """
+        Drop files that are already complete
+
+        Args:
+            file_paths: Candidate input files
+            decode_profile: Profile of the current run
+
+        Returns:
+            Files that still need processing, in their original order
+        """
+        return [path for path in file_paths if not self.is_complete(path, decode_profile)]
+
+    def record_completion(self, file_path: str, decode_profile: str, output_files: Optional[List[str]] = None) -> bool:
+        """
+        Record that a file was transcribed
+
+        Args:
+            file_path: Input file
+            decode_profile: Profile the file was transcribed with
+            output_files: Output files written for it
+
+        Returns:
+            True if the entry was stored
+        """
+        abs_path = os.path.abspath(file_path)
+        try:
+            stat_result = os.stat(abs_path)
+            content_hash = hash_file(abs_path) if self.verify_hash else None
+        except OSError as e:
+            logger.warning(f"⚠️ Cannot index {file_path}: {e}")
+            return False
+
+        entry = CompletedFile(
+            path=abs_path,
+            size=stat_result.st_size,
+            mtime_ns=stat_result.st_mtime_ns,
+            decode_profile=decode_profile,
+            content_hash=content_hash,
+            output_files=[os.path.abspath(path) for path in (output_files or [])],
+            completed_at=datetime.now().isoformat()
+        )
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.execute("BEGIN IMMEDIATE")
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO completed_files "
+                        "(path, size, mtime_ns, content_hash, decode_profile, output_files, completed_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (entry.path, entry.size, entry.mtime_ns, entry.content_hash, entry.decode_profile,
+                         json.dumps(entry.output_files), entry.completed_at)
+                    )
+            except sqlite3.Error as e:
+                logger.warning(f"⚠️ Cannot update skip index for {file_path}: {e}")
+                return False
+            self._entries[abs_path] = entry
+        return True
+
+    def forget(self, file_path: str) -> None:
+        """Remove a file from the index"""
+        abs_path = os.path.abspath(file_path)
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM completed_files WHERE path = ?", (abs_path,))
+            self._entries.pop(abs_path, None)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def create_skip_index(config_manager: Any, input_directory: str) -> Optional[BatchSkipIndex]:
+    """
+    Open the skip index of an input directory if batch.skip_completed is enabled
+
+    The index lives in batch.skip_index_dir, or in a .batch_index folder under
+    the output directory, so read-only input mounts work.
+
+    Args:
+        config_manager: Configuration manager
+        input_directory: Batch input directory
+
+    Returns:
+        BatchSkipIndex, or None when skipping is disabled or the index cannot be opened
+    """
+    config = getattr(config_manager, 'config', None)
+    batch = getattr(config, 'batch', None)
+    if getattr(batch, 'skip_completed', False) is not True or not input_directory:
+        return None
+
+    index_dir = getattr(batch, 'skip_index_dir', None)
+    if not isinstance(index_dir, str) or not index_dir:
+        output_dir = getattr(getattr(config, 'output', None), 'output_dir', None)
+        index_dir = os.path.join(output_dir if isinstance(output_dir, str) else 'output', INDEX_DIR_NAME)
+    try:
+        return BatchSkipIndex(BatchSkipIndex.path_for(input_directory, index_dir),
+                              verify_hash=bool(getattr(batch, 'skip_index_verify_hash', False)))
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"⚠️ Skip index unavailable, processing every file: {e}")
+        return None
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+CPU Placement
+Pins concurrent workers to disjoint core sets grouped by NUMA node
+"""
+
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+NUMA_SYSFS_ROOT = '/sys/devices/system/node'
+SUPPORTED_PLACEMENTS = ('none', 'numa')
+# How long a starting worker process waits for the worker it replaces to free its slot
+SLOT_CLAIM_TIMEOUT_SECONDS = 10.0
+
+
+def parse_cpu_list(cpu_list: str) -> List[int]:
+    """
+    Parse a kernel CPU list such as "0-3,8-11"
+
+    Returns:
+        Sorted list of CPU ids
+    """
+    cpus = set()
+    for part in cpu_list.strip().split(','):
+        if not part:
+            continue
+        if '-' in part:
+            start, end = part.split('-')
+            cpus.update(range(int(start), int(end) + 1))
+        else:
+            cpus.add(int(part))
+    return sorted(cpus)
+
+
+def _allowed_cpus() -> List[int]:
+    try:
+        return sorted(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        return list(range(os.cpu_count() or 1))
+
+
+# CPUs available to the process before any worker pinned itself
+_PROCESS_CPUS = _allowed_cpus()
+
+# Marks thread pool workers that pinned themselves (they share models with other workers)
+_thread_state = threading.local()
+
+
+def read_numa_topology(sysfs_root: str = NUMA_SYSFS_ROOT, allowed_cpus: Optional[List[int]] = None) -> Dict[int, List[int]]:
+    """
+    Read the CPUs of each NUMA node, restricted to the CPUs this process may use
+
+    Hosts without NUMA information are reported as a single node.
+
+    Args:
+        sysfs_root: NUMA node directory in sysfs
+        allowed_cpus: CPUs to consider (defaults to the process affinity)
+
+    Returns:
+        Dictionary of node id to sorted CPU ids (nodes without usable CPUs are omitted)
+    """
+    allowed = set(allowed_cpus if allowed_cpus is not None else _allowed_cpus())
+    topology: Dict[int, List[int]] = {}
+    try:
+        node_dirs = [name for name in os.listdir(sysfs_root) if name.startswith('node') and name[4:].isdigit()]
+    except OSError:
+        node_dirs = []
+
+    for node_dir in node_dirs:
+        try:
+            with open(os.path.join(sysfs_root, node_dir, 'cpulist'), 'r') as f:
+                cpus = [cpu for cpu in parse_cpu_list(f.read()) if cpu in allowed]
+        except (OSError, ValueError):
+            continue
+        if cpus:
+            topology[int(node_dir[4:])] = cpus
+
+    if not topology:
+        topology = {0: sorted(allowed)}
+    return dict(sorted(topology.items()))
+
+
+@dataclass
+class WorkerPlacement:
+    """Core set assigned to one worker"""
+    worker_index: int
+    node: int
+    cpus: List[int] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'worker_index': self.worker_index, 'node': self.node, 'cpus': list(self.cpus)}
+
+
+class CpuPlacementPlanner:
+    """
+    Splits NUMA nodes into disjoint per-worker core sets
+
+    Workers are distributed across nodes in proportion to their core counts
+    (largest remainder), and every worker's cores come from a single node so
+    its threads and the memory it touches first stay node-local.
+    """
+
+    def __init__(self, topology: Optional[Dict[int, List[int]]] = None):
+        """
+        Initialize planner
+
+        Args:
+            topology: Node id to CPU ids (defaults to the host topology)
+        """
+        self.topology = topology if topology is not None else read_numa_topology()
+
+    def plan(self, num_workers: int) -> List[WorkerPlacement]:
+        """
+        Plan core sets for a number of workers
+
+        Args:
+            num_workers: Number of concurrent workers
+
+        Returns:
+            One WorkerPlacement per worker, in worker order
+        """
+        num_workers = max(1, num_workers)
+        nodes = list(self.topology.items())
+        total_cpus = sum(len(cpus) for _, cpus in nodes)
+
+        # Workers per node, proportional to node size, at least one core each
+        shares = [num_workers * len(cpus) / total_cpus for _, cpus in nodes]
+        counts = [min(int(share), len(cpus)) for share, (_, cpus) in zip(shares, nodes)]
+        by_remainder = sorted(range(len(nodes)), key=lambda i: shares[i] - counts[i], reverse=True)
+        for index in by_remainder:
+            if sum(counts) >= num_workers:
+                break
+            if counts[index] < len(nodes[index][1]):
+                counts[index] += 1
+
+        per_node: List[List[WorkerPlacement]] = []
+        for (node, cpus), count in zip(nodes, counts):
+            if count == 0:
+                continue
+            per_worker = len(cpus) // count
+            per_node.append([WorkerPlacement(worker_index=0, node=node, cpus=cpus[slot * per_worker:(slot + 1) * per_worker])
+                             for slot in range(count)])
+
+        # Interleave nodes so consecutive workers land on different sockets
+        placements: List[WorkerPlacement] = []
+        for round_index in range(max(len(node_placements) for node_placements in per_node)):
+            placements.extend(node_placements[round_index] for node_placements in per_node
+                              if round_index < len(node_placements))
+
+        # More workers than cores: wrap around and share core sets
+        for extra in range(num_workers - len(placements)):
+            source = placements[extra % len(placements)]
+            placements.append(WorkerPlacement(worker_index=0, node=source.node, cpus=list(source.cpus)))
+
+        for index, placement in enumerate(placements):
+            placement.worker_index = index
+        return placements
+
+
+def pin_to_cpus(cpus: List[int]) -> bool:
+    """
+    Pin the calling thread (and threads it creates later) to a set of CPUs
+
+    On Linux sched_setaffinity(0) applies to the calling thread, so a worker
+    must pin itself before loading its model: the model's compute threads
+    inherit the affinity and its first-touch allocations land on the local node.
+
+    Returns:
+        True if the affinity was applied
+    """
+    if not cpus or not hasattr(os, 'sched_setaffinity'):
+        return False
+    try:
+        os.sched_setaffinity(0, cpus)
+        return True
+    except OSError as e:
+        logger.warning(f"⚠️ Could not pin to CPUs {cpus}: {e}")
+        return False
+
+
+class WorkerPinner:
+    """
+    Hands out placements to pool workers as they start
+
+    Used as a thread pool initializer: each new worker thread claims the
+    next placement and pins itself. Claims wrap around if a pool replaces
+    workers.
+    """
+
+    def __init__(self, placements: List[WorkerPlacement], role: str):
+        self.placements = placements
+        self.role = role
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def pin_next(self) -> Optional[WorkerPlacement]:
+        with self._lock:
+            placement = self.placements[self._next % len(self.placements)]
+            self._next += 1
+        if pin_to_cpus(placement.cpus):
+            _thread_state.placement = placement
+            record_worker_placement(self.role, placement, threading.current_thread().name)
+            return placement
+        return None
+
+
+def create_placement_slots(mp_context: Any, count: int) -> Any:
+    """
+    Create the queue of free placement slots shared with a worker process pool
+
+    Each worker process claims a slot when it starts and returns it when it
+    exits, so a worker replaced after max_tasks_per_child hands its slot to
+    its replacement instead of the replacement doubling up on another
+    worker's cores.
+
+    Args:
+        mp_context: multiprocessing context of the pool
+        count: Number of placements
+
+    Returns:
+        Queue of free slot indices, passed to the pool initializer
+    """
+    free_slots = mp_context.Queue()
+    for slot in range(count):
+        free_slots.put(slot)
+    return free_slots
+
+
+def claim_placement_slot(free_slots: Any, timeout: float = SLOT_CLAIM_TIMEOUT_SECONDS) -> Optional[int]:
+    """
+    Claim a free placement slot for the calling worker process until it exits
+
+    Returns:
+        Slot index, or None if no slot was freed in time (a crashed worker never
+        returns its slot); the worker then runs unpinned
+    """
+    import queue
+    from multiprocessing import util
+
+    try:
+        slot = free_slots.get(timeout=timeout)
+    except queue.Empty:
+        logger.warning(f"⚠️ No free CPU placement slot for worker {os.getpid()}, running unpinned")
+        return None
+    # Pool workers exit through multiprocessing's finalizers, not atexit
+    util.Finalize(None, free_slots.put, args=(slot,), exitpriority=10)
+    return slot
+
+
+@contextmanager
+def shared_model_affinity():
+    """
+    Load a process-wide shared model with the process's full CPU set
+
+    A model shared by all thread workers must not inherit the core set of
+    whichever pinned worker thread happens to load it, or every decode would
+    run on that worker's cores. Worker processes holding their own replica
+    are not marked, so their models load pinned and node-local.
+    """
+    placement = getattr(_thread_state, 'placement', None)
+    if placement is None:
+        yield
+        return
+    pin_to_cpus(_PROCESS_CPUS)
+    try:
+        yield
+    finally:
+        pin_to_cpus(placement.cpus)
+
+
+def placement_mode(config_manager: Any) -> str:
+    """Get the configured placement mode ('none' or 'numa')"""
+    system = getattr(getattr(config_manager, 'config', None), 'system', None)
+    mode = getattr(system, 'cpu_placement', None)
+    mode = mode.lower() if isinstance(mode, str) else 'none'
+    if mode not in SUPPORTED_PLACEMENTS:
+        logger.warning(f"⚠️ Unknown CPU placement '{mode}', placement disabled")
+        return 'none'
+    return mode
+
+
+def plan_worker_placements(config_manager: Any, num_workers: int) -> Optional[List[WorkerPlacement]]:
+    """
+    Plan worker placements if placement is enabled in the configuration
+
+    Returns:
+        Placements, or None when placement is disabled or not supported on this platform
+    """
+    if placement_mode(config_manager) == 'none' or num_workers < 2 or not hasattr(os, 'sched_setaffinity'):
+        return None
+    placements = CpuPlacementPlanner().plan(num_workers)
+    logger.info("📌 CPU placement: " + "; ".join(
+        f"worker {p.worker_index} → node {p.node} cpus {p.cpus[0]}-{p.cpus[-1]}" if p.cpus else f"worker {p.worker_index} → node {p.node}"
+        for p in placements))
+    return placements
+
+
+# Applied placements of this process, reported in performance statistics
+_placement_report: Dict[str, List[Dict[str, Any]]] = {}
+_placement_report_lock = threading.Lock()
+
+
+def record_worker_placement(role: str, placement: WorkerPlacement, worker: Any) -> None:
+    """Record that a worker was pinned"""
+    with _placement_report_lock:
+        entries = _placement_report.setdefault(role, [])
+        entries.append({**placement.to_dict(), 'worker': worker})
+
+
+def get_placement_report() -> Dict[str, List[Dict[str, Any]]]:
+    """Get the placements applied in this process, by worker role"""
+    with _placement_report_lock:
+        return {role: list(entries) for role, entries in _placement_report.items()}
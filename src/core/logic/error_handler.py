@@ -37,6 +37,11 @@ class ErrorCategory(Enum):
     UNKNOWN = "unknown"
 
 
+# Errors that fail the same way on every attempt
+PERMANENT_ERROR_CATEGORIES = {ErrorCategory.VALIDATION, ErrorCategory.CONFIGURATION}
+PERMANENT_ERROR_TYPES = {'FileNotFoundError', 'IsADirectoryError', 'NotADirectoryError', 'PermissionError'}
+
+
 @dataclass
 class ErrorContext:
     """Structured error context information"""
@@ -170,6 +175,32 @@ class ErrorHandler:
         
         return ErrorCategory.UNKNOWN
     
+    def is_retryable(self, error: Union[Exception, Dict[str, Any]]) -> bool:
+        """
+        Check whether another attempt could succeed
+        
+        Validation and configuration errors, and missing or unreadable files,
+        are permanent; everything else (network, resources, transcription,
+        unknown) is treated as transient.
+        
+        Args:
+            error: The exception, or a failed result with error, error_type and category fields
+            
+        Returns:
+            True if the failure is worth retrying
+        """
+        if isinstance(error, Exception):
+            error_type = type(error).__name__
+            category = self._categorize_error(error)
+        else:
+            error_type = error.get('error_type') or ''
+            category_values = {member.value: member for member in ErrorCategory}
+            category = category_values.get(error.get('category')) or category_values.get(error_type)
+            if category is None:
+                # Only the message is known; categorize it by its keywords
+                category = self._categorize_error(RuntimeError(error.get('error') or ''))
+        return error_type not in PERMANENT_ERROR_TYPES and category not in PERMANENT_ERROR_CATEGORIES
+    
     def _determine_severity(self, error: Exception, category: ErrorCategory) -> ErrorSeverity:
         """Determine error severity based on error type and category"""
         error_type = type(error)
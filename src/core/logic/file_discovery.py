@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+File Discovery
+Streams audio files out of a directory tree while it is still being walked,
+scanning subdirectories in parallel with os.scandir
+"""
+
+import logging
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DISCOVERY_WORKERS = 4
+# Discovered paths buffered ahead of the consumer before scanning threads wait
+DEFAULT_QUEUE_SIZE = 10000
+
+# Called with (path, stat_result) for each matching file; False drops the file
+FileFilter = Callable[[str, os.stat_result], bool]
+
+_DONE = object()
+
+
+@dataclass
+class DiscoveryStats:
+    """Counters of one discovery run"""
+    directories: int = 0
+    matched: int = 0
+    accepted: int = 0
+    errors: int = 0
+
+
+def ordered_in_windows(paths: Iterable[str], window_size: int, key: Optional[Callable[[str], Any]] = None) -> Iterator[str]:
+    """
+    Sort a stream within consecutive windows
+
+    Keeps the first window available as soon as it fills, instead of waiting
+    for the whole stream as a full sort would.
+
+    Args:
+        paths: Path stream
+        window_size: Paths per window (0 or 1 keeps the stream order)
+        key: Sort key (defaults to the path)
+
+    Yields:
+        Paths, sorted within each window
+    """
+    if window_size <= 1:
+        yield from paths
+        return
+    window: List[str] = []
+    for path in paths:
+        window.append(path)
+        if len(window) >= window_size:
+            yield from sorted(window, key=key)
+            window = []
+    yield from sorted(window, key=key)
+
+
+class StreamingFileDiscovery:
+    """
+    Finds files by extension with parallel os.scandir walks
+
+    Every directory is scanned by a thread pool task that queues its
+    subdirectories as new tasks, so wide trees on network mounts are listed
+    concurrently. Matching files are handed to the consumer through a
+    bounded queue as soon as they are seen, so processing can start before
+    the walk finishes. An optional filter (such as the batch skip index)
+    runs in the scanning threads with the entry's stat result.
+    """
+
+    def __init__(self, extensions: Iterable[str], max_workers: int = DEFAULT_DISCOVERY_WORKERS,
+                 follow_symlinks: bool = False, queue_size: int = DEFAULT_QUEUE_SIZE):
+        """
+        Initialize discovery
+
+        Args:
+            extensions: File extensions to match (with or without the leading dot, any case)
+            max_workers: Directories scanned concurrently
+            follow_symlinks: Descend into symlinked directories
+            queue_size: Paths buffered ahead of the consumer
+        """
+        self.extensions = {ext.lower() if ext.startswith('.') else f".{ext.lower()}" for ext in extensions}
+        self.max_workers = max(1, max_workers)
+        self.follow_symlinks = follow_symlinks
+        self.queue_size = max(1, queue_size)
+
+    def matches(self, name: str) -> bool:
+        return os.path.splitext(name)[1].lower() in self.extensions
+
+    def iter_files(self, root: str, accept: Optional[FileFilter] = None,
+                   stats: Optional[DiscoveryStats] = None) -> Iterator[str]:
+        """
+        Stream matching files below a directory
+
+        Paths arrive in discovery order. Closing the iterator early stops the walk.
+
+        Args:
+            root: Directory to walk
+            accept: Optional filter called with (path, stat_result)
+            stats: Optional counters updated during the walk
+
+        Yields:
+            File paths
+        """
+        stats = stats if stats is not None else DiscoveryStats()
+        results: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        lock = threading.Lock()
+        pending = [1]
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="discovery")
+
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    results.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def scan(directory: str) -> None:
+            try:
+                with lock:
+                    stats.directories += 1
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if stop.is_set():
+                            return
+                        try:
+                            if entry.is_dir(follow_symlinks=self.follow_symlinks):
+                                with lock:
+                                    pending[0] += 1
+                                try:
+                                    executor.submit(scan, entry.path)
+                                except RuntimeError:
+                                    # The consumer closed the stream and the pool is shutting down
+                                    return
+                            elif entry.is_file() and self.matches(entry.name):
+                                with lock:
+                                    stats.matched += 1
+                                if accept is not None and not accept(entry.path, entry.stat()):
+                                    continue
+                                with lock:
+                                    stats.accepted += 1
+                                if not put(entry.path):
+                                    return
+                        except OSError as e:
+                            with lock:
+                                stats.errors += 1
+                            logger.debug(f"⚠️ Cannot inspect {entry.path}: {e}")
+            except OSError as e:
+                with lock:
+                    stats.errors += 1
+                logger.warning(f"⚠️ Cannot scan {directory}: {e}")
+            finally:
+                with lock:
+                    pending[0] -= 1
+                    finished = pending[0] == 0
+                if finished:
+                    put(_DONE)
+
+        executor.submit(scan, root)
+        try:
+            while True:
+                item = results.get()
+                if item is _DONE:
+                    break
+                yield item
+        finally:
+            stop.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+            logger.debug(f"🔎 Discovery of {root}: {stats.accepted}/{stats.matched} files in {stats.directories} directories")
+
+    def discover(self, root: str, accept: Optional[FileFilter] = None) -> List[str]:
+        """
+        List matching files below a directory, sorted by path
+
+        Args:
+            root: Directory to walk
+            accept: Optional filter called with (path, stat_result)
+
+        Returns:
+            Sorted file paths
+        """
+        return sorted(self.iter_files(root, accept))
+
+
+def create_file_discovery(config_manager: Any, extensions: Iterable[str]) -> StreamingFileDiscovery:
+    """
+    Create discovery configured from the batch section (batch.discovery_workers)
+
+    Args:
+        config_manager: Configuration manager
+        extensions: File extensions to match
+
+    Returns:
+        StreamingFileDiscovery
+    """
+    batch = getattr(getattr(config_manager, 'config', None), 'batch', None)
+    workers = getattr(batch, 'discovery_workers', None)
+    return StreamingFileDiscovery(extensions, max_workers=workers if isinstance(workers, int) else DEFAULT_DISCOVERY_WORKERS)
@@ -11,6 +11,7 @@ import os
 import struct
 
 from src.core.interfaces.audio_file_validator_interface import AudioFileValidatorInterface
+from src.core.logic.audio_probe import AudioProbe, get_audio_probe
 from src.models import AppConfig
 
 
@@ -22,15 +23,18 @@ class FileValidator(AudioFileValidatorInterface):
     and the Open/Closed Principle by being extensible for different validation rules.
     """
     
-    def __init__(self, config: AppConfig, supported_formats: Optional[Set[str]] = None):
+    def __init__(self, config: AppConfig, supported_formats: Optional[Set[str]] = None,
+                 audio_probe: Optional[AudioProbe] = None):
         """
         Initialize the file validator
         
         Args:
             config: Application configuration containing validation settings
             supported_formats: Set of supported file extensions (defaults to common audio formats)
+            audio_probe: Shared audio metadata probe (defaults to the process-wide probe)
         """
         self.config = config
+        self.audio_probe = audio_probe or get_audio_probe()
         self.logger = logging.getLogger('file-validator')
         
         # Default supported audio formats if not provided
@@ -234,6 +238,20 @@ class FileValidator(AudioFileValidatorInterface):
     def _validate_audio_content(self, path: Path) -> Dict[str, Any]:
         """Validate audio file content and detect corruption"""
         try:
+            # A successful header probe both validates the file and caches its metadata
+            # for strategy selection, so the header is parsed only once per file version
+            metadata = self.audio_probe.probe(str(path))
+            if metadata is not None and metadata.has_duration:
+                return {
+                    'valid': True,
+                    'format': path.suffix.lower()[1:].upper(),
+                    'codec': metadata.codec,
+                    'duration': metadata.duration,
+                    'sample_rate': metadata.sample_rate,
+                    'channels': metadata.channels,
+                    'bit_depth': metadata.bit_depth
+                }
+            
             file_extension = path.suffix.lower()
             
             # Validate based on file format
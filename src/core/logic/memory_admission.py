@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Memory Admission
+Admits concurrent batch jobs only while their estimated peak memory fits a
+budget, correcting the estimates from observed RSS
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from src.core.logic.audio_probe import AudioProbe, get_audio_probe
+from src.core.logic.memory_governor import read_memory_limit_bytes, read_rss_bytes
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+
+# Decoded audio is held as 16 kHz mono int16
+BUFFER_BYTES_PER_SECOND = 16000 * 2
+# Features, decoder state and chunk copies of one job, independent of its length
+JOB_OVERHEAD_BYTES = 256 * MB
+# Resident model assumed when batch.model_memory_mb is not set
+DEFAULT_MODEL_MEMORY_MB = 2048
+# Share of the memory limit available to the model and jobs together
+DEFAULT_BUDGET_FRACTION = 0.80
+UNLIMITED_BYTES = 1 << 62
+# Assumed source format when a header cannot be read
+FALLBACK_SAMPLE_RATE = 44100
+FALLBACK_CHANNELS = 2
+FALLBACK_DURATION_SECONDS = 600.0
+
+# Bounds and smoothing of the RSS correction factor; it rises quickly and decays slowly
+MIN_CORRECTION = 0.5
+MAX_CORRECTION = 4.0
+CORRECTION_RISE = 0.5
+CORRECTION_DECAY = 0.1
+
+
+@dataclass
+class MemoryReservation:
+    """Memory reserved for one admitted job"""
+    label: str
+    estimated_bytes: int
+    reserved_bytes: int
+    admitted_at: float
+
+
+def estimate_job_bytes(duration: float, sample_rate: int, channels: int) -> int:
+    """
+    Uncorrected peak memory of transcribing one file
+
+    The int16 working buffer grows with duration. Formats that are not
+    streamed are decoded in full as float32 at the source rate and channel
+    count before downmixing, which dominates the peak for long recordings.
+
+    Args:
+        duration: Audio duration in seconds
+        sample_rate: Source sample rate
+        channels: Source channel count
+
+    Returns:
+        Estimated peak bytes, excluding the shared model
+    """
+    decode_bytes_per_second = sample_rate * channels * 4
+    return int(JOB_OVERHEAD_BYTES + duration * (BUFFER_BYTES_PER_SECOND + decode_bytes_per_second))
+
+
+class MemoryAdmissionController:
+    """
+    Gates job starts on a memory budget
+
+    Each job's peak memory is estimated from its header (duration, sample
+    rate, channels) and reserved before it starts; a job waits while the
+    running reservations plus its own would exceed the budget. A job is
+    always admitted when nothing else runs, so one file larger than the
+    budget still makes progress alone.
+
+    The budget is the memory limit (cgroup-aware) times a fraction, minus
+    the resident model and the memory in use before the batch started.
+    Whenever jobs start or finish, the RSS in excess of that resident
+    baseline is compared with the raw estimates of the running jobs, and a
+    correction factor applied to later estimates follows the ratio. Jobs in
+    worker processes report their own peak instead.
+    """
+
+    def __init__(self, budget_bytes: Optional[int] = None, model_bytes: int = DEFAULT_MODEL_MEMORY_MB * MB,
+                 audio_probe: Optional[AudioProbe] = None,
+                 rss_reader: Optional[Callable[[], int]] = read_rss_bytes):
+        """
+        Initialize admission controller
+
+        Args:
+            budget_bytes: Memory for jobs (defaults to a share of the memory limit minus resident memory)
+            model_bytes: Resident memory of the loaded model, shared by all jobs
+            audio_probe: Header probe (defaults to the shared probe)
+            rss_reader: Returns the current RSS in bytes (None when the jobs run in other
+                processes, which report their peaks through observe_job() instead)
+        """
+        self.audio_probe = audio_probe or get_audio_probe()
+        self.rss_reader = rss_reader
+        # Memory that is not attributed to jobs: the model, or what the process already holds
+        self.resident_bytes = max(rss_reader(), model_bytes) if rss_reader else model_bytes
+        if budget_bytes is None:
+            limit_bytes = read_memory_limit_bytes()
+            # Without a known limit there is nothing to budget against
+            budget_bytes = UNLIMITED_BYTES
+            if limit_bytes:
+                budget_bytes = int(limit_bytes * DEFAULT_BUDGET_FRACTION) - self.resident_bytes
+        self.budget_bytes = max(0, budget_bytes)
+        self.correction = 1.0
+
+        self._condition = threading.Condition()
+        self._reserved_bytes = 0
+        self._estimated_bytes = 0
+        self._running = 0
+        self.stats: Dict[str, Any] = {
+            'admitted': 0,
+            'waits': 0,
+            'wait_seconds': 0.0,
+            'oversized_jobs': 0,
+            'peak_reserved_mb': 0.0,
+            'peak_running': 0
+        }
+        logger.info(f"🧮 Memory admission: budget {self.budget_bytes / MB:.0f}MB for jobs, "
+                    f"{self.resident_bytes / MB:.0f}MB resident")
+
+    def estimate(self, file_path: str, duration: Optional[float] = None) -> int:
+        """
+        Uncorrected peak memory of a job
+
+        Args:
+            file_path: Audio file
+            duration: Seconds of audio the job covers (defaults to the file's duration)
+
+        Returns:
+            Estimated bytes
+        """
+        metadata = self.audio_probe.probe(file_path)
+        if duration is None:
+            duration = metadata.duration if metadata and metadata.has_duration else FALLBACK_DURATION_SECONDS
+        sample_rate = (metadata.sample_rate if metadata else None) or FALLBACK_SAMPLE_RATE
+        channels = (metadata.channels if metadata else None) or FALLBACK_CHANNELS
+        return estimate_job_bytes(duration, sample_rate, channels)
+
+    def acquire(self, file_path: str, duration: Optional[float] = None) -> MemoryReservation:
+        """
+        Wait until a job fits the budget and reserve its memory
+
+        Args:
+            file_path: Audio file of the job
+            duration: Seconds of audio the job covers (defaults to the whole file)
+
+        Returns:
+            Reservation to pass to release()
+        """
+        estimated = self.estimate(file_path, duration)
+        started = time.monotonic()
+        waited = False
+        with self._condition:
+            self._observe()
+            while self._running and self._reserved_bytes + self._corrected(estimated) > self.budget_bytes:
+                if not waited:
+                    waited = True
+                    self.stats['waits'] += 1
+                    logger.info(f"⏸️ Waiting for memory: {file_path} needs ~{self._corrected(estimated) / MB:.0f}MB, "
+                                f"{self._reserved_bytes / MB:.0f}/{self.budget_bytes / MB:.0f}MB reserved")
+                self._condition.wait(timeout=1.0)
+                self._observe()
+
+            reservation = self._reserve(file_path, estimated)
+            if waited:
+                self.stats['wait_seconds'] += time.monotonic() - started
+        return reservation
+
+    def try_acquire(self, file_path: str, duration: Optional[float] = None) -> Optional[MemoryReservation]:
+        """
+        Reserve a job's memory only if it fits the budget now
+
+        For callers that cannot block because they release reservations
+        themselves, such as the loop that feeds batch worker processes.
+
+        Args:
+            file_path: Audio file of the job
+            duration: Seconds of audio the job covers (defaults to the whole file)
+
+        Returns:
+            Reservation to pass to release(), or None if the job has to wait
+        """
+        estimated = self.estimate(file_path, duration)
+        with self._condition:
+            self._observe()
+            if self._running and self._reserved_bytes + self._corrected(estimated) > self.budget_bytes:
+                return None
+            return self._reserve(file_path, estimated)
+
+    def _reserve(self, file_path: str, estimated: int) -> MemoryReservation:
+        """Record an admitted job; the caller holds the condition"""
+        reserved = self._corrected(estimated)
+        if reserved > self.budget_bytes:
+            self.stats['oversized_jobs'] += 1
+            logger.warning(f"⚠️ {file_path} needs ~{reserved / MB:.0f}MB, more than the "
+                           f"{self.budget_bytes / MB:.0f}MB budget; running it alone")
+        self._reserved_bytes += reserved
+        self._estimated_bytes += estimated
+        self._running += 1
+        self.stats['admitted'] += 1
+        self.stats['peak_running'] = max(self.stats['peak_running'], self._running)
+        self.stats['peak_reserved_mb'] = max(self.stats['peak_reserved_mb'], self._reserved_bytes / MB)
+        return MemoryReservation(file_path, estimated, reserved, time.monotonic())
+
+    def release(self, reservation: MemoryReservation) -> None:
+        """Return a finished job's memory to the budget"""
+        with self._condition:
+            # Sample while the job's memory is still counted
+            self._observe()
+            self._reserved_bytes = max(0, self._reserved_bytes - reservation.reserved_bytes)
+            self._estimated_bytes = max(0, self._estimated_bytes - reservation.estimated_bytes)
+            self._running = max(0, self._running - 1)
+            self._condition.notify_all()
+
+    def observe_job(self, reservation: MemoryReservation, peak_bytes: int) -> None:
+        """
+        Adjust the correction factor from the peak memory a finished job reported
+
+        For jobs that run in other processes, whose RSS is not visible here.
+
+        Args:
+            reservation: The job's reservation, not yet released
+            peak_bytes: Peak memory the job added to its process
+        """
+        if reservation.estimated_bytes <= 0:
+            return
+        with self._condition:
+            self._update_correction(peak_bytes / reservation.estimated_bytes)
+
+    def _corrected(self, estimated: int) -> int:
+        return int(estimated * self.correction)
+
+    def _observe(self) -> None:
+        """Adjust the correction factor from RSS attributable to the running jobs"""
+        if not self._running or not self._estimated_bytes or self.rss_reader is None:
+            return
+        job_bytes = max(0, self.rss_reader() - self.resident_bytes)
+        self._update_correction(job_bytes / self._estimated_bytes)
+
+    def _update_correction(self, ratio: float) -> None:
+        """Move the correction factor towards an observed/estimated ratio; the caller holds the condition"""
+        ratio = min(MAX_CORRECTION, max(MIN_CORRECTION, ratio))
+        rate = CORRECTION_RISE if ratio > self.correction else CORRECTION_DECAY
+        self.correction += rate * (ratio - self.correction)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._condition:
+            return {
+                **self.stats,
+                'budget_mb': self.budget_bytes / MB,
+                'correction': round(self.correction, 3)
+            }
+
+
+def create_memory_admission(config_manager: Any, worker_processes: int = 0) -> Optional[MemoryAdmissionController]:
+    """
+    Create admission control from the batch section if batch.memory_admission is enabled
+
+    Reads batch.memory_budget_mb (0 derives the budget from the memory limit)
+    and batch.model_memory_mb.
+
+    Args:
+        config_manager: Configuration manager
+        worker_processes: Worker processes running the jobs, each holding its own model
+            (0 when jobs run in this process)
+
+    Returns:
+        MemoryAdmissionController, or None when disabled
+    """
+    batch = getattr(getattr(config_manager, 'config', None), 'batch', None)
+    if getattr(batch, 'memory_admission', False) is not True:
+        return None
+    budget_mb = getattr(batch, 'memory_budget_mb', None)
+    model_mb = getattr(batch, 'model_memory_mb', None)
+    model_bytes = (model_mb if isinstance(model_mb, int) else DEFAULT_MODEL_MEMORY_MB) * MB
+    budget_bytes = budget_mb * MB if isinstance(budget_mb, int) and budget_mb > 0 else None
+    if worker_processes > 0:
+        # This process's RSS does not include the workers, so every worker's model is counted
+        # up front and the estimates are corrected from the peaks workers report
+        return MemoryAdmissionController(
+            budget_bytes=budget_bytes,
+            model_bytes=read_rss_bytes() + model_bytes * worker_processes,
+            rss_reader=None
+        )
+    return MemoryAdmissionController(budget_bytes=budget_bytes, model_bytes=model_bytes)
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Memory Governor
+Samples process memory cheaply and applies memory hygiene only under pressure
+"""
+
+import ctypes
+import gc
+import logging
+import os
+import threading
+import time
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+class MemoryPressure(Enum):
+    """Memory pressure levels"""
+    NORMAL = "normal"
+    SOFT = "soft"
+    HARD = "hard"
+
+
+def read_rss_bytes() -> int:
+    """
+    Read the resident set size of the current process
+
+    Uses /proc/self/statm (a single small read) and falls back to psutil.
+
+    Returns:
+        RSS in bytes, or 0 if it cannot be determined
+    """
+    try:
+        with open('/proc/self/statm', 'rb') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except Exception:
+        return 0
+
+
+def reset_peak_rss() -> bool:
+    """
+    Restart peak RSS tracking of the current process (Linux)
+
+    Returns:
+        True if read_peak_rss_bytes() now measures from this point
+    """
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def read_peak_rss_bytes() -> int:
+    """
+    Read the peak resident set size of the current process
+
+    Uses VmHWM from /proc/self/status, which reset_peak_rss() restarts, and
+    falls back to the lifetime peak from getrusage.
+
+    Returns:
+        Peak RSS in bytes, or 0 if it cannot be determined
+    """
+    try:
+        with open('/proc/self/status', 'rb') as f:
+            for line in f:
+                if line.startswith(b'VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+        import sys
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Kilobytes on Linux, bytes on macOS
+        return peak if sys.platform == 'darwin' else peak * 1024
+    except Exception:
+        return 0
+
+
+def read_memory_limit_bytes() -> int:
+    """
+    Determine the memory available to this process
+
+    Honors cgroup (container) limits before falling back to physical memory.
+
+    Returns:
+        Memory limit in bytes, or 0 if it cannot be determined
+    """
+    for cgroup_file in ('/sys/fs/cgroup/memory.max', '/sys/fs/cgroup/memory/memory.limit_in_bytes'):
+        try:
+            with open(cgroup_file, 'r') as f:
+                value = f.read().strip()
+            if value.isdigit() and int(value) < (1 << 60):
+                return int(value)
+        except OSError:
+            continue
+    try:
+        return os.sysconf('SC_PHYS_PAGES') * _PAGE_SIZE
+    except (ValueError, OSError, AttributeError):
+        return 0
+
+
+def _release_free_heap() -> None:
+    """Return freed heap pages to the OS (glibc only)"""
+    try:
+        ctypes.CDLL("libc.so.6").malloc_trim(0)
+    except (OSError, AttributeError):
+        pass
+
+
+class MemoryGovernor:
+    """
+    Applies memory hygiene in proportion to actual pressure
+
+    Below the soft threshold nothing is done. Above it a garbage collection
+    runs (rate-limited). Above the hard threshold registered cache shrinkers
+    run as well, and admission of new work pauses until usage drops back
+    below the soft threshold or the admission timeout expires. Pausing only
+    helps while other admitted work is running and can free memory; with
+    nothing in flight the caches are shrunk and the work proceeds.
+    """
+
+    def __init__(self, config_manager=None, soft_limit_mb: Optional[int] = None,
+                 hard_limit_mb: Optional[int] = None, sample_interval: float = 0.5,
+                 gc_cooldown_seconds: float = 10.0, admission_timeout_seconds: Optional[float] = None):
+        """
+        Initialize memory governor
+
+        Args:
+            config_manager: Optional configuration manager (system.memory_* settings)
+            soft_limit_mb: RSS above which garbage collection runs
+            hard_limit_mb: RSS above which caches shrink and admission pauses
+            sample_interval: Minimum seconds between RSS samples
+            gc_cooldown_seconds: Minimum seconds between soft-pressure collections
+            admission_timeout_seconds: Maximum time to pause admission
+        """
+        system_config = getattr(getattr(config_manager, 'config', None), 'system', None)
+        soft_limit_mb = soft_limit_mb or getattr(system_config, 'memory_soft_limit_mb', None)
+        hard_limit_mb = hard_limit_mb or getattr(system_config, 'memory_hard_limit_mb', None)
+        if admission_timeout_seconds is None:
+            admission_timeout_seconds = getattr(system_config, 'memory_admission_timeout_seconds', None) or 300
+
+        limit_bytes = read_memory_limit_bytes()
+        self.soft_limit_bytes = int(soft_limit_mb * 1024 * 1024) if soft_limit_mb else int(limit_bytes * 0.70)
+        self.hard_limit_bytes = int(hard_limit_mb * 1024 * 1024) if hard_limit_mb else int(limit_bytes * 0.85)
+        if self.hard_limit_bytes and self.hard_limit_bytes < self.soft_limit_bytes:
+            self.hard_limit_bytes = self.soft_limit_bytes
+
+        self.sample_interval = sample_interval
+        self.gc_cooldown_seconds = gc_cooldown_seconds
+        self.admission_timeout_seconds = admission_timeout_seconds
+
+        self._cache_shrinkers: List[Callable[[], None]] = []
+        self._lock = threading.RLock()
+        self._last_sample_time = 0.0
+        self._last_rss = 0
+        self._last_gc_time = 0.0
+        self._in_flight = 0
+        self.stats: Dict[str, Any] = {
+            'samples': 0,
+            'gc_collections': 0,
+            'cache_shrinks': 0,
+            'admission_pauses': 0,
+            'admission_skips': 0,
+            'admission_wait_seconds': 0.0,
+            'peak_rss_mb': 0.0
+        }
+
+        logger.info(f"🧠 Memory governor: soft={self.soft_limit_bytes / 1024 / 1024:.0f}MB, "
+                    f"hard={self.hard_limit_bytes / 1024 / 1024:.0f}MB")
+
+    def register_cache_shrinker(self, shrinker: Callable[[], None]) -> None:
+        """Register a callable that releases cached memory under hard pressure"""
+        with self._lock:
+            self._cache_shrinkers.append(shrinker)
+
+    def work_started(self) -> None:
+        """Record that admitted work started running"""
+        with self._lock:
+            self._in_flight += 1
+
+    def work_finished(self) -> None:
+        """Record that admitted work finished and released its memory"""
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+
+    @property
+    def in_flight(self) -> int:
+        """Admitted work still running"""
+        with self._lock:
+            return self._in_flight
+
+    def get_rss_bytes(self, force: bool = False) -> int:
+        """Get RSS, re-sampling at most every sample_interval seconds"""
+        now = time.monotonic()
+        with self._lock:
+            if force or now - self._last_sample_time >= self.sample_interval:
+                self._last_rss = read_rss_bytes()
+                self._last_sample_time = now
+                self.stats['samples'] += 1
+                self.stats['peak_rss_mb'] = max(self.stats['peak_rss_mb'], self._last_rss / 1024 / 1024)
+            return self._last_rss
+
+    def get_pressure(self, force: bool = False) -> MemoryPressure:
+        """Classify the current memory pressure"""
+        rss = self.get_rss_bytes(force)
+        if self.hard_limit_bytes and rss >= self.hard_limit_bytes:
+            return MemoryPressure.HARD
+        if self.soft_limit_bytes and rss >= self.soft_limit_bytes:
+            return MemoryPressure.SOFT
+        return MemoryPressure.NORMAL
+
+    def check(self) -> MemoryPressure:
+        """
+        Sample memory and reclaim only if a threshold is crossed
+
+        Returns:
+            Memory pressure observed before reclaiming
+        """
+        pressure = self.get_pressure()
+        if pressure == MemoryPressure.NORMAL:
+            return pressure
+
+        with self._lock:
+            now = time.monotonic()
+            if pressure == MemoryPressure.HARD:
+                self._shrink_caches()
+                self._collect(now)
+                _release_free_heap()
+            elif now - self._last_gc_time >= self.gc_cooldown_seconds:
+                self._collect(now)
+        return pressure
+
+    def _collect(self, now: float) -> None:
+        """Run a full garbage collection"""
+        gc.collect()
+        self._last_gc_time = now
+        self.stats['gc_collections'] += 1
+        logger.debug(f"🧹 Memory governor collected garbage at {self._last_rss / 1024 / 1024:.0f}MB RSS")
+
+    def _shrink_caches(self) -> None:
+        """Run registered cache shrinkers"""
+        for shrinker in self._cache_shrinkers:
+            try:
+                shrinker()
+            except Exception as e:
+                logger.warning(f"⚠️ Cache shrinker failed: {e}")
+        self.stats['cache_shrinks'] += 1
+
+    def wait_for_admission(self, poll_interval: float = 0.5) -> bool:
+        """
+        Block admission of new work while under hard memory pressure
+
+        Once paused, admission resumes only after usage falls below the soft
+        threshold (hysteresis), the last work in flight finishes, or the
+        admission timeout expires. With nothing in flight no memory can be
+        freed by waiting, so the work is admitted after the caches shrink.
+
+        Returns:
+            True if admitted without timing out
+        """
+        if self.check() != MemoryPressure.HARD:
+            return True
+
+        if self.in_flight == 0:
+            self.stats['admission_skips'] += 1
+            logger.warning(f"⚠️ Memory pressure: {self._last_rss / 1024 / 1024:.0f}MB RSS with no work in flight, "
+                           f"caches shrunk, continuing")
+            return True
+
+        started = time.monotonic()
+        self.stats['admission_pauses'] += 1
+        logger.warning(f"⏸️ Memory pressure: {self._last_rss / 1024 / 1024:.0f}MB RSS, pausing admission of new work")
+
+        admitted = True
+        while self.get_pressure(force=True) != MemoryPressure.NORMAL and self.in_flight > 0:
+            if time.monotonic() - started >= self.admission_timeout_seconds:
+                logger.warning("⚠️ Memory pressure persisted past admission timeout, continuing")
+                admitted = False
+                break
+            time.sleep(poll_interval)
+            self.check()
+
+        waited = time.monotonic() - started
+        self.stats['admission_wait_seconds'] += waited
+        if admitted:
+            logger.info(f"▶️ Memory pressure relieved after {waited:.1f}s, resuming admission")
+        return admitted
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get governor statistics"""
+        with self._lock:
+            return {
+                **self.stats,
+                'in_flight': self._in_flight,
+                'current_rss_mb': self._last_rss / 1024 / 1024,
+                'soft_limit_mb': self.soft_limit_bytes / 1024 / 1024,
+                'hard_limit_mb': self.hard_limit_bytes / 1024 / 1024
+            }
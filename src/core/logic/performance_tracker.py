@@ -10,6 +10,7 @@ from datetime import datetime
 import time
 
 from src.utils.config_manager import ConfigManager
+from src.core.logic.cpu_placement import get_placement_report
 
 logger = logging.getLogger(__name__)
 
@@ -150,6 +151,11 @@ class PerformanceTracker:
             'timestamp': datetime.now().isoformat()
         }
         
+        # Worker pinning applied in this process (system.cpu_placement)
+        placement_report = get_placement_report()
+        if placement_report:
+            report['cpu_placement'] = placement_report
+        
         # Add performance monitor data if available
         if self._performance_monitor:
             try:
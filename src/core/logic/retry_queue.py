@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Delayed Retry Queue
+Holds failed work until its jittered backoff expires, so retries wait on a
+timer instead of occupying a worker
+"""
+
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Share of the backoff that is randomized; 0.5 waits between half and all of it
+DEFAULT_JITTER = 0.5
+
+
+class DelayedRetryQueue:
+    """
+    Thread-safe queue of items that become due after a delay
+
+    Items are kept in a heap ordered by due time. A coordinator takes the
+    items that are due and resubmits them, and waits on the queue (not on a
+    worker) until the next one is due or new work completes. Delays are
+    jittered so files that failed together, e.g. on a shared outage, do not
+    retry in lockstep.
+    """
+
+    def __init__(self, jitter: float = DEFAULT_JITTER, clock: Callable[[], float] = time.monotonic,
+                 rng: Optional[random.Random] = None):
+        """
+        Initialize queue
+
+        Args:
+            jitter: Share of each delay that is randomized (0 keeps delays exact)
+            clock: Monotonic time source
+            rng: Random source for jitter
+        """
+        self.jitter = min(1.0, max(0.0, jitter))
+        self.clock = clock
+        self.rng = rng or random.Random()
+        self._heap: List[Tuple[float, int, Any]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+
+    def schedule(self, item: Any, delay: float) -> float:
+        """
+        Add an item that becomes due after a jittered delay
+
+        Args:
+            item: Work to retry
+            delay: Backoff in seconds before jitter
+
+        Returns:
+            Actual delay in seconds
+        """
+        delay = max(0.0, delay) * (1.0 - self.jitter * self.rng.random())
+        with self._condition:
+            heapq.heappush(self._heap, (self.clock() + delay, next(self._sequence), item))
+            self._condition.notify_all()
+        return delay
+
+    def pop_due(self) -> List[Any]:
+        """Remove and return every item whose delay has expired, earliest first"""
+        now = self.clock()
+        due = []
+        with self._condition:
+            while self._heap and self._heap[0][0] <= now:
+                due.append(heapq.heappop(self._heap)[2])
+        return due
+
+    def drain(self) -> List[Any]:
+        """Remove and return every item, due or not, earliest first"""
+        with self._condition:
+            items = [entry[2] for entry in sorted(self._heap)]
+            self._heap = []
+        return items
+
+    def seconds_until_due(self) -> Optional[float]:
+        """Time until the next item is due (0 if one already is), or None when empty"""
+        with self._condition:
+            if not self._heap:
+                return None
+            return max(0.0, self._heap[0][0] - self.clock())
+
+    def wait_until_due(self, timeout: Optional[float] = None) -> None:
+        """Block until the next item is due, an item is added, or the timeout passes"""
+        with self._condition:
+            delay = max(0.0, self._heap[0][0] - self.clock()) if self._heap else timeout
+            if timeout is not None and delay is not None:
+                delay = min(delay, timeout)
+            if delay is None or delay > 0:
+                self._condition.wait(delay)
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._heap)
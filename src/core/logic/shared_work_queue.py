@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+"""
+Shared Work Queue
+SQLite work queue on a shared filesystem, so several hosts can process the
+same batch without duplicating files or needing a broker
+"""
+
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEASE_SECONDS = 300
+DEFAULT_MAX_ATTEMPTS = 3
+# Leases are renewed this many times per lease period
+HEARTBEATS_PER_LEASE = 3
+# Seconds between claim attempts while other hosts hold the remaining files, backing off from the minimum
+MIN_POLL_SECONDS = 0.1
+DEFAULT_POLL_SECONDS = 5.0
+# Seconds a host waits for another host's write transaction
+BUSY_TIMEOUT_SECONDS = 60.0
+# Files a host adds per enqueue while discovery is still streaming
+ENQUEUE_BATCH_SIZE = 64
+
+PENDING = 'pending'
+LEASED = 'leased'
+DONE = 'done'
+FAILED = 'failed'
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS work_items (
+        path TEXT PRIMARY KEY,
+        position INTEGER NOT NULL,
+        cost REAL NOT NULL DEFAULT 0,
+        state TEXT NOT NULL,
+        owner TEXT,
+        lease_token TEXT,
+        lease_expires REAL,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        error TEXT,
+        completed_by TEXT,
+        completed_at TEXT,
+        run_id INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS work_items_state ON work_items (state, position)",
+    """
+    CREATE TABLE IF NOT EXISTS runs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        started_by TEXT,
+        started_at TEXT
+    )
+    """
+)
+
+
+@dataclass
+class WorkLease:
+    """A claimed file; only the holder of the current token can record its outcome"""
+    file_path: str
+    position: int
+    cost: float
+    token: str
+    attempt: int
+    expires: float
+
+
+def default_worker_id() -> str:
+    """Identity of this process across hosts: host name, process id and a random suffix"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+class SharedWorkQueue:
+    """
+    Lease-based work queue in one SQLite database
+
+    Every host enqueues the same file list; inserts are idempotent, so the
+    first host creates the items and the others join. Items belong to a
+    run: a host joins the run in progress while any file is pending or
+    leased, and otherwise starts a new run, which returns the files it
+    enqueues to pending even if an earlier run finished them. Which files
+    need processing again is decided before enqueueing (the batch skip
+    index), not by the queue. A host claims the
+    first pending file in a write transaction and holds it under a lease
+    that a heartbeat thread renews. A host that crashes stops renewing, and
+    once its lease expires another host reclaims the file, counted as a new
+    attempt. Completion is recorded at most once: it only succeeds for the
+    holder of the current lease token, so a host that lost its lease cannot
+    overwrite the outcome of the host that took over.
+
+    Network filesystems do not provide the shared memory WAL mode relies on,
+    so the database uses the rollback journal and needs POSIX locks on the
+    mount (NFSv4 or a locking NFSv3 setup). Lease expiry uses wall-clock time,
+    so host clocks must agree to well within the lease period.
+    """
+
+    def __init__(self, db_path: str, worker_id: Optional[str] = None, lease_seconds: float = DEFAULT_LEASE_SECONDS,
+                 max_attempts: int = DEFAULT_MAX_ATTEMPTS, poll_seconds: float = DEFAULT_POLL_SECONDS,
+                 clock: Callable[[], float] = time.time):
+        """
+        Initialize work queue
+
+        Args:
+            db_path: SQLite database path on the shared filesystem (created if missing)
+            worker_id: Identity recorded on claims (defaults to host:pid:random)
+            lease_seconds: Time a claim stays valid without a heartbeat
+            max_attempts: Claims of a file before it is marked failed
+            poll_seconds: Longest wait between claim attempts while other hosts hold the remaining files
+            clock: Wall-clock time source shared by all hosts
+        """
+        self.db_path = Path(db_path)
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_seconds = max(1.0, float(lease_seconds))
+        self.max_attempts = max(1, max_attempts)
+        self.poll_seconds = poll_seconds
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._held: Dict[str, WorkLease] = {}
+        self.run_id: Optional[int] = None
+        self._next_position = 0
+        self._heartbeat_thread: Optional[threading.Thread] = None
+        self._heartbeat_stop = threading.Event()
+        self.stats: Dict[str, Any] = {'claimed': 0, 'completed': 0, 'failed': 0, 'reclaimed': 0, 'lost_leases': 0}
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), timeout=BUSY_TIMEOUT_SECONDS,
+                                     check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=DELETE")
+        for statement in _SCHEMA:
+            self._conn.execute(statement)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(work_items)")}
+        if 'run_id' not in columns:
+            # Queues created before runs existed; another host may add the column first
+            try:
+                self._conn.execute("ALTER TABLE work_items ADD COLUMN run_id INTEGER NOT NULL DEFAULT 0")
+            except sqlite3.OperationalError as e:
+                if 'duplicate column' not in str(e):
+                    raise
+        logger.info(f"🗂️ Shared work queue {self.db_path} as {self.worker_id}")
+
+    def enqueue(self, items: Iterable[Tuple[str, float]]) -> int:
+        """
+        Add files in claim order, after the files this queue enqueued before
+
+        The first call joins the run in progress or starts a new one. Files
+        already queued in the current run keep their state; files left over
+        from an earlier run are queued again.
+
+        Args:
+            items: (file path, expected cost) pairs, highest priority first
+
+        Returns:
+            Number of files added or queued again by this call
+        """
+        rows = [(os.path.abspath(path), self._next_position + offset, float(cost or 0.0), PENDING)
+                for offset, (path, cost) in enumerate(items)]
+        self._next_position += len(rows)
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            if self.run_id is None:
+                self.run_id = self._join_or_start_run()
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT INTO work_items (path, position, cost, state, run_id) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (path) DO UPDATE SET position = excluded.position, cost = excluded.cost, "
+                "state = excluded.state, owner = NULL, lease_token = NULL, lease_expires = NULL, attempts = 0, "
+                "error = NULL, completed_by = NULL, completed_at = NULL, run_id = excluded.run_id "
+                "WHERE work_items.run_id < excluded.run_id",
+                [row + (self.run_id,) for row in rows]
+            )
+            added = self._conn.total_changes - before
+        logger.info(f"🗂️ Enqueued {added} of {len(rows)} files ({len(rows) - added} already queued)")
+        return added
+
+    def _join_or_start_run(self) -> int:
+        """Id of the run in progress, or of a new run if every file is finished; the caller holds a transaction"""
+        latest = self._conn.execute("SELECT MAX(id) FROM runs").fetchone()[0]
+        active = self._conn.execute(
+            "SELECT 1 FROM work_items WHERE state IN (?, ?) LIMIT 1", (PENDING, LEASED)
+        ).fetchone()
+        if latest is not None and active is not None:
+            logger.info(f"🗂️ Joining run {latest} of the shared work queue")
+            return latest
+        run_id = self._conn.execute(
+            "INSERT INTO runs (started_by, started_at) VALUES (?, ?)", (self.worker_id, datetime.now().isoformat())
+        ).lastrowid
+        logger.info(f"🗂️ Started run {run_id} of the shared work queue")
+        return run_id
+
+    def claim(self) -> Optional[WorkLease]:
+        """
+        Lease the first pending file, or one whose lease expired
+
+        Returns:
+            WorkLease, or None if nothing can be claimed right now
+        """
+        now = self.clock()
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            # Expired leases that used up their attempts will not be retried
+            self._conn.execute(
+                "UPDATE work_items SET state = ?, error = ?, owner = NULL, lease_token = NULL "
+                "WHERE state = ? AND lease_expires < ? AND attempts >= ?",
+                (FAILED, 'Lease expired on the last attempt', LEASED, now, self.max_attempts)
+            )
+            row = self._conn.execute(
+                "SELECT path, position, cost, state, attempts, run_id FROM work_items "
+                "WHERE state = ? OR (state = ? AND lease_expires < ?) ORDER BY position LIMIT 1",
+                (PENDING, LEASED, now)
+            ).fetchone()
+            if row is None:
+                return None
+            path, position, cost, state, attempts, run_id = row
+            if self.run_id is None:
+                # Helping with a run before enqueueing joins it
+                self.run_id = run_id
+            lease = WorkLease(path, position, cost, uuid.uuid4().hex, attempts + 1, now + self.lease_seconds)
+            self._conn.execute(
+                "UPDATE work_items SET state = ?, owner = ?, lease_token = ?, lease_expires = ?, attempts = ? "
+                "WHERE path = ?",
+                (LEASED, self.worker_id, lease.token, lease.expires, lease.attempt, path)
+            )
+            self._held[path] = lease
+        self.stats['claimed'] += 1
+        if state == LEASED:
+            self.stats['reclaimed'] += 1
+            logger.warning(f"♻️ Reclaimed {path} after its lease expired (attempt {lease.attempt})")
+        return lease
+
+    def next_lease(self, stop: Optional[threading.Event] = None) -> Optional[WorkLease]:
+        """
+        Claim the next file, waiting while other hosts hold every remaining file
+
+        Files held by other hosts are waited for because their leases expire
+        if those hosts die.
+
+        Args:
+            stop: Event that ends the wait early
+
+        Returns:
+            WorkLease, or None once every file is done or failed
+        """
+        wait = min(MIN_POLL_SECONDS, self.poll_seconds)
+        while True:
+            lease = self.claim()
+            if lease is not None:
+                return lease
+            if self.is_drained() or (stop is not None and stop.is_set()):
+                return None
+            if stop is not None:
+                stop.wait(wait)
+            else:
+                time.sleep(wait)
+            # Back off while the remaining files stay leased elsewhere
+            wait = min(self.poll_seconds, wait * 2)
+
+    def heartbeat(self, lease: WorkLease) -> bool:
+        """
+        Extend a lease
+
+        Returns:
+            False if the lease was lost to another host
+        """
+        expires = self.clock() + self.lease_seconds
+        with self._lock, self._conn:
+            renewed = self._conn.execute(
+                "UPDATE work_items SET lease_expires = ? WHERE path = ? AND lease_token = ? AND state = ?",
+                (expires, lease.file_path, lease.token, LEASED)
+            ).rowcount == 1
+            if renewed:
+                lease.expires = expires
+            else:
+                self._held.pop(lease.file_path, None)
+        if not renewed:
+            self.stats['lost_leases'] += 1
+            logger.warning(f"⚠️ Lost the lease on {lease.file_path}")
+        return renewed
+
+    def complete(self, lease: WorkLease) -> bool:
+        """
+        Record a file as done, once
+
+        Returns:
+            True if this call recorded the completion; False if the lease was lost
+        """
+        return self._finish(lease, DONE, None)
+
+    def fail(self, lease: WorkLease, error: str, retry: bool = True) -> Optional[str]:
+        """
+        Record a failed attempt
+
+        Args:
+            lease: Lease of the file
+            error: Failure description
+            retry: Return the file to the queue if attempts remain
+
+        Returns:
+            The file's new state (pending to retry, or failed), or None if the lease was lost
+        """
+        state = PENDING if retry and lease.attempt < self.max_attempts else FAILED
+        return state if self._finish(lease, state, error) else None
+
+    def _finish(self, lease: WorkLease, state: str, error: Optional[str]) -> bool:
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            recorded = self._conn.execute(
+                "UPDATE work_items SET state = ?, error = ?, owner = NULL, lease_token = NULL, lease_expires = NULL, "
+                "completed_by = ?, completed_at = ? WHERE path = ? AND lease_token = ? AND state = ?",
+                (state, error, self.worker_id if state == DONE else None,
+                 datetime.now().isoformat() if state == DONE else None, lease.file_path, lease.token, LEASED)
+            ).rowcount == 1
+            self._held.pop(lease.file_path, None)
+        if not recorded:
+            self.stats['lost_leases'] += 1
+            logger.warning(f"⚠️ Outcome of {lease.file_path} not recorded: its lease passed to another worker")
+        elif state == DONE:
+            self.stats['completed'] += 1
+        elif state == FAILED:
+            self.stats['failed'] += 1
+        return recorded
+
+    def counts(self) -> Dict[str, int]:
+        """Number of files in each state, within the current run once this queue has joined one"""
+        with self._lock:
+            if self.run_id is None:
+                rows = self._conn.execute("SELECT state, COUNT(*) FROM work_items GROUP BY state").fetchall()
+            else:
+                rows = self._conn.execute(
+                    "SELECT state, COUNT(*) FROM work_items WHERE run_id = ? GROUP BY state", (self.run_id,)
+                ).fetchall()
+        return {PENDING: 0, LEASED: 0, DONE: 0, FAILED: 0, **dict(rows)}
+
+    def is_drained(self) -> bool:
+        """True when no file is pending or leased"""
+        counts = self.counts()
+        return counts[PENDING] == 0 and counts[LEASED] == 0
+
+    def start_heartbeat(self) -> None:
+        """Renew this worker's leases in the background"""
+        if self._heartbeat_thread is not None:
+            return
+        self._heartbeat_stop.clear()
+        self._heartbeat_thread = threading.Thread(target=self._heartbeat_loop, name="work-queue-heartbeat",
+                                                  daemon=True)
+        self._heartbeat_thread.start()
+
+    def stop_heartbeat(self) -> None:
+        if self._heartbeat_thread is None:
+            return
+        self._heartbeat_stop.set()
+        self._heartbeat_thread.join(timeout=5)
+        self._heartbeat_thread = None
+
+    def _heartbeat_loop(self) -> None:
+        while not self._heartbeat_stop.wait(self.lease_seconds / HEARTBEATS_PER_LEASE):
+            with self._lock:
+                held = list(self._held.values())
+            for lease in held:
+                try:
+                    self.heartbeat(lease)
+                except sqlite3.Error as e:
+                    logger.warning(f"⚠️ Heartbeat for {lease.file_path} failed: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, 'worker_id': self.worker_id, 'run_id': self.run_id, 'queue': self.counts()}
+
+    def close(self) -> None:
+        self.stop_heartbeat()
+        with self._lock:
+            self._conn.close()
+
+
+def create_shared_work_queue(config_manager: Any) -> Optional[SharedWorkQueue]:
+    """
+    Open the shared work queue if batch.work_queue_path is set
+
+    Attempts per file are system.retry_attempts plus the first one.
+
+    Args:
+        config_manager: Configuration manager
+
+    Returns:
+        SharedWorkQueue, or None when not configured or the database cannot be opened
+    """
+    config = getattr(config_manager, 'config', None)
+    batch = getattr(config, 'batch', None)
+    db_path = getattr(batch, 'work_queue_path', None)
+    if not isinstance(db_path, str) or not db_path:
+        return None
+    lease_seconds = getattr(batch, 'work_queue_lease_seconds', None)
+    retry_attempts = getattr(getattr(config, 'system', None), 'retry_attempts', None)
+    try:
+        return SharedWorkQueue(
+            db_path,
+            lease_seconds=lease_seconds if isinstance(lease_seconds, int) else DEFAULT_LEASE_SECONDS,
+            max_attempts=retry_attempts + 1 if isinstance(retry_attempts, int) else DEFAULT_MAX_ATTEMPTS
+        )
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"⚠️ Shared work queue unavailable, processing the whole batch here: {e}")
+        return None
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Thread Budget
+Splits the available cores between batch workers, chunk workers, CTranslate2
+and native BLAS/OpenMP pools so they do not oversubscribe the CPU
+"""
+
+import logging
+import math
+import os
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Environment variables read by OpenMP, MKL, OpenBLAS, Accelerate and numexpr when they initialize
+NATIVE_THREAD_ENV_VARS = (
+    'OMP_NUM_THREADS', 'MKL_NUM_THREADS', 'OPENBLAS_NUM_THREADS',
+    'VECLIB_MAXIMUM_THREADS', 'NUMEXPR_NUM_THREADS'
+)
+
+# Lists the user-set variables, so child processes can tell inherited budget values from user settings
+MANAGED_MARKER_ENV_VAR = 'THREAD_BUDGET_USER_VARS'
+
+
+def _detect_user_thread_env() -> Dict[str, str]:
+    if MANAGED_MARKER_ENV_VAR in os.environ:
+        user_vars = [name for name in os.environ[MANAGED_MARKER_ENV_VAR].split(',') if name]
+    else:
+        user_vars = [name for name in NATIVE_THREAD_ENV_VARS if name in os.environ]
+    return {name: os.environ[name] for name in user_vars if name in os.environ}
+
+
+# Limits set by the user before startup always win over the computed budget
+_USER_THREAD_ENV = _detect_user_thread_env()
+
+
+def detect_available_cores() -> int:
+    """
+    Count the cores this process may actually use
+
+    Honors CPU affinity and cgroup (container) CPU quotas before falling back
+    to the host core count.
+
+    Returns:
+        Number of usable cores (at least 1)
+    """
+    try:
+        cores = len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        cores = os.cpu_count() or 1
+
+    for cgroup_file in ('/sys/fs/cgroup/cpu.max', '/sys/fs/cgroup/cpu/cpu.cfs_quota_us'):
+        try:
+            with open(cgroup_file, 'r') as f:
+                fields = f.read().split()
+            if cgroup_file.endswith('cpu.max'):
+                quota, period = fields[0], int(fields[1])
+            else:
+                with open('/sys/fs/cgroup/cpu/cpu.cfs_period_us', 'r') as f:
+                    quota, period = fields[0], int(f.read().strip())
+            if quota.isdigit() and period > 0:
+                cores = min(cores, max(1, math.ceil(int(quota) / period)))
+            break
+        except (OSError, ValueError, IndexError):
+            continue
+    return max(1, cores)
+
+
+@dataclass
+class ThreadLayout:
+    """How the core budget is split across the processing layers"""
+    total_cores: int
+    batch_workers: int
+    chunk_workers: int
+    chunk_backend: str
+    model_instances: int
+    ct2_inter_threads: int
+    ct2_intra_threads: int
+    native_threads: int
+    worker_native_threads: int
+    batch_backend: str = 'thread'
+
+    @property
+    def concurrent_decodes(self) -> int:
+        return self.batch_workers * self.chunk_workers
+
+    @property
+    def compute_threads(self) -> int:
+        """Threads the CTranslate2 models can run at once"""
+        return self.model_instances * self.ct2_inter_threads * self.ct2_intra_threads
+
+    def to_dict(self) -> Dict[str, Any]:
+        layout = asdict(self)
+        layout['concurrent_decodes'] = self.concurrent_decodes
+        layout['compute_threads'] = self.compute_threads
+        return layout
+
+    def describe(self) -> str:
+        return (f"{self.total_cores} cores → {self.batch_workers} {self.batch_backend} batch worker(s) × "
+                f"{self.chunk_workers} {self.chunk_backend} chunk worker(s); "
+                f"{self.model_instances} model(s) with inter_threads={self.ct2_inter_threads}, "
+                f"intra_threads={self.ct2_intra_threads}; BLAS/OpenMP threads={self.native_threads}"
+                + (f" (workers {self.worker_native_threads})" if 'process' in (self.batch_backend, self.chunk_backend) else ""))
+
+
+class ThreadBudgetAllocator:
+    """
+    Computes a thread layout from the core count and the worker layout
+
+    Worker counts are capped so that concurrent decodes never exceed the
+    cores. With the thread backend all decodes share one model, so
+    CTranslate2 runs them as parallel batches (inter_threads) and divides the
+    cores between them (intra_threads). With the process backend every worker
+    holds its own model and gets an equal share of the cores. With the process
+    batch backend every file worker holds its own model, gets an equal share
+    of the cores and runs its chunks on threads. Native BLAS and OpenMP pools
+    get the cores left per concurrent decode, since feature extraction and
+    audio processing run on the same worker threads.
+    """
+
+    def __init__(self, total_cores: Optional[int] = None):
+        """
+        Initialize allocator
+
+        Args:
+            total_cores: Cores to budget (defaults to the usable cores of this process)
+        """
+        self.total_cores = max(1, total_cores or detect_available_cores())
+
+    def allocate(self, batch_workers: int = 1, chunk_workers: int = 1, chunk_backend: str = 'thread',
+                 intra_threads: Optional[int] = None, inter_threads: Optional[int] = None,
+                 max_intra_threads: Optional[int] = None, batch_backend: str = 'thread') -> ThreadLayout:
+        """
+        Allocate threads for a worker layout
+
+        Args:
+            batch_workers: Requested concurrent files
+            chunk_workers: Requested concurrent chunks per file
+            chunk_backend: 'thread' or 'process'
+            intra_threads: Explicit CTranslate2 intra_threads (overrides the computed value)
+            inter_threads: Explicit CTranslate2 inter_threads (overrides the computed value)
+            max_intra_threads: Upper bound for the computed intra_threads (0 or None for no bound)
+            batch_backend: 'thread' or 'process' (process batch workers run their chunks on threads)
+
+        Returns:
+            ThreadLayout
+        """
+        cores = self.total_cores
+        batch_workers = min(max(1, batch_workers), cores)
+        chunk_workers = min(max(1, chunk_workers), max(1, cores // batch_workers))
+        concurrent_decodes = batch_workers * chunk_workers
+
+        if batch_backend == 'process':
+            # Batch worker processes never start chunk processes of their own
+            chunk_backend = 'thread'
+            cores_per_worker = max(1, cores // batch_workers)
+            model_instances = batch_workers
+            computed_inter = min(chunk_workers, cores_per_worker)
+            computed_intra = max(1, cores_per_worker // computed_inter)
+            native_threads = max(1, cores // concurrent_decodes)
+        elif chunk_backend == 'process':
+            model_instances = chunk_workers
+            computed_inter = 1
+            computed_intra = max(1, cores // chunk_workers)
+            native_threads = max(1, cores // batch_workers)
+        else:
+            model_instances = 1
+            computed_inter = min(concurrent_decodes, cores)
+            computed_intra = max(1, cores // computed_inter)
+            native_threads = max(1, cores // concurrent_decodes)
+
+        if max_intra_threads:
+            computed_intra = min(computed_intra, max_intra_threads)
+        ct2_inter = max(1, inter_threads or computed_inter)
+        ct2_intra = max(1, intra_threads or computed_intra)
+        return ThreadLayout(
+            total_cores=cores,
+            batch_workers=batch_workers,
+            chunk_workers=chunk_workers,
+            chunk_backend=chunk_backend,
+            model_instances=model_instances,
+            ct2_inter_threads=ct2_inter,
+            ct2_intra_threads=ct2_intra,
+            native_threads=native_threads,
+            worker_native_threads=ct2_intra if 'process' in (batch_backend, chunk_backend) else native_threads,
+            batch_backend=batch_backend
+        )
+
+
+def apply_native_thread_limits(threads: int) -> Dict[str, str]:
+    """
+    Limit BLAS/OpenMP thread pools
+
+    Sets the environment variables read by pools that initialize later (and
+    by spawned worker processes), then resizes pools that are already loaded
+    through threadpoolctl when it is installed. Variables the user set before
+    startup are left untouched.
+
+    Args:
+        threads: Threads per native pool
+
+    Returns:
+        The environment values in effect
+    """
+    threads = max(1, int(threads))
+    for name in NATIVE_THREAD_ENV_VARS:
+        if name not in _USER_THREAD_ENV:
+            os.environ[name] = str(threads)
+    os.environ[MANAGED_MARKER_ENV_VAR] = ','.join(_USER_THREAD_ENV)
+
+    try:
+        from threadpoolctl import threadpool_limits
+        threadpool_limits(limits=int(_USER_THREAD_ENV.get('OMP_NUM_THREADS', threads)))
+    except ImportError:
+        pass
+    except Exception as e:
+        logger.debug(f"threadpoolctl could not resize native pools: {e}")
+
+    return {name: os.environ[name] for name in NATIVE_THREAD_ENV_VARS}
+
+
+def _read_option(section: Any, key: str, expected_type: type) -> Any:
+    """Read a config option from a pydantic section or a plain dict (None if unset or of another type)"""
+    value = section.get(key) if isinstance(section, dict) else getattr(section, key, None)
+    if isinstance(value, bool) and expected_type is not bool:
+        return None
+    return value if isinstance(value, expected_type) else None
+
+
+def layout_from_config(config_manager: Any, total_cores: Optional[int] = None) -> ThreadLayout:
+    """
+    Compute the thread layout described by the configuration
+
+    Reads batch.max_workers (when parallel_processing is on), batch.execution_backend,
+    chunking.max_chunk_workers, chunking.execution_backend, system.thread_budget_cores and, from
+    transcription.ctranslate2_optimization, explicit intra_threads/inter_threads and
+    cpu_threads (faster-whisper's per-model thread count, used as an upper bound).
+    """
+    config = getattr(config_manager, 'config', None)
+    batch = getattr(config, 'batch', None)
+    chunking = getattr(config, 'chunking', None)
+    system = getattr(config, 'system', None)
+    ct2_config = getattr(getattr(config, 'transcription', None), 'ctranslate2_optimization', None)
+
+    allocator = ThreadBudgetAllocator(total_cores or _read_option(system, 'thread_budget_cores', int))
+    parallel = _read_option(batch, 'parallel_processing', bool)
+    return allocator.allocate(
+        batch_workers=(_read_option(batch, 'max_workers', int) or 1) if parallel else 1,
+        chunk_workers=_read_option(chunking, 'max_chunk_workers', int) or 1,
+        chunk_backend=(_read_option(chunking, 'execution_backend', str) or 'thread').lower(),
+        intra_threads=_read_option(ct2_config, 'intra_threads', int),
+        inter_threads=_read_option(ct2_config, 'inter_threads', int),
+        max_intra_threads=_read_option(ct2_config, 'cpu_threads', int),
+        batch_backend=(_read_option(batch, 'execution_backend', str) or 'thread').lower()
+    )
+
+
+_thread_layout: Optional[ThreadLayout] = None
+_thread_layout_lock = threading.Lock()
+
+
+def configure_thread_budget(config_manager: Any, worker_process: bool = False) -> ThreadLayout:
+    """
+    Compute the process-wide thread layout, apply native limits and log it
+
+    Args:
+        config_manager: Configuration manager
+        worker_process: True in batch and chunk worker processes, which get the per-worker native limit
+
+    Returns:
+        ThreadLayout in effect for this process
+    """
+    global _thread_layout
+    with _thread_layout_lock:
+        layout = layout_from_config(config_manager)
+        native_threads = layout.worker_native_threads if worker_process else layout.native_threads
+        apply_native_thread_limits(native_threads)
+        if worker_process:
+            logger.debug(f"🧵 Worker thread layout: {layout.describe()}")
+        elif _thread_layout != layout:
+            logger.info(f"🧵 Thread layout: {layout.describe()}")
+        _thread_layout = layout
+        return layout
+
+
+def get_thread_layout(config_manager: Any = None) -> ThreadLayout:
+    """
+    Get the process-wide thread layout, configuring it on first use
+
+    Args:
+        config_manager: Configuration manager used if the layout is not configured yet
+
+    Returns:
+        ThreadLayout in effect for this process
+    """
+    if _thread_layout is None:
+        return configure_thread_budget(config_manager)
+    return _thread_layout
@@ -21,6 +21,8 @@ from src.core.factories import (
     SpeakerServiceFactory,
     ProgressMonitorFactory
 )
+from src.core.logic.audio_probe import get_audio_probe
+from src.utils.lazy_provider import LazyProvider
 from src.models import SpeakerConfig
 
 if TYPE_CHECKING:
@@ -60,22 +62,60 @@ class TranscriptionService:
         self.config_manager = config_manager
         self.output_manager = output_manager
 
-        # Create transcription engine to inject into services (DIP compliance)
-        self.transcription_engine = self._create_transcription_engine()
+        # Heavyweight components are built on first use, so commands that never
+        # transcribe do not construct the engine or load model code
+        self._engine_provider = LazyProvider(self._create_transcription_engine, name="transcription engine")
 
         # Use injected services or create default ones using factories with injected engine
-        self.transcription_service = transcription_service or TranscriptionServiceFactory.create_service(
-            config_manager, output_manager, self.transcription_engine
+        self._transcription_service_provider = (
+            LazyProvider.of(transcription_service) if transcription_service
+            else TranscriptionServiceFactory.create_service_provider(config_manager, output_manager, self._engine_provider)
         )
-        self.speaker_service = speaker_service or self._create_speaker_service()
-        self.enhanced_service = enhanced_service or TranscriptionServiceFactory.create_service(
-            config_manager, output_manager, self.transcription_engine
+        self._speaker_service_provider = (
+            LazyProvider.of(speaker_service) if speaker_service
+            else LazyProvider(self._create_speaker_service, name="speaker service")
+        )
+        self._enhanced_service_provider = (
+            LazyProvider.of(enhanced_service) if enhanced_service
+            else TranscriptionServiceFactory.create_service_provider(config_manager, output_manager, self._engine_provider)
         )
         self.progress_monitor = progress_monitor or ProgressMonitorFactory.create_monitor(config_manager)
 
         self.current_job: Optional[Dict[str, Any]] = None
         self.processing_stats: Dict[str, Any] = {}
     
+    @property
+    def transcription_engine(self):
+        """Transcription engine, created on first use"""
+        return self._engine_provider.get()
+    
+    @property
+    def transcription_service(self) -> Optional[TranscriptionServiceProtocol]:
+        """Basic transcription service, created on first use"""
+        return self._transcription_service_provider.get()
+    
+    @transcription_service.setter
+    def transcription_service(self, service: Optional[TranscriptionServiceProtocol]) -> None:
+        self._transcription_service_provider = LazyProvider.of(service, name="transcription service")
+    
+    @property
+    def speaker_service(self) -> Optional[SpeakerServiceProtocol]:
+        """Speaker diarization service, created on first use"""
+        return self._speaker_service_provider.get()
+    
+    @speaker_service.setter
+    def speaker_service(self, service: Optional[SpeakerServiceProtocol]) -> None:
+        self._speaker_service_provider = LazyProvider.of(service, name="speaker service")
+    
+    @property
+    def enhanced_service(self) -> Optional[TranscriptionServiceProtocol]:
+        """Enhanced transcription service, created on first use"""
+        return self._enhanced_service_provider.get()
+    
+    @enhanced_service.setter
+    def enhanced_service(self, service: Optional[TranscriptionServiceProtocol]) -> None:
+        self._enhanced_service_provider = LazyProvider.of(service, name="enhanced service")
+    
     def _create_transcription_engine(self):
         """Create transcription engine with dependency injection"""
         try:
@@ -184,14 +224,12 @@ class TranscriptionService:
     
     def _should_use_chunked_transcription(self, file_path: str) -> bool:
         """Determine if chunked transcription should be used based on audio length"""
-        try:
-            import librosa
-            duration = librosa.get_duration(path=file_path)
-            # Use chunked transcription for files longer than 5 minutes
-            return duration > 300  # 5 minutes = 300 seconds
-        except Exception as e:
-            logger.debug(f"Could not determine audio duration: {e}")
+        duration = get_audio_probe().get_duration(file_path)
+        if duration is None:
+            logger.debug(f"Could not determine audio duration: {file_path}")
             return False
+        # Use chunked transcription for files longer than 5 minutes
+        return duration > 300  # 5 minutes = 300 seconds
     
     def transcribe(self, input_data: Dict[str, Any], **kwargs) -> Dict[str, Any]:
         """
@@ -463,13 +501,30 @@ class TranscriptionService:
     
     def get_available_services(self) -> Dict[str, bool]:
         """Get information about available services"""
+        # Built services report whether they resolved; the rest report whether they
+        # can be built, without materializing them
+        engine_available = self._is_engine_available()
         return {
-            'basic_transcription': self.transcription_service is not None,
-            'speaker_diarization': self.speaker_service is not None,
-            'enhanced_features': self.enhanced_service is not None,
+            'basic_transcription': self._is_service_available(self._transcription_service_provider, engine_available),
+            'speaker_diarization': self._is_service_available(self._speaker_service_provider,
+                                                              self._is_speaker_diarization_enabled()),
+            'enhanced_features': self._is_service_available(self._enhanced_service_provider, engine_available),
             'progress_monitoring': self.progress_monitor is not None
         }
     
+    @staticmethod
+    def _is_service_available(provider: LazyProvider, buildable: bool) -> bool:
+        """Whether a service resolved, or would be built if it has not been used yet"""
+        return provider.peek() is not None if provider.is_initialized else buildable
+    
+    def _is_engine_available(self) -> bool:
+        """Whether the transcription engine is (or can be) available, without building it"""
+        engine = self._engine_provider.peek()
+        if engine is not None:
+            return engine.is_available()
+        import importlib.util
+        return importlib.util.find_spec('ctranslate2') is not None
+    
     def get_available_engines(self) -> Dict[str, str]:
         """Get available transcription engines"""
         return {
@@ -539,8 +594,9 @@ class TranscriptionService:
             except Exception:
                 pass
         
-        # Clean up other services if they have cleanup methods
-        for service in [self.transcription_service, self.speaker_service, self.enhanced_service]:
+        # Clean up other services if they have cleanup methods (services never built need no cleanup)
+        providers = [self._transcription_service_provider, self._speaker_service_provider, self._enhanced_service_provider]
+        for service in [provider.peek() for provider in providers]:
             if hasattr(service, 'cleanup'):
                 try:
                     service.cleanup()
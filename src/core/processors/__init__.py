@@ -1,10 +1,9 @@
 """
-Processors module for handling input, output, batch, and audio file processing
+Processors module for handling input, output and audio file processing
 """
 
 from .input_processor import InputProcessor
 from .output_processor import OutputProcessor
-from .batch_processor import BatchProcessor
 from .audio_file_processor import AudioFileProcessor
 from .output_saver import OutputSaver
 from .result_display import ResultDisplay
@@ -12,7 +11,6 @@ from .result_display import ResultDisplay
 __all__ = [
     'InputProcessor',
     'OutputProcessor', 
-    'BatchProcessor',
     'AudioFileProcessor',
     'OutputSaver',
     'ResultDisplay'
@@ -15,6 +15,7 @@ from src.core.processors.processing_pipeline import (
 )
 # Import moved to method level to avoid circular import
 from src.utils.config_manager import ConfigManager
+from src.utils.lazy_provider import LazyProvider
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -29,22 +30,37 @@ class AudioFileProcessor(ProcessingPipeline):
     to provide specific audio file transcription functionality.
     """
     
-    def __init__(self, config_manager: ConfigManager, output_manager: 'OutputManager'):
-        """Initialize the audio file processor"""
+    def __init__(self, config_manager: ConfigManager, output_manager: 'OutputManager',
+                 transcription_orchestrator_provider: Optional[LazyProvider] = None):
+        """
+        Initialize the audio file processor
+        
+        Args:
+            config_manager: Configuration manager instance
+            output_manager: Output manager instance
+            transcription_orchestrator_provider: Shared orchestrator provider, so processors
+                created per file reuse one engine and its loaded model
+        """
         super().__init__(config_manager, output_manager)
-        # Lazy initialization to avoid circular import
-        self._transcription_orchestrator = None
+        # Lazy initialization to avoid circular import and to keep model code out of
+        # runs that never reach core processing
+        self._transcription_orchestrator_provider = transcription_orchestrator_provider or LazyProvider(
+            self._create_transcription_orchestrator, name="transcription orchestrator"
+        )
     
     @property
     def transcription_orchestrator(self):
-        """Lazy load transcription orchestrator to avoid circular import"""
-        if self._transcription_orchestrator is None:
-            from src.core.orchestrator.transcription_orchestrator import TranscriptionOrchestrator
-            self._transcription_orchestrator = TranscriptionOrchestrator(
-                self.config_manager, 
-                self.output_manager
-            )
-        return self._transcription_orchestrator
+        """Transcription orchestrator, created on first use"""
+        return self._get_transcription_orchestrator()
+    
+    def _get_transcription_orchestrator(self):
+        """Get the shared transcription orchestrator"""
+        return self._transcription_orchestrator_provider.get()
+    
+    def _create_transcription_orchestrator(self):
+        """Create the transcription orchestrator"""
+        from src.core.orchestrator.transcription_service import TranscriptionService
+        return TranscriptionService(self.config_manager, self.output_manager)
     
     def _execute_core_processing(self, context: ProcessingContext) -> Dict[str, Any]:
         """Execute core audio transcription processing"""
@@ -167,6 +183,7 @@ class AudioFileProcessor(ProcessingPipeline):
                 save_result = self._save_results(context, formatted_data)
                 if not save_result['success']:
                     return save_result
+                formatted_data['output_files'] = save_result.get('output_files', {})
             
             self._log_processing_step("Postprocessing", context, True, "Results formatted and saved")
             return {'success': True, 'data': formatted_data}
@@ -217,11 +234,19 @@ class AudioFileProcessor(ProcessingPipeline):
             file_name = Path(context.file_path).stem
             save_result = self.output_manager.save_transcription(data, file_name)
             
-            if save_result['success']:
-                self._log_processing_step("Save results", context, True, f"Saved to {save_result.get('file_path', 'unknown')}")
-                return {'success': True, 'file_path': save_result.get('file_path')}
+            # OutputManager returns {format: path}; older managers return a success flag and file_path
+            if 'success' in save_result:
+                if not save_result['success']:
+                    return save_result
+                output_files = {'json': save_result['file_path']} if save_result.get('file_path') else {}
             else:
-                return save_result
+                output_files = {name: path for name, path in save_result.items() if isinstance(path, str)}
+                if not output_files:
+                    return {'success': False, 'error': 'No output files were saved'}
+            
+            file_path = next(iter(output_files.values()), None)
+            self._log_processing_step("Save results", context, True, f"Saved to {file_path or 'unknown'}")
+            return {'success': True, 'file_path': file_path, 'output_files': output_files}
                 
         except Exception as e:
             return self.error_handler.handle_file_processing_error(e, context.file_path, "save_results")
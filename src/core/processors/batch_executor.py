@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Process Batch Executor
+Runs batch files in worker processes that each load the model once and write
+their own outputs, returning only compact result summaries
+"""
+
+import itertools
+import logging
+import os
+import sys
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.core.logic.memory_governor import read_peak_rss_bytes, read_rss_bytes, reset_peak_rss
+from src.core.logic.retry_queue import DelayedRetryQueue
+
+logger = logging.getLogger(__name__)
+
+# Per-process state of batch worker processes
+_worker_state: Dict[str, Any] = {}
+
+
+def summarize_file_result(result, file_path: str) -> Dict[str, Any]:
+    """
+    Reduce a file ProcessingResult to a small picklable summary
+
+    Transcription text and segments stay in the worker (they are already
+    written to the output files); only counts and status cross the process
+    boundary.
+
+    Args:
+        result: ProcessingResult of a single file
+        file_path: Processed file
+
+    Returns:
+        Summary dictionary
+    """
+    data = result.data or {}
+    status = getattr(result.status, 'value', result.status)
+    return {
+        'file_path': file_path,
+        'success': bool(result.success),
+        'status': status,
+        'errors': [
+            {'error': error.get('error') or error.get('message'), 'error_type': error.get('error_type')}
+            if isinstance(error, dict) else {'error': str(error), 'error_type': None}
+            for error in result.errors
+        ],
+        'warnings': list(result.warnings),
+        'processing_time': (result.performance_metrics or {}).get('processing_time_seconds', 0.0),
+        'transcription_chars': len(data.get('transcription') or ''),
+        'segment_count': len(data.get('segments') or []),
+        'processing_info': data.get('processing_info', {}),
+        'output_files': data.get('output_files', {}),
+        'worker_pid': os.getpid()
+    }
+
+
+def _initialize_batch_worker(config_dir: str, environment, explicit_config: bool, model_name: Optional[str],
+                             placements: Optional[List[Dict[str, Any]]] = None, free_slots=None) -> None:
+    """Process pool initializer: pin the worker, then build the file pipeline and load the model once per worker"""
+    from src.utils.config_manager import ConfigManager
+    from src.core.logic.cpu_placement import claim_placement_slot, pin_to_cpus
+    from src.core.logic.thread_budget import configure_thread_budget
+
+    started = time.time()
+    config_manager = ConfigManager(config_dir=config_dir, environment=environment, explicit_config=explicit_config)
+    # Files already run one per process; a nested chunk process pool would oversubscribe the cores
+    chunking = getattr(config_manager.config, 'chunking', None)
+    if chunking is not None and getattr(chunking, 'execution_backend', 'thread') != 'thread':
+        chunking.execution_backend = 'thread'
+    # Limit native pools to this worker's share before the engine and model are imported
+    configure_thread_budget(config_manager, worker_process=True)
+
+    slot = claim_placement_slot(free_slots) if placements and free_slots is not None else None
+    if slot is not None:
+        placement = placements[slot]
+        if pin_to_cpus(placement['cpus']):
+            logger.info(f"📌 Batch worker {os.getpid()} pinned to node {placement['node']} cpus {placement['cpus']}")
+
+    from src.core.factories.output_strategy_factory import OutputStrategyFactory
+    from src.core.processors.audio_file_processor import AudioFileProcessor
+
+    output_manager = OutputStrategyFactory.create_output_manager_with_strategy(config_manager)
+    processor = AudioFileProcessor(config_manager, output_manager)
+
+    model_name = model_name or getattr(getattr(config_manager.config, 'transcription', None), 'default_model', None)
+    if model_name:
+        try:
+            engine = processor.transcription_orchestrator.transcription_engine
+            engine.model_manager.get_or_load_model(model_name)
+        except Exception as e:
+            # The model is loaded on the first file instead
+            logger.warning(f"⚠️ Batch worker {os.getpid()} could not preload {model_name}: {e}")
+
+    _worker_state['processor'] = processor
+    logger.info(f"✅ Batch worker {os.getpid()} ready in {time.time() - started:.1f}s")
+
+
+def _process_file_in_worker(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Process one file with the worker's pipeline and return its summary"""
+    from src.core.processors.processing_pipeline import ProcessingContext
+
+    context = ProcessingContext(
+        session_id=task['session_id'],
+        file_path=task['file_path'],
+        operation_type="single_file_processing",
+        parameters=task['parameters']
+    )
+    # The parent cannot see worker memory, so the worker measures what this file added to its RSS
+    resident_bytes = read_rss_bytes()
+    peak_resets = reset_peak_rss()
+    try:
+        result = _worker_state['processor'].process(context)
+        summary = summarize_file_result(result, task['file_path'])
+    except Exception as e:
+        summary = {
+            'file_path': task['file_path'],
+            'success': False,
+            'status': 'error',
+            'errors': [{'error': str(e), 'error_type': type(e).__name__}],
+            'warnings': [],
+            'processing_time': 0.0,
+            'worker_pid': os.getpid()
+        }
+    peak_bytes = read_peak_rss_bytes()
+    # Without a reset the lifetime peak may predate this file; it is only this file's if it grew
+    if resident_bytes and (peak_resets or peak_bytes > _worker_state.get('peak_rss_bytes', 0)):
+        summary['job_peak_rss_bytes'] = max(0, peak_bytes - resident_bytes)
+    _worker_state['peak_rss_bytes'] = peak_bytes
+    return summary
+
+
+class ProcessBatchExecutor:
+    """
+    Runs batch files in a pool of worker processes
+
+    Each worker builds its own file pipeline and model in the pool
+    initializer, so text cleanup, deduplication and document building run
+    in parallel instead of serializing on one interpreter lock. Tasks carry
+    only the file path and parameters; workers write the outputs themselves.
+    With max_tasks_per_child, a worker is replaced after that many files so
+    memory that leaks across files is returned to the system.
+    """
+
+    def __init__(self, config_manager, max_workers: int = 2, max_tasks_per_child: int = 0,
+                 start_method: str = "spawn", placements: Optional[List[Any]] = None,
+                 model_name: Optional[str] = None, memory_admission=None, concurrency=None,
+                 retry_delay: Optional[Callable[[Dict[str, Any], int], Optional[float]]] = None):
+        """
+        Initialize process batch executor
+
+        Args:
+            config_manager: Configuration manager (its config_dir and environment are passed to workers)
+            max_workers: Number of worker processes
+            max_tasks_per_child: Files per worker before it is replaced (0 never recycles)
+            start_method: multiprocessing start method ('spawn' avoids forking a loaded model)
+            placements: Optional WorkerPlacement per worker; each worker pins itself before loading its model
+            model_name: Model preloaded by each worker
+            memory_admission: Optional MemoryAdmissionController; a file is submitted only while its
+                estimated memory fits next to the files already in the workers
+            concurrency: Optional AdaptiveConcurrencyController deciding how many of the workers are busy
+            retry_delay: Returns the backoff before retrying a failed summary's file after the given
+                attempt, or None to report the failure (none never retries)
+        """
+        self.config_manager = config_manager
+        self.max_workers = max(1, max_workers)
+        self.max_tasks_per_child = max(0, max_tasks_per_child or 0)
+        self.start_method = start_method
+        self.placements = placements
+        self.model_name = model_name
+        self.memory_admission = memory_admission
+        self.concurrency = concurrency
+        self.retry_delay = retry_delay
+
+        if self.max_tasks_per_child and self.start_method == 'fork':
+            logger.warning("⚠️ Worker recycling is not supported with 'fork', using 'spawn'")
+            self.start_method = 'spawn'
+        if self.max_tasks_per_child and sys.version_info < (3, 11):
+            logger.warning("⚠️ Worker recycling needs Python 3.11+, batch workers will not be recycled")
+            self.max_tasks_per_child = 0
+
+    def get_executor_info(self) -> Dict[str, Any]:
+        info = {
+            'backend': 'process',
+            'max_workers': self.max_workers,
+            'max_tasks_per_child': self.max_tasks_per_child,
+            'start_method': self.start_method,
+            'memory_admission': self.memory_admission is not None,
+            'adaptive_concurrency': self.concurrency is not None
+        }
+        if self.placements:
+            info['cpu_placement'] = [placement.to_dict() for placement in self.placements]
+        return info
+
+    def _create_pool(self) -> ProcessPoolExecutor:
+        import multiprocessing
+
+        mp_context = multiprocessing.get_context(self.start_method)
+        placements, free_slots = None, None
+        if self.placements:
+            from src.core.logic.cpu_placement import create_placement_slots, record_worker_placement
+            placements = [placement.to_dict() for placement in self.placements]
+            free_slots = create_placement_slots(mp_context, len(placements))
+            for placement in self.placements:
+                record_worker_placement('batch_process', placement, f"batch-worker-{placement.worker_index}")
+
+        pool_kwargs = {}
+        if self.max_tasks_per_child:
+            pool_kwargs['max_tasks_per_child'] = self.max_tasks_per_child
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=mp_context,
+            initializer=_initialize_batch_worker,
+            initargs=(str(self.config_manager.config_dir), self.config_manager.environment,
+                      getattr(self.config_manager, 'explicit_config', False), self.model_name,
+                      placements, free_slots),
+            **pool_kwargs
+        )
+
+    def execute(self, tasks: Iterable[Dict[str, Any]]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Process files and yield their summaries as they complete
+
+        Tasks are pulled lazily, so a streamed queue is consumed as workers free up.
+        With retry_delay, a transient failure waits on a delay queue and is
+        resubmitted ahead of fresh tasks once due; only its final attempt is yielded.
+
+        Args:
+            tasks: Dictionaries with file_path, session_id and parameters
+
+        Yields:
+            Tuples of (task_index, summary); summaries carry the attempts they took
+        """
+        pending = iter(enumerate(tasks))
+        # Workers load a model each, so none are started for an empty queue
+        first = next(pending, None)
+        if first is None:
+            return
+        pending = itertools.chain([first], pending)
+        logger.info(f"🚀 Starting {self.max_workers} batch worker processes ({self.start_method}"
+                    + (f", recycled every {self.max_tasks_per_child} files" if self.max_tasks_per_child else "") + ")")
+        pool = self._create_pool()
+        in_flight: Dict[Future, Tuple[int, Dict[str, Any], Tuple[Optional[float], Any]]] = {}
+        failed: List[Tuple[int, Dict[str, Any]]] = []
+        # Due retries, and a task without a free slot or memory, run before fresh tasks
+        held: List[Tuple[int, Dict[str, Any]]] = []
+        retries = DelayedRetryQueue() if self.retry_delay else None
+        attempts: Dict[int, int] = {}
+        broken = []
+        # Keep about two files per worker queued so results stream back without pickling the whole
+        # batch up front; gated files are admitted as they run, so none are queued
+        gated = self.memory_admission is not None or self.concurrency is not None
+        capacity = self.max_workers if gated else self.max_workers * 2
+
+        def submit_next() -> bool:
+            next_task = held.pop(0) if held else next(pending, None)
+            if next_task is None:
+                return False
+            index, task = next_task
+            admission = self._admit(task)
+            if admission is None:
+                held.insert(0, next_task)
+                return False
+            try:
+                in_flight[pool.submit(_process_file_in_worker, task)] = (index, task, admission)
+            except BrokenProcessPool as e:
+                broken.append(e)
+                self._release(admission)
+                failed.append((index, self._failed_summary(task, e)))
+            return True
+
+        def fill() -> None:
+            if retries:
+                held.extend(retries.pop_due())
+            while len(in_flight) < capacity and submit_next():
+                pass
+
+        def schedule_retry(index: int, task: Dict[str, Any], summary: Dict[str, Any]) -> bool:
+            attempt = attempts.get(index, 1)
+            delay = self.retry_delay(summary, attempt) if retries is not None and not broken else None
+            if delay is None:
+                return False
+            attempts[index] = attempt + 1
+            delay = retries.schedule((index, task), delay)
+            logger.info(f"⏳ Retrying {task['file_path']} in {delay:.1f}s (attempt {attempt + 1})")
+            return True
+
+        try:
+            fill()
+            while in_flight or failed or retries:
+                while failed:
+                    index, summary = failed.pop(0)
+                    yield index, dict(summary, attempts=attempts.pop(index, 1))
+                if not in_flight:
+                    if broken:
+                        # A dead pool accepts no more work; fail the rest instead of hanging
+                        remaining = held + (retries.drain() if retries else []) + list(pending)
+                        for index, task in remaining:
+                            summary = self._failed_summary(task, BrokenProcessPool("batch worker pool is not usable"))
+                            yield index, dict(summary, attempts=attempts.pop(index, 1))
+                        break
+                    if retries:
+                        # Nothing runs until the next retry is due
+                        retries.wait_until_due()
+                        fill()
+                    continue
+                timeout = retries.seconds_until_due() if retries else None
+                done, _ = wait(list(in_flight), timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, task, admission = in_flight.pop(future)
+                    try:
+                        summary = future.result()
+                    except Exception as e:
+                        logger.error(f"❌ Batch worker failed on {task['file_path']}: {e}")
+                        summary = self._failed_summary(task, e)
+                    self._release(admission, task, summary['success'], summary.get('job_peak_rss_bytes'))
+                    if not summary['success'] and schedule_retry(index, task, summary):
+                        continue
+                    fill()
+                    yield index, dict(summary, attempts=attempts.pop(index, 1))
+                fill()
+        finally:
+            for future, (_, _, admission) in in_flight.items():
+                future.cancel()
+                self._release(admission)
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _admit(self, task: Dict[str, Any]) -> Optional[Tuple[Optional[float], Any]]:
+        """Take a concurrency slot and reserve the file's memory, or None if the file has to wait"""
+        started = self.concurrency.try_acquire() if self.concurrency else None
+        if self.concurrency and started is None:
+            return None
+        reservation = self.memory_admission.try_acquire(task['file_path']) if self.memory_admission else None
+        if self.memory_admission and reservation is None:
+            if started is not None:
+                self.concurrency.release(started, success=False)
+            return None
+        return started, reservation
+
+    def _release(self, admission: Tuple[Optional[float], Any], task: Optional[Dict[str, Any]] = None,
+                 success: bool = False, peak_bytes: Optional[int] = None) -> None:
+        """Return a file's reservation and slot; only completed files are measured by the controller"""
+        started, reservation = admission
+        if reservation is not None:
+            if peak_bytes is not None:
+                # The worker's measured peak corrects the estimates of later files
+                self.memory_admission.observe_job(reservation, peak_bytes)
+            self.memory_admission.release(reservation)
+        if started is not None:
+            # Latency is compared per audio second, so long and short files weigh alike
+            work_units = self._audio_seconds(task['file_path']) if task and success else 1.0
+            self.concurrency.release(started, work_units=work_units, success=success)
+
+    @staticmethod
+    def _audio_seconds(file_path: str) -> float:
+        from src.core.logic.audio_probe import get_audio_probe
+
+        return get_audio_probe().get_duration(file_path) or 1.0
+
+    @staticmethod
+    def _failed_summary(task: Dict[str, Any], error: Exception) -> Dict[str, Any]:
+        return {
+            'file_path': task['file_path'],
+            'success': False,
+            'status': 'error',
+            'errors': [{'error': str(error) or type(error).__name__, 'error_type': type(error).__name__}],
+            'warnings': [],
+            'processing_time': 0.0
+        }
@@ -3,13 +3,14 @@ Input Processor
 Responsible for handling input file discovery, validation, and processing
 """
 
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from typing import List, Dict, Any, Iterator, Optional, TYPE_CHECKING
 from pathlib import Path
 import logging
 from datetime import datetime
 
 from src.utils.config_manager import ConfigManager
 from src.core.factories.file_validator_factory import FileValidatorFactory
+from src.core.logic.file_discovery import DiscoveryStats, FileFilter, create_file_discovery, ordered_in_windows
 
 if TYPE_CHECKING:
     from src.output_data import OutputManager
@@ -56,24 +57,8 @@ class InputProcessor:
             List of discovered audio file paths
         """
         try:
-            input_path = Path(input_directory)
-            
-            if not input_path.exists():
-                self.logger.error(f"Input directory does not exist: {input_directory}")
-                return []
-            
-            if not input_path.is_dir():
-                self.logger.error(f"Input path is not a directory: {input_directory}")
-                return []
-            
-            # Find all audio files recursively
-            audio_files = []
-            for file_path in input_path.rglob('*'):
-                if file_path.is_file() and file_path.suffix.lower() in self.supported_formats:
-                    audio_files.append(str(file_path))
-            
             # Sort files for consistent processing order
-            audio_files.sort()
+            audio_files = sorted(self.iter_files(input_directory))
             
             self.logger.info(f"Discovered {len(audio_files)} audio files in {input_directory}")
             return audio_files
@@ -88,6 +73,36 @@ class InputProcessor:
             self.logger.error(f"Unexpected error discovering files in {input_directory}: {e}")
             return []
     
+    def iter_files(self, input_directory: str, accept: Optional[FileFilter] = None,
+                   stats: Optional[DiscoveryStats] = None) -> Iterator[str]:
+        """
+        Stream audio files from the specified directory while it is being walked
+        
+        Subdirectories are scanned in parallel (batch.discovery_workers) and files
+        arrive in discovery order, optionally sorted within windows of
+        batch.discovery_order_window files.
+        
+        Args:
+            input_directory: Directory to search for audio files
+            accept: Optional filter called with (path, stat_result), e.g. the batch skip index
+            stats: Optional discovery counters
+            
+        Returns:
+            Iterator over audio file paths (empty if the directory does not exist)
+        """
+        input_path = Path(input_directory)
+        if not input_path.exists():
+            self.logger.error(f"Input directory does not exist: {input_directory}")
+            return iter(())
+        if not input_path.is_dir():
+            self.logger.error(f"Input path is not a directory: {input_directory}")
+            return iter(())
+        
+        discovery = create_file_discovery(self.config_manager, self.supported_formats)
+        window = getattr(getattr(self.config, 'batch', None), 'discovery_order_window', 0)
+        return ordered_in_windows(discovery.iter_files(str(input_path), accept, stats),
+                                  window if isinstance(window, int) else 0)
+    
     def validate_file(self, file_path: str) -> Dict[str, Any]:
         """
         Validate a single audio file using the unified FileValidator
@@ -4,10 +4,13 @@ Implements template method pattern for different processing types
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List, Union, TYPE_CHECKING
+from typing import Callable, Dict, Any, Iterable, Iterator, Optional, List, Union, TYPE_CHECKING
 from pathlib import Path
+import itertools
 import logging
-from datetime import datetime
+import os
+import threading
+from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from enum import Enum
 class ProcessingStatus(Enum):
@@ -17,20 +20,37 @@ class ProcessingStatus(Enum):
     ERROR = "error"
 
 
+from src.core.logic.batch_skip_index import build_decode_profile, create_skip_index, extract_output_files
 from src.core.logic.error_handler import ErrorHandler
+from src.core.logic.file_discovery import DiscoveryStats, create_file_discovery, ordered_in_windows
+from src.core.logic.batch_scheduler import DEFAULT_ORDER_WINDOW, create_batch_scheduler
 from src.core.logic.result_builder import ResultBuilder
+from src.core.logic.retry_queue import DelayedRetryQueue
+from src.core.logic.shared_work_queue import (
+    ENQUEUE_BATCH_SIZE, FAILED, SharedWorkQueue, WorkLease, create_shared_work_queue
+)
 from src.utils.config_manager import ConfigManager
+from src.utils.lazy_provider import LazyProvider
 
 if TYPE_CHECKING:
     from src.output_data import OutputManager
 
 logger = logging.getLogger(__name__)
 
-# Optional dependency for tests to patch at module level
-try:
-    import librosa  # noqa: F401
-except Exception:
-    librosa = None
+# Context parameters that describe the whole batch and are not passed on to single files
+BATCH_ONLY_PARAMETERS = ('files', 'processing_queue')
+
+# Optional dependency for tests to patch at module level (imported on first use)
+librosa = None
+
+
+def _get_librosa():
+    """Import librosa on first use, keeping module import cheap"""
+    global librosa
+    if librosa is None:
+        import librosa as librosa_module
+        librosa = librosa_module
+    return librosa
 
 
 @dataclass
@@ -421,10 +441,8 @@ class AudioFileProcessingPipeline(ProcessingPipeline):
     def _extract_audio_metadata(self, file_path: str) -> Dict[str, Any]:
         """Extract audio file metadata"""
         try:
-            import librosa
-            
             # Load audio file to get basic info
-            y, sr = librosa.load(file_path, sr=None)
+            y, sr = _get_librosa().load(file_path, sr=None)
             duration = len(y) / sr
             
             return {
@@ -493,6 +511,28 @@ class BatchProcessingPipeline(ProcessingPipeline):
     handling multiple files in sequence with proper error handling.
     """
     
+    def __init__(self, config_manager: ConfigManager, output_manager: 'OutputManager',
+                 transcription_orchestrator_provider: Optional[LazyProvider] = None):
+        """
+        Initialize the batch pipeline
+        
+        Args:
+            config_manager: Configuration manager instance
+            output_manager: Output manager instance
+            transcription_orchestrator_provider: Orchestrator shared by every file pipeline
+                (defaults to one built on first use for this batch pipeline)
+        """
+        super().__init__(config_manager, output_manager)
+        # One orchestrator (engine and loaded model) for all files, not one per file
+        self._transcription_orchestrator_provider = transcription_orchestrator_provider or LazyProvider(
+            self._create_transcription_orchestrator, name="transcription orchestrator"
+        )
+    
+    def _create_transcription_orchestrator(self):
+        """Create the transcription orchestrator shared by the file pipelines"""
+        from src.core.orchestrator.transcription_service import TranscriptionService
+        return TranscriptionService(self.config_manager, self.output_manager)
+    
     def _validate_input(self, context: ProcessingContext) -> Dict[str, Any]:
         """Validate batch processing input"""
         try:
@@ -509,11 +549,28 @@ class BatchProcessingPipeline(ProcessingPipeline):
             if not input_path.is_dir():
                 return {'success': False, 'error': f'Input path is not a directory: {input_dir}'}
             
+            skip_filter = self._open_skip_filter(context)
+            if self._is_streaming_discovery_enabled():
+                # Hand files to the queue while the walk continues
+                files = self._stream_files(input_path, skip_filter)
+                if files is None:
+                    return {'success': False, 'error': 'No audio files found'}
+                context.parameters['files'] = files
+                self._log_processing_step("Batch validation", context, True, "Streaming files from discovery")
+                return {'success': True, 'files': files}
+            
             # Discover files
             files = self._discover_files(input_path)
             if not files:
                 return {'success': False, 'error': 'No audio files found'}
+            if skip_filter is not None:
+                files = [file_path for file_path in files if skip_filter(file_path, None)]
+            # Submit long files first so parallel workers finish together
+            scheduler = create_batch_scheduler(self.config_manager)
+            files = [unit.file_path for unit in scheduler.plan(files, self._get_batch_workers())]
             
+            # Later steps read the discovered files from the context
+            context.parameters['files'] = files
             self._log_processing_step("Batch validation", context, True, f"Found {len(files)} files")
             return {'success': True, 'files': files}
             
@@ -525,23 +582,28 @@ class BatchProcessingPipeline(ProcessingPipeline):
         try:
             files = context.parameters.get('files', [])
             
-            # Create processing queue
-            processing_queue = []
-            for file_path in files:
-                file_context = ProcessingContext(
-                    session_id=context.session_id,
-                    file_path=file_path,
-                    operation_type="single_file_processing",
-                    parameters=context.parameters.copy()
-                )
-                processing_queue.append(file_context)
-            
-            self._log_processing_step("Batch preprocessing", context, True, f"Queue created with {len(processing_queue)} items")
+            # Create processing queue (lazily when files are streamed from discovery)
+            file_contexts = (self._create_file_context(context, file_path) for file_path in files)
+            processing_queue = list(file_contexts) if isinstance(files, list) else file_contexts
+            
+            context.parameters['processing_queue'] = processing_queue
+            self._log_processing_step("Batch preprocessing", context, True,
+                                      f"Queue created with {len(processing_queue)} items" if isinstance(processing_queue, list)
+                                      else "Queue fed by discovery")
             return {'success': True, 'processing_queue': processing_queue}
             
         except Exception as e:
             return self.error_handler.handle_operation_error("batch_preprocessing", e, "Batch processing")
     
+    def _create_file_context(self, context: ProcessingContext, file_path: str) -> ProcessingContext:
+        """Create the context of one queued file"""
+        return ProcessingContext(
+            session_id=context.session_id,
+            file_path=file_path,
+            operation_type="single_file_processing",
+            parameters={key: value for key, value in context.parameters.items() if key not in BATCH_ONLY_PARAMETERS}
+        )
+    
     def _execute_core_processing(self, context: ProcessingContext) -> Dict[str, Any]:
         """Execute batch processing"""
         try:
@@ -549,15 +611,14 @@ class BatchProcessingPipeline(ProcessingPipeline):
             results = []
             errors = []
             
-            for i, file_context in enumerate(processing_queue):
-                self.logger.info(f"Processing file {i+1}/{len(processing_queue)}: {Path(file_context.file_path).name}")
-                
-                # Process individual file using the appropriate pipeline
-                file_pipeline = self._create_file_pipeline(file_context)
-                result = file_pipeline.process(file_context)
-                
+            skip_index = context.metadata.get('skip_index')
+            for result in self._process_queue(processing_queue, context.parameters.get('model')):
+                file_context = result.context
                 if result.success:
                     results.append(result)
+                    if skip_index is not None and result.status == ProcessingStatus.SUCCESS:
+                        skip_index.record_completion(file_context.file_path, context.metadata['decode_profile'],
+                                                     extract_output_files(result.data))
                 else:
                     errors.append({
                         'file_path': file_context.file_path,
@@ -570,13 +631,443 @@ class BatchProcessingPipeline(ProcessingPipeline):
                 'success': True,
                 'results': results,
                 'errors': errors,
-                'total_files': len(processing_queue),
+                'total_files': len(results) + len(errors),
                 'successful_files': len(results),
-                'failed_files': len(errors)
+                'failed_files': len(errors),
+                'skipped_files': context.metadata.get('skipped_files', 0)
             }
             
         except Exception as e:
             return self.error_handler.handle_operation_error("batch_processing", e, "Batch processing")
+        finally:
+            skip_index = context.metadata.pop('skip_index', None)
+            if skip_index is not None:
+                skip_index.close()
+    
+    def _open_skip_filter(self, context: ProcessingContext) -> Optional[Callable[[str, Any], bool]]:
+        """
+        Open the input directory's skip index and return a filter that drops completed files
+        
+        The filter is thread-safe, so discovery threads can apply it while they walk.
+        Returns None when the run reprocesses everything or skipping is disabled.
+        """
+        if context.parameters.get('reprocess'):
+            return None
+        skip_index = create_skip_index(self.config_manager, context.parameters.get('input_directory'))
+        if skip_index is None:
+            return None
+        
+        decode_profile = build_decode_profile(self.config_manager, context.parameters)
+        context.metadata.update(skip_index=skip_index, decode_profile=decode_profile, skipped_files=0)
+        lock = threading.Lock()
+        
+        def accept(file_path: str, stat_result=None) -> bool:
+            if not skip_index.is_complete(file_path, decode_profile, stat_result):
+                return True
+            with lock:
+                context.metadata['skipped_files'] += 1
+            self.logger.debug(f"⏭️ Skipping already transcribed {file_path}")
+            return False
+        
+        return accept
+    
+    def _is_streaming_discovery_enabled(self) -> bool:
+        return getattr(getattr(self.config, 'batch', None), 'streaming_discovery', False) is True
+    
+    def _stream_files(self, input_path: Path, skip_filter=None) -> Optional[Iterator[str]]:
+        """
+        Start streaming discovery and wait only for the first file
+        
+        Returns:
+            Iterator over the files to process, or None if the directory holds no supported files
+        """
+        discovery = create_file_discovery(self.config_manager, self._get_supported_formats())
+        stats = DiscoveryStats()
+        window = getattr(getattr(self.config, 'batch', None), 'discovery_order_window', 0)
+        window = window if isinstance(window, int) else 0
+        scheduler = create_batch_scheduler(self.config_manager)
+        key = scheduler.window_key(self._get_batch_workers())
+        if key is not None and window == 0:
+            # Discovery order would silently ignore scheduling_policy
+            window = DEFAULT_ORDER_WINDOW
+            logger.info(f"🗓️ Ordering streamed files {scheduler.policy.value} within windows of {window} files")
+        stream = ordered_in_windows(discovery.iter_files(str(input_path), skip_filter, stats), window, key=key)
+        first = next(stream, None)
+        if first is None:
+            # Every file may have been skipped, which is not an error
+            return None if stats.matched == 0 else iter(())
+        return itertools.chain([first], stream)
+    
+    def _process_queue(self, processing_queue: Iterable[ProcessingContext], model_name: Optional[str] = None):
+        """Process queued files in this process or in batch worker processes, yielding their results"""
+        # Hosts sharing batch.work_queue_path split the batch between them
+        work_queue = create_shared_work_queue(self.config_manager)
+        if work_queue is not None:
+            try:
+                yield from self._process_shared_queue(work_queue, processing_queue, model_name)
+            finally:
+                work_queue.close()
+            return
+        yield from self._process_local_queue(processing_queue, model_name)
+    
+    def _process_local_queue(self, processing_queue: Iterable[ProcessingContext], model_name: Optional[str] = None,
+                             retry_failures: bool = True) -> Iterator[ProcessingResult]:
+        """
+        Process files from the queue with the configured execution mode
+        
+        Args:
+            processing_queue: File contexts to process
+            model_name: Model to transcribe with
+            retry_failures: Retry transient failures here (off when a shared queue hands them to any host)
+        """
+        total = len(processing_queue) if isinstance(processing_queue, list) else None
+        progress = (lambda count: f"{count}/{total}") if total is not None else str
+        
+        if self._is_cross_file_batching_enabled():
+            yield from self._process_queue_cross_file(processing_queue, model_name, progress, retry_failures)
+            return
+        
+        executor = self._create_process_executor(total, model_name, retry_failures)
+        if executor is None:
+            yield from self._process_queue_sequential(processing_queue, progress, retry_failures)
+            return
+        
+        file_contexts: Dict[int, ProcessingContext] = {}
+        
+        def tasks():
+            for index, file_context in enumerate(processing_queue):
+                file_contexts[index] = file_context
+                yield {
+                    'file_path': str(file_context.file_path),
+                    'session_id': file_context.session_id,
+                    'parameters': file_context.parameters
+                }
+        
+        completed = 0
+        for index, summary in executor.execute(tasks()):
+            completed += 1
+            self.logger.info(f"Completed file {progress(completed)}: {Path(summary['file_path']).name}")
+            yield self._result_from_summary(file_contexts.pop(index), summary)
+    
+    def _process_shared_queue(self, work_queue: SharedWorkQueue, processing_queue: Iterable[ProcessingContext],
+                              model_name: Optional[str] = None) -> Iterator[ProcessingResult]:
+        """
+        Enqueue the batch on the shared work queue and process the files this host claims
+        
+        Discovered files are enqueued in bounded batches whenever nothing is
+        claimable, so claiming starts before discovery finishes. Claimed files
+        feed the configured execution mode under leases that a heartbeat
+        renews. A failed file goes back to the queue while attempts
+        remain and its error is transient, so any host may retry it; only
+        final outcomes recorded by this host are yielded. Claiming never waits
+        on other hosts while this host's own files are still running: the pass
+        ends instead, and the next pass claims whatever was freed meanwhile
+        (retries, or files of a host whose lease expired).
+        
+        Args:
+            work_queue: Shared work queue
+            processing_queue: Batch files; every host enqueues the same list
+            model_name: Model to transcribe with
+        
+        Yields:
+            Final results of the files this host completed or failed
+        """
+        file_contexts: Dict[str, ProcessingContext] = {}
+        files = iter(processing_queue)
+        discovering = [True]
+        
+        def enqueue_next() -> None:
+            # Files arrive in scheduled order, so positions keep the long-first plan
+            chunk = []
+            for file_context in itertools.islice(files, ENQUEUE_BATCH_SIZE):
+                file_path = os.path.abspath(str(file_context.file_path))
+                file_contexts[file_path] = file_context
+                chunk.append((file_path, 0.0))
+            if len(chunk) < ENQUEUE_BATCH_SIZE:
+                discovering[0] = False
+            if chunk:
+                work_queue.enqueue(chunk)
+        
+        # Enqueueing first joins the run in progress, or starts a new one, before anything is claimed
+        enqueue_next()
+        leases: Dict[str, WorkLease] = {}
+        leases_lock = threading.Lock()
+        stop = threading.Event()
+        drained = threading.Event()
+        
+        def leased_contexts() -> Iterator[ProcessingContext]:
+            while not stop.is_set():
+                lease = work_queue.claim()
+                if lease is None and discovering[0]:
+                    # Discovery is enqueued in bounded batches as the queue runs dry
+                    enqueue_next()
+                    continue
+                if lease is None:
+                    with leases_lock:
+                        own_running = bool(leases)
+                    if own_running:
+                        return
+                    lease = work_queue.next_lease(stop)
+                    if lease is None:
+                        drained.set()
+                        return
+                file_context = file_contexts.get(lease.file_path)
+                if file_context is None:
+                    # Enqueued by another host from a file list this host did not discover
+                    template = next(iter(file_contexts.values()), None)
+                    file_context = ProcessingContext(
+                        session_id=template.session_id if template else "shared_queue",
+                        file_path=lease.file_path,
+                        operation_type="single_file_processing",
+                        parameters=dict(template.parameters) if template else {}
+                    )
+                with leases_lock:
+                    leases[lease.file_path] = lease
+                yield file_context
+        
+        work_queue.start_heartbeat()
+        try:
+            while not drained.is_set():
+                for result in self._process_local_queue(leased_contexts(), model_name, retry_failures=False):
+                    with leases_lock:
+                        lease = leases.pop(os.path.abspath(str(result.context.file_path)))
+                    if result.success:
+                        final = work_queue.complete(lease)
+                    else:
+                        error = self._first_error(result.errors)
+                        state = work_queue.fail(lease, error.get('error') or error.get('message') or 'Unknown error',
+                                                retry=self.error_handler.is_retryable(error))
+                        final = state == FAILED
+                        if state and not final:
+                            self.logger.info(f"🔄 {Path(lease.file_path).name} returned to the shared queue "
+                                             f"for another attempt")
+                    if final:
+                        result.performance_metrics['attempts'] = lease.attempt
+                        yield result
+                with leases_lock:
+                    unsettled = list(leases.values())
+                    leases.clear()
+                for lease in unsettled:
+                    # The heartbeat would otherwise keep a file without a result leased forever
+                    work_queue.fail(lease, 'No result was produced')
+        finally:
+            stop.set()
+            work_queue.stop_heartbeat()
+            self.logger.info(f"🗂️ Shared work queue: {work_queue.get_stats()}")
+    
+    def _process_queue_sequential(self, processing_queue: Iterable[ProcessingContext],
+                                  progress: Callable[[int], str], retry_failures: bool = True
+                                  ) -> Iterator[ProcessingResult]:
+        """Process queued files one at a time in this process, running due retries between fresh files"""
+        # Decode upcoming files while the current one is transcribed (batch.prefetch_files)
+        from src.core.services.audio_prefetch_service import create_audio_prefetcher
+        prefetcher = create_audio_prefetcher(self.config_manager)
+        if prefetcher is not None:
+            processing_queue = prefetcher.run(processing_queue, lambda file_context: file_context.file_path)
+        retries = self._create_retry_queue() if retry_failures else None
+        
+        def run(file_context: ProcessingContext, attempt: int) -> Optional[ProcessingResult]:
+            # Process individual file using the appropriate pipeline
+            result = self._create_file_pipeline(file_context).process(file_context)
+            result.performance_metrics['attempts'] = attempt
+            if not result.success and self._schedule_retry(retries, file_context, result.errors, attempt):
+                return None
+            return result
+        
+        def run_due_retries() -> Iterator[ProcessingResult]:
+            for file_context, attempt in (retries.pop_due() if retries else []):
+                self.logger.info(f"🔄 Retrying {Path(file_context.file_path).name} (attempt {attempt})")
+                result = run(file_context, attempt)
+                if result is not None:
+                    yield result
+        
+        for i, file_context in enumerate(processing_queue, 1):
+            yield from run_due_retries()
+            self.logger.info(f"Processing file {progress(i)}: {Path(file_context.file_path).name}")
+            result = run(file_context, 1)
+            if result is not None:
+                yield result
+        while retries:
+            retries.wait_until_due()
+            yield from run_due_retries()
+    
+    def _create_retry_queue(self) -> Optional[DelayedRetryQueue]:
+        """Delay queue for files whose failure is transient, or None when system.retry_attempts is 0"""
+        return DelayedRetryQueue() if self._get_retry_attempts() > 0 else None
+    
+    def _get_retry_attempts(self) -> int:
+        attempts = getattr(getattr(self.config, 'system', None), 'retry_attempts', 0)
+        return attempts if isinstance(attempts, int) else 0
+    
+    def _retry_delay(self, file_path: str, errors: List[Any], attempt: int) -> Optional[float]:
+        """
+        Backoff before retrying a failed file
+        
+        Args:
+            file_path: File that failed
+            errors: The attempt's errors; the first one decides whether the failure is transient
+            attempt: Attempt that failed, starting at 1
+            
+        Returns:
+            Delay in seconds, or None if attempts ran out or the error is permanent
+        """
+        if attempt > self._get_retry_attempts():
+            return None
+        error = self._first_error(errors)
+        if not self.error_handler.is_retryable(error):
+            self.logger.warning(f"⛔ Not retrying {file_path}: permanent error "
+                                f"({error.get('error') or error.get('message') or 'Unknown error'})")
+            return None
+        constants = getattr(getattr(self.config, 'system', None), 'constants', None)
+        if constants is None:
+            return min(2 ** (attempt - 1), 30)
+        return min(constants.exponential_backoff_base ** (attempt - 1), constants.max_backoff_seconds)
+    
+    @staticmethod
+    def _first_error(errors: List[Any]) -> Dict[str, Any]:
+        """The first error of a failed file as a dictionary, which decides whether it is transient"""
+        error = errors[0] if errors else {}
+        return error if isinstance(error, dict) else {'error': str(error)}
+    
+    def _schedule_retry(self, retries: Optional[DelayedRetryQueue], file_context: ProcessingContext,
+                        errors: List[Any], attempt: int) -> bool:
+        """Put a failed file on the retry queue if attempts remain and its error is transient"""
+        if retries is None:
+            return False
+        delay = self._retry_delay(file_context.file_path, errors, attempt)
+        if delay is None:
+            return False
+        delay = retries.schedule((file_context, attempt + 1), delay)
+        self.logger.info(f"⏳ Retrying {Path(file_context.file_path).name} in {delay:.1f}s")
+        return True
+    
+    def _is_cross_file_batching_enabled(self) -> bool:
+        return getattr(getattr(self.config, 'batch', None), 'cross_file_batching', False) is True
+    
+    def _process_queue_cross_file(self, processing_queue: Iterable[ProcessingContext], model_name: Optional[str],
+                                  progress: Callable[[int], str], retry_failures: bool = True):
+        """Transcribe queued files as mixed-file window batches, then save each file as it completes"""
+        from src.core.services.cross_file_batch_service import create_cross_file_transcriber
+        
+        file_pipeline = self._create_file_pipeline(None)
+        model_name = model_name or getattr(getattr(self.config, 'transcription', None), 'default_model', None)
+        engine = file_pipeline.transcription_orchestrator.transcription_engine
+        transcriber = create_cross_file_transcriber(self.config_manager, engine, model_name)
+        
+        retries = self._create_retry_queue() if retry_failures else None
+        
+        def files(queue: Iterable, file_contexts: Dict[int, Any]) -> Iterator[str]:
+            for index, (file_context, attempt) in enumerate(queue):
+                file_contexts[index] = (file_context, attempt)
+                yield str(file_context.file_path)
+        
+        completed = 0
+        queue = ((file_context, 1) for file_context in processing_queue)
+        while True:
+            file_contexts: Dict[int, Any] = {}
+            for index, file_path, data in transcriber.transcribe(files(queue, file_contexts)):
+                file_context, attempt = file_contexts.pop(index)
+                if not data['success'] and self._schedule_retry(retries, file_context, [data], attempt):
+                    continue
+                completed += 1
+                processing_time = data.get('processing_info', {}).get('processing_time', 0.0)
+                started = datetime.now() - timedelta(seconds=processing_time)
+                self.logger.info(f"Completed file {progress(completed)}: {Path(file_path).name}")
+                if not data['success']:
+                    result = file_pipeline._build_error_result(file_context, data, started)
+                else:
+                    postprocess_result = file_pipeline._postprocess(file_context, data)
+                    if postprocess_result['success']:
+                        result = file_pipeline._build_success_result(file_context, postprocess_result['data'], started)
+                    else:
+                        result = file_pipeline._build_error_result(file_context, postprocess_result, started)
+                result.performance_metrics['attempts'] = attempt
+                yield result
+            if not retries:
+                break
+            # Transcribe the files whose backoff expired as the next mixed-file pass
+            queue = []
+            while not queue:
+                retries.wait_until_due()
+                queue = retries.pop_due()
+    
+    def uses_worker_processes(self) -> bool:
+        """Whether files are transcribed in batch worker processes (each with its own model) rather than here"""
+        return not self._is_cross_file_batching_enabled() and self._get_batch_workers() > 1
+    
+    def _get_batch_workers(self) -> int:
+        """Number of files processed at once (batch worker processes, or one in this process)"""
+        batch_config = getattr(self.config, 'batch', None)
+        if str(getattr(batch_config, 'execution_backend', 'thread') or 'thread').lower() != 'process':
+            return 1
+        from src.core.logic.thread_budget import get_thread_layout
+        return get_thread_layout(self.config_manager).batch_workers
+    
+    def _create_process_executor(self, queue_size: Optional[int], model_name: Optional[str] = None,
+                                 retry_failures: bool = True):
+        """Create the process batch executor when batch.execution_backend is 'process' and more than one worker is useful"""
+        batch_config = getattr(self.config, 'batch', None)
+        if str(getattr(batch_config, 'execution_backend', 'thread') or 'thread').lower() != 'process':
+            return None
+        
+        from src.core.logic.adaptive_concurrency import create_adaptive_concurrency
+        from src.core.logic.cpu_placement import plan_worker_placements
+        from src.core.logic.memory_admission import create_memory_admission
+        from src.core.logic.thread_budget import get_thread_layout
+        from src.core.processors.batch_executor import ProcessBatchExecutor
+        
+        # The thread budget caps batch workers so their models never share cores
+        layout = get_thread_layout(self.config_manager)
+        budget_workers = layout.batch_workers
+        max_workers = budget_workers
+        adaptive = getattr(batch_config, 'adaptive_concurrency', False) is True
+        if adaptive:
+            # With batch.adaptive_concurrency the pool is sized for batch.adaptive_max_workers and an
+            # AIMD controller decides how many workers are active, starting below that ceiling
+            max_workers = self._get_adaptive_ceiling(layout.total_cores)
+        if queue_size is not None:
+            max_workers = min(max_workers, queue_size)
+        if max_workers < 2:
+            return None
+        initial_workers = min(budget_workers, max(1, max_workers // 2)) if adaptive else max_workers
+        executor = ProcessBatchExecutor(
+            self.config_manager,
+            max_workers=max_workers,
+            max_tasks_per_child=getattr(batch_config, 'max_tasks_per_child', 0),
+            start_method=getattr(batch_config, 'process_start_method', None) or 'spawn',
+            placements=plan_worker_placements(self.config_manager, max_workers),
+            model_name=model_name,
+            retry_delay=self._summary_retry_delay if retry_failures and self._get_retry_attempts() > 0 else None,
+            # Files start only while their estimated memory fits (batch.memory_admission)
+            memory_admission=create_memory_admission(self.config_manager, worker_processes=max_workers),
+            concurrency=create_adaptive_concurrency(self.config_manager, max_workers, initial_workers)
+        )
+        logger.info(f"🔧 Batch execution: {executor.get_executor_info()}")
+        return executor
+    
+    def _get_adaptive_ceiling(self, total_cores: int) -> int:
+        """Most workers the adaptive controller may activate (batch.adaptive_max_workers, 0 for all cores)"""
+        ceiling = getattr(getattr(self.config, 'batch', None), 'adaptive_max_workers', 0)
+        if not isinstance(ceiling, int) or ceiling <= 0:
+            ceiling = total_cores
+        return min(ceiling, total_cores)
+    
+    def _summary_retry_delay(self, summary: Dict[str, Any], attempt: int) -> Optional[float]:
+        """Backoff before a batch worker retries a failed file, or None to report the failure"""
+        return self._retry_delay(summary['file_path'], summary.get('errors', []), attempt)
+    
+    def _result_from_summary(self, file_context: ProcessingContext, summary: Dict[str, Any]) -> ProcessingResult:
+        """Build the file result from a worker summary (outputs were already written by the worker)"""
+        return ProcessingResult(
+            success=summary['success'],
+            context=file_context,
+            status=ProcessingStatus(summary.get('status', 'success' if summary['success'] else 'error')),
+            data=summary,
+            errors=summary.get('errors', []),
+            warnings=summary.get('warnings', []),
+            performance_metrics={'processing_time_seconds': summary.get('processing_time', 0.0),
+                                 'attempts': summary.get('attempts', 1)}
+        )
     
     def _postprocess(self, context: ProcessingContext, data: Dict[str, Any]) -> Dict[str, Any]:
         """Post-process batch results"""
@@ -597,9 +1088,8 @@ class BatchProcessingPipeline(ProcessingPipeline):
         except Exception as e:
             return self.error_handler.handle_operation_error("batch_postprocessing", e, "Batch processing")
     
-    def _discover_files(self, input_path: Path) -> List[str]:
-        """Discover supported files in input directory"""
-        # Prefer audio.supported_formats, then input.supported_formats
+    def _get_supported_formats(self) -> List[str]:
+        """Supported file extensions: audio.supported_formats, then input.supported_formats"""
         supported_formats = None
         if self.config is not None:
             audio_cfg = getattr(self.config, 'audio', None)
@@ -608,15 +1098,12 @@ class BatchProcessingPipeline(ProcessingPipeline):
             else:
                 input_cfg = getattr(self.config, 'input', None)
                 supported_formats = getattr(input_cfg, 'supported_formats', None) if input_cfg else None
-        if not supported_formats:
-            supported_formats = ['.wav', '.mp3', '.m4a']
-        files = []
-        
-        for file_path in input_path.rglob('*'):
-            if file_path.is_file() and file_path.suffix.lower() in supported_formats:
-                files.append(str(file_path))
-        
-        return sorted(files)
+        return list(supported_formats or ['.wav', '.mp3', '.m4a'])
+    
+    def _discover_files(self, input_path: Path) -> List[str]:
+        """Discover supported files in input directory"""
+        discovery = create_file_discovery(self.config_manager, self._get_supported_formats())
+        return discovery.discover(str(input_path))
     
     def _create_file_pipeline(self, file_context: ProcessingContext) -> ProcessingPipeline:
         """Create appropriate pipeline for individual file processing with validation"""
@@ -624,7 +1111,8 @@ class BatchProcessingPipeline(ProcessingPipeline):
             # This would be determined based on file type or processing requirements
             # For now, return a generic audio pipeline
             from src.core.processors.audio_file_processor import AudioFileProcessor
-            pipeline = AudioFileProcessor(self.config_manager, self.output_manager)
+            pipeline = AudioFileProcessor(self.config_manager, self.output_manager,
+                                          self._transcription_orchestrator_provider)
             
             if not pipeline:
                 raise ValueError("Failed to create AudioFileProcessor")
@@ -653,6 +1141,7 @@ class BatchProcessingPipeline(ProcessingPipeline):
             'total_files': total_files,
             'successful_files': successful_files,
             'failed_files': failed_files,
+            'skipped_files': data.get('skipped_files', 0),
             'success_rate': success_rate,
             'timestamp': datetime.now().isoformat()
         }
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Audio prefetch service
+Decodes the next files of a batch in the background while the current file
+is transcribed, so the engine finds their audio already normalized
+Follows SOLID principles with dependency injection
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, TypeVar
+
+from src.core.engines.utilities.audio_buffer import AudioBuffer
+from src.core.logic.memory_admission import MemoryAdmissionController, create_memory_admission
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOOKAHEAD = 2
+
+T = TypeVar('T')
+
+# Prefetchers of the batches running in this process, consulted by load_audio_buffer
+_active_prefetchers = []
+_active_lock = threading.Lock()
+
+
+class _PrefetchEntry:
+    """Decoded audio of one file, or the error decoding it raised"""
+
+    def __init__(self, reservation=None):
+        self.ready = threading.Event()
+        self.buffer: Optional[AudioBuffer] = None
+        self.error: Optional[Exception] = None
+        self.reservation = reservation
+
+
+class AudioPrefetcher:
+    """
+    Bounded lookahead decoder for a stream of batch files
+
+    A background thread walks the batch ahead of the consumer and decodes up
+    to lookahead files past the one being transcribed into 16 kHz mono int16
+    AudioBuffers (container decoding, downmixing and resampling). Each file's
+    memory is reserved with the admission controller before it is decoded,
+    so prefetching never pushes the batch past its memory budget, and the
+    reservation is held until the consumer finishes the file. The engine's
+    loaders pick the buffer up through load_audio_buffer(); a file that is
+    still decoding is waited for rather than decoded twice.
+    """
+
+    def __init__(self, lookahead: int = DEFAULT_LOOKAHEAD,
+                 memory_admission: Optional[MemoryAdmissionController] = None,
+                 load_audio: Callable[[str], AudioBuffer] = AudioBuffer.from_file):
+        """
+        Initialize prefetcher
+
+        Args:
+            lookahead: Files decoded ahead of the one being transcribed
+            memory_admission: Budget the decoded files are reserved against (none bounds by count only)
+            load_audio: Decodes a file into an AudioBuffer
+        """
+        self.lookahead = max(1, lookahead)
+        self.memory_admission = memory_admission
+        self.load_audio = load_audio
+        self._entries: Dict[str, _PrefetchEntry] = {}
+        self._lock = threading.Lock()
+        self.stats = {'prefetched': 0, 'hits': 0, 'waits': 0, 'wait_seconds': 0.0, 'failed': 0}
+
+    def run(self, items: Iterable[T], path_of: Callable[[T], str]) -> Iterator[T]:
+        """
+        Yield items in order while their audio is decoded ahead in the background
+
+        A file's audio is kept until the consumer asks for the next item.
+
+        Args:
+            items: Batch items (e.g. file paths or processing contexts), possibly a lazy stream
+            path_of: Returns the audio file path of an item
+
+        Yields:
+            The items, unchanged
+        """
+        handoff: queue.Queue = queue.Queue()
+        # The file being transcribed plus the lookahead
+        slots = threading.Semaphore(self.lookahead + 1)
+        stop = threading.Event()
+        done = object()
+
+        def produce() -> None:
+            try:
+                for item in items:
+                    while not slots.acquire(timeout=0.1):
+                        if stop.is_set():
+                            return
+                    if stop.is_set():
+                        return
+                    file_path = str(path_of(item))
+                    entry = self._register(file_path)
+                    handoff.put(item)
+                    self._decode(file_path, entry)
+            except Exception as e:
+                handoff.put(e)
+            finally:
+                handoff.put(done)
+
+        with _active_lock:
+            _active_prefetchers.append(self)
+        producer = threading.Thread(target=produce, name="audio-prefetch", daemon=True)
+        producer.start()
+        logger.info(f"📥 Prefetching audio up to {self.lookahead} files ahead")
+        try:
+            while True:
+                item = handoff.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                try:
+                    yield item
+                finally:
+                    self._finish(str(path_of(item)))
+                    slots.release()
+        finally:
+            stop.set()
+            producer.join(timeout=5)
+            with _active_lock:
+                if self in _active_prefetchers:
+                    _active_prefetchers.remove(self)
+            for file_path in list(self._entries):
+                self._finish(file_path)
+            logger.info(f"📥 Audio prefetch: {self.stats['hits']} of {self.stats['prefetched']} files ready "
+                        f"when needed, {self.stats['wait_seconds']:.1f}s waited on decoding")
+
+    def get(self, file_path: str) -> Optional[AudioBuffer]:
+        """
+        Prefetched audio of a file, waiting if it is still being decoded
+
+        Returns:
+            AudioBuffer, or None if the file was not prefetched or failed to decode
+        """
+        with self._lock:
+            entry = self._entries.get(str(file_path))
+        if entry is None:
+            return None
+        if entry.ready.is_set():
+            self.stats['hits'] += 1
+        else:
+            started = time.monotonic()
+            self.stats['waits'] += 1
+            entry.ready.wait()
+            self.stats['wait_seconds'] += time.monotonic() - started
+        return entry.buffer
+
+    def _register(self, file_path: str) -> _PrefetchEntry:
+        reservation = self.memory_admission.acquire(file_path) if self.memory_admission else None
+        entry = _PrefetchEntry(reservation)
+        with self._lock:
+            self._entries[file_path] = entry
+        return entry
+
+    def _decode(self, file_path: str, entry: _PrefetchEntry) -> None:
+        try:
+            entry.buffer = self.load_audio(file_path)
+            self.stats['prefetched'] += 1
+        except Exception as e:
+            # The engine decodes the file itself and reports the error in context
+            logger.debug(f"⚠️ Prefetch of {file_path} failed: {e}")
+            entry.error = e
+            self.stats['failed'] += 1
+        finally:
+            entry.ready.set()
+
+    def _finish(self, file_path: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(file_path, None)
+        if entry is not None and entry.reservation is not None:
+            self.memory_admission.release(entry.reservation)
+
+
+def load_audio_buffer(audio_file_path: str) -> AudioBuffer:
+    """
+    Audio of a file as 16 kHz mono int16, from a running prefetcher when it has the file
+
+    Args:
+        audio_file_path: Audio file path
+
+    Returns:
+        AudioBuffer
+    """
+    with _active_lock:
+        prefetchers = list(_active_prefetchers)
+    for prefetcher in prefetchers:
+        buffer = prefetcher.get(audio_file_path)
+        if buffer is not None:
+            return buffer
+    return AudioBuffer.from_file(audio_file_path)
+
+
+def create_audio_prefetcher(config_manager: Any) -> Optional[AudioPrefetcher]:
+    """
+    Create a prefetcher if batch.prefetch_files is above zero
+
+    Decoded files count against the memory admission budget when
+    batch.memory_admission is enabled.
+
+    Args:
+        config_manager: Configuration manager
+
+    Returns:
+        AudioPrefetcher, or None when disabled
+    """
+    batch = getattr(getattr(config_manager, 'config', None), 'batch', None)
+    lookahead = getattr(batch, 'prefetch_files', 0)
+    if not isinstance(lookahead, int) or lookahead <= 0:
+        return None
+    return AudioPrefetcher(lookahead, memory_admission=create_memory_admission(config_manager))
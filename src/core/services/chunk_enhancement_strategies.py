@@ -11,6 +11,7 @@ from abc import ABC, abstractmethod
 from typing import List, Optional, Tuple, Dict, Any
 from dataclasses import dataclass
 
+from src.core.engines.utilities.audio_buffer import AudioBuffer
 from src.models.speaker_models import TranscriptionSegment
 from src.core.orchestrator.transcription_service import TranscriptionService as SpeakerTranscriptionService
 
@@ -27,6 +28,11 @@ class ChunkEnhancementContext:
     sample_rate: int
     config: Any
     enhancement_level: str = 'basic'
+    
+    def __post_init__(self):
+        # Audio is held as 16 kHz mono int16 whatever form the caller loaded it in
+        self.audio_data = AudioBuffer.from_array(self.audio_data, self.sample_rate)
+        self.sample_rate = self.audio_data.sample_rate
 
 
 class ChunkEnhancementStrategy(ABC):
@@ -157,20 +163,13 @@ class AdvancedSpeakerEnhancementStrategy(ChunkEnhancementStrategy):
     def _create_temp_chunk_audio(self, context: ChunkEnhancementContext) -> Optional[str]:
         """Create temporary audio file for chunk analysis"""
         try:
-            import soundfile as sf
-            
             # Create temporary file
             temp_file = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
             temp_file_path = temp_file.name
             temp_file.close()
             
-            # Extract audio data for this chunk
-            start_sample = int(context.chunk_start * context.sample_rate)
-            end_sample = int(context.chunk_end * context.sample_rate)
-            chunk_audio = context.audio_data[start_sample:end_sample]
-            
-            # Save as temporary WAV file
-            sf.write(temp_file_path, chunk_audio, context.sample_rate)
+            # Save this chunk's int16 samples as a temporary WAV file for diarization
+            context.audio_data.write_wav(temp_file_path, context.chunk_start, context.chunk_end)
             logger.debug(f"💾 Created temp audio for chunk {context.chunk_num + 1}")
             
             return temp_file_path
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+Chunk execution backends for chunked transcription
+Runs chunk transcription in-process (threads) or in a pool of worker processes
+Follows SOLID principles with dependency injection
+"""
+
+import atexit
+import logging
+import os
+import threading
+import time
+import weakref
+from abc import ABC, abstractmethod
+from concurrent.futures import (
+    Future, ThreadPoolExecutor, ProcessPoolExecutor, FIRST_COMPLETED, as_completed, wait
+)
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ChunkOutcome = Tuple[int, Dict[str, Any], Optional[Dict[str, Any]], float]
+ChunkStartedCallback = Callable[[int, Dict[str, Any]], None]
+ChunkFinishedCallback = Callable[[int, Dict[str, Any]], None]
+
+SAMPLE_RATE = 16000
+
+
+def chunk_result_to_dict(chunk_result, chunk_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Convert a chunk TranscriptionResult into the segment dict used by the chunked strategy
+
+    Segment times are relative to the chunk and are shifted to absolute positions.
+
+    Args:
+        chunk_result: TranscriptionResult of a single chunk
+        chunk_info: Chunk metadata with chunk_number, start and end
+
+    Returns:
+        Dictionary with absolute segments, or None if the result has no segments
+    """
+    if not getattr(chunk_result, 'speakers', None):
+        return None
+
+    chunk_start = chunk_info['start']
+    segments = []
+    for speaker_id, speaker_segments in chunk_result.speakers.items():
+        for segment in speaker_segments:
+            segments.append({
+                'start': segment.start + chunk_start,
+                'end': segment.end + chunk_start,
+                'text': segment.text,
+                'speaker': speaker_id
+            })
+
+    full_text = chunk_result.full_text if hasattr(chunk_result, 'full_text') else ' '.join([seg.get('text', '') for seg in segments])
+    return {
+        'segments': segments,
+        'success': True,
+        'text': full_text,
+        'chunk_number': chunk_info['chunk_number'],
+        'chunk_start': chunk_start,
+        'chunk_end': chunk_info['end']
+    }
+
+
+class ChunkExecutionBackend(ABC):
+    """Abstract base class for chunk execution backends"""
+
+    name = "base"
+
+    @abstractmethod
+    def execute_chunks(self, chunks: List[Dict[str, Any]], audio_file_path: str, model_name: str,
+                       process_chunk: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]],
+                       on_chunk_started: Optional[ChunkStartedCallback] = None,
+                       on_chunk_finished: Optional[ChunkFinishedCallback] = None) -> Iterator[ChunkOutcome]:
+        """
+        Transcribe chunks and yield results as they complete
+
+        Args:
+            chunks: Chunk metadata in audio order
+            audio_file_path: Source audio file
+            model_name: Model to transcribe with
+            process_chunk: In-process chunk transcription function
+            on_chunk_started: Callback invoked when a chunk starts (or is dispatched)
+            on_chunk_finished: Callback invoked as soon as a started chunk finishes, before the next is dispatched
+
+        Yields:
+            Tuples of (chunk_index, chunk_info, chunk_result, processing_time)
+        """
+        pass
+
+    def get_backend_info(self) -> Dict[str, Any]:
+        """Get backend description for logging and statistics"""
+        return {'backend': self.name}
+
+    def shutdown(self) -> None:
+        """Release backend resources"""
+        pass
+
+
+class ThreadChunkExecutionBackend(ChunkExecutionBackend):
+    """Runs chunks inside the current process, sequentially or on a thread pool"""
+
+    name = "thread"
+
+    def __init__(self, max_workers: int = 1):
+        """
+        Initialize thread backend
+
+        Args:
+            max_workers: Number of concurrent chunks (1 keeps strictly sequential processing)
+        """
+        self.max_workers = max(1, max_workers)
+
+    def get_backend_info(self) -> Dict[str, Any]:
+        return {'backend': self.name, 'max_workers': self.max_workers}
+
+    def execute_chunks(self, chunks, audio_file_path, model_name, process_chunk,
+                       on_chunk_started=None, on_chunk_finished=None) -> Iterator[ChunkOutcome]:
+        def run(chunk_index: int, chunk_info: Dict[str, Any]):
+            if on_chunk_started:
+                on_chunk_started(chunk_index, chunk_info)
+            started = time.time()
+            try:
+                return process_chunk(chunk_info), time.time() - started
+            finally:
+                if on_chunk_finished:
+                    on_chunk_finished(chunk_index, chunk_info)
+
+        if self.max_workers == 1:
+            for chunk_index, chunk_info in enumerate(chunks):
+                chunk_result, processing_time = run(chunk_index, chunk_info)
+                yield chunk_index, chunk_info, chunk_result, processing_time
+            return
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="chunk-worker")
+        futures: Dict[Future, Tuple[int, Dict[str, Any]]] = {
+            executor.submit(run, chunk_index, chunk_info): (chunk_index, chunk_info)
+            for chunk_index, chunk_info in enumerate(chunks)
+        }
+        try:
+            for future in as_completed(futures):
+                chunk_index, chunk_info = futures[future]
+                try:
+                    chunk_result, processing_time = future.result()
+                except Exception as e:
+                    logger.error(f"❌ Chunk {chunk_info.get('chunk_number')} raised in thread backend: {e}")
+                    chunk_result, processing_time = None, 0.0
+                yield chunk_index, chunk_info, chunk_result, processing_time
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+# Per-process state of chunk worker processes
+_worker_state: Dict[str, Any] = {}
+
+
+def _initialize_chunk_worker(config_dir: str, environment, explicit_config: bool, model_name: str,
+                             placements: Optional[List[Dict[str, Any]]] = None, free_slots=None) -> None:
+    """Process pool initializer: pin the worker, then build the engine and load the model once per worker"""
+    from src.utils.config_manager import ConfigManager
+    from src.core.logic.cpu_placement import claim_placement_slot, pin_to_cpus
+    from src.core.logic.thread_budget import configure_thread_budget
+
+    started = time.time()
+    config_manager = ConfigManager(config_dir=config_dir, environment=environment, explicit_config=explicit_config)
+    # Limit native pools to this worker's share before the engine and model are imported
+    configure_thread_budget(config_manager, worker_process=True)
+
+    # Pin before loading so the replica's threads and first-touch memory are node-local
+    slot = claim_placement_slot(free_slots) if placements and free_slots is not None else None
+    if slot is not None:
+        placement = placements[slot]
+        if pin_to_cpus(placement['cpus']):
+            _worker_state['placement'] = placement
+            logger.info(f"📌 Chunk worker {os.getpid()} pinned to node {placement['node']} cpus {placement['cpus']}")
+
+    from src.core.engines.consolidated_transcription_engine import ConsolidatedTranscriptionEngine
+    from src.core.engines.utilities.simple_text_processor import SimpleTextProcessor
+
+    engine = ConsolidatedTranscriptionEngine(config_manager, text_processor=SimpleTextProcessor())
+    engine.model_manager.get_or_load_model(model_name)
+
+    _worker_state['engine'] = engine
+    _worker_state['model_name'] = model_name
+    logger.info(f"✅ Chunk worker {os.getpid()} loaded {model_name} in {time.time() - started:.1f}s")
+
+
+def _attach_shared_memory(name: str):
+    """Attach to an existing shared memory block without taking ownership of it"""
+    from multiprocessing import shared_memory
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 has no track flag; the pool shares the parent's resource tracker
+        return shared_memory.SharedMemory(name=name)
+
+
+def _transcribe_chunk_in_worker(task: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], float]:
+    """Transcribe one chunk window read from shared memory"""
+    import numpy as np
+    from src.core.engines.utilities.audio_buffer import AudioBuffer
+
+    started = time.time()
+    chunk_info = task['chunk_info']
+
+    shm = _attach_shared_memory(task['shm_name'])
+    try:
+        samples = np.ndarray((task['total_samples'],), dtype=np.int16, buffer=shm.buf)
+        # The float32 copy holds only this window and no longer references shared memory
+        window = AudioBuffer(samples[task['start_sample']:task['end_sample']]).window()
+        del samples
+    finally:
+        shm.close()
+
+    engine = _worker_state['engine']
+    try:
+        chunk_result = engine._transcribe_chunk(
+            window, chunk_info['chunk_number'], 0.0, len(window) / SAMPLE_RATE, _worker_state['model_name']
+        )
+    except Exception as e:
+        return {'status': 'error', 'error_message': str(e)}, time.time() - started
+
+    if not chunk_result or not chunk_result.success:
+        error_message = getattr(chunk_result, 'error_message', None) or "Chunk transcription failed"
+        return {'status': 'error', 'error_message': error_message}, time.time() - started
+
+    return chunk_result_to_dict(chunk_result, chunk_info), time.time() - started
+
+
+# Process backends still alive at interpreter exit
+_live_process_backends: 'weakref.WeakSet[ProcessChunkExecutionBackend]' = weakref.WeakSet()
+
+
+def _shutdown_live_process_backends() -> None:
+    """Stop the worker processes of every backend still alive at exit"""
+    for backend in list(_live_process_backends):
+        backend.shutdown()
+
+
+atexit.register(_shutdown_live_process_backends)
+
+
+class ProcessChunkExecutionBackend(ChunkExecutionBackend):
+    """
+    Runs chunks in worker processes that each hold their own model
+
+    The decoded 16 kHz mono audio is placed once in shared memory; tasks only
+    carry sample offsets, so no audio is pickled between processes. Workers
+    persist across jobs and are rebuilt only when the model changes, so one
+    backend is meant to be shared by every file an engine transcribes.
+    """
+
+    name = "process"
+
+    def __init__(self, config_manager, max_workers: int = 2, start_method: str = "spawn",
+                 placements: Optional[List[Any]] = None):
+        """
+        Initialize process backend
+
+        Args:
+            config_manager: Configuration manager (its config_dir and environment are passed to workers)
+            max_workers: Number of worker processes
+            start_method: multiprocessing start method ('spawn' avoids forking a loaded model)
+            placements: Optional WorkerPlacement per worker; each worker pins itself before loading its model
+        """
+        self.config_manager = config_manager
+        self.max_workers = max(1, max_workers)
+        self.start_method = start_method
+        self.placements = placements
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_model: Optional[str] = None
+        self._lock = threading.RLock()
+        # Tracked weakly so exit cleanup does not keep discarded backends alive
+        _live_process_backends.add(self)
+
+    def get_backend_info(self) -> Dict[str, Any]:
+        info = {'backend': self.name, 'max_workers': self.max_workers, 'start_method': self.start_method}
+        if self.placements:
+            info['cpu_placement'] = [placement.to_dict() for placement in self.placements]
+        return info
+
+    def _get_executor(self, model_name: str) -> ProcessPoolExecutor:
+        """Get the worker pool for a model, creating it on first use"""
+        import multiprocessing
+
+        with self._lock:
+            if self._executor is not None and self._executor_model == model_name:
+                return self._executor
+            self.shutdown()
+
+            logger.info(f"🚀 Starting {self.max_workers} chunk worker processes ({self.start_method}) for {model_name}")
+            mp_context = multiprocessing.get_context(self.start_method)
+            placements, free_slots = None, None
+            if self.placements:
+                from src.core.logic.cpu_placement import create_placement_slots, record_worker_placement
+                placements = [placement.to_dict() for placement in self.placements]
+                free_slots = create_placement_slots(mp_context, len(placements))
+                for placement in self.placements:
+                    record_worker_placement('chunk_process', placement, f"chunk-worker-{placement.worker_index}")
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=mp_context,
+                initializer=_initialize_chunk_worker,
+                initargs=(str(self.config_manager.config_dir), self.config_manager.environment,
+                          getattr(self.config_manager, 'explicit_config', False), model_name,
+                          placements, free_slots)
+            )
+            self._executor_model = model_name
+            return self._executor
+
+    def _load_audio(self, audio_file_path: str):
+        """Decode the source audio once as 16 kHz mono int16 (prefetched by the batch when available)"""
+        from src.core.services.audio_prefetch_service import load_audio_buffer
+
+        return load_audio_buffer(audio_file_path).samples
+
+    def execute_chunks(self, chunks, audio_file_path, model_name, process_chunk,
+                       on_chunk_started=None, on_chunk_finished=None) -> Iterator[ChunkOutcome]:
+        import numpy as np
+        from multiprocessing import shared_memory
+
+        audio = self._load_audio(audio_file_path)
+        total_samples = len(audio)
+        shm = shared_memory.SharedMemory(create=True, size=max(audio.nbytes, 1))
+        try:
+            shared_audio = np.ndarray((total_samples,), dtype=np.int16, buffer=shm.buf)
+            shared_audio[:] = audio
+            del shared_audio, audio
+
+            executor = self._get_executor(model_name)
+            pending_chunks = enumerate(chunks)
+            in_flight: Dict[Future, Tuple[int, Dict[str, Any]]] = {}
+
+            def submit_next() -> bool:
+                # Dispatch lazily so admission control sees each chunk just before it runs
+                next_chunk = next(pending_chunks, None)
+                if next_chunk is None:
+                    return False
+                chunk_index, chunk_info = next_chunk
+                if on_chunk_started:
+                    on_chunk_started(chunk_index, chunk_info)
+                task = {
+                    'shm_name': shm.name,
+                    'total_samples': total_samples,
+                    'start_sample': min(total_samples, int(chunk_info['start'] * SAMPLE_RATE)),
+                    'end_sample': min(total_samples, int(chunk_info['end'] * SAMPLE_RATE)),
+                    'chunk_info': chunk_info
+                }
+                in_flight[executor.submit(_transcribe_chunk_in_worker, task)] = (chunk_index, chunk_info)
+                return True
+
+            try:
+                for _ in range(self.max_workers):
+                    if not submit_next():
+                        break
+                while in_flight:
+                    done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                    for future in done:
+                        chunk_index, chunk_info = in_flight.pop(future)
+                        if on_chunk_finished:
+                            on_chunk_finished(chunk_index, chunk_info)
+                        try:
+                            chunk_result, processing_time = future.result()
+                        except Exception as e:
+                            logger.error(f"❌ Chunk worker failed on chunk {chunk_info.get('chunk_number')}: {e}")
+                            chunk_result, processing_time = {'status': 'error', 'error_message': str(e)}, 0.0
+                        submit_next()
+                        yield chunk_index, chunk_info, chunk_result, processing_time
+            finally:
+                for future in in_flight:
+                    future.cancel()
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def shutdown(self) -> None:
+        """Stop worker processes"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+                self._executor_model = None
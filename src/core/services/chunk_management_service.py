@@ -12,6 +12,9 @@ from typing import List, Dict, Any, Tuple
 from pathlib import Path
 from abc import ABC, abstractmethod
 
+from src.core.engines.utilities.audio_buffer import AudioBuffer
+from src.core.services.audio_prefetch_service import load_audio_buffer
+
 logger = logging.getLogger(__name__)
 
 
@@ -96,26 +99,18 @@ class OverlappingChunkManager(ChunkManager):
             raise RuntimeError(f"Failed to create overlapping chunks: {e}")
     
     def save_audio_chunks(self, chunks: List[Dict[str, Any]], audio_data, sample_rate: int) -> None:
-        """Save overlapping audio chunks to WAV files"""
+        """Save overlapping audio chunks to 16 kHz mono 16-bit WAV files"""
         try:
             logger.info("🎯 Saving overlapping audio chunks")
+            audio_buffer = AudioBuffer.from_array(audio_data, sample_rate)
             
             for chunk_info in chunks:
                 start_time = chunk_info['start']
                 end_time = chunk_info['end']
                 chunk_num = chunk_info['chunk_number'] - 1  # Convert to 0-based index
                 
-                # Extract audio segment
-                start_sample = int(start_time * sample_rate)
-                end_sample = int(end_time * sample_rate)
-                
-                if len(audio_data.shape) > 1:  # Stereo
-                    chunk_audio = audio_data[start_sample:end_sample, :]
-                else:  # Mono
-                    chunk_audio = audio_data[start_sample:end_sample]
-                
-                # Save audio chunk
-                self._save_audio_chunk(chunk_audio, sample_rate, chunk_num, start_time, end_time)
+                # Save audio chunk straight from the int16 samples
+                self._save_audio_chunk(audio_buffer, chunk_num, start_time, end_time)
             
             logger.info(f"✅ Saved {len(chunks)} overlapping audio chunks")
             
@@ -168,16 +163,14 @@ class OverlappingChunkManager(ChunkManager):
         except Exception as e:
             logger.error(f"❌ Error creating initial chunk JSON: {e}")
     
-    def _save_audio_chunk(self, audio_chunk, sample_rate: int, chunk_num: int, chunk_start: float, chunk_end: float):
+    def _save_audio_chunk(self, audio_buffer: AudioBuffer, chunk_num: int, chunk_start: float, chunk_end: float):
         """Save audio chunk as WAV file"""
         try:
-            import soundfile as sf
-            
             filename = f"audio_chunk_{chunk_num + 1:03d}_{int(chunk_start)}s_{int(chunk_end)}s.wav"
             filepath = f"{self.output_directories['audio_chunks']}/{filename}"
             
             # Save as WAV file
-            sf.write(filepath, audio_chunk, sample_rate)
+            audio_buffer.write_wav(filepath, chunk_start, chunk_end)
             logger.debug(f"💾 Saved audio chunk: {filename}")
             
         except ImportError:
@@ -246,13 +239,10 @@ class ChunkManagementService:
                 return []
             
             # Load audio data for saving chunks
-            audio_data, sample_rate = self._load_audio_data(audio_file_path)
-            
-            # Ensure sample_rate is an integer for soundfile compatibility
-            sample_rate = int(sample_rate)
+            audio_buffer = self._load_audio_data(audio_file_path)
             
             # Save audio chunks
-            self.chunk_manager.save_audio_chunks(chunks, audio_data, sample_rate)
+            self.chunk_manager.save_audio_chunks(chunks, audio_buffer, audio_buffer.sample_rate)
             
             return chunks
             
@@ -260,33 +250,12 @@ class ChunkManagementService:
             logger.error(f"❌ Error creating and saving chunks: {e}")
             raise RuntimeError(f"Failed to create and save chunks: {e}")
     
-    def _load_audio_data(self, audio_file_path: str):
-        """Load audio data for chunking"""
+    def _load_audio_data(self, audio_file_path: str) -> AudioBuffer:
+        """Load audio data for chunking as 16 kHz mono int16 (prefetched by the batch when available)"""
         try:
-            # Try soundfile first (more reliable for WAV files)
-            try:
-                import soundfile as sf
-                audio_data, sample_rate = sf.read(audio_file_path)
-                logger.info(f"✅ Audio loaded with soundfile: {len(audio_data):,} samples at {sample_rate}Hz")
-                if len(audio_data.shape) > 1:
-                    logger.info(f"   🎧 Audio channels: {audio_data.shape[1]} (stereo preserved)")
-                else:
-                    logger.info(f"   🎧 Audio channels: 1 (mono)")
-                return audio_data, sample_rate
-            except ImportError:
-                logger.debug("⚠️ Soundfile not available, trying librosa")
-                pass
-            
-            # Fallback to librosa
-            import librosa
-            # Preserve stereo to avoid audio corruption during chunking
-            audio_data, sample_rate = librosa.load(audio_file_path, sr=None, mono=False)
-            logger.info(f"✅ Audio loaded with librosa: {len(audio_data):,} samples at {sample_rate}Hz")
-            if len(audio_data.shape) > 1:
-                logger.info(f"   🎧 Audio channels: {audio_data.shape[1]} (stereo preserved)")
-            else:
-                logger.info(f"   🎧 Audio channels: 1 (mono)")
-            return audio_data, sample_rate
+            audio_buffer = load_audio_buffer(audio_file_path)
+            logger.info(f"✅ Audio loaded for chunking: {len(audio_buffer):,} samples at {audio_buffer.sample_rate}Hz (mono int16)")
+            return audio_buffer
             
         except ImportError:
             logger.error("❌ Neither soundfile nor librosa available")
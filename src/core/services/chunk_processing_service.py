@@ -11,6 +11,7 @@ import json
 from typing import Dict, Any, Optional, List
 from abc import ABC, abstractmethod
 
+from src.core.engines.utilities.audio_buffer import AudioBuffer
 from src.models.speaker_models import TranscriptionResult, TranscriptionSegment
 
 logger = logging.getLogger(__name__)
@@ -88,11 +89,11 @@ class AudioChunkProcessor(ChunkProcessor):
             # Transcribe the actual audio chunk using the engine directly
             logger.info(f"🎤 Transcribing audio chunk: {audio_chunk_filename}")
             
-            # Load the audio chunk data for transcription
-            audio_chunk_data, sample_rate, duration = self._load_audio(audio_chunk_path)
+            # Load the audio chunk, converting to float32 only for feature extraction
+            audio_buffer = self._load_audio(audio_chunk_path)
             
             chunk_result = engine._transcribe_chunk(
-                audio_chunk_data,
+                audio_buffer.window(),
                 chunk_info['chunk_number'],
                 chunk_start,
                 chunk_end,
@@ -231,20 +232,16 @@ class AudioChunkProcessor(ChunkProcessor):
             return getattr(transcription_result, 'text', '')
         return ''
     
-    def _load_audio(self, audio_file_path: str):
-        """Load and validate audio file"""
+    def _load_audio(self, audio_file_path: str) -> AudioBuffer:
+        """Load and validate audio file as 16 kHz mono int16"""
         if not os.path.exists(audio_file_path):
             raise FileNotFoundError(f"Audio file not found: {audio_file_path}")
         
         try:
-            import librosa
-            audio_data, sample_rate = librosa.load(audio_file_path, sr=None, mono=True)
-            duration = len(audio_data) / sample_rate
-            logger.info(f"✅ Audio loaded: {duration:.1f}s at {sample_rate}Hz")
-            return audio_data, sample_rate, duration
+            return AudioBuffer.from_file(audio_file_path)
         except ImportError:
-            logger.error("❌ Librosa not available")
-            raise ImportError("Librosa is required for audio processing")
+            logger.error("❌ Neither soundfile nor librosa available")
+            raise ImportError("Soundfile or librosa is required for audio processing")
         except Exception as e:
             logger.error(f"❌ Error loading audio: {e}")
             raise
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Cross-file batch transcription service
+Cuts every batch file into windows that share one priority queue, so each
+generate call is filled with windows from as many files as it takes
+Follows SOLID principles with dependency injection
+"""
+
+import heapq
+import logging
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.core.engines.utilities.audio_buffer import AudioBuffer
+
+logger = logging.getLogger(__name__)
+
+# Whisper's fixed input length; longer windows would be truncated by the feature extractor
+WINDOW_SECONDS = 30.0
+DEFAULT_DECODE_BATCH_SIZE = 8
+# Files decoded and held in memory per window of the decode batch
+OPEN_FILES_PER_BATCH_SLOT = 2
+
+FileOutcome = Tuple[int, str, Dict[str, Any]]
+
+
+@dataclass(order=True)
+class AudioWindow:
+    """A window of one file; windows of earlier files are decoded first"""
+    file_index: int
+    window_index: int
+    start: float = field(compare=False)
+    end: float = field(compare=False)
+
+
+def cut_windows(file_index: int, duration: float, window_seconds: float = WINDOW_SECONDS) -> List[AudioWindow]:
+    """
+    Cut a file into consecutive windows
+
+    Args:
+        file_index: Position of the file in the batch
+        duration: Audio duration in seconds
+        window_seconds: Window length
+
+    Returns:
+        Windows covering the audio, the last one possibly shorter
+    """
+    count = math.ceil(duration / window_seconds) if duration > 0 else 0
+    return [
+        AudioWindow(file_index, index, index * window_seconds, min(duration, (index + 1) * window_seconds))
+        for index in range(count)
+    ]
+
+
+class GlobalWindowQueue:
+    """Thread-safe priority queue of the windows of every open file"""
+
+    def __init__(self):
+        self._heap: List[AudioWindow] = []
+        self._condition = threading.Condition()
+        self._closed = False
+
+    def put_many(self, windows: Iterable[AudioWindow]) -> None:
+        with self._condition:
+            for window in windows:
+                heapq.heappush(self._heap, window)
+            self._condition.notify_all()
+
+    def close(self) -> None:
+        """Signal that no more windows will be added"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def take_batch(self, max_windows: int) -> List[AudioWindow]:
+        """
+        Wait for windows and take up to max_windows of the highest priority
+
+        Returns:
+            Windows, possibly from several files; empty once the queue is closed and drained
+        """
+        with self._condition:
+            while not self._heap and not self._closed:
+                self._condition.wait()
+            count = min(max_windows, len(self._heap))
+            return [heapq.heappop(self._heap) for _ in range(count)]
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._heap)
+
+
+class WindowReassembler:
+    """Collects window texts per file and rebuilds a file when its last window completes"""
+
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+        self._files: Dict[int, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def register(self, file_index: int, file_path: str, window_count: int, duration: float) -> None:
+        with self._lock:
+            self._files[file_index] = {
+                'file_path': file_path,
+                'window_count': window_count,
+                'duration': duration,
+                'texts': {},
+                'started': time.time()
+            }
+
+    def is_open(self, file_index: int) -> bool:
+        with self._lock:
+            return file_index in self._files
+
+    def add(self, window: AudioWindow, text: str) -> Optional[FileOutcome]:
+        """
+        Record a window's text
+
+        Returns:
+            The file's outcome if this was its last window, else None
+        """
+        with self._lock:
+            entry = self._files.get(window.file_index)
+            if entry is None:
+                return None
+            entry['texts'][window.window_index] = (window.start, window.end, text)
+            if len(entry['texts']) < entry['window_count']:
+                return None
+            del self._files[window.file_index]
+        return window.file_index, entry['file_path'], self._build_file_result(entry)
+
+    def fail(self, file_index: int, error: str) -> Optional[FileOutcome]:
+        """
+        Give up on a file; its remaining windows are ignored
+
+        Returns:
+            The file's failed outcome, or None if it was already finished
+        """
+        with self._lock:
+            entry = self._files.pop(file_index, None)
+        if entry is None:
+            return None
+        return file_index, entry['file_path'], {'success': False, 'error': error}
+
+    def _build_file_result(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Join window texts in time order into the file's transcription"""
+        segments = [
+            {'start': start, 'end': end, 'text': text, 'speaker': 'speaker_1'}
+            for start, end, text in (entry['texts'][index] for index in sorted(entry['texts']))
+            if text and text.strip()
+        ]
+        return {
+            'success': True,
+            'transcription': " ".join(segment['text'].strip() for segment in segments),
+            'segments': segments,
+            'metadata': {
+                'model_name': self.model_name,
+                'duration': entry['duration'],
+                'window_count': entry['window_count']
+            },
+            'processing_info': {
+                'mode': 'cross_file_batch',
+                'model': self.model_name,
+                'processing_time': time.time() - entry['started']
+            }
+        }
+
+
+class CrossFileBatchTranscriber:
+    """
+    Transcribes a batch of files as one stream of mixed-file window batches
+
+    A loader thread decodes files into AudioBuffers, cuts them into 30 second
+    windows and pushes the windows into one priority queue ordered by file,
+    then window. The decode loop pulls up to batch_size windows at a time,
+    so a folder of short recordings fills every generate call with windows of
+    several files, while a long file's windows fill whole batches on their
+    own. A file is rebuilt, in window order, as soon as its last window is
+    decoded, and its audio is released. At most OPEN_FILES_PER_BATCH_SLOT
+    files per batch slot are held in memory at once.
+    """
+
+    def __init__(self, engine, model_name: str, batch_size: int = DEFAULT_DECODE_BATCH_SIZE,
+                 window_seconds: float = WINDOW_SECONDS, max_open_files: Optional[int] = None,
+                 load_audio: Callable[[str], AudioBuffer] = AudioBuffer.from_file):
+        """
+        Initialize transcriber
+
+        Args:
+            engine: Transcription engine with transcribe_windows(windows, model_name)
+            model_name: Model to transcribe with
+            batch_size: Windows per generate call
+            window_seconds: Window length (at most Whisper's 30 seconds)
+            max_open_files: Files decoded ahead of the decode loop (defaults to twice the batch size)
+            load_audio: Decodes a file into an AudioBuffer
+        """
+        self.engine = engine
+        self.model_name = model_name
+        self.batch_size = max(1, batch_size)
+        self.window_seconds = min(WINDOW_SECONDS, window_seconds)
+        self.max_open_files = max(1, max_open_files or self.batch_size * OPEN_FILES_PER_BATCH_SLOT)
+        self.load_audio = load_audio
+        self.stats = {'files': 0, 'windows': 0, 'batches': 0, 'failed_files': 0}
+
+    def transcribe(self, files: Iterable[str]) -> Iterator[FileOutcome]:
+        """
+        Transcribe files and yield each as soon as its last window is decoded
+
+        Files are pulled lazily, so a streamed discovery queue works as input.
+
+        Args:
+            files: Audio file paths
+
+        Yields:
+            Tuples of (file_index, file_path, result); a result has success plus
+            transcription, segments, metadata and processing_info, or error
+        """
+        window_queue = GlobalWindowQueue()
+        reassembler = WindowReassembler(self.model_name)
+        buffers: Dict[int, AudioBuffer] = {}
+        ready: deque = deque()
+        open_slots = threading.Semaphore(self.max_open_files)
+        stop = threading.Event()
+
+        def load_files() -> None:
+            try:
+                for file_index, file_path in enumerate(files):
+                    while not open_slots.acquire(timeout=0.1):
+                        if stop.is_set():
+                            return
+                    if stop.is_set():
+                        return
+                    try:
+                        buffer = self.load_audio(file_path)
+                    except Exception as e:
+                        logger.error(f"❌ Cannot decode {file_path}: {e}")
+                        ready.append((file_index, file_path, {'success': False, 'error': f"Cannot decode audio: {e}"}))
+                        open_slots.release()
+                        continue
+                    windows = cut_windows(file_index, buffer.duration, self.window_seconds)
+                    if not windows:
+                        ready.append((file_index, file_path, {'success': False, 'error': 'Audio is empty'}))
+                        open_slots.release()
+                        continue
+                    buffers[file_index] = buffer
+                    reassembler.register(file_index, file_path, len(windows), buffer.duration)
+                    window_queue.put_many(windows)
+            except Exception as e:
+                logger.error(f"❌ Batch file loading stopped: {e}")
+            finally:
+                window_queue.close()
+
+        def finish(outcome: Optional[FileOutcome]) -> None:
+            if outcome is None:
+                return
+            buffers.pop(outcome[0], None)
+            open_slots.release()
+            ready.append(outcome)
+
+        loader = threading.Thread(target=load_files, name="cross-file-loader", daemon=True)
+        loader.start()
+        logger.info(f"🧺 Cross-file batching: {self.batch_size} windows per generate call, "
+                    f"up to {self.max_open_files} files in memory")
+        try:
+            while True:
+                while ready:
+                    yield self._count(ready.popleft())
+                taken = window_queue.take_batch(self.batch_size)
+                if not taken:
+                    # The loader closed the queue and every window was decoded
+                    break
+                # Windows of files that already failed are dropped
+                batch = [window for window in taken if reassembler.is_open(window.file_index)]
+                if not batch:
+                    continue
+                for window, text in self._decode_batch(batch, buffers, reassembler, finish):
+                    finish(reassembler.add(window, text))
+            loader.join()
+            while ready:
+                yield self._count(ready.popleft())
+        finally:
+            stop.set()
+            window_queue.close()
+            logger.info(f"🧺 Cross-file batching: {self.stats['windows']} windows of {self.stats['files']} files "
+                        f"in {self.stats['batches']} generate calls")
+
+    def _decode_batch(self, batch: List[AudioWindow], buffers: Dict[int, AudioBuffer],
+                      reassembler: WindowReassembler, finish: Callable[[Optional[FileOutcome]], None]
+                      ) -> List[Tuple[AudioWindow, str]]:
+        """Decode a batch; if the batched call fails, decode its windows one by one to isolate the bad file"""
+        audio = [buffers[window.file_index].window(window.start, window.end) for window in batch]
+        self.stats['batches'] += 1
+        try:
+            texts = self.engine.transcribe_windows(audio, self.model_name)
+            self.stats['windows'] += len(batch)
+            return list(zip(batch, texts))
+        except Exception as e:
+            logger.warning(f"⚠️ Batched decode of {len(batch)} windows failed ({e}), decoding them one by one")
+
+        decoded = []
+        for window, window_audio in zip(batch, audio):
+            if not reassembler.is_open(window.file_index):
+                continue
+            try:
+                decoded.append((window, self.engine.transcribe_windows([window_audio], self.model_name)[0]))
+                self.stats['windows'] += 1
+            except Exception as e:
+                logger.error(f"❌ Window {window.window_index} of file {window.file_index} failed: {e}")
+                finish(reassembler.fail(window.file_index, f"Window at {window.start:.0f}s failed: {e}"))
+        return decoded
+
+    def _count(self, outcome: FileOutcome) -> FileOutcome:
+        self.stats['files'] += 1
+        if not outcome[2].get('success'):
+            self.stats['failed_files'] += 1
+        return outcome
+
+
+def create_cross_file_transcriber(config_manager: Any, engine, model_name: str) -> CrossFileBatchTranscriber:
+    """
+    Create a cross-file transcriber configured from the batch section (batch.decode_batch_size)
+
+    Args:
+        config_manager: Configuration manager
+        engine: Transcription engine
+        model_name: Model to transcribe with
+
+    Returns:
+        CrossFileBatchTranscriber
+    """
+    batch = getattr(getattr(config_manager, 'config', None), 'batch', None)
+    batch_size = getattr(batch, 'decode_batch_size', None)
+    return CrossFileBatchTranscriber(
+        engine, model_name,
+        batch_size=batch_size if isinstance(batch_size, int) else DEFAULT_DECODE_BATCH_SIZE
+    )
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Partial transcript service for progressive chunked transcription output
+Follows SOLID principles with dependency injection
+"""
+
+import bisect
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from src.core.engines.strategies.output_strategy import IntelligentDeduplicationStrategy
+from src.utils.atomic_file_writer import write_json_atomically, write_text_atomically
+
+logger = logging.getLogger(__name__)
+
+
+class PartialTranscriptService:
+    """
+    Maintains an ordered, deduplicated transcript prefix while chunks complete
+
+    Chunk results may arrive in any order; only the contiguous prefix of
+    completed chunks is merged. Each merge re-deduplicates just the new tail
+    (segments that sort after the merge point), producing exactly what a full
+    sort-and-deduplicate pass over the same segments would produce.
+    """
+
+    def __init__(self, config_manager, deduplicator: IntelligentDeduplicationStrategy,
+                 output_dir: Optional[str] = None):
+        """
+        Initialize partial transcript service
+
+        Args:
+            config_manager: Configuration manager instance
+            deduplicator: Deduplication strategy shared with the final output strategy
+            output_dir: Directory for partial outputs (defaults to transcriptions/partial)
+        """
+        self.config_manager = config_manager
+        self.deduplicator = deduplicator
+        self.enabled = bool(self._get_chunking_value('partial_output_enabled', True))
+        self.flush_interval_seconds = float(self._get_chunking_value('partial_flush_interval_seconds', 30))
+
+        if output_dir is None:
+            transcriptions_dir = config_manager.get_directory_paths().get('transcriptions_dir', 'output/transcriptions')
+            output_dir = os.path.join(transcriptions_dir, 'partial')
+        self.output_dir = Path(output_dir)
+
+        self._lock = threading.RLock()
+        self.start_job("unknown", 0)
+
+    def _get_chunking_value(self, key: str, default_value: Any) -> Any:
+        """Get a chunking configuration value with a default"""
+        chunking = getattr(self.config_manager.config, 'chunking', None)
+        value = getattr(chunking, key, None) if chunking is not None else None
+        return default_value if value is None else value
+
+    def start_job(self, audio_file_path: str, total_chunks: int) -> None:
+        """
+        Reset state for a new job
+
+        Args:
+            audio_file_path: Source audio file
+            total_chunks: Number of chunks the job was split into
+        """
+        with self._lock:
+            self.audio_file_path = audio_file_path
+            self.total_chunks = total_chunks
+            self._pending: Dict[int, Dict[str, Any]] = {}
+            self._next_chunk_index = 0
+            self._covered_until = 0.0
+            self._raw_segments: List[Dict[str, Any]] = []
+            self._raw_starts: List[float] = []
+            self._deduplicated_segments: List[Dict[str, Any]] = []
+            self._last_flush = time.monotonic()
+            self._flushed_chunk_index = 0
+
+    def add_chunk_result(self, chunk_index: int, segments: List[Dict[str, Any]],
+                         chunk_end: Optional[float] = None) -> bool:
+        """
+        Register the result of a chunk
+
+        Args:
+            chunk_index: Zero-based position of the chunk in the job
+            segments: Transcribed segments (empty for a chunk that produced nothing)
+            chunk_end: End time of the chunk in the source audio
+
+        Returns:
+            True if the contiguous transcript prefix advanced
+        """
+        with self._lock:
+            if chunk_index < self._next_chunk_index:
+                return False
+            self._pending[chunk_index] = {'segments': segments, 'chunk_end': chunk_end}
+
+            advanced = False
+            while self._next_chunk_index in self._pending:
+                entry = self._pending.pop(self._next_chunk_index)
+                self._merge_tail(entry['segments'])
+                if entry['chunk_end'] is not None:
+                    self._covered_until = max(self._covered_until, entry['chunk_end'])
+                self._next_chunk_index += 1
+                advanced = True
+            return advanced
+
+    def _merge_tail(self, new_segments: List[Dict[str, Any]]) -> None:
+        """Merge new segments into the prefix, re-deduplicating only the affected tail"""
+        if not new_segments:
+            return
+
+        new_sorted = sorted(new_segments, key=lambda x: x.get('start', 0.0))
+        min_start = new_sorted[0].get('start', 0.0)
+
+        # Segments at or before min_start keep their position in the global sort order
+        merge_index = bisect.bisect_right(self._raw_starts, min_start)
+        tail = sorted(self._raw_segments[merge_index:] + new_sorted, key=lambda x: x.get('start', 0.0))
+
+        if merge_index > 0:
+            context = self._deduplicated_segments[merge_index - 1]
+            deduplicated_tail = self.deduplicator.deduplicate_segments([context] + tail)[1:]
+        else:
+            deduplicated_tail = self.deduplicator.deduplicate_segments(tail)
+
+        self._raw_segments = self._raw_segments[:merge_index] + tail
+        self._raw_starts = self._raw_starts[:merge_index] + [seg.get('start', 0.0) for seg in tail]
+        self._deduplicated_segments = self._deduplicated_segments[:merge_index] + deduplicated_tail
+
+    @property
+    def completed_prefix_chunks(self) -> int:
+        """Number of contiguous chunks merged into the prefix"""
+        return self._next_chunk_index
+
+    def get_segments(self) -> List[Dict[str, Any]]:
+        """Get the deduplicated segments of the current prefix"""
+        with self._lock:
+            return list(self._deduplicated_segments)
+
+    def get_text(self) -> str:
+        """Get the deduplicated text of the current prefix"""
+        with self._lock:
+            return " ".join(seg.get('text', '') for seg in self._deduplicated_segments if seg.get('text')).strip()
+
+    def get_output_paths(self) -> Dict[str, Path]:
+        """Get the partial TXT and JSON output paths for the current job"""
+        stem = Path(self.audio_file_path).stem
+        return {
+            'txt': self.output_dir / f"{stem}_partial.txt",
+            'json': self.output_dir / f"{stem}_partial.json"
+        }
+
+    def maybe_flush(self) -> Optional[Dict[str, Path]]:
+        """
+        Flush partial outputs if the prefix advanced and the flush interval elapsed
+
+        Returns:
+            Written output paths, or None if nothing was flushed
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            if self._next_chunk_index == self._flushed_chunk_index:
+                return None
+            if time.monotonic() - self._last_flush < self.flush_interval_seconds:
+                return None
+            return self._flush(complete=False)
+
+    def finalize(self) -> Optional[Dict[str, Path]]:
+        """
+        Write the final state of the partial outputs
+
+        Returns:
+            Written output paths, or None if partial output is disabled
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            return self._flush(complete=self._next_chunk_index >= self.total_chunks)
+
+    def _flush(self, complete: bool) -> Optional[Dict[str, Path]]:
+        """Atomically replace the partial TXT and JSON outputs"""
+        paths = self.get_output_paths()
+        try:
+            text = self.get_text()
+            write_text_atomically(paths['txt'], text + "\n" if text else "")
+            write_json_atomically(paths['json'], {
+                'audio_file': self.audio_file_path,
+                'complete': complete,
+                'chunks_completed': self._next_chunk_index,
+                'total_chunks': self.total_chunks,
+                'covered_until_seconds': self._covered_until,
+                'segments': self._deduplicated_segments,
+                'text': text,
+                'updated_at': datetime.now().isoformat()
+            })
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"⚠️ Could not write partial transcript: {e}")
+            return None
+
+        self._last_flush = time.monotonic()
+        self._flushed_chunk_index = self._next_chunk_index
+        logger.info(f"📝 Partial transcript updated: {self._next_chunk_index}/{self.total_chunks} chunks "
+                    f"({self._covered_until:.0f}s) → {paths['txt']}")
+        return paths
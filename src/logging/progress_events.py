@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+In-process progress event bus
+Lightweight publish/subscribe channel for transcription pipeline progress
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Callable, Dict, Any, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ProgressEventType(Enum):
+    """Progress events emitted by the transcription pipeline"""
+    JOB_STARTED = "job_started"
+    CHUNK_STARTED = "chunk_started"
+    CHUNK_COMPLETED = "chunk_completed"
+    CHUNK_FAILED = "chunk_failed"
+    JOB_COMPLETED = "job_completed"
+
+
+@dataclass
+class ProgressEvent:
+    """A single progress event published on the bus"""
+    event_type: ProgressEventType
+    job_id: str
+    chunk_number: Optional[int] = None
+    total_chunks: Optional[int] = None
+    start_time: Optional[float] = None
+    end_time: Optional[float] = None
+    text: str = ""
+    processing_time: Optional[float] = None
+    success: Optional[bool] = None
+    error_message: Optional[str] = None
+    timestamp: float = field(default_factory=time.time)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert event to a JSON-serializable dictionary"""
+        return {
+            'event_type': self.event_type.value,
+            'job_id': self.job_id,
+            'chunk_number': self.chunk_number,
+            'total_chunks': self.total_chunks,
+            'start_time': self.start_time,
+            'end_time': self.end_time,
+            'text_length': len(self.text),
+            'processing_time': self.processing_time,
+            'success': self.success,
+            'error_message': self.error_message,
+            'timestamp': self.timestamp
+        }
+
+
+ProgressSubscriber = Callable[[ProgressEvent], None]
+
+
+class ProgressEventBus:
+    """
+    Synchronous in-process event bus
+
+    Publishing costs one call per interested subscriber, so monitoring cost
+    scales with the number of events instead of the number of chunks on disk.
+    Subscriber failures are logged and never propagate into the pipeline.
+    """
+
+    def __init__(self):
+        self._subscribers: List[Tuple[ProgressSubscriber, Optional[Set[ProgressEventType]]]] = []
+        self._lock = threading.RLock()
+
+    def subscribe(self, subscriber: ProgressSubscriber,
+                  event_types: Optional[List[ProgressEventType]] = None) -> None:
+        """
+        Register a subscriber
+
+        Args:
+            subscriber: Callable receiving ProgressEvent instances
+            event_types: Optional event types to filter on (all events if None)
+        """
+        with self._lock:
+            if any(existing == subscriber for existing, _ in self._subscribers):
+                return
+            filter_set = set(event_types) if event_types else None
+            self._subscribers.append((subscriber, filter_set))
+
+    def unsubscribe(self, subscriber: ProgressSubscriber) -> None:
+        """Remove a previously registered subscriber"""
+        with self._lock:
+            self._subscribers = [
+                (existing, filter_set) for existing, filter_set in self._subscribers
+                if existing != subscriber
+            ]
+
+    def publish(self, event: ProgressEvent) -> None:
+        """
+        Deliver an event to all interested subscribers
+
+        Args:
+            event: Event to publish
+        """
+        with self._lock:
+            subscribers = list(self._subscribers)
+
+        for subscriber, filter_set in subscribers:
+            if filter_set is not None and event.event_type not in filter_set:
+                continue
+            try:
+                subscriber(event)
+            except Exception as e:
+                logger.debug(f"Progress subscriber {subscriber!r} failed: {e}")
+
+    def has_subscribers(self) -> bool:
+        """Check whether any subscriber is registered"""
+        with self._lock:
+            return bool(self._subscribers)
+
+    def clear(self) -> None:
+        """Remove all subscribers"""
+        with self._lock:
+            self._subscribers.clear()
+
+
+_progress_event_bus: Optional[ProgressEventBus] = None
+_progress_event_bus_lock = threading.Lock()
+
+
+def get_progress_event_bus() -> ProgressEventBus:
+    """Get the process-wide progress event bus"""
+    global _progress_event_bus
+    if _progress_event_bus is None:
+        with _progress_event_bus_lock:
+            if _progress_event_bus is None:
+                _progress_event_bus = ProgressEventBus()
+    return _progress_event_bus
@@ -5,18 +5,27 @@ Provides real-time monitoring of transcription progress with detailed statistics
 """
 
 import os
+import sys
 import time
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, TextIO
 from datetime import datetime, timedelta
 from dataclasses import dataclass
-from threading import Thread, Lock
+from threading import Lock
 import re
 
+from src.logging.progress_events import (
+    ProgressEvent, ProgressEventBus, ProgressEventType, ProgressSubscriber, get_progress_event_bus
+)
+from src.utils.atomic_file_writer import write_json_atomically
+
 logger = logging.getLogger(__name__)
 
+# Finished jobs kept per subscriber once newer jobs arrive
+MAX_FINISHED_JOBS = 16
+
 
 @dataclass
 class ChunkProgress:
@@ -47,38 +56,17 @@ class TranscriptionProgress:
     start_time: datetime
     current_chunk_start: Optional[datetime] = None
     chunks: Dict[int, ChunkProgress] = None
+    job_id: Optional[str] = None
+    job_completed: bool = False
     
     def __post_init__(self):
         if self.chunks is None:
             self.chunks = {}
-
-
-class ProgressMonitor:
-    """Real-time transcription progress monitor"""
     
-    def __init__(self, temp_chunks_dir: str = None):
-        # Use definition.py for temp chunks directory
-        if temp_chunks_dir is None:
-            try:
-                from definition import TEMP_DIR
-                temp_chunks_dir = TEMP_DIR
-            except ImportError:
-                temp_chunks_dir = "output/temp_chunks"
-        self.temp_chunks_dir = Path(temp_chunks_dir)
-        self.temp_chunks_dir.mkdir(parents=True, exist_ok=True)
-        self.monitoring = False
-        self.monitor_thread: Optional[Thread] = None
-        self.lock = Lock()
-        self.current_progress: Optional[TranscriptionProgress] = None
-        
-    def start_monitoring(self, audio_file: str, estimated_duration: float = None):
-        """Start monitoring transcription progress"""
-        if self.monitoring:
-            logger.warning("Progress monitoring is already active")
-            return
-            
-        self.monitoring = True
-        self.current_progress = TranscriptionProgress(
+    @classmethod
+    def create(cls, start_time: Optional[datetime] = None, job_id: Optional[str] = None) -> 'TranscriptionProgress':
+        """Create an empty progress record"""
+        return cls(
             total_chunks=0,
             completed_chunks=0,
             failed_chunks=0,
@@ -87,172 +75,375 @@ class ProgressMonitor:
             elapsed_time=0.0,
             estimated_remaining=0.0,
             success_rate=0.0,
-            start_time=datetime.now()
+            start_time=start_time or datetime.now(),
+            job_id=job_id
         )
+    
+    def apply_event(self, event: ProgressEvent) -> None:
+        """
+        Update progress from a single event in O(1)
         
-        # Start monitoring thread
-        self.monitor_thread = Thread(
-            target=self._monitor_loop,
-            args=(audio_file, estimated_duration),
-            daemon=True
-        )
-        self.monitor_thread.start()
-        logger.info("🚀 Progress monitoring started")
+        Events of other jobs are ignored, so concurrent jobs never mix their chunks.
         
-    def stop_monitoring(self):
-        """Stop progress monitoring"""
-        self.monitoring = False
-        if self.monitor_thread and self.monitor_thread.is_alive():
-            self.monitor_thread.join(timeout=2)
-        logger.info("🛑 Progress monitoring stopped")
+        Args:
+            event: Progress event published by the pipeline
+        """
+        if event.job_id and self.job_id and event.job_id != self.job_id:
+            return
+        event_time = datetime.fromtimestamp(event.timestamp)
         
-    def _monitor_loop(self, audio_file: str, estimated_duration: float = None):
-        """Main monitoring loop"""
-        last_check = time.time()
+        if event.job_id and not self.job_id:
+            self.job_id = event.job_id
+        if event.total_chunks:
+            self.total_chunks = event.total_chunks
         
-        while self.monitoring:
-            try:
-                current_time = time.time()
-                
-                # Update progress from temp chunk files
-                self._update_progress_from_chunks()
-                
-                # Update timing information
-                if self.current_progress:
-                    self.current_progress.elapsed_time = current_time - self.current_progress.start_time.timestamp()
-                    
-                    # Calculate estimated remaining time
-                    if self.current_progress.completed_chunks > 0:
-                        avg_chunk_time = self.current_progress.elapsed_time / self.current_progress.completed_chunks
-                        remaining_chunks = self.current_progress.total_chunks - self.current_progress.completed_chunks
-                        self.current_progress.estimated_remaining = avg_chunk_time * remaining_chunks
-                    
-                    # Calculate success rate
-                    total_processed = self.current_progress.completed_chunks + self.current_progress.failed_chunks
-                    if total_processed > 0:
-                        self.current_progress.success_rate = (self.current_progress.completed_chunks / total_processed) * 100
-                
-                # Display progress update
-                self._display_progress()
-                
-                # Check every 2 seconds
-                time.sleep(2)
-                
-            except Exception as e:
-                logger.error(f"Error in progress monitoring: {e}")
-                time.sleep(5)
-                
-    def _update_progress_from_chunks(self):
-        """Update progress by reading temporary chunk files"""
-        if not self.current_progress:
-            return
-            
-        try:
-            chunk_files = list(self.temp_chunks_dir.glob("chunk_*.json"))
-            
-            # Parse chunk files to update progress
-            for chunk_file in chunk_files:
-                try:
-                    with open(chunk_file, 'r', encoding='utf-8') as f:
-                        chunk_data = json.load(f)
-                    
-                    chunk_num = chunk_data.get('chunk_number')
-                    if chunk_num is None:
-                        continue
-                        
-                    # Create or update chunk progress
-                    if chunk_num not in self.current_progress.chunks:
-                        chunk_progress = ChunkProgress(
-                            chunk_number=chunk_num,
-                            start_time=chunk_data.get('start_time', 0),
-                            end_time=chunk_data.get('end_time', 0),
-                            status=chunk_data.get('status', 'unknown'),
-                            transcription=chunk_data.get('text', ''),
-                            word_count=chunk_data.get('word_count', 0),
-                            timestamp=chunk_data.get('timestamp')
-                        )
-                        self.current_progress.chunks[chunk_num] = chunk_progress
-                        
-                        # Update total chunks count
-                        if chunk_num > self.current_progress.total_chunks:
-                            self.current_progress.total_chunks = chunk_num
-                    else:
-                        # Update existing chunk
-                        chunk_progress = self.current_progress.chunks[chunk_num]
-                        chunk_progress.status = chunk_data.get('status', chunk_progress.status)
-                        chunk_progress.transcription = chunk_data.get('text', chunk_progress.transcription)
-                        chunk_progress.word_count = chunk_data.get('word_count', chunk_progress.word_count)
-                        
-                        # Update timestamps
-                        if chunk_data.get('timestamp'):
-                            chunk_progress.timestamp = chunk_data.get('timestamp')
-                            
-            # Update progress counts
-            completed = sum(1 for c in self.current_progress.chunks.values() if c.status == 'completed')
-            failed = sum(1 for c in self.current_progress.chunks.values() if c.status == 'failed')
-            
-            self.current_progress.completed_chunks = completed
-            self.current_progress.failed_chunks = failed
-            
-            # Calculate overall progress
-            if self.current_progress.total_chunks > 0:
-                self.current_progress.overall_progress = (completed / self.current_progress.total_chunks) * 100
-                
-        except Exception as e:
-            logger.error(f"Error updating progress from chunks: {e}")
-            
-    def _display_progress(self):
-        """Display current progress information"""
-        if not self.current_progress:
-            return
+        if event.chunk_number is not None:
+            chunk = self.chunks.get(event.chunk_number)
+            if chunk is None:
+                chunk = ChunkProgress(
+                    chunk_number=event.chunk_number,
+                    start_time=event.start_time or 0.0,
+                    end_time=event.end_time or 0.0,
+                    status='processing',
+                    transcription='',
+                    word_count=0
+                )
+                self.chunks[event.chunk_number] = chunk
             
-        progress = self.current_progress
+            if event.event_type == ProgressEventType.CHUNK_STARTED:
+                if chunk.status == 'failed':
+                    chunk.retry_count += 1
+                    self.failed_chunks = max(0, self.failed_chunks - 1)
+                chunk.status = 'processing'
+                chunk.processing_start = event_time
+                self.current_chunk = event.chunk_number
+                self.current_chunk_start = event_time
+            elif event.event_type == ProgressEventType.CHUNK_COMPLETED:
+                if chunk.status != 'completed':
+                    self.completed_chunks += 1
+                chunk.status = 'completed'
+                chunk.transcription = event.text
+                chunk.word_count = len(event.text.split())
+                chunk.processing_end = event_time
+            elif event.event_type == ProgressEventType.CHUNK_FAILED:
+                if chunk.status != 'failed':
+                    self.failed_chunks += 1
+                chunk.status = 'failed'
+                chunk.error_message = event.error_message
+                chunk.processing_end = event_time
         
-        # Clear screen (simple approach)
-        os.system('clear' if os.name == 'posix' else 'cls')
+        if event.event_type == ProgressEventType.JOB_COMPLETED:
+            self.job_completed = True
+        
+        self._update_derived_values(event_time)
+    
+    def _update_derived_values(self, now: datetime) -> None:
+        """Recalculate percentages and timing estimates"""
+        self.elapsed_time = max(0.0, (now - self.start_time).total_seconds())
         
-        print("🎯 TRANSCRIPTION PROGRESS MONITOR")
-        print("=" * 80)
+        if self.total_chunks > 0:
+            self.overall_progress = (self.completed_chunks / self.total_chunks) * 100
+        
+        total_processed = self.completed_chunks + self.failed_chunks
+        if total_processed > 0:
+            self.success_rate = (self.completed_chunks / total_processed) * 100
+        
+        if self.job_completed:
+            self.estimated_remaining = 0.0
+        elif self.completed_chunks > 0:
+            avg_chunk_time = self.elapsed_time / self.completed_chunks
+            remaining_chunks = max(0, self.total_chunks - self.completed_chunks)
+            self.estimated_remaining = avg_chunk_time * remaining_chunks
+
+
+class ProgressStateSubscriber:
+    """
+    Base bus subscriber that keeps an aggregated TranscriptionProgress per job
+    
+    Jobs that run concurrently (batch threads or worker processes) each get
+    their own record, keyed by the event's job_id; progress is the record
+    of the job that sent the latest event.
+    """
+    
+    def __init__(self):
+        self.lock = Lock()
+        self.jobs: Dict[str, TranscriptionProgress] = {}
+        self.progress: Optional[TranscriptionProgress] = None
+    
+    def __call__(self, event: ProgressEvent) -> None:
+        with self.lock:
+            job_id = event.job_id or ''
+            progress = self.jobs.get(job_id)
+            if progress is None or (
+                event.event_type == ProgressEventType.JOB_STARTED and progress.job_completed
+            ):
+                progress = self._start_job(job_id)
+            progress.apply_event(event)
+            self.progress = progress
+            self.on_event(event, progress)
+    
+    def _start_job(self, job_id: str) -> TranscriptionProgress:
+        """Create a job's record and forget the oldest finished jobs (called with the lock held)"""
+        self.jobs.pop(job_id, None)
+        finished = [key for key, progress in self.jobs.items() if progress.job_completed]
+        for key in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self.jobs[key]
+        progress = TranscriptionProgress.create(job_id=job_id or None)
+        self.jobs[job_id] = progress
+        return progress
+    
+    def on_event(self, event: ProgressEvent, progress: TranscriptionProgress) -> None:
+        """Hook invoked after the aggregated progress has been updated"""
+        pass
+
+
+class TerminalProgressRenderer(ProgressStateSubscriber):
+    """Redraws the progress screen with ANSI escape codes (no subprocess per refresh)"""
+    
+    CLEAR_SCREEN = "\x1b[H\x1b[2J"
+    STATUS_EMOJI = {
+        'completed': '✅',
+        'processing': '🔄',
+        'failed': '❌',
+        'unknown': '❓'
+    }
+    
+    def __init__(self, stream: Optional[TextIO] = None, refresh_interval: float = 1.0,
+                 max_recent_chunks: int = 10):
+        """
+        Initialize renderer
         
-        # Overall progress
-        print(f"📊 Overall Progress: {progress.overall_progress:.1f}%")
-        print(f"🎯 Current Chunk: {progress.current_chunk}/{progress.total_chunks}")
-        print(f"✅ Completed: {progress.completed_chunks}")
-        print(f"❌ Failed: {progress.failed_chunks}")
-        print(f"📈 Success Rate: {progress.success_rate:.1f}%")
+        Args:
+            stream: Output stream (defaults to stdout)
+            refresh_interval: Minimum seconds between redraws of chunk updates
+            max_recent_chunks: Number of recent chunks listed on screen
+        """
+        super().__init__()
+        self.stream = stream or sys.stdout
+        self.refresh_interval = refresh_interval
+        self.max_recent_chunks = max_recent_chunks
+        self._last_render = 0.0
+    
+    def on_event(self, event: ProgressEvent, progress: TranscriptionProgress) -> None:
+        now = time.monotonic()
+        is_job_event = event.event_type in (ProgressEventType.JOB_STARTED, ProgressEventType.JOB_COMPLETED)
+        if not is_job_event and now - self._last_render < self.refresh_interval:
+            return
+        self._last_render = now
+        self.render(progress)
+    
+    def render(self, progress: TranscriptionProgress) -> None:
+        """Render progress in a single write to the output stream"""
+        is_tty = hasattr(self.stream, 'isatty') and self.stream.isatty()
+        if not is_tty:
+            self.stream.write(
+                f"📊 {progress.overall_progress:.1f}% ({progress.completed_chunks}/{progress.total_chunks} chunks, "
+                f"{progress.failed_chunks} failed)\n"
+            )
+            self.stream.flush()
+            return
         
-        # Time information
+        self.stream.write(self.CLEAR_SCREEN + "\n".join(self._format_lines(progress)) + "\n")
+        self.stream.flush()
+    
+    def _format_lines(self, progress: TranscriptionProgress) -> List[str]:
+        """Build the lines of the progress screen"""
         elapsed_str = str(timedelta(seconds=int(progress.elapsed_time)))
         remaining_str = str(timedelta(seconds=int(progress.estimated_remaining))) if progress.estimated_remaining > 0 else "Calculating..."
         
-        print(f"⏱️  Elapsed Time: {elapsed_str}")
-        print(f"⏳ Estimated Remaining: {remaining_str}")
-        
-        # Progress bar
         bar_length = 50
         filled_length = int(bar_length * progress.overall_progress / 100)
         bar = '█' * filled_length + '░' * (bar_length - filled_length)
-        print(f"\n[{bar}] {progress.overall_progress:.1f}%")
         
-        # Recent chunks status
-        print(f"\n📋 Recent Chunks Status:")
-        recent_chunks = sorted(progress.chunks.keys(), reverse=True)[:10]
+        lines = [
+            "🎯 TRANSCRIPTION PROGRESS MONITOR",
+            "=" * 80,
+            f"📊 Overall Progress: {progress.overall_progress:.1f}%",
+            f"🎯 Current Chunk: {progress.current_chunk}/{progress.total_chunks}",
+            f"✅ Completed: {progress.completed_chunks}",
+            f"❌ Failed: {progress.failed_chunks}",
+            f"📈 Success Rate: {progress.success_rate:.1f}%",
+            f"⏱️  Elapsed Time: {elapsed_str}",
+            f"⏳ Estimated Remaining: {remaining_str}",
+            "",
+            f"[{bar}] {progress.overall_progress:.1f}%",
+            "",
+            "📋 Recent Chunks Status:"
+        ]
         
-        for chunk_num in recent_chunks:
+        for chunk_num in sorted(progress.chunks.keys(), reverse=True)[:self.max_recent_chunks]:
             chunk = progress.chunks[chunk_num]
-            status_emoji = {
-                'completed': '✅',
-                'processing': '🔄',
-                'failed': '❌',
-                'unknown': '❓'
-            }.get(chunk.status, '❓')
-            
-            print(f"   {status_emoji} Chunk {chunk_num:03d}: {chunk.status} "
-                  f"({chunk.start_time:.0f}s - {chunk.end_time:.0f}s)")
-            
-        print("\n" + "=" * 80)
-        print("Press Ctrl+C to stop monitoring")
+            status_emoji = self.STATUS_EMOJI.get(chunk.status, '❓')
+            lines.append(f"   {status_emoji} Chunk {chunk_num:03d}: {chunk.status} "
+                         f"({chunk.start_time:.0f}s - {chunk.end_time:.0f}s)")
         
+        lines.append("=" * 80)
+        return lines
+
+
+class StatusFileWriter(ProgressStateSubscriber):
+    """Writes a JSON status snapshot that external tools can poll"""
+    
+    def __init__(self, status_file: str, min_interval: float = 2.0):
+        """
+        Initialize status file writer
+        
+        Args:
+            status_file: Path of the status JSON file
+            min_interval: Minimum seconds between writes for chunk events
+        """
+        super().__init__()
+        self.status_file = Path(status_file)
+        self.min_interval = min_interval
+        self._last_write = 0.0
+    
+    def on_event(self, event: ProgressEvent, progress: TranscriptionProgress) -> None:
+        if event.event_type == ProgressEventType.CHUNK_STARTED:
+            return
+        now = time.monotonic()
+        is_job_event = event.event_type in (ProgressEventType.JOB_STARTED, ProgressEventType.JOB_COMPLETED)
+        if not is_job_event and now - self._last_write < self.min_interval:
+            return
+        self._last_write = now
+        
+        try:
+            write_json_atomically(self.status_file, {
+                'job_id': progress.job_id,
+                'status': 'completed' if progress.job_completed else 'running',
+                'overall_progress': progress.overall_progress,
+                'total_chunks': progress.total_chunks,
+                'completed_chunks': progress.completed_chunks,
+                'failed_chunks': progress.failed_chunks,
+                'current_chunk': progress.current_chunk,
+                'elapsed_time': progress.elapsed_time,
+                'estimated_remaining': progress.estimated_remaining,
+                'last_event': event.to_dict(),
+                'updated_at': datetime.now().isoformat()
+            })
+        except OSError as e:
+            logger.warning(f"⚠️ Could not write progress status file {self.status_file}: {e}")
+
+
+class ProgressMetricsExporter:
+    """Aggregates event counters and chunk latency metrics"""
+    
+    def __init__(self):
+        self._lock = Lock()
+        self.reset()
+    
+    def reset(self) -> None:
+        """Reset all metrics"""
+        with self._lock:
+            self.event_counts: Dict[str, int] = {event_type.value: 0 for event_type in ProgressEventType}
+            self.chunk_time_total = 0.0
+            self.chunk_time_max = 0.0
+            self.chunks_timed = 0
+            self.audio_seconds_processed = 0.0
+    
+    def __call__(self, event: ProgressEvent) -> None:
+        with self._lock:
+            self.event_counts[event.event_type.value] += 1
+            if event.event_type == ProgressEventType.CHUNK_COMPLETED:
+                if event.processing_time is not None:
+                    self.chunk_time_total += event.processing_time
+                    self.chunk_time_max = max(self.chunk_time_max, event.processing_time)
+                    self.chunks_timed += 1
+                if event.start_time is not None and event.end_time is not None:
+                    self.audio_seconds_processed += max(0.0, event.end_time - event.start_time)
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get current metrics
+        
+        Returns:
+            Dictionary with event counters and chunk latency statistics
+        """
+        with self._lock:
+            return {
+                'events': dict(self.event_counts),
+                'chunks_completed': self.event_counts[ProgressEventType.CHUNK_COMPLETED.value],
+                'chunks_failed': self.event_counts[ProgressEventType.CHUNK_FAILED.value],
+                'jobs_completed': self.event_counts[ProgressEventType.JOB_COMPLETED.value],
+                'average_chunk_time': self.chunk_time_total / self.chunks_timed if self.chunks_timed else 0.0,
+                'max_chunk_time': self.chunk_time_max,
+                'audio_seconds_processed': self.audio_seconds_processed,
+                'realtime_factor': (self.audio_seconds_processed / self.chunk_time_total
+                                    if self.chunk_time_total > 0 else 0.0)
+            }
+    
+    def export_prometheus(self) -> str:
+        """Render metrics in Prometheus text exposition format"""
+        metrics = self.get_metrics()
+        lines = []
+        for event_type, count in metrics['events'].items():
+            lines.append(f'transcription_progress_events_total{{event="{event_type}"}} {count}')
+        lines.append(f"transcription_chunk_seconds_avg {metrics['average_chunk_time']:.6f}")
+        lines.append(f"transcription_chunk_seconds_max {metrics['max_chunk_time']:.6f}")
+        lines.append(f"transcription_audio_seconds_total {metrics['audio_seconds_processed']:.3f}")
+        return "\n".join(lines) + "\n"
+
+
+class ProgressMonitor(ProgressStateSubscriber):
+    """
+    Event-driven transcription progress monitor
+    
+    Subscribes to the progress event bus instead of polling chunk files, so
+    each update costs O(1) and no disk I/O competes with the decoder.
+    """
+    
+    def __init__(self, event_bus: Optional[ProgressEventBus] = None,
+                 subscribers: Optional[List[ProgressSubscriber]] = None):
+        """
+        Initialize progress monitor
+        
+        Args:
+            event_bus: Event bus to subscribe to (defaults to the process-wide bus)
+            subscribers: Additional subscribers attached while monitoring (renderer, exporters)
+        """
+        super().__init__()
+        self.event_bus = event_bus or get_progress_event_bus()
+        self.subscribers: List[ProgressSubscriber] = list(subscribers or [])
+        self.monitoring = False
+        self.job_id: Optional[str] = None
+    
+    @property
+    def current_progress(self) -> Optional[TranscriptionProgress]:
+        """Aggregated progress of the monitored job, or of the latest job if none was named"""
+        with self.lock:
+            if self.job_id is not None and self.job_id in self.jobs:
+                return self.jobs[self.job_id]
+            return self.progress
+    
+    def start_monitoring(self, audio_file: str, estimated_duration: float = None):
+        """Start monitoring transcription progress of a job"""
+        with self.lock:
+            self.job_id = audio_file
+            self.progress = self._start_job(audio_file)
+        
+        if self.monitoring:
+            # Already subscribed; only the monitored job changes
+            return
+        
+        self.event_bus.subscribe(self)
+        for subscriber in self.subscribers:
+            self.event_bus.subscribe(subscriber)
+        self.monitoring = True
+        logger.info("🚀 Progress monitoring started")
+    
+    def stop_monitoring(self):
+        """Stop progress monitoring"""
+        if not self.monitoring:
+            return
+        self.event_bus.unsubscribe(self)
+        for subscriber in self.subscribers:
+            self.event_bus.unsubscribe(subscriber)
+        self.monitoring = False
+        logger.info("🛑 Progress monitoring stopped")
+    
+    def stop(self):
+        """Stop monitoring (ProgressMonitorProtocol)"""
+        self.stop_monitoring()
+    
     def get_progress_summary(self) -> Optional[Dict]:
         """Get a summary of current progress"""
         if not self.current_progress:
@@ -3,6 +3,8 @@
 Batch processing configuration model
 """
 
+from typing import Optional
+
 from pydantic import BaseModel, Field, ConfigDict
 
 
@@ -12,12 +14,32 @@ class BatchConfig(BaseModel):
     enabled: bool = Field(default=True, description="Enable batch processing")
     parallel_processing: bool = Field(default=False, description="Enable parallel processing")
     max_workers: int = Field(default=1, ge=1, le=16, description="Maximum number of worker processes")
+    execution_backend: str = Field(default="thread", pattern="^(thread|process)$", description="Run files in this process ('thread') or in worker processes that each load the model once ('process')")
+    max_tasks_per_child: int = Field(default=0, ge=0, le=10000, description="Files a batch worker process handles before it is replaced (0 never recycles)")
+    process_start_method: str = Field(default="spawn", pattern="^(spawn|forkserver|fork)$", description="multiprocessing start method for batch worker processes")
+    scheduling_policy: str = Field(default="lpt", pattern="^(fifo|lpt|sjf)$", description="Order files by probed duration: longest first ('lpt', shortest batch wall time), shortest first ('sjf') or discovery order ('fifo')")
+    cross_file_batching: bool = Field(default=False, description="Cut every file into 30 s windows that share one queue and decode mixed-file batches of windows (plain transcription: no chunk files or speaker labels)")
+    decode_batch_size: int = Field(default=8, ge=1, le=64, description="Windows per generate call with cross_file_batching")
+    memory_admission: bool = Field(default=True, description="Start concurrent files only while their estimated peak memory fits the memory budget")
+    memory_budget_mb: int = Field(default=0, ge=0, description="Memory for concurrently running files (0 uses 80% of the memory limit minus the resident model)")
+    model_memory_mb: int = Field(default=2048, ge=0, description="Resident memory of the loaded model, counted once against the memory limit")
+    adaptive_concurrency: bool = Field(default=False, description="Adjust the number of active batch workers from throughput, latency, CPU oversubscription and memory pressure (AIMD), starting at the thread budget's worker count or half of adaptive_max_workers, whichever is lower")
+    adaptive_max_workers: int = Field(default=0, ge=0, le=256, description="Most workers adaptive concurrency may activate, and the size of the process worker pool (0 for all cores)")
+    prefetch_files: int = Field(default=2, ge=0, le=16, description="Files decoded in the background ahead of the one being transcribed, within the memory admission budget (0 disables prefetching)")
+    work_queue_path: Optional[str] = Field(default=None, description="SQLite work queue on a shared filesystem; hosts running the same batch with the same path split its files between them")
+    work_queue_lease_seconds: int = Field(default=300, ge=30, le=86400, description="Seconds a claimed file stays reserved for a host without a heartbeat before others may reclaim it")
     delay_between_files: int = Field(default=0, ge=0, le=60, description="Delay between processing files in seconds")
     progress_tracking: bool = Field(default=True, description="Enable progress tracking")
     continue_on_error: bool = Field(default=True, description="Continue processing on file errors")
     timeout_per_file: int = Field(default=600, ge=30, le=3600, description="Timeout per file in seconds")
     retry_failed_files: bool = Field(default=True, description="Retry failed files")
     max_retries: int = Field(default=3, ge=0, le=10, description="Maximum number of retries per file")
+    streaming_discovery: bool = Field(default=True, description="Start processing files while the input directory is still being walked")
+    discovery_workers: int = Field(default=4, ge=1, le=64, description="Directories scanned concurrently during file discovery")
+    discovery_order_window: int = Field(default=0, ge=0, le=100000, description="Sort streamed files within windows of this many files, by scheduling_policy or else by path (0 uses windows of 64 files under 'lpt' and 'sjf' and keeps discovery order otherwise)")
+    skip_completed: bool = Field(default=True, description="Skip files an earlier run already transcribed with the same settings and whose outputs still exist")
+    skip_index_dir: Optional[str] = Field(default=None, description="Directory of the per-input-directory skip index (defaults to <output_dir>/.batch_index)")
+    skip_index_verify_hash: bool = Field(default=False, description="Also compare content hashes before skipping a file (reads every unchanged file)")
     
     model_config = ConfigDict(
         validate_assignment=True,
@@ -51,12 +51,23 @@ class SystemConfig(BaseModel):
     auto_cleanup: bool = Field(default=True, description="Enable automatic cleanup")
     session_management: bool = Field(default=True, description="Enable session management")
     error_reporting: bool = Field(default=True, description="Enable error reporting")
+    advanced_monitoring: bool = Field(default=False, description="Enable terminal progress view and status file")
+    model_warmup: bool = Field(default=False, description="Load and warm up the default model in the background at startup")
     
     # Path configurations
     models_path: str = Field(default="models", description="Path to models directory")
     temp_dir: str = Field(default="output/temp", description="Path to temporary directory")
     cache_dir: str = Field(default="output/cache", description="Path to cache directory")
     
+    # Memory governor thresholds (default to 70%/85% of the container or host memory)
+    memory_soft_limit_mb: Optional[int] = Field(default=None, ge=128, description="RSS above which garbage collection runs")
+    memory_hard_limit_mb: Optional[int] = Field(default=None, ge=128, description="RSS above which caches shrink and admission pauses")
+    memory_admission_timeout_seconds: int = Field(default=300, ge=1, le=3600, description="Maximum time to pause admission under memory pressure")
+    
+    # Thread budget (defaults to the cores available to the process, honoring affinity and cgroup quotas)
+    thread_budget_cores: Optional[int] = Field(default=None, ge=1, description="Cores shared by batch workers, chunk workers, CTranslate2 and BLAS/OpenMP pools")
+    cpu_placement: str = Field(default="none", pattern="^(none|numa)$", description="Pin batch workers and chunk worker processes to disjoint core sets per NUMA node ('none' or 'numa')")
+    
     # Application constants
     constants: ApplicationConstants = Field(default_factory=ApplicationConstants, description="Application constants and thresholds")
     
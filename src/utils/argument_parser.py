@@ -5,7 +5,7 @@ Handles command-line argument parsing and validation
 """
 
 import argparse
-from typing import Optional
+from typing import List, Optional
 import sys
 
 
@@ -24,6 +24,7 @@ Examples:
   python main_app.py batch --model base --engine speaker-diarization
   python main_app.py --config-file config/environments/ivrit_whisper_large_v3_ct2.json batch
   python main_app.py status
+  python main_app.py autotune --audio examples/audio/voice/audio.wav
             """
         )
         
@@ -66,6 +67,8 @@ Examples:
         batch_parser.add_argument('--speaker-preset', 
                                 choices=['default', 'conversation', 'interview'], 
                                 help='Speaker diarization preset')
+        batch_parser.add_argument('--reprocess', action='store_true',
+                                help='Transcribe every file, including files the skip index marks as done')
         
         # Status
         status_parser = subparsers.add_parser('status', help='Show application status')
@@ -73,8 +76,31 @@ Examples:
         # Process existing chunks
         process_chunks_parser = subparsers.add_parser('process-chunks', help='Process existing chunk results without transcription')
         
+        # Tune thread, worker and beam settings for this host
+        autotune_parser = subparsers.add_parser('autotune', help='Benchmark settings on this host and write a host profile')
+        autotune_parser.add_argument('--audio', help='Sample audio file (synthetic audio if omitted)')
+        autotune_parser.add_argument('--model', help='Model to benchmark (defaults to the configured model)')
+        autotune_parser.add_argument('--workers', type=ArgumentParser._int_list,
+                                   help='Comma-separated concurrent decode counts to try (e.g. 1,2,4)')
+        autotune_parser.add_argument('--beam-sizes', type=ArgumentParser._int_list,
+                                   help='Comma-separated beam sizes to try (defaults to the configured beam size)')
+        autotune_parser.add_argument('--max-rss-mb', type=float, help='Reject settings whose peak RSS exceeds this')
+        autotune_parser.add_argument('--output-dir', help='Profile directory (defaults to the configuration directory)')
+        autotune_parser.add_argument('--dry-run', action='store_true', help='Report measurements without writing a profile')
+        
         return parser
     
+    @staticmethod
+    def _int_list(value: str) -> List[int]:
+        """Parse a comma-separated list of positive integers"""
+        try:
+            values = [int(item) for item in value.split(',') if item.strip()]
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"expected comma-separated integers, got '{value}'")
+        if not values or min(values) < 1:
+            raise argparse.ArgumentTypeError(f"expected positive integers, got '{value}'")
+        return values
+    
     @staticmethod
     def parse_args() -> argparse.Namespace:
         """Parse command-line arguments"""
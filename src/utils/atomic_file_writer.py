@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Atomic file writing helpers
+Readers never observe a half-written file: content goes to a temporary
+sibling first and is moved over the target with os.replace
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Union
+
+
+def write_text_atomically(file_path: Union[str, Path], content: str, encoding: str = 'utf-8') -> Path:
+    """
+    Write text to a file atomically
+    
+    Args:
+        file_path: Target file path
+        content: Text content to write
+        encoding: Text encoding
+        
+    Returns:
+        Path of the written file
+    """
+    target = Path(file_path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{target.name}.", suffix=".tmp", dir=str(target.parent))
+    try:
+        with os.fdopen(fd, 'w', encoding=encoding) as f:
+            f.write(content)
+        os.replace(tmp_name, target)
+    except Exception:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    return target
+
+
+def write_json_atomically(file_path: Union[str, Path], data: Any, indent: int = 2) -> Path:
+    """
+    Serialize data to JSON and write it atomically
+    
+    Args:
+        file_path: Target file path
+        data: JSON-serializable data
+        indent: JSON indentation
+        
+    Returns:
+        Path of the written file
+    """
+    return write_text_atomically(file_path, json.dumps(data, indent=indent, ensure_ascii=False))
@@ -22,6 +22,7 @@ from src.models.input import InputConfig
 from src.models.chunking import ChunkingConfig
 from src.models.processing import ProcessingConfig
 from src.models.app_config import AppConfig
+from src.utils.host_profile import HOST_PROFILE_METADATA_KEY, host_profile_filename
 
 logger = logging.getLogger(__name__)
 
@@ -78,8 +79,15 @@ class JsonConfigLoader:
     def __init__(self, config_dir: Path):
         self.config_dir = config_dir
     
-    def load_config(self, environment: Environment) -> Dict[str, Any]:
-        """Load and merge configuration for given environment"""
+    def load_config(self, environment: Environment, explicit_config: bool = False) -> Dict[str, Any]:
+        """
+        Load and merge configuration for given environment
+        
+        Args:
+            environment: Environment whose configuration file is layered over base.json
+            explicit_config: The environment configuration was passed explicitly (--config-file),
+                so its settings win over the host profile
+        """
         # Load base config (if exists)
         base_config = self._load_json_file("base.json")
         logger.info(f"🔍 Base config loaded: {list(base_config.keys()) if base_config else 'Empty'}")
@@ -88,8 +96,13 @@ class JsonConfigLoader:
         env_config = self._load_json_file(f"{environment.value}.json")
         logger.info(f"🔍 Environment config loaded: {list(env_config.keys()) if env_config else 'Empty'}")
         
-        # Merge configurations
-        merged_config = self._merge_configs(base_config, env_config)
+        # The tuned profile of this host type (written by the autotune command) goes over the
+        # defaults, but under a configuration file the user passed explicitly
+        host_config = self._load_host_profile()
+        if explicit_config:
+            merged_config = self._merge_configs(self._merge_configs(base_config, host_config), env_config)
+        else:
+            merged_config = self._merge_configs(self._merge_configs(base_config, env_config), host_config)
         logger.info(f"🔍 Merged config keys: {list(merged_config.keys()) if merged_config else 'Empty'}")
         
         # Enhanced transcription config debugging
@@ -120,6 +133,17 @@ class JsonConfigLoader:
         
         return merged_config
     
+    def _load_host_profile(self) -> Dict[str, Any]:
+        """Load the host profile for this host type, without its tuning metadata"""
+        filename = host_profile_filename()
+        if not filename or not (self.config_dir / filename).exists():
+            return {}
+        
+        host_config = self._load_json_file(filename)
+        metadata = host_config.pop(HOST_PROFILE_METADATA_KEY, None) or {}
+        logger.info(f"🖥️ Host profile applied: {filename} (tuned {metadata.get('created_at', 'unknown')})")
+        return host_config
+    
     def _load_json_file(self, filename: str) -> Dict[str, Any]:
         """Load JSON file safely"""
         file_path = self.config_dir / filename
@@ -554,19 +578,22 @@ class ConfigPrinter:
 class ConfigManager:
     """Main configuration manager - orchestrates other components"""
     
-    def __init__(self, config_dir: str = "config", environment: Union[Environment, None] = None):
+    def __init__(self, config_dir: str = "config", environment: Union[Environment, None] = None,
+                 explicit_config: bool = False):
         """
         Initialize configuration manager
         
         Args:
             config_dir: Directory containing configuration files
             environment: Optional environment override
+            explicit_config: The configuration file was passed explicitly and overrides the host profile
         """
         self.config_dir = Path(config_dir)
         self.config_dir.mkdir(exist_ok=True)
         
         # Determine environment
         self.environment = EnvironmentLoader.determine_environment(environment)
+        self.explicit_config = explicit_config
         
         # Load configuration using the pipeline
         self.config = self._load_configuration()
@@ -579,7 +606,7 @@ class ConfigManager:
         # 1. Load JSON configurations first
         logger.info("📁 Loading configuration from JSON files...")
         json_loader = JsonConfigLoader(self.config_dir)
-        json_config = json_loader.load_config(self.environment)
+        json_config = json_loader.load_config(self.environment, self.explicit_config)
         logger.info("✅ JSON configuration loaded")
         
         # 2. Create AppConfig from JSON
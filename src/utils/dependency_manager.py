@@ -4,6 +4,8 @@ Centralized dependency manager for the project
 Provides unified optional dependency handling across all modules
 """
 
+import importlib
+import importlib.util
 import logging
 import threading
 from typing import Dict, List, Any, Optional
@@ -12,14 +14,22 @@ logger = logging.getLogger(__name__)
 
 
 class DependencyManager:
-    """Manages optional dependencies with better error handling and documentation"""
+    """
+    Manages optional dependencies with better error handling and documentation
+    
+    Availability is answered from the import system's module specs without
+    executing the dependency; the module itself is imported on the first
+    get_module() call, so reporting status costs milliseconds instead of the
+    seconds heavy packages such as torch or transformers take to import.
+    """
     
     def __init__(self):
         self._dependencies = {}
+        self._lock = threading.RLock()
         self._load_dependencies()
     
     def _load_dependencies(self):
-        """Load all optional dependencies with proper error handling"""
+        """Register all optional dependencies (nothing is imported here)"""
         dependencies = {
             'torch': {
                 'import_name': 'torch',
@@ -56,6 +66,16 @@ class DependencyManager:
                 'description': 'CTranslate2 for optimized inference',
                 'required_for': ['Fast inference', 'Optimized models']
             },
+            'transformers': {
+                'import_name': 'transformers',
+                'description': 'Hugging Face Transformers for Whisper tokenization',
+                'required_for': ['Token decoding', 'Model loading']
+            },
+            'tokenizers': {
+                'import_name': 'tokenizers',
+                'description': 'Hugging Face Tokenizers for lightweight Whisper decoding',
+                'required_for': ['Token decoding without transformers']
+            },
             'runpod': {
                 'import_name': 'runpod',
                 'description': 'RunPod API client',
@@ -64,42 +84,53 @@ class DependencyManager:
         }
         
         for dep_name, dep_info in dependencies.items():
+            self._dependencies[dep_name] = {
+                'import_name': dep_info['import_name'],
+                'available': None,
+                'module': None,
+                'description': dep_info['description'],
+                'required_for': dep_info['required_for']
+            }
+    
+    def _check_available(self, dependency: str) -> bool:
+        """Resolve availability from the module spec, caching the answer"""
+        dep_info = self._dependencies.get(dependency)
+        if dep_info is None:
+            return False
+        if dep_info['available'] is None:
             try:
-                module = __import__(dep_info['import_name'])
-                self._dependencies[dep_name] = {
-                    'available': True,
-                    'module': module,
-                    'description': dep_info['description'],
-                    'required_for': dep_info['required_for']
-                }
-            except ImportError:
-                self._dependencies[dep_name] = {
-                    'available': False,
-                    'module': None,
-                    'description': dep_info['description'],
-                    'required_for': dep_info['required_for']
-                }
+                dep_info['available'] = importlib.util.find_spec(dep_info['import_name']) is not None
+            except (ImportError, ValueError):
+                dep_info['available'] = False
+        return dep_info['available']
     
     def is_available(self, dependency: str) -> bool:
         """Check if a dependency is available"""
-        return self._dependencies.get(dependency, {}).get('available', False)
+        with self._lock:
+            return self._check_available(dependency)
     
     def get_module(self, dependency: str):
-        """Get the imported module if available"""
-        dep_info = self._dependencies.get(dependency, {})
-        if dep_info.get('available', False):
+        """Get the dependency module, importing it on first use"""
+        with self._lock:
+            if not self._check_available(dependency):
+                raise ImportError(f"Dependency '{dependency}' is not available")
+            dep_info = self._dependencies[dependency]
+            if dep_info['module'] is None:
+                try:
+                    dep_info['module'] = importlib.import_module(dep_info['import_name'])
+                except ImportError as e:
+                    # Installed but broken (e.g. missing native library)
+                    dep_info['available'] = False
+                    raise ImportError(f"Dependency '{dependency}' is not available: {e}") from e
             return dep_info['module']
-        raise ImportError(f"Dependency '{dependency}' is not available")
     
     def get_missing_dependencies(self) -> List[str]:
         """Get list of missing dependencies"""
-        return [name for name, info in self._dependencies.items() 
-                if not info.get('available', False)]
+        return [name for name in self._dependencies if not self.is_available(name)]
     
     def get_available_dependencies(self) -> List[str]:
         """Get list of available dependencies"""
-        return [name for name, info in self._dependencies.items() 
-                if info.get('available', False)]
+        return [name for name in self._dependencies if self.is_available(name)]
     
     def log_dependency_status(self, logger_instance=None):
         """Log the status of all dependencies"""
@@ -140,6 +171,7 @@ def SOUNDFILE_AVAILABLE(): return get_dependency_manager().is_available('soundfi
 def STABLE_WHISPER_AVAILABLE(): return get_dependency_manager().is_available('stable_whisper')
 def CTRANSLATE2_AVAILABLE(): return get_dependency_manager().is_available('ctranslate2')
 def TRANSFORMERS_AVAILABLE(): return get_dependency_manager().is_available('transformers')
+def TOKENIZERS_AVAILABLE(): return get_dependency_manager().is_available('tokenizers')
 def RUNPOD_AVAILABLE(): return get_dependency_manager().is_available('runpod')
 
 # Backward compatibility - direct access (deprecated)
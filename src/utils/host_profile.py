@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Host Profile
+Identifies the host type so tuned settings can be stored per instance type
+and layered over the environment configuration
+"""
+
+import os
+import platform
+import re
+from typing import Optional
+
+# Overrides the host profile file name ("none" disables host profiles)
+HOST_PROFILE_ENV_VAR = 'HOST_PROFILE'
+HOST_PROFILE_PREFIX = 'host-'
+
+# Key of the tuning metadata stored alongside the settings in a host profile
+HOST_PROFILE_METADATA_KEY = '_autotune'
+
+
+def _cpu_model() -> str:
+    try:
+        with open('/proc/cpuinfo', 'r') as f:
+            for line in f:
+                if line.startswith('model name') or line.startswith('Hardware'):
+                    return line.split(':', 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine() or 'cpu'
+
+
+def _memory_gb() -> int:
+    try:
+        return round(os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') / (1024 ** 3))
+    except (AttributeError, OSError, ValueError):
+        return 0
+
+
+def host_fingerprint() -> str:
+    """
+    Describe the host type as a file-name-safe slug
+
+    Built from the CPU model, the logical core count and the physical memory,
+    so instances of the same type share a profile.
+
+    Returns:
+        Slug such as "amd-epyc-7r13-processor-16c-64g"
+    """
+    model = re.sub(r'\((r|tm)\)|cpu|@.*$', '', _cpu_model().lower())
+    slug = re.sub(r'[^a-z0-9]+', '-', model).strip('-') or 'cpu'
+    return f"{slug}-{os.cpu_count() or 1}c-{_memory_gb()}g"
+
+
+def host_profile_filename() -> Optional[str]:
+    """
+    Get the file name of this host's profile
+
+    Returns:
+        File name relative to the environments directory, or None if host profiles are disabled
+    """
+    override = os.environ.get(HOST_PROFILE_ENV_VAR)
+    if override:
+        if override.lower() == 'none':
+            return None
+        return override if override.endswith('.json') else f"{override}.json"
+    return f"{HOST_PROFILE_PREFIX}{host_fingerprint()}.json"
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Lazy provider for deferred construction of heavyweight components
+"""
+
+import logging
+import threading
+from typing import Callable, Generic, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+_UNSET = object()
+
+
+class LazyProvider(Generic[T]):
+    """
+    Builds a component on first use and shares it afterwards
+
+    Construction is thread-safe and happens at most once. If the factory
+    raises, nothing is cached and the next get() retries.
+    """
+
+    def __init__(self, factory: Callable[[], T], name: Optional[str] = None):
+        """
+        Initialize lazy provider
+
+        Args:
+            factory: Callable creating the component
+            name: Component name for logging
+        """
+        self._factory = factory
+        self.name = name or getattr(factory, '__name__', 'component')
+        self._instance = _UNSET
+        self._lock = threading.RLock()
+
+    @classmethod
+    def of(cls, instance: T, name: Optional[str] = None) -> 'LazyProvider[T]':
+        """Wrap an already constructed (e.g. injected) component"""
+        provider = cls(lambda: instance, name=name or type(instance).__name__)
+        provider._instance = instance
+        return provider
+
+    def get(self) -> T:
+        """Get the component, constructing it on first use"""
+        instance = self._instance
+        if instance is not _UNSET:
+            return instance
+        with self._lock:
+            if self._instance is _UNSET:
+                logger.debug(f"🔧 Materializing {self.name}")
+                self._instance = self._factory()
+            return self._instance
+
+    @property
+    def is_initialized(self) -> bool:
+        """Whether the component has been constructed"""
+        return self._instance is not _UNSET
+
+    def peek(self) -> Optional[T]:
+        """Get the component only if it has already been constructed"""
+        instance = self._instance
+        return None if instance is _UNSET else instance
+
+    def reset(self) -> Optional[T]:
+        """
+        Drop the constructed component so the next get() rebuilds it
+
+        Returns:
+            The previously constructed component, if any
+        """
+        with self._lock:
+            instance = self.peek()
+            self._instance = _UNSET
+            return instance
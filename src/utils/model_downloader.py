@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Model download manager
+Downloads model artifacts concurrently with HTTP range segments, resumes
+interrupted downloads, verifies SHA256 checksums and installs atomically
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+
+from src.utils.atomic_file_writer import write_json_atomically
+
+logger = logging.getLogger(__name__)
+
+HUGGINGFACE_ENDPOINT = "https://huggingface.co"
+STAGING_DIR_NAME = ".downloads"
+PART_SUFFIX = ".part"
+STATE_SUFFIX = ".part.json"
+
+
+class ModelDownloadError(Exception):
+    """Raised when a model artifact cannot be downloaded or verified"""
+    pass
+
+
+@dataclass
+class ManifestEntry:
+    """A single model file: where it goes, where it comes from and what it must hash to"""
+    path: str
+    url: str
+    size: Optional[int] = None
+    sha256: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'path': self.path, 'url': self.url, 'size': self.size, 'sha256': self.sha256}
+
+
+@dataclass
+class ModelManifest:
+    """The set of files that make up a model"""
+    model_name: str
+    files: List[ManifestEntry] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ModelManifest':
+        files = [ManifestEntry(path=entry['path'], url=entry['url'], size=entry.get('size'),
+                               sha256=entry.get('sha256')) for entry in data.get('files', [])]
+        return cls(model_name=data['model_name'], files=files)
+
+    @classmethod
+    def from_file(cls, manifest_path: str) -> 'ModelManifest':
+        """Load a manifest from a JSON file"""
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+    @classmethod
+    def from_huggingface(cls, repo_id: str, revision: str = "main", endpoint: str = HUGGINGFACE_ENDPOINT,
+                         timeout: float = 30) -> 'ModelManifest':
+        """
+        Build a manifest from a Hugging Face repository listing
+
+        LFS files (the model weights) carry their SHA256 in the listing; small
+        files stored in git have a size but no SHA256 and are verified by size.
+
+        Args:
+            repo_id: Repository id, e.g. ivrit-ai/whisper-large-v3-ct2
+            revision: Branch, tag or commit
+            endpoint: Hub endpoint
+
+        Returns:
+            ModelManifest for the repository
+        """
+        response = requests.get(f"{endpoint}/api/models/{repo_id}/tree/{revision}", params={'recursive': 'true'},
+                                timeout=timeout)
+        response.raise_for_status()
+        files = []
+        for item in response.json():
+            if item.get('type') != 'file':
+                continue
+            lfs = item.get('lfs') or {}
+            files.append(ManifestEntry(
+                path=item['path'],
+                url=f"{endpoint}/{repo_id}/resolve/{revision}/{item['path']}",
+                size=lfs.get('size', item.get('size')),
+                sha256=lfs.get('oid')
+            ))
+        return cls(model_name=repo_id, files=files)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'model_name': self.model_name, 'files': [entry.to_dict() for entry in self.files]}
+
+
+class ModelDownloadManager:
+    """
+    Downloads a model manifest into the models directory
+
+    Files are fetched into a staging directory inside the models directory.
+    Each file is split into range segments that download concurrently into a
+    preallocated .part file; completed segments are recorded in a sidecar
+    state file, so an interrupted download resumes with only the missing
+    segments. A file is accepted once its size and SHA256 match the manifest,
+    and the model directory is swapped into place with a rename only after
+    every file has been verified.
+    """
+
+    def __init__(self, models_dir: str, max_workers: int = 8, segment_size: int = 64 * 1024 * 1024,
+                 timeout: float = 60, max_retries: int = 3, chunk_size: int = 1024 * 1024,
+                 headers: Optional[Dict[str, str]] = None):
+        """
+        Initialize download manager
+
+        Args:
+            models_dir: Directory models are installed into
+            max_workers: Concurrent segment downloads (across all files)
+            segment_size: Bytes per range segment
+            timeout: Per-request timeout in seconds
+            max_retries: Attempts per segment before giving up
+            chunk_size: Streaming read size
+            headers: Extra request headers (e.g. Authorization)
+        """
+        self.models_dir = Path(models_dir)
+        self.max_workers = max(1, max_workers)
+        self.segment_size = max(1, segment_size)
+        self.timeout = timeout
+        self.max_retries = max(1, max_retries)
+        self.chunk_size = chunk_size
+        self.headers = {'User-Agent': 'ivrit-ai-transcription/1.0', **(headers or {})}
+        self._local = threading.local()
+        self._state_lock = threading.Lock()
+        self.stats: Dict[str, Any] = {'bytes_downloaded': 0, 'segments_downloaded': 0,
+                                      'segments_resumed': 0, 'files_verified': 0}
+
+    def get_install_path(self, model_name: str) -> Path:
+        """Directory a model is installed into (matches ModelManager's lookup)"""
+        return self.models_dir / model_name
+
+    def download(self, manifest: ModelManifest, force: bool = False) -> Path:
+        """
+        Download, verify and install every file of a manifest
+
+        Args:
+            manifest: Files to download
+            force: Reinstall even if the model directory already exists
+
+        Returns:
+            Path of the installed model directory
+
+        Raises:
+            ModelDownloadError: If a file cannot be downloaded or fails verification
+        """
+        install_path = self.get_install_path(manifest.model_name)
+        if install_path.exists() and not force:
+            logger.info(f"✅ Model already installed at {install_path}")
+            return install_path
+
+        staging_path = self.models_dir / STAGING_DIR_NAME / manifest.model_name
+        staging_path.mkdir(parents=True, exist_ok=True)
+        started = time.time()
+        logger.info(f"📥 Downloading {len(manifest.files)} files for {manifest.model_name} "
+                    f"({self.max_workers} parallel segments of {self.segment_size / (1024 ** 2):.0f} MB)")
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="model-download") as executor:
+            plans = [self._plan_file(entry, staging_path) for entry in manifest.files]
+            futures = [executor.submit(self._download_segment, entry, part_path, segment, ranged)
+                       for entry, part_path, pending, ranged in plans for segment in pending]
+            errors = []
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    errors.append(e)
+            if errors:
+                raise ModelDownloadError(f"{len(errors)} segment(s) failed for {manifest.model_name}: {errors[0]}")
+
+        for entry, part_path, pending, ranged in plans:
+            self._finalize_file(entry, part_path, staging_path / entry.path)
+
+        self._install(staging_path, install_path)
+        elapsed = time.time() - started
+        logger.info(f"✅ Installed {manifest.model_name} at {install_path} in {elapsed:.1f}s "
+                    f"({self.stats['bytes_downloaded'] / (1024 ** 2):.1f} MB downloaded, "
+                    f"{self.stats['segments_resumed']} segments resumed)")
+        return install_path
+
+    def _plan_file(self, entry: ManifestEntry, staging_path: Path) -> Tuple[ManifestEntry, Path, List[Tuple[int, int]], bool]:
+        """
+        Work out which segments of a file still need downloading
+
+        Returns:
+            Tuple of (entry with resolved size, .part path, pending segments, whether ranges are used)
+        """
+        final_path = staging_path / entry.path
+        part_path = final_path.with_name(final_path.name + PART_SUFFIX)
+        final_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if final_path.exists() and (entry.size is None or final_path.stat().st_size == entry.size):
+            return entry, part_path, [], False
+
+        size, ranges_supported = self._probe(entry)
+        entry = replace(entry, size=size)
+        if not ranges_supported or not size:
+            # Single stream from the start; without ranges a partial file cannot be resumed
+            self._write_state(part_path, {'size': size, 'segments': [], 'completed': []})
+            self._preallocate(part_path, 0)
+            return entry, part_path, [(0, (size or 0) - 1)], False
+
+        segments = [(start, min(start + self.segment_size, size) - 1) for start in range(0, size, self.segment_size)]
+        state = self._read_state(part_path)
+        if (state and state.get('size') == size and [tuple(s) for s in state.get('segments', [])] == segments
+                and part_path.exists()):
+            completed = {tuple(s) for s in state.get('completed', [])}
+            self.stats['segments_resumed'] += len(completed)
+            if completed:
+                logger.info(f"🔁 Resuming {entry.path}: {len(completed)}/{len(segments)} segments already downloaded")
+        else:
+            completed = set()
+            self._write_state(part_path, {'size': size, 'segments': segments, 'completed': []})
+            self._preallocate(part_path, size)
+        pending = [segment for segment in segments if segment not in completed]
+        return entry, part_path, pending, True
+
+    def _probe(self, entry: ManifestEntry) -> Tuple[Optional[int], bool]:
+        """Get the file size (None if unknown) and whether the server honours range requests"""
+        response = self._session().head(entry.url, headers=self.headers, timeout=self.timeout, allow_redirects=True)
+        response.raise_for_status()
+        size = entry.size
+        if size is None and 'Content-Length' in response.headers:
+            size = int(response.headers['Content-Length'])
+        ranges_supported = response.headers.get('Accept-Ranges', '').lower() == 'bytes'
+        return size, ranges_supported
+
+    def _download_segment(self, entry: ManifestEntry, part_path: Path, segment: Tuple[int, int], ranged: bool) -> None:
+        """Download one byte range into its place in the .part file, retrying with backoff"""
+        start, end = segment
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                headers = dict(self.headers)
+                if ranged:
+                    headers['Range'] = f"bytes={start}-{end}"
+                else:
+                    self._preallocate(part_path, 0)
+                with self._session().get(entry.url, headers=headers, stream=True, timeout=self.timeout) as response:
+                    response.raise_for_status()
+                    if ranged and response.status_code != 206:
+                        raise ModelDownloadError(f"Server ignored range request for {entry.path}")
+                    written = self._write_stream(response, part_path, start)
+                expected = end - start + 1 if end >= start else written
+                if written != expected:
+                    raise ModelDownloadError(f"Short read for {entry.path} [{start}-{end}]: {written}/{expected} bytes")
+                self._mark_completed(part_path, segment, written)
+                return
+            except (requests.RequestException, OSError, ModelDownloadError) as e:
+                if attempt == self.max_retries:
+                    raise ModelDownloadError(f"Failed to download {entry.path} [{start}-{end}]: {e}") from e
+                delay = min(2 ** attempt, 30)
+                logger.warning(f"⚠️ Segment {entry.path} [{start}-{end}] failed (attempt {attempt}), retrying in {delay}s: {e}")
+                time.sleep(delay)
+
+    def _write_stream(self, response: Any, part_path: Path, offset: int) -> int:
+        written = 0
+        with open(part_path, 'r+b') as f:
+            f.seek(offset)
+            for chunk in response.iter_content(chunk_size=self.chunk_size):
+                if chunk:
+                    f.write(chunk)
+                    written += len(chunk)
+        return written
+
+    def _finalize_file(self, entry: ManifestEntry, part_path: Path, final_path: Path) -> None:
+        """Verify a downloaded file and move it to its final staging name"""
+        if final_path.exists() and not part_path.exists():
+            source = final_path
+        else:
+            source = part_path
+        actual_size = source.stat().st_size
+        if entry.size is not None and actual_size != entry.size:
+            self._discard(part_path)
+            raise ModelDownloadError(f"Size mismatch for {entry.path}: {actual_size} != {entry.size}")
+        if entry.sha256:
+            digest = self._sha256(source)
+            if digest != entry.sha256.lower():
+                self._discard(part_path)
+                if source == final_path:
+                    final_path.unlink()
+                raise ModelDownloadError(f"SHA256 mismatch for {entry.path}: {digest} != {entry.sha256}")
+        if source == part_path:
+            os.replace(part_path, final_path)
+            self._state_path(part_path).unlink(missing_ok=True)
+        self.stats['files_verified'] += 1
+        logger.info(f"🔒 Verified {entry.path} ({actual_size:,} bytes{', sha256 ok' if entry.sha256 else ''})")
+
+    def _install(self, staging_path: Path, install_path: Path) -> None:
+        """Swap the verified staging directory into place"""
+        install_path.parent.mkdir(parents=True, exist_ok=True)
+        previous = None
+        if install_path.exists():
+            previous = install_path.with_name(f".{install_path.name}.old-{int(time.time())}")
+            os.replace(install_path, previous)
+        os.replace(staging_path, install_path)
+        if previous is not None:
+            shutil.rmtree(previous, ignore_errors=True)
+
+    def _mark_completed(self, part_path: Path, segment: Tuple[int, int], written: int) -> None:
+        with self._state_lock:
+            state = self._read_state(part_path) or {}
+            completed = [tuple(s) for s in state.get('completed', [])]
+            if segment not in completed:
+                completed.append(segment)
+            state['completed'] = completed
+            self._write_state(part_path, state)
+            self.stats['bytes_downloaded'] += written
+            self.stats['segments_downloaded'] += 1
+
+    def _session(self) -> requests.Session:
+        """One HTTP session per worker thread, so connections are reused"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+        return session
+
+    @staticmethod
+    def _preallocate(part_path: Path, size: int) -> None:
+        with open(part_path, 'wb') as f:
+            if size:
+                f.truncate(size)
+
+    @staticmethod
+    def _sha256(file_path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(8 * 1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _state_path(part_path: Path) -> Path:
+        return part_path.with_name(part_path.name[:-len(PART_SUFFIX)] + STATE_SUFFIX)
+
+    def _read_state(self, part_path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._state_path(part_path), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_state(self, part_path: Path, state: Dict[str, Any]) -> None:
+        write_json_atomically(self._state_path(part_path), state)
+
+    def _discard(self, part_path: Path) -> None:
+        part_path.unlink(missing_ok=True)
+        self._state_path(part_path).unlink(missing_ok=True)
@@ -276,6 +276,26 @@ class ApplicationUI:
         
         self.print_section_footer()
     
+    def print_autotune_result(self, result: Dict[str, Any]):
+        """Print autotune measurements and the selected settings"""
+        self.print_section_header(f"Autotune Results ({result['host']})", "🔧")
+        for measurement in result['measurements']:
+            outcome = measurement.get('error') or (f"{measurement['throughput']:.2f}x realtime, "
+                                                   f"peak RSS {measurement['peak_rss_mb']:.0f} MB")
+            print(f"    • workers={measurement['workers']} intra_threads={measurement['intra_threads']} "
+                  f"beam_size={measurement['beam_size']}: {outcome}")
+        print()
+        if result['success']:
+            best = result['best']
+            print(f"  ✅ Best: workers={best['workers']} intra_threads={best['intra_threads']} "
+                  f"beam_size={best['beam_size']} ({best['throughput']:.2f}x realtime)")
+            if result['profile_path']:
+                print(f"  💾 Host profile written to {result['profile_path']}")
+        else:
+            print(f"  ❌ {result.get('error')}")
+        
+        self.print_section_footer()
+    
     def print_success_message(self):
         """Print clean success message"""
         print()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Unit tests for AdaptiveConcurrencyController
+Tests additive increase on throughput gains, multiplicative decrease on
+latency and memory degradation, CPU oversubscription only with falling
+throughput, and slot gating
+"""
+
+import threading
+import time
+import unittest
+from pathlib import Path
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.logic.adaptive_concurrency import PROBE_AFTER_HOLDS, AdaptiveConcurrencyController
+from src.core.logic.memory_governor import MemoryPressure
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeGovernor:
+    """Memory governor with a settable pressure level"""
+
+    def __init__(self):
+        self.pressure = MemoryPressure.NORMAL
+
+    def get_pressure(self):
+        return self.pressure
+
+
+class TestAdaptiveConcurrency(unittest.TestCase):
+    """Test cases for AdaptiveConcurrencyController"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.load = [0.5]
+        self.governor = FakeGovernor()
+
+    def create_controller(self, initial_limit=4):
+        return AdaptiveConcurrencyController(max_limit=8, initial_limit=initial_limit, window_size=2,
+                                             memory_governor=self.governor,
+                                             load_reader=lambda: self.load[0], clock=self.clock)
+
+    def run_window(self, controller, latency, jobs=2):
+        """Complete a window of jobs that each took the given latency"""
+        started = [controller.acquire() for _ in range(jobs)]
+        self.clock.now += latency
+        for start in started:
+            controller.release(start)
+
+    def test_throughput_gain_adds_one_worker(self):
+        """Each window that improves throughput raises the limit by one"""
+        controller = self.create_controller()
+        self.run_window(controller, latency=10.0)
+        self.assertEqual(controller.limit, 5)
+        # Same latency, more jobs in the window: higher throughput
+        controller.window_size = 4
+        self.run_window(controller, latency=10.0, jobs=4)
+        self.assertEqual(controller.limit, 6)
+        self.assertEqual(controller.get_stats()['increases'], 2)
+
+    def test_latency_and_memory_degradation_cut_the_limit(self):
+        """Latency far above the best window and memory pressure each reduce the limit"""
+        controller = self.create_controller(initial_limit=8)
+        self.run_window(controller, latency=10.0)
+        self.assertEqual(controller.limit, 8)
+
+        self.run_window(controller, latency=30.0)
+        self.assertEqual(controller.limit, 5)
+        self.assertIn('latency', controller.decisions[-1].reason)
+
+        self.governor.pressure = MemoryPressure.SOFT
+        self.run_window(controller, latency=30.0)
+        self.assertEqual(controller.limit, 3)
+        self.assertEqual(controller.decisions[-1].reason, 'memory pressure')
+
+    def test_busy_cpu_cuts_the_limit_only_when_throughput_falls(self):
+        """CPU-bound workers that keep every core busy hold their limit until throughput drops"""
+        controller = self.create_controller(initial_limit=4)
+        self.load[0] = 3.0
+        self.run_window(controller, latency=10.0)
+        self.assertEqual(controller.limit, 5)
+
+        # Steady throughput on a busy CPU neither cuts the limit nor probes for more workers
+        for _ in range(PROBE_AFTER_HOLDS + 1):
+            self.run_window(controller, latency=10.0)
+        self.assertEqual(controller.limit, 5)
+        self.assertEqual(controller.get_stats()['decreases'], 0)
+
+        # Slower, within the latency tolerance, but throughput fell while the CPU is oversubscribed
+        self.run_window(controller, latency=14.0)
+        self.assertEqual(controller.limit, 3)
+        self.assertIn('CPU oversubscribed', controller.decisions[-1].reason)
+
+    def test_acquire_blocks_at_the_limit(self):
+        """A job beyond the current limit waits until a slot is released"""
+        controller = AdaptiveConcurrencyController(max_limit=4, initial_limit=1, load_reader=None)
+        started = controller.acquire()
+        admitted = threading.Event()
+
+        def second_job():
+            with controller.slot():
+                admitted.set()
+
+        worker = threading.Thread(target=second_job)
+        worker.start()
+        time.sleep(0.2)
+        self.assertFalse(admitted.is_set())
+
+        controller.release(started)
+        worker.join(timeout=5)
+        self.assertTrue(admitted.is_set())
+        self.assertEqual(controller.get_stats()['peak_active'], 1)
+
+    def test_try_acquire_does_not_wait(self):
+        """A non-blocking acquire reports a full limit instead of waiting"""
+        controller = AdaptiveConcurrencyController(max_limit=4, initial_limit=1, load_reader=None)
+        started = controller.try_acquire()
+        self.assertIsNotNone(started)
+        self.assertIsNone(controller.try_acquire())
+        controller.release(started)
+        self.assertIsNotNone(controller.try_acquire())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,6 +16,7 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.core.application import TranscriptionApplication
+from src.core.processors.processing_pipeline import ProcessingResult
 from src.models import (
     AppConfig, TranscriptionConfig, OutputConfig, InputConfig,
     SpeakerConfig, BatchConfig, DockerConfig, RunPodConfig, SystemConfig
@@ -228,47 +229,29 @@ class TestTranscriptionApplication(unittest.TestCase):
         mock_output_manager_instance = Mock()
         mock_output_manager.return_value = mock_output_manager_instance
         
-        mock_input_processor_instance = Mock()
-        mock_input_processor_instance.discover_files.return_value = ['file1.wav', 'file2.wav']
-        mock_input_processor_instance.process_input.return_value = {
-            'success': True,
-            'data': {'file_path': 'test.wav', 'file_name': 'test.wav'},
-            'metadata': {'file_name': 'test.wav'}
-        }
-        mock_input_processor.return_value = mock_input_processor_instance
+        mock_input_processor.return_value = Mock()
+        mock_output_processor.return_value = Mock()
+        mock_orchestrator.return_value = Mock()
         
-        mock_output_processor_instance = Mock()
-        mock_output_processor_instance.process_output.return_value = {
-            'success': True,
-            'formats_generated': ['json', 'txt']
-        }
-        mock_output_processor.return_value = mock_output_processor_instance
+        batch_pipeline = Mock()
+        batch_pipeline.process.side_effect = lambda context: ProcessingResult(
+            success=True,
+            context=context,
+            data={'total_files': 2, 'successful_files': 2, 'failed_files': 0, 'results': [{}, {}]}
+        )
         
-        mock_orchestrator_instance = Mock()
-        mock_orchestrator_instance.transcribe.return_value = {
-            'success': True,
-            'transcription': 'Test transcription',
-            'model': 'base',
-            'engine': 'speaker-diarization'
-        }
-        mock_orchestrator.return_value = mock_orchestrator_instance
-        
-        # Test batch processing
+        # Test batch processing without an input directory
         with TranscriptionApplication() as app:
-            result = app.process_batch()
+            with patch.object(app, '_get_pipeline', return_value=batch_pipeline) as get_pipeline:
+                result = app.process_batch()
             
-            # Verify result
+            # The configured input directory goes through the batch pipeline
             self.assertTrue(result['success'])
-            self.assertEqual(result['total_files'], 2)
-            self.assertEqual(result['successful_files'], 2)
-            self.assertEqual(result['failed_files'], 0)
-            self.assertIn('results', result)
-            self.assertEqual(len(result['results']), 2)
-            
-            # Verify method calls
-            mock_input_processor_instance.discover_files.assert_called_once()
-            self.assertEqual(mock_input_processor_instance.process_input.call_count, 2)
-            self.assertEqual(mock_orchestrator_instance.transcribe.call_count, 2)
+            self.assertEqual(result['data']['total_files'], 2)
+            self.assertEqual(result['data']['successful_files'], 2)
+            get_pipeline.assert_called_once_with("batch_processing")
+            context = batch_pipeline.process.call_args[0][0]
+            self.assertEqual(context.parameters['input_directory'], "examples/audio/voice")
     
     @patch('src.core.application.ConfigManager')
     @patch('src.core.application.OutputManager')
@@ -286,28 +269,27 @@ class TestTranscriptionApplication(unittest.TestCase):
         mock_output_manager_instance = Mock()
         mock_output_manager.return_value = mock_output_manager_instance
         
-        mock_input_processor_instance = Mock()
-        mock_input_processor_instance.discover_files.return_value = []
-        mock_input_processor.return_value = mock_input_processor_instance
-        
-        mock_output_processor_instance = Mock()
-        mock_output_processor.return_value = mock_output_processor_instance
+        mock_input_processor.return_value = Mock()
+        mock_output_processor.return_value = Mock()
+        mock_orchestrator.return_value = Mock()
         
-        mock_orchestrator_instance = Mock()
-        mock_orchestrator.return_value = mock_orchestrator_instance
+        batch_pipeline = Mock()
+        batch_pipeline.process.side_effect = lambda context: ProcessingResult(
+            success=False,
+            context=context,
+            errors=[{'error': 'No audio files found'}]
+        )
         
         # Test batch processing with no files
         with TranscriptionApplication() as app:
-            result = app.process_batch()
+            with patch.object(app, '_get_pipeline', return_value=batch_pipeline):
+                result = app.process_batch()
             
             # Verify result
             self.assertFalse(result['success'])
             self.assertIn('error', result)
             self.assertIn('No audio files found', result['error'])
-            
-            # Verify no processing occurred
-            mock_input_processor_instance.process_input.assert_not_called()
-            mock_orchestrator_instance.transcribe.assert_not_called()
+            batch_pipeline.process.assert_called_once()
     
     @patch('src.core.application.ConfigManager')
     @patch('src.core.application.OutputManager')
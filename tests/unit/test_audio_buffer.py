@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Unit tests for AudioBuffer
+Tests int16 storage, mono conversion and lazy float32 windows
+"""
+
+import unittest
+from pathlib import Path
+import sys
+
+import numpy as np
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.engines.utilities.audio_buffer import AudioBuffer, float_to_int16
+
+
+class TestAudioBuffer(unittest.TestCase):
+    """Test cases for AudioBuffer"""
+
+    def test_float64_stereo_is_stored_as_mono_int16(self):
+        """soundfile's float64 (frames, channels) audio is stored at 2 bytes per sample"""
+        t = np.arange(16000 * 3) / 16000
+        left = 0.5 * np.sin(2 * np.pi * 440 * t)
+        stereo = np.stack([left, left], axis=1)
+
+        buffer = AudioBuffer.from_array(stereo, 16000)
+
+        self.assertEqual(buffer.samples.dtype, np.int16)
+        self.assertEqual(buffer.nbytes, len(t) * 2)
+        self.assertAlmostEqual(buffer.duration, 3.0)
+        np.testing.assert_allclose(buffer.window(), left, atol=1.0 / 32768)
+
+        channels_first = AudioBuffer.from_array(stereo.T.astype(np.float32), 16000, channels_first=True)
+        np.testing.assert_array_equal(channels_first.samples, buffer.samples)
+
+    def test_windows_are_float32_copies_of_int16_views(self):
+        """Windows clamp to the audio, int16 windows share memory and float32 windows do not"""
+        buffer = AudioBuffer(np.arange(-16000, 16000, dtype=np.int16))
+
+        int16_window = buffer.int16_window(0.5, 1.0)
+        self.assertTrue(np.shares_memory(int16_window, buffer.samples))
+        self.assertEqual(len(int16_window), 8000)
+
+        window = buffer.window(1.5, 10.0)
+        self.assertEqual(window.dtype, np.float32)
+        self.assertEqual(len(window), 8000)
+        self.assertFalse(np.shares_memory(window, buffer.samples))
+        self.assertAlmostEqual(float(window[0]), 8000 / 32768)
+        self.assertEqual(len(buffer.window(5.0, 6.0)), 0)
+
+    def test_out_of_range_samples_are_clipped(self):
+        """Values beyond full scale saturate instead of wrapping around"""
+        converted = float_to_int16(np.array([-2.0, -1.0, 0.0, 1.0, 2.0], dtype=np.float32))
+        self.assertEqual(converted.tolist(), [-32768, -32768, 0, 32767, 32767])
+
+        with self.assertRaises(ValueError):
+            AudioBuffer(np.zeros(10, dtype=np.float32))
+
+
+if __name__ == '__main__':
+    unittest.main()
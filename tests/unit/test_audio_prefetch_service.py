@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Unit tests for AudioPrefetcher
+Tests bounded lookahead, reuse of prefetched audio and the memory budget
+"""
+
+import threading
+import time
+import unittest
+from pathlib import Path
+import sys
+
+import numpy as np
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.engines.utilities.audio_buffer import AudioBuffer
+from src.core.logic.audio_probe import AudioMetadata
+from src.core.logic.memory_admission import MB, MemoryAdmissionController
+from src.core.services.audio_prefetch_service import AudioPrefetcher, load_audio_buffer
+
+
+class RecordingLoader:
+    """Loader that records decoded files and fails on names starting with 'bad'"""
+
+    def __init__(self):
+        self.decoded = []
+        self.lock = threading.Lock()
+
+    def __call__(self, file_path):
+        if file_path.startswith('bad'):
+            raise RuntimeError("cannot decode")
+        with self.lock:
+            self.decoded.append(file_path)
+        return AudioBuffer(np.zeros(1600, dtype=np.int16), file_path)
+
+
+class FakeProbe:
+    """Probe reporting ten minutes of 16 kHz mono audio for every file"""
+
+    def probe(self, file_path):
+        return AudioMetadata(file_path=file_path, file_size=0, mtime=0.0, duration=600.0,
+                             sample_rate=16000, channels=1)
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+class TestAudioPrefetcher(unittest.TestCase):
+    """Test cases for AudioPrefetcher"""
+
+    def test_files_are_decoded_ahead_and_reused(self):
+        """Upcoming files are decoded at most lookahead ahead, and the engine gets the prefetched buffer"""
+        loader = RecordingLoader()
+        prefetcher = AudioPrefetcher(lookahead=2, load_audio=loader)
+        files = [f"f{i}.wav" for i in range(6)]
+
+        seen = []
+        for file_path in prefetcher.run(files, str):
+            wait_for(lambda: len(loader.decoded) >= min(len(files), len(seen) + 3))
+            # The current file plus two ahead, never more
+            self.assertLessEqual(len(loader.decoded), len(seen) + 3)
+            buffer = load_audio_buffer(file_path)
+            self.assertEqual(buffer.source, file_path)
+            seen.append(file_path)
+
+        self.assertEqual(seen, files)
+        self.assertEqual(loader.decoded, files)
+        self.assertEqual(prefetcher.stats['prefetched'], 6)
+
+    def test_memory_budget_limits_lookahead(self):
+        """When the budget fits one file, the next file is decoded only after the current one finishes"""
+        loader = RecordingLoader()
+        admission = MemoryAdmissionController(budget_bytes=500 * MB, model_bytes=0, audio_probe=FakeProbe(),
+                                              rss_reader=lambda: 0)
+        prefetcher = AudioPrefetcher(lookahead=3, memory_admission=admission, load_audio=loader)
+
+        for index, file_path in enumerate(prefetcher.run(['a.wav', 'b.wav', 'c.wav'], str)):
+            time.sleep(0.1)
+            self.assertEqual(len(loader.decoded), index + 1)
+        self.assertEqual(admission.get_stats()['peak_running'], 1)
+
+    def test_failed_prefetch_falls_back_to_decoding(self):
+        """A file that failed to prefetch is decoded by the caller, which sees the real error"""
+        prefetcher = AudioPrefetcher(lookahead=1, load_audio=RecordingLoader())
+        for file_path in prefetcher.run(['bad.wav'], str):
+            self.assertIsNone(prefetcher.get(file_path))
+            with self.assertRaises(Exception):
+                load_audio_buffer(file_path)
+        self.assertEqual(prefetcher.stats['failed'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
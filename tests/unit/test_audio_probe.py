@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Unit tests for AudioProbe
+Tests header parsing, caching and duration-based strategy selection
+"""
+
+import os
+import struct
+import tempfile
+import unittest
+import wave
+from pathlib import Path
+from unittest.mock import Mock
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.logic.audio_probe import AudioProbe
+
+
+class TestAudioProbe(unittest.TestCase):
+    """Test cases for AudioProbe"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.probe = AudioProbe()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write_wav(self, name: str, seconds: float, sample_rate: int = 16000, channels: int = 1) -> str:
+        path = os.path.join(self.temp_dir.name, name)
+        with wave.open(path, 'wb') as wav:
+            wav.setnchannels(channels)
+            wav.setsampwidth(2)
+            wav.setframerate(sample_rate)
+            wav.writeframes(b'\x00\x00' * channels * int(seconds * sample_rate))
+        return path
+
+    def test_wav_header_and_cache(self):
+        """WAV metadata comes from the header and is cached per file version"""
+        path = self._write_wav("speech.wav", 2.5, sample_rate=8000, channels=2)
+
+        metadata = self.probe.probe(path)
+        self.assertAlmostEqual(metadata.duration, 2.5)
+        self.assertEqual((metadata.sample_rate, metadata.channels, metadata.bit_depth, metadata.codec),
+                         (8000, 2, 16, 'pcm'))
+
+        self.probe.probe(path)
+        self.assertEqual(self.probe.stats['cache_hits'], 1)
+
+        # Rewriting the file changes its size, so it is probed again
+        path = self._write_wav("speech.wav", 4.0, sample_rate=8000, channels=2)
+        self.assertAlmostEqual(self.probe.get_duration(path), 4.0)
+        self.assertEqual(self.probe.stats['probes'], 2)
+
+    def test_cbr_mp3_duration(self):
+        """A constant-bitrate MP3 duration is derived from the first frame header"""
+        # MPEG-1 Layer III, 128 kbps, 44.1 kHz, mono: 417-byte frames of 1152 samples
+        header = bytes([0xFF, 0xFB, 0x90, 0xC0])
+        path = os.path.join(self.temp_dir.name, "podcast.mp3")
+        with open(path, 'wb') as f:
+            f.write((header + b'\x00' * 413) * 100)
+
+        metadata = self.probe.probe(path)
+        self.assertEqual((metadata.codec, metadata.sample_rate, metadata.channels), ('mp3', 44100, 1))
+        self.assertAlmostEqual(metadata.duration, 417 * 100 * 8 / 128000, places=3)
+
+    def test_flac_streaminfo(self):
+        """FLAC metadata comes from the STREAMINFO block"""
+        packed = (48000 << 44) | ((2 - 1) << 41) | ((24 - 1) << 36) | (48000 * 90)
+        streaminfo = b'\x00' * 10 + packed.to_bytes(8, 'big') + b'\x00' * 16
+        path = os.path.join(self.temp_dir.name, "lecture.flac")
+        with open(path, 'wb') as f:
+            f.write(b'fLaC' + struct.pack('>B', 0x80) + len(streaminfo).to_bytes(3, 'big') + streaminfo)
+
+        metadata = self.probe.probe(path)
+        self.assertEqual((metadata.sample_rate, metadata.channels, metadata.bit_depth), (48000, 2, 24))
+        self.assertAlmostEqual(metadata.duration, 90.0)
+
+    def test_strategy_selection_is_duration_based(self):
+        """Long but small files are chunked; short files go direct"""
+        from src.core.engines.strategies.transcription_strategy_factory import TranscriptionStrategyFactory
+
+        config_manager = Mock()
+        config_manager.config.chunking.max_chunk_duration = 30
+        factory = TranscriptionStrategyFactory(config_manager, audio_probe=self.probe)
+
+        self.assertTrue(factory._requires_chunking(self._write_wav("long.wav", 45)))
+        self.assertFalse(factory._requires_chunking(self._write_wav("short.wav", 10)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the autotuner
+Tests the tuning grid, candidate selection and host profile loading
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.logic.autotuner import (
+    AutotuneCandidate, AutotuneMeasurement, Autotuner, build_autotune_grid, build_host_profile
+)
+from src.utils.host_profile import HOST_PROFILE_ENV_VAR, HOST_PROFILE_METADATA_KEY
+
+
+class TestAutotuner(unittest.TestCase):
+    """Test cases for Autotuner and host profiles"""
+
+    def test_grid_splits_cores_between_workers(self):
+        """Default worker counts are powers of two, each with an equal share of the cores"""
+        grid = build_autotune_grid(8, beam_sizes=[1, 5])
+
+        self.assertEqual([(c.workers, c.intra_threads) for c in grid[::2]], [(1, 8), (2, 4), (4, 2), (8, 1)])
+        self.assertEqual([c.beam_size for c in grid[:2]], [1, 5])
+        self.assertEqual([c.workers for c in build_autotune_grid(4, worker_counts=[3, 12])], [3, 4])
+
+    def test_failures_and_memory_limit_are_excluded_from_selection(self):
+        """The fastest candidate wins only if it ran and stayed within the RSS limit"""
+        throughput = {1: 2.0, 2: 3.5, 4: 4.0}
+
+        def benchmark(candidate):
+            if candidate.workers == 8:
+                raise MemoryError("out of memory")
+            return 60.0 * candidate.workers, 60.0 * candidate.workers / throughput[candidate.workers]
+
+        tuner = Autotuner(benchmark, max_rss_mb=1000)
+        measurements = tuner.run(build_autotune_grid(8))
+        self.assertEqual(len(measurements), 4)
+        self.assertIn('out of memory', measurements[-1].error)
+
+        for measurement in measurements:
+            measurement.peak_rss_mb = 1500 if measurement.candidate.workers == 4 else 500
+        best = tuner.select_best(measurements)
+        self.assertEqual(best.candidate, AutotuneCandidate(workers=2, intra_threads=4, beam_size=5))
+
+    def test_host_profile_is_layered_over_environment_config(self):
+        """ConfigManager's loader applies the host profile over the defaults and drops its metadata"""
+        merged = self._load_with_profile(explicit_config=False)
+
+        ct2_config = merged['transcription']['ctranslate2_optimization']
+        self.assertEqual(ct2_config['compute_type'], 'int8')
+        self.assertEqual((ct2_config['cpu_threads'], ct2_config['inter_threads']), (4, 2))
+        self.assertEqual(merged['chunking']['max_chunk_workers'], 2)
+        self.assertNotIn(HOST_PROFILE_METADATA_KEY, merged)
+
+    def test_host_profile_writes_only_measured_settings_under_explicit_config(self):
+        """Batch and backend settings are left alone, and an explicit config file wins over the profile"""
+        merged = self._load_with_profile(explicit_config=True)
+
+        self.assertEqual(merged['batch'], {'parallel_processing': True, 'max_workers': 4})
+        self.assertEqual(merged['chunking'], {'execution_backend': 'process', 'max_chunk_workers': 3})
+        self.assertEqual(merged['transcription']['ctranslate2_optimization']['inter_threads'], 2)
+
+    def _load_with_profile(self, explicit_config):
+        from src.models.environment import Environment
+        from src.utils.config_manager import JsonConfigLoader
+
+        best = AutotuneMeasurement(AutotuneCandidate(workers=2, intra_threads=4, beam_size=5),
+                                   audio_seconds=60.0, wall_seconds=20.0)
+        profile = build_host_profile(best, [best], total_cores=8, audio_source='synthetic')
+        self.assertEqual(set(profile) - {HOST_PROFILE_METADATA_KEY}, {'transcription', 'chunking'})
+
+        with tempfile.TemporaryDirectory() as config_dir:
+            base = {'transcription': {'language': 'he', 'ctranslate2_optimization': {'compute_type': 'int8', 'cpu_threads': 8}}}
+            production = {'batch': {'parallel_processing': True, 'max_workers': 4},
+                          'chunking': {'execution_backend': 'process', 'max_chunk_workers': 3}}
+            (Path(config_dir) / 'base.json').write_text(json.dumps(base))
+            (Path(config_dir) / 'production.json').write_text(json.dumps(production))
+            (Path(config_dir) / 'host-test.json').write_text(json.dumps(profile))
+
+            environment = Environment.PRODUCTION if explicit_config else Environment.BASE
+            with patch.dict(os.environ, {HOST_PROFILE_ENV_VAR: 'host-test'}):
+                return JsonConfigLoader(Path(config_dir)).load_config(environment, explicit_config=explicit_config)
+
+if __name__ == '__main__':
+    unittest.main()
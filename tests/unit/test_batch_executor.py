@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the process batch executor
+Tests result summaries, how worker failures are reported, and memory admission,
+worker memory reports and adaptive concurrency of submissions
+"""
+
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.logic.adaptive_concurrency import AdaptiveConcurrencyController
+from src.core.logic.audio_probe import AudioMetadata
+from src.core.logic.memory_admission import MB, MemoryAdmissionController
+from src.core.processors import batch_executor
+from src.core.processors.batch_executor import ProcessBatchExecutor, summarize_file_result
+
+
+def _fake_worker(task):
+    if task['file_path'].endswith('bad.wav'):
+        raise RuntimeError("decoder crashed")
+    return {'file_path': task['file_path'], 'success': True, 'status': 'success', 'errors': [], 'warnings': []}
+
+
+class TestProcessBatchExecutor(unittest.TestCase):
+    """Test cases for ProcessBatchExecutor"""
+
+    def setUp(self):
+        self.config_manager = SimpleNamespace(config_dir='config', environment='base')
+
+    def _tasks(self, *names):
+        return [{'file_path': name, 'session_id': 's1', 'parameters': {}} for name in names]
+
+    def test_summary_drops_transcription_text(self):
+        """Only counts and status are returned from a worker"""
+        result = SimpleNamespace(
+            success=True, status=SimpleNamespace(value='success'), errors=[], warnings=[],
+            data={'transcription': 'שלום עולם', 'segments': [{}, {}], 'processing_info': {'model': 'm'}},
+            performance_metrics={'processing_time_seconds': 1.5}
+        )
+
+        summary = summarize_file_result(result, 'a.wav')
+
+        self.assertNotIn('transcription', summary)
+        self.assertEqual((summary['transcription_chars'], summary['segment_count']), (9, 2))
+        self.assertEqual(summary['processing_time'], 1.5)
+
+    def test_worker_reports_the_memory_a_file_added(self):
+        """The worker summary carries the RSS peak of the file above the worker's resident memory"""
+        def process(context):
+            buffer = bytearray(64 * MB)
+            del buffer
+            return SimpleNamespace(success=True, status='success', errors=[], warnings=[], data={},
+                                   performance_metrics={})
+
+        with patch.dict(batch_executor._worker_state, {'processor': SimpleNamespace(process=process)}):
+            summary = batch_executor._process_file_in_worker(self._tasks('a.wav')[0])
+
+        self.assertTrue(summary['success'])
+        self.assertGreaterEqual(summary['job_peak_rss_bytes'], 32 * MB)
+
+    def test_every_task_yields_one_summary(self):
+        """A failing file is reported without stopping the rest of the batch"""
+        executor = ProcessBatchExecutor(self.config_manager, max_workers=2)
+        tasks = self._tasks('a.wav', 'bad.wav', 'c.wav', 'd.wav', 'e.wav')
+
+        with patch.object(executor, '_create_pool', return_value=ThreadPoolExecutor(2)), \
+                patch.object(batch_executor, '_process_file_in_worker', _fake_worker):
+            outcomes = dict(executor.execute(tasks))
+
+        self.assertEqual(sorted(outcomes), [0, 1, 2, 3, 4])
+        self.assertFalse(outcomes[1]['success'])
+        self.assertIn('decoder crashed', outcomes[1]['errors'][0]['error'])
+        self.assertTrue(all(outcomes[i]['success'] for i in (0, 2, 3, 4)))
+
+    def test_broken_pool_fails_remaining_files(self):
+        """Files that cannot be submitted to a dead pool are reported as failed instead of hanging"""
+        executor = ProcessBatchExecutor(self.config_manager, max_workers=1)
+        pool = ThreadPoolExecutor(1)
+        submit = pool.submit
+        calls = []
+
+        def submit_once(*args):
+            calls.append(args)
+            if len(calls) > 1:
+                raise BrokenProcessPool("worker killed")
+            return submit(*args)
+
+        pool.submit = submit_once
+        with patch.object(executor, '_create_pool', return_value=pool), \
+                patch.object(batch_executor, '_process_file_in_worker', _fake_worker):
+            outcomes = dict(executor.execute(self._tasks('a.wav', 'b.wav', 'c.wav', 'd.wav')))
+
+        self.assertEqual(sorted(outcomes), [0, 1, 2, 3])
+        self.assertTrue(outcomes[0]['success'])
+        self.assertEqual([outcomes[i]['errors'][0]['error_type'] for i in (1, 2, 3)], ['BrokenProcessPool'] * 3)
+
+    def test_memory_admission_gates_submissions(self):
+        """Long files wait for a running file to finish; every reservation is released"""
+        probe = SimpleNamespace(probe=lambda file_path: AudioMetadata(
+            file_path=file_path, file_size=0, mtime=0.0, sample_rate=16000, channels=1,
+            duration=3 * 3600.0 if file_path.startswith('long') else 60.0))
+        admission = MemoryAdmissionController(budget_bytes=2000 * MB, model_bytes=0, audio_probe=probe,
+                                              rss_reader=None)
+        executor = ProcessBatchExecutor(self.config_manager, max_workers=4, memory_admission=admission)
+        running, peak = set(), []
+        lock = threading.Lock()
+
+        def worker(task):
+            with lock:
+                running.add(task['file_path'])
+                peak.append(set(running))
+            time.sleep(0.05)
+            with lock:
+                running.discard(task['file_path'])
+            return _fake_worker(task)
+
+        with patch.object(executor, '_create_pool', return_value=ThreadPoolExecutor(4)), \
+                patch.object(batch_executor, '_process_file_in_worker', worker):
+            outcomes = dict(executor.execute(self._tasks('long1.wav', 'long2.wav', 'a.wav', 'b.wav')))
+
+        self.assertEqual(sorted(outcomes), [0, 1, 2, 3])
+        self.assertFalse(any({'long1.wav', 'long2.wav'} <= seen for seen in peak))
+        self.assertEqual(admission.get_stats()['admitted'], 4)
+        self.assertEqual(admission._running, 0)
+
+    def test_worker_peak_rss_corrects_memory_estimates(self):
+        """Peaks reported by workers raise the reservations of later files"""
+        probe = SimpleNamespace(probe=lambda file_path: AudioMetadata(
+            file_path=file_path, file_size=0, mtime=0.0, sample_rate=16000, channels=1, duration=60.0))
+        admission = MemoryAdmissionController(budget_bytes=100000 * MB, model_bytes=0, audio_probe=probe,
+                                              rss_reader=None)
+        executor = ProcessBatchExecutor(self.config_manager, max_workers=2, memory_admission=admission)
+        estimated = admission.estimate('a.wav')
+
+        def worker(task):
+            return dict(_fake_worker(task), job_peak_rss_bytes=3 * estimated)
+
+        with patch.object(executor, '_create_pool', return_value=ThreadPoolExecutor(2)), \
+                patch.object(batch_executor, '_process_file_in_worker', worker):
+            outcomes = dict(executor.execute(self._tasks('a.wav', 'b.wav', 'c.wav')))
+
+        self.assertEqual(len(outcomes), 3)
+        self.assertGreater(admission.correction, 1.5)
+        self.assertEqual(admission._running, 0)
+
+    def test_adaptive_concurrency_limits_busy_workers(self):
+        """Only as many files run as the controller's limit allows, and each completion is measured"""
+        concurrency = AdaptiveConcurrencyController(max_limit=4, initial_limit=1, window_size=10, load_reader=None)
+        executor = ProcessBatchExecutor(self.config_manager, max_workers=4, concurrency=concurrency)
+        running, peak = [0], [0]
+        lock = threading.Lock()
+
+        def worker(task):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+            return _fake_worker(task)
+
+        with patch.object(executor, '_create_pool', return_value=ThreadPoolExecutor(4)), \
+                patch.object(batch_executor, '_process_file_in_worker', worker):
+            outcomes = dict(executor.execute(self._tasks('a.wav', 'bad.wav', 'c.wav', 'd.wav')))
+
+        self.assertEqual(sorted(outcomes), [0, 1, 2, 3])
+        self.assertEqual(peak[0], 1)
+        self.assertEqual(concurrency.get_stats()['completed'], 3)
+        self.assertEqual(concurrency._active, 0)
+
+    def test_transient_failures_are_resubmitted(self):
+        """A retryable failure runs again after its backoff; only the final attempt is reported"""
+        executor = ProcessBatchExecutor(self.config_manager, max_workers=2,
+                                        retry_delay=lambda summary, attempt: 0.01 if attempt < 3 and
+                                        'flaky' in summary['file_path'] else None)
+        calls = []
+
+        def worker(task):
+            calls.append(task['file_path'])
+            if task['file_path'] == 'flaky.wav' and calls.count('flaky.wav') < 3:
+                return {'file_path': 'flaky.wav', 'success': False, 'status': 'error',
+                        'errors': [{'error': 'timed out', 'error_type': 'TimeoutError'}], 'warnings': []}
+            return _fake_worker(task)
+
+        with patch.object(executor, '_create_pool', return_value=ThreadPoolExecutor(2)), \
+                patch.object(batch_executor, '_process_file_in_worker', worker):
+            outcomes = list(executor.execute(self._tasks('flaky.wav', 'bad.wav', 'c.wav')))
+
+        self.assertEqual(sorted(index for index, _ in outcomes), [0, 1, 2])
+        summaries = dict(outcomes)
+        self.assertTrue(summaries[0]['success'])
+        self.assertEqual(summaries[0]['attempts'], 3)
+        self.assertFalse(summaries[1]['success'])
+        self.assertEqual(summaries[1]['attempts'], 1)
+        self.assertEqual(calls.count('bad.wav'), 1)
+
+    def test_recycling_requires_a_fresh_interpreter(self):
+        """Worker recycling is not combined with fork"""
+        executor = ProcessBatchExecutor(self.config_manager, max_workers=2, max_tasks_per_child=10,
+                                        start_method='fork')
+        if sys.version_info >= (3, 11):
+            self.assertEqual((executor.start_method, executor.max_tasks_per_child), ('spawn', 10))
+        else:
+            self.assertEqual(executor.max_tasks_per_child, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
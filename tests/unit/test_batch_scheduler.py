@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Unit tests for BatchScheduler
+Tests duration-based ordering, makespan estimates and the size fallback
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.logic.batch_scheduler import BatchScheduler, estimate_makespan
+
+
+class FakeProbe:
+    """Header probe returning fixed durations"""
+
+    def __init__(self, durations):
+        self.durations = durations
+
+    def get_duration(self, file_path):
+        return self.durations.get(file_path)
+
+
+class TestBatchScheduler(unittest.TestCase):
+    """Test cases for BatchScheduler"""
+
+    def setUp(self):
+        self.probe = FakeProbe({'a.wav': 60.0, 'b.wav': 3600.0, 'c.wav': 600.0, 'd.wav': 60.0})
+        self.files = ['a.wav', 'b.wav', 'c.wav', 'd.wav']
+
+    def test_policies_order_by_duration(self):
+        """LPT submits the longest file first, SJF the shortest, ties keep discovery order"""
+        lpt = BatchScheduler('lpt', audio_probe=self.probe)
+        sjf = BatchScheduler('sjf', audio_probe=self.probe)
+        fifo = BatchScheduler('fifo', audio_probe=self.probe)
+
+        self.assertEqual([u.file_path for u in lpt.plan(self.files, 2)], ['b.wav', 'c.wav', 'a.wav', 'd.wav'])
+        self.assertEqual([u.file_path for u in sjf.plan(self.files, 2)], ['a.wav', 'd.wav', 'c.wav', 'b.wav'])
+        self.assertEqual([u.file_path for u in fifo.plan(self.files, 2)], self.files)
+        # A single worker gains nothing from longest-first
+        self.assertEqual([u.file_path for u in lpt.plan(self.files, 1)], self.files)
+        self.assertIsNone(lpt.window_key(1))
+        self.assertEqual(lpt.window_key(2)('b.wav'), -3600.0)
+
+    def test_longest_first_shortens_makespan(self):
+        """A long file submitted last keeps one worker busy after the others finish"""
+        costs = [60.0, 60.0, 60.0, 60.0, 300.0]
+        self.assertEqual(estimate_makespan(costs, 2), 420.0)
+        self.assertEqual(estimate_makespan(sorted(costs, reverse=True), 2), 300.0)
+
+    def test_unprobed_files_fall_back_to_size(self):
+        """Files without a readable header are ordered by size"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            big = os.path.join(temp_dir, 'big.mp3')
+            small = os.path.join(temp_dir, 'small.mp3')
+            with open(big, 'wb') as f:
+                f.write(b'\0' * 160000)
+            with open(small, 'wb') as f:
+                f.write(b'\0' * 16000)
+
+            scheduler = BatchScheduler('lpt', audio_probe=FakeProbe({}))
+            units = scheduler.plan([small, big], 2)
+
+            self.assertEqual([u.file_path for u in units], [big, small])
+            self.assertAlmostEqual(units[0].duration, 10.0)
+            self.assertFalse(units[0].duration_known)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the batch skip index
+Tests completion records, invalidation and persistence across runs
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.logic.batch_skip_index import (
+    BatchSkipIndex, build_decode_profile, create_skip_index, extract_output_files
+)
+
+
+class TestBatchSkipIndex(unittest.TestCase):
+    """Test cases for BatchSkipIndex"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.input_dir = Path(self.temp_dir) / "audio"
+        self.input_dir.mkdir()
+        self.audio_file = self.input_dir / "call.wav"
+        self.audio_file.write_bytes(b"RIFF fake audio")
+        self.output_file = Path(self.temp_dir) / "call.json"
+        self.output_file.write_text('{"text": "שלום"}')
+        self.index_path = BatchSkipIndex.path_for(str(self.input_dir), os.path.join(self.temp_dir, '.batch_index'))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_completed_file_is_skipped_on_the_next_run(self):
+        """A recorded file with intact outputs is skipped after the index is reopened"""
+        index = BatchSkipIndex(self.index_path)
+        self.assertFalse(index.is_complete(str(self.audio_file), 'profile-a'))
+        self.assertTrue(index.record_completion(str(self.audio_file), 'profile-a', [str(self.output_file)]))
+        index.close()
+
+        reopened = BatchSkipIndex(self.index_path)
+        self.assertEqual(len(reopened), 1)
+        self.assertEqual(reopened.filter_pending([str(self.audio_file)], 'profile-a'), [])
+        self.assertEqual(reopened.filter_pending([str(self.audio_file)], 'profile-b'), [str(self.audio_file)])
+        reopened.close()
+
+    def test_changed_input_or_missing_output_is_processed_again(self):
+        """Size/mtime changes and deleted outputs invalidate an entry"""
+        index = BatchSkipIndex(self.index_path)
+        index.record_completion(str(self.audio_file), 'p', [str(self.output_file)])
+
+        stat = self.audio_file.stat()
+        os.utime(self.audio_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.assertFalse(index.is_complete(str(self.audio_file), 'p'))
+
+        index.record_completion(str(self.audio_file), 'p', [str(self.output_file)])
+        self.assertTrue(index.is_complete(str(self.audio_file), 'p'))
+        self.output_file.unlink()
+        self.assertFalse(index.is_complete(str(self.audio_file), 'p'))
+        index.close()
+
+    def test_hash_verification_detects_same_size_rewrites(self):
+        """With verify_hash, content changes that keep size and mtime are detected"""
+        index = BatchSkipIndex(self.index_path, verify_hash=True)
+        index.record_completion(str(self.audio_file), 'p')
+        stat = self.audio_file.stat()
+        self.audio_file.write_bytes(b"RIFF fake AUDIO")
+        os.utime(self.audio_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        self.assertFalse(index.is_complete(str(self.audio_file), 'p'))
+        index.close()
+
+    def test_profile_outputs_and_config(self):
+        """Profiles follow the settings, outputs come from output_files, and the index is opt-in per config"""
+        config_manager = SimpleNamespace(config=SimpleNamespace(
+            transcription=SimpleNamespace(default_model='large-v3', language='he', beam_size=5),
+            batch=SimpleNamespace(skip_completed=True, skip_index_dir=os.path.join(self.temp_dir, 'idx')),
+            output=SimpleNamespace(output_dir=self.temp_dir)
+        ))
+        self.assertEqual(build_decode_profile(config_manager), build_decode_profile(config_manager, {'model': None}))
+        self.assertNotEqual(build_decode_profile(config_manager), build_decode_profile(config_manager, {'model': 'tiny'}))
+
+        self.assertEqual(extract_output_files({'output_files': {
+            'json': {'success': True, 'file_path': '/out/a.json'},
+            'docx': {'success': False, 'file_path': '/out/a.docx'},
+            'txt': '/out/a.txt'
+        }, 'metadata': {'file_path': '/in/a.wav'}}), ['/out/a.json', '/out/a.txt'])
+
+        index = create_skip_index(config_manager, str(self.input_dir))
+        self.assertTrue(str(index.index_path).startswith(os.path.join(self.temp_dir, 'idx')))
+        index.close()
+        config_manager.config.batch.skip_completed = False
+        self.assertIsNone(create_skip_index(config_manager, str(self.input_dir)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Unit tests for chunk execution backend lifecycle
+Tests that one backend serves every chunked file of an engine and is released on shutdown,
+and that chunk start and finish callbacks bracket every chunk
+"""
+
+import gc
+import unittest
+import weakref
+from pathlib import Path
+from unittest.mock import Mock, patch
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.engines.strategies.transcription_strategy_factory import TranscriptionStrategyFactory
+from src.core.services import chunk_execution_backends
+from src.core.services.chunk_execution_backends import ProcessChunkExecutionBackend, ThreadChunkExecutionBackend
+
+
+class TestChunkExecutionBackendLifecycle(unittest.TestCase):
+    """Test cases for shared chunk execution backends"""
+
+    @patch('src.core.factories.chunk_execution_backend_factory.ChunkExecutionBackendFactory.create_backend')
+    def test_strategy_factory_shares_one_backend(self, mock_create_backend):
+        """Every chunked file reuses the factory's backend until the factory shuts down"""
+        factory = TranscriptionStrategyFactory(Mock(), audio_probe=Mock())
+        backend = factory.get_chunk_execution_backend()
+
+        self.assertIs(factory.get_chunk_execution_backend(), backend)
+        mock_create_backend.assert_called_once()
+
+        factory.shutdown()
+        backend.shutdown.assert_called_once()
+        factory.get_chunk_execution_backend()
+        self.assertEqual(mock_create_backend.call_count, 2)
+
+    def test_exit_cleanup_does_not_keep_backends_alive(self):
+        """A discarded process backend is not held by the exit handler"""
+        backend = ProcessChunkExecutionBackend(Mock(), max_workers=1)
+        self.assertIn(backend, chunk_execution_backends._live_process_backends)
+        reference = weakref.ref(backend)
+
+        del backend
+        gc.collect()
+        self.assertIsNone(reference())
+
+
+class TestChunkCallbacks(unittest.TestCase):
+    """Test cases for chunk start and finish callbacks"""
+
+    def test_chunk_finishes_before_next_starts(self):
+        """A sequential backend reports each chunk finished before starting the next"""
+        events = []
+        backend = ThreadChunkExecutionBackend(max_workers=1)
+        chunks = [{'chunk_number': number} for number in (1, 2)]
+
+        outcomes = list(backend.execute_chunks(
+            chunks, 'a.wav', 'model', process_chunk=lambda chunk_info: {'segments': []},
+            on_chunk_started=lambda index, chunk_info: events.append(('started', index)),
+            on_chunk_finished=lambda index, chunk_info: events.append(('finished', index))
+        ))
+
+        self.assertEqual(len(outcomes), 2)
+        self.assertEqual(events, [('started', 0), ('finished', 0), ('started', 1), ('finished', 1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
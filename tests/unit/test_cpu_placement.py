@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Unit tests for CPU placement
+Tests NUMA topology parsing, core set planning, worker pinning and
+placement slots of recycled worker processes
+"""
+
+import multiprocessing
+import os
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.logic.cpu_placement import (
+    CpuPlacementPlanner, WorkerPinner, WorkerPlacement, claim_placement_slot, create_placement_slots,
+    parse_cpu_list, read_numa_topology, shared_model_affinity
+)
+
+
+class TestCpuPlacement(unittest.TestCase):
+    """Test cases for CPU placement"""
+
+    def test_topology_is_read_from_sysfs_and_restricted_to_allowed_cpus(self):
+        """Node CPU lists are parsed and filtered by the process affinity"""
+        with tempfile.TemporaryDirectory() as sysfs_root:
+            for node, cpulist in ((0, "0-3,8-11"), (1, "4-7,12-15")):
+                node_dir = Path(sysfs_root) / f"node{node}"
+                node_dir.mkdir()
+                (node_dir / "cpulist").write_text(cpulist + "\n")
+            (Path(sysfs_root) / "online").write_text("0-1\n")
+
+            topology = read_numa_topology(sysfs_root, allowed_cpus=list(range(0, 16, 2)))
+
+        self.assertEqual(parse_cpu_list("0-2,5"), [0, 1, 2, 5])
+        self.assertEqual(topology, {0: [0, 2, 8, 10], 1: [4, 6, 12, 14]})
+
+    def test_workers_get_disjoint_node_local_core_sets(self):
+        """Workers alternate between sockets and never share or straddle cores"""
+        planner = CpuPlacementPlanner({0: list(range(0, 8)), 1: list(range(8, 16))})
+
+        placements = planner.plan(4)
+
+        self.assertEqual([p.node for p in placements], [0, 1, 0, 1])
+        self.assertEqual([p.worker_index for p in placements], [0, 1, 2, 3])
+        all_cpus = [cpu for p in placements for cpu in p.cpus]
+        self.assertEqual(len(all_cpus), len(set(all_cpus)))
+        for placement in placements:
+            self.assertEqual(len(placement.cpus), 4)
+            self.assertTrue(set(placement.cpus) <= set(planner.topology[placement.node]))
+
+        uneven = CpuPlacementPlanner({0: list(range(0, 12)), 1: list(range(12, 16))}).plan(4)
+        self.assertEqual(sorted(p.node for p in uneven), [0, 0, 0, 1])
+
+    @unittest.skipUnless(hasattr(os, 'sched_setaffinity'), "CPU affinity is not supported on this platform")
+    def test_pinned_thread_loads_shared_models_unpinned(self):
+        """A pinned worker thread keeps its core set, except while loading a shared model"""
+        allowed = sorted(os.sched_getaffinity(0))
+        pinner = WorkerPinner([WorkerPlacement(worker_index=0, node=0, cpus=allowed[:1])], role='test')
+        observed = {}
+
+        def worker():
+            pinner.pin_next()
+            observed['pinned'] = sorted(os.sched_getaffinity(0))
+            with shared_model_affinity():
+                observed['loading'] = sorted(os.sched_getaffinity(0))
+            observed['after'] = sorted(os.sched_getaffinity(0))
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        self.assertEqual(observed['pinned'], allowed[:1])
+        self.assertEqual(observed['loading'], allowed)
+        self.assertEqual(observed['after'], allowed[:1])
+        self.assertEqual(sorted(os.sched_getaffinity(0)), allowed)
+
+
+    def test_recycled_workers_return_their_slots(self):
+        """A worker replaced after max_tasks_per_child frees its slot for its replacement"""
+        mp_context = multiprocessing.get_context('spawn')
+        free_slots = create_placement_slots(mp_context, 2)
+        with ProcessPoolExecutor(max_workers=2, mp_context=mp_context, max_tasks_per_child=1,
+                                 initializer=claim_placement_slot, initargs=(free_slots, 5)) as pool:
+            pids = [pool.submit(os.getpid).result() for _ in range(4)]
+
+        self.assertEqual(len(set(pids)), 4)
+        # Every replacement found a freed slot, and all slots are free again once the pool exits
+        self.assertEqual(sorted(free_slots.get(timeout=5) for _ in range(2)), [0, 1])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Unit tests for CrossFileBatchTranscriber
+Tests mixed-file window batches, per-file reassembly and failure isolation
+"""
+
+import unittest
+from pathlib import Path
+import sys
+
+import numpy as np
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.engines.utilities.audio_buffer import AudioBuffer
+from src.core.services.cross_file_batch_service import CrossFileBatchTranscriber, cut_windows
+
+
+class FakeEngine:
+    """Engine that records batch sizes and labels each window by its first sample"""
+
+    def __init__(self, failing_marker=None):
+        self.batch_sizes = []
+        self.failing_marker = failing_marker
+
+    def transcribe_windows(self, windows, model_name):
+        self.batch_sizes.append(len(windows))
+        markers = [int(round(float(window[0]) * 32768)) for window in windows]
+        if self.failing_marker in markers:
+            raise RuntimeError("bad window")
+        return [f"w{marker}" for marker in markers]
+
+
+def load_marked_audio(durations):
+    """Loader producing audio whose windows start with a marker sample: file * 100 + window"""
+    def load(file_path):
+        if file_path not in durations:
+            raise RuntimeError("cannot decode")
+        file_number = int(file_path[1:])
+        samples = np.zeros(int(durations[file_path] * 16000), dtype=np.int16)
+        for window in range(int(np.ceil(durations[file_path] / 30.0))):
+            samples[window * 30 * 16000] = file_number * 100 + window
+        return AudioBuffer(samples, file_path)
+    return load
+
+
+class TestCrossFileBatchTranscriber(unittest.TestCase):
+    """Test cases for CrossFileBatchTranscriber"""
+
+    def test_short_files_share_one_generate_call(self):
+        """Five 10 second files fill a single batch of eight windows"""
+        durations = {f"f{i}": 10.0 for i in range(1, 6)}
+        engine = FakeEngine()
+        transcriber = CrossFileBatchTranscriber(engine, "model", batch_size=8, max_open_files=8,
+                                                load_audio=load_marked_audio(durations))
+
+        outcomes = {path: result for _, path, result in transcriber.transcribe(list(durations))}
+
+        self.assertEqual(sum(engine.batch_sizes), 5)
+        self.assertLessEqual(len(engine.batch_sizes), 5)
+        self.assertEqual(outcomes['f3']['transcription'], 'w300')
+        self.assertTrue(all(result['success'] for result in outcomes.values()))
+
+    def test_long_file_is_reassembled_in_window_order(self):
+        """A file's windows are decoded across batches and joined in time order"""
+        durations = {'f1': 95.0, 'f2': 20.0}
+        transcriber = CrossFileBatchTranscriber(FakeEngine(), "model", batch_size=3,
+                                                load_audio=load_marked_audio(durations))
+
+        outcomes = {path: result for _, path, result in transcriber.transcribe(['f1', 'f2'])}
+
+        self.assertEqual(outcomes['f1']['transcription'], 'w100 w101 w102 w103')
+        self.assertEqual([segment['start'] for segment in outcomes['f1']['segments']], [0.0, 30.0, 60.0, 90.0])
+        self.assertEqual(outcomes['f1']['segments'][-1]['end'], 95.0)
+        self.assertEqual(outcomes['f2']['metadata']['window_count'], 1)
+        self.assertEqual([(w.start, w.end) for w in cut_windows(0, 45.0)], [(0.0, 30.0), (30.0, 45.0)])
+
+    def test_failures_are_isolated_to_their_file(self):
+        """A failing window fails only its file, and undecodable files are reported"""
+        durations = {'f1': 10.0, 'f2': 10.0, 'f3': 10.0}
+        transcriber = CrossFileBatchTranscriber(FakeEngine(failing_marker=200), "model", batch_size=4,
+                                                load_audio=load_marked_audio(durations))
+
+        outcomes = {path: result for _, path, result in transcriber.transcribe(['f1', 'f2', 'missing', 'f3'])}
+
+        self.assertEqual(len(outcomes), 4)
+        self.assertTrue(outcomes['f1']['success'])
+        self.assertTrue(outcomes['f3']['success'])
+        self.assertFalse(outcomes['f2']['success'])
+        self.assertIn('bad window', outcomes['f2']['error'])
+        self.assertIn('Cannot decode', outcomes['missing']['error'])
+        self.assertEqual(transcriber.stats['failed_files'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
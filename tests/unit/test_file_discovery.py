@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Unit tests for streaming file discovery
+Tests parallel directory walks, filtering and windowed ordering
+"""
+
+import shutil
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.logic.file_discovery import DiscoveryStats, StreamingFileDiscovery, ordered_in_windows
+
+
+class TestStreamingFileDiscovery(unittest.TestCase):
+    """Test cases for StreamingFileDiscovery"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        root = Path(self.temp_dir)
+        self.audio_files = []
+        for folder in ('a', 'a/deep/er', 'b', ''):
+            (root / folder).mkdir(parents=True, exist_ok=True)
+            for name in ('one.wav', 'two.MP3'):
+                path = root / folder / name
+                path.write_bytes(b'audio')
+                self.audio_files.append(str(path))
+            (root / folder / 'notes.txt').write_text('not audio')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_walks_nested_directories_by_extension(self):
+        """All matching files are found, case-insensitively, and nothing else"""
+        discovery = StreamingFileDiscovery(['.wav', 'mp3'], max_workers=3)
+        stats = DiscoveryStats()
+
+        found = list(discovery.iter_files(self.temp_dir, stats=stats))
+
+        self.assertEqual(sorted(found), sorted(self.audio_files))
+        self.assertEqual(discovery.discover(self.temp_dir), sorted(self.audio_files))
+        self.assertEqual((stats.directories, stats.matched, stats.accepted), (5, 8, 8))
+
+    def test_filter_runs_with_stat_results(self):
+        """The accept filter sees each file's stat and its rejections are counted"""
+        seen_sizes = []
+        lock = threading.Lock()
+
+        def accept(path, stat_result):
+            with lock:
+                seen_sizes.append(stat_result.st_size)
+            return path.endswith('.wav')
+
+        stats = DiscoveryStats()
+        found = list(StreamingFileDiscovery(['.wav', '.mp3']).iter_files(self.temp_dir, accept, stats))
+
+        self.assertEqual(len(found), 4)
+        self.assertEqual(seen_sizes, [5] * 8)
+        self.assertEqual((stats.matched, stats.accepted), (8, 4))
+
+    def test_closing_the_stream_stops_the_walk(self):
+        """A consumer that stops early does not leave scanning threads blocked"""
+        stream = StreamingFileDiscovery(['.wav', '.mp3'], queue_size=1).iter_files(self.temp_dir)
+        self.assertIsNotNone(next(stream))
+        stream.close()
+
+        self.assertEqual(list(StreamingFileDiscovery(['.wav']).iter_files('/nonexistent/dir')), [])
+
+    def test_ordering_is_applied_within_windows(self):
+        """Each window is sorted without waiting for the whole stream"""
+        self.assertEqual(list(ordered_in_windows(iter(['d', 'c', 'b', 'a', 'e']), 2)), ['c', 'd', 'a', 'b', 'e'])
+        self.assertEqual(list(ordered_in_windows(iter(['b', 'a']), 0)), ['b', 'a'])
+
+
+if __name__ == '__main__':
+    unittest.main()
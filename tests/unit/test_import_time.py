@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Unit tests for import-time budget
+Ensures lightweight entry points do not import heavy optional dependencies
+"""
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+HEAVY_MODULES = ('torch', 'whisper', 'stable_whisper', 'librosa', 'soundfile',
+                 'ctranslate2', 'transformers', 'runpod')
+
+# Generous bound for a cold interpreter on CI; a regression to eager imports costs several seconds
+IMPORT_BUDGET_SECONDS = float(os.environ.get('IMPORT_BUDGET_SECONDS', '1.5'))
+
+PROBE_SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+import src.utils.dependency_manager as dm
+import src.core.engines.utilities.model_manager
+dm.get_dependency_manager().get_available_dependencies()
+elapsed = time.perf_counter() - started
+print(json.dumps({'elapsed': elapsed, 'heavy': [m for m in %r if m in sys.modules]}))
+""" % (HEAVY_MODULES,)
+
+
+class TestImportTime(unittest.TestCase):
+    """Test cases for lazy dependency loading"""
+
+    def _run_probe(self):
+        completed = subprocess.run(
+            [sys.executable, '-c', PROBE_SCRIPT], cwd=str(project_root),
+            capture_output=True, text=True, timeout=120
+        )
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+        return json.loads(completed.stdout.strip().splitlines()[-1])
+
+    def test_status_checks_do_not_import_heavy_dependencies(self):
+        """Availability checks and model manager import leave heavy modules unloaded"""
+        result = self._run_probe()
+        self.assertEqual(result['heavy'], [])
+
+    def test_import_time_budget(self):
+        """Importing the dependency and model managers stays within budget"""
+        result = self._run_probe()
+        self.assertLess(result['elapsed'], IMPORT_BUDGET_SECONDS)
+
+    def test_get_module_imports_on_demand(self):
+        """get_module imports the dependency only when asked"""
+        from src.utils.dependency_manager import DependencyManager
+
+        manager = DependencyManager()
+        self.assertIsNone(manager._dependencies['psutil']['module'])
+        self.assertFalse(manager.is_available('not_a_registered_dependency'))
+        if manager.is_available('psutil'):
+            self.assertIsNotNone(manager.get_module('psutil'))
+        else:
+            with self.assertRaises(ImportError):
+                manager.get_module('psutil')
+
+
+if __name__ == '__main__':
+    unittest.main()
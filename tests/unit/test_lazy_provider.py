@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Unit tests for LazyProvider
+Tests deferred, shared and thread-safe component construction
+"""
+
+import threading
+import time
+import unittest
+from pathlib import Path
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.lazy_provider import LazyProvider
+
+
+class TestLazyProvider(unittest.TestCase):
+    """Test cases for LazyProvider"""
+
+    def test_builds_once_on_first_use(self):
+        """The factory runs on first get() only, even under concurrent access"""
+        calls = []
+
+        def factory():
+            calls.append(True)
+            time.sleep(0.05)
+            return object()
+
+        provider = LazyProvider(factory, name="engine")
+        self.assertFalse(provider.is_initialized)
+        self.assertIsNone(provider.peek())
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(provider.get())) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertIs(provider.peek(), results[0])
+
+    def test_failed_construction_is_retried(self):
+        """A factory error is not cached"""
+        attempts = []
+
+        def factory():
+            attempts.append(True)
+            if len(attempts) == 1:
+                raise RuntimeError("model directory missing")
+            return "engine"
+
+        provider = LazyProvider(factory)
+        with self.assertRaises(RuntimeError):
+            provider.get()
+        self.assertFalse(provider.is_initialized)
+        self.assertEqual(provider.get(), "engine")
+
+    def test_wrapped_instance_and_reset(self):
+        """Injected instances are returned as-is; reset forces a rebuild"""
+        injected = object()
+        self.assertIs(LazyProvider.of(injected).get(), injected)
+
+        provider = LazyProvider(object)
+        first = provider.get()
+        self.assertIs(provider.reset(), first)
+        self.assertIsNot(provider.get(), first)
+
+
+if __name__ == '__main__':
+    unittest.main()
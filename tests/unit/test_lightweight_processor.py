@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the lightweight Whisper processor
+Tests NumPy feature extraction and the tokenizers-backed adapter
+"""
+
+import importlib.util
+import json
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+import numpy as np
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.engines.utilities.whisper_feature_extractor import WhisperFeatureExtractorNumpy
+from src.core.engines.utilities.lightweight_processor import LightweightWhisperProcessor
+
+TOKENIZERS_INSTALLED = importlib.util.find_spec("tokenizers") is not None
+
+
+class TestWhisperFeatureExtractor(unittest.TestCase):
+    """Test cases for NumPy log-mel features"""
+
+    def test_features_are_padded_to_window_and_normalized(self):
+        """Short audio yields a full 30 second window scaled like WhisperFeatureExtractor"""
+        extractor = WhisperFeatureExtractorNumpy()
+        t = np.arange(16000 * 2) / 16000
+        tone = 0.5 * np.sin(2 * np.pi * 1000 * t).astype(np.float32)
+
+        features = extractor(tone, sampling_rate=16000, return_tensors="np").input_features
+
+        self.assertEqual(features.shape, (1, 80, 3000))
+        self.assertEqual(features.dtype, np.float32)
+        self.assertLessEqual(features.max() - features.min(), 2.0 + 1e-5)
+        # The tone's energy peaks in the mel bin around 1 kHz during the audible frames
+        peak_bin = int(np.argmax(features[0, :, 50]))
+        self.assertTrue(20 <= peak_bin <= 35, peak_bin)
+        self.assertLess(features[0, peak_bin, 2500], features[0, peak_bin, 50])
+
+    def test_rejects_other_sample_rates(self):
+        """Resampling is the caller's job, as with WhisperProcessor"""
+        with self.assertRaises(ValueError):
+            WhisperFeatureExtractorNumpy()(np.zeros(8000), sampling_rate=8000)
+
+
+@unittest.skipUnless(TOKENIZERS_INSTALLED, "tokenizers is not installed")
+class TestWhisperTokenizerAdapter(unittest.TestCase):
+    """Test cases for the tokenizers-backed processor"""
+
+    def setUp(self):
+        from tokenizers import AddedToken, Tokenizer
+        from tokenizers.models import WordLevel
+        from tokenizers.pre_tokenizers import Whitespace
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        vocab = {"[UNK]": 0, "shalom": 1, "olam": 2}
+        tokenizer = Tokenizer(WordLevel(vocab, unk_token="[UNK]"))
+        tokenizer.pre_tokenizer = Whitespace()
+        tokenizer.add_special_tokens([AddedToken(token, special=True) for token in (
+            "<|endoftext|>", "<|startoftranscript|>", "<|he|>", "<|transcribe|>", "<|notimestamps|>")])
+        tokenizer.add_tokens(["<|0.00|>", "<|0.02|>"])
+        tokenizer.save(str(Path(self.temp_dir.name) / "tokenizer.json"))
+        with open(Path(self.temp_dir.name) / "preprocessor_config.json", "w") as f:
+            json.dump({"feature_size": 80, "sampling_rate": 16000, "hop_length": 160, "n_fft": 400}, f)
+
+        self.processor = LightweightWhisperProcessor.from_pretrained(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_decode_skips_special_and_timestamp_tokens(self):
+        """skip_special_tokens drops control and timestamp tokens, like WhisperTokenizer"""
+        tokenizer = self.processor.tokenizer
+        ids = tokenizer.convert_tokens_to_ids(
+            ["<|startoftranscript|>", "<|he|>", "<|0.00|>", "shalom", "olam", "<|0.02|>", "<|endoftext|>"])
+
+        self.assertEqual(self.processor.decode(ids, skip_special_tokens=True).split(), ["shalom", "olam"])
+        self.assertIn("<|he|>", self.processor.decode(ids))
+
+    def test_prompt_ids_and_token_lookup(self):
+        """Forced decoder ids and <|startoftranscript|> encoding match the engine's expectations"""
+        tokenizer = self.processor.tokenizer
+        prompt = self.processor.get_decoder_prompt_ids(language="hebrew", task="transcribe")
+
+        self.assertEqual(prompt, [(1, tokenizer.convert_tokens_to_ids("<|he|>")),
+                                  (2, tokenizer.convert_tokens_to_ids("<|transcribe|>")),
+                                  (3, tokenizer.convert_tokens_to_ids("<|notimestamps|>"))])
+        self.assertEqual(tokenizer.encode("<|startoftranscript|>", add_special_tokens=False),
+                         [tokenizer.convert_tokens_to_ids("<|startoftranscript|>")])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Unit tests for MemoryAdmissionController
+Tests size-based admission, oversized jobs and RSS correction of estimates
+"""
+
+import threading
+import time
+import unittest
+from pathlib import Path
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.logic.audio_probe import AudioMetadata
+from src.core.logic.memory_admission import MB, MemoryAdmissionController, estimate_job_bytes
+
+
+class FakeProbe:
+    """Probe returning 16 kHz mono metadata with fixed durations"""
+
+    def __init__(self, durations):
+        self.durations = durations
+
+    def probe(self, file_path):
+        return AudioMetadata(file_path=file_path, file_size=0, mtime=0.0, duration=self.durations[file_path],
+                             sample_rate=16000, channels=1)
+
+
+class TestMemoryAdmission(unittest.TestCase):
+    """Test cases for MemoryAdmissionController"""
+
+    def setUp(self):
+        self.rss = [100 * MB]
+        self.probe = FakeProbe({'short.wav': 60.0, 'long.wav': 6 * 3600.0})
+
+    def create_controller(self, budget_mb, rss_reader=None):
+        return MemoryAdmissionController(budget_bytes=budget_mb * MB, model_bytes=0, audio_probe=self.probe,
+                                         rss_reader=rss_reader or (lambda: self.rss[0]))
+
+    def test_estimate_grows_with_duration_rate_and_channels(self):
+        """Long, high-rate stereo recordings cost far more than short mono ones"""
+        short = estimate_job_bytes(60.0, 16000, 1)
+        long_stereo = estimate_job_bytes(3 * 3600.0, 44100, 2)
+        self.assertLess(short, 300 * MB)
+        self.assertGreater(long_stereo, 3000 * MB)
+
+    def test_many_small_jobs_run_while_large_jobs_wait(self):
+        """Short files run side by side; a long file waits until the budget frees up"""
+        # RSS that matches the estimates of the running jobs
+        running = []
+        controller = self.create_controller(budget_mb=2048,
+                                            rss_reader=lambda: 100 * MB + sum(r.estimated_bytes for r in running))
+        small = []
+        for _ in range(4):
+            small.append(controller.acquire('short.wav'))
+            running.append(small[-1])
+        self.assertEqual(controller.get_stats()['peak_running'], 4)
+
+        admitted = threading.Event()
+
+        def admit_long():
+            reservation = controller.acquire('long.wav')
+            admitted.set()
+            controller.release(reservation)
+
+        waiter = threading.Thread(target=admit_long)
+        waiter.start()
+        time.sleep(0.2)
+        self.assertFalse(admitted.is_set())
+
+        for reservation in small:
+            controller.release(reservation)
+            running.remove(reservation)
+        waiter.join(timeout=5)
+        self.assertTrue(admitted.is_set())
+        # Larger than the whole budget, so it ran alone
+        self.assertEqual(controller.get_stats()['oversized_jobs'], 1)
+
+    def test_observed_rss_corrects_estimates(self):
+        """RSS above the estimates raises later reservations"""
+        controller = self.create_controller(budget_mb=100000)
+        first = controller.acquire('short.wav')
+        self.rss[0] = 100 * MB + 3 * first.estimated_bytes
+        controller.release(first)
+
+        second = controller.acquire('short.wav')
+        self.assertGreater(controller.correction, 1.5)
+        self.assertGreater(second.reserved_bytes, second.estimated_bytes)
+        controller.release(second)
+
+    def test_reported_job_peaks_correct_estimates(self):
+        """Without an RSS reader, peaks reported by the jobs' processes drive the correction"""
+        controller = MemoryAdmissionController(budget_bytes=100000 * MB, model_bytes=0, audio_probe=self.probe,
+                                               rss_reader=None)
+        first = controller.acquire('short.wav')
+        controller.observe_job(first, first.estimated_bytes // 4)
+        controller.release(first)
+        self.assertLess(controller.correction, 1.0)
+
+        second = controller.acquire('short.wav')
+        controller.observe_job(second, 3 * second.estimated_bytes)
+        controller.release(second)
+        self.assertGreater(controller.correction, 1.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Unit tests for MemoryGovernor
+Tests pressure classification, reclaim and admission control
+"""
+
+import unittest
+from unittest.mock import patch
+from pathlib import Path
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.logic.memory_governor import (
+    MemoryGovernor, MemoryPressure, read_peak_rss_bytes, read_rss_bytes, reset_peak_rss
+)
+
+MB = 1024 * 1024
+
+
+class TestMemoryGovernor(unittest.TestCase):
+    """Test cases for MemoryGovernor"""
+
+    def _governor(self):
+        governor = MemoryGovernor(soft_limit_mb=100, hard_limit_mb=200, sample_interval=0,
+                                  gc_cooldown_seconds=0, admission_timeout_seconds=1)
+        self.shrinks = []
+        governor.register_cache_shrinker(lambda: self.shrinks.append(True))
+        return governor
+
+    @patch('src.core.logic.memory_governor.gc.collect')
+    @patch('src.core.logic.memory_governor.read_rss_bytes', return_value=50 * MB)
+    def test_no_reclaim_below_soft_limit(self, mock_rss, mock_collect):
+        """Nothing is collected while memory is below the soft threshold"""
+        governor = self._governor()
+        self.assertEqual(governor.check(), MemoryPressure.NORMAL)
+        mock_collect.assert_not_called()
+        self.assertEqual(self.shrinks, [])
+
+    @patch('src.core.logic.memory_governor.gc.collect')
+    @patch('src.core.logic.memory_governor.read_rss_bytes', return_value=150 * MB)
+    def test_soft_pressure_collects_without_shrinking(self, mock_rss, mock_collect):
+        """Soft pressure triggers garbage collection only"""
+        governor = self._governor()
+        self.assertEqual(governor.check(), MemoryPressure.SOFT)
+        mock_collect.assert_called_once()
+        self.assertEqual(self.shrinks, [])
+
+    @patch('src.core.logic.memory_governor.time.sleep')
+    @patch('src.core.logic.memory_governor.gc.collect')
+    @patch('src.core.logic.memory_governor.read_rss_bytes')
+    def test_hard_pressure_pauses_admission_until_below_soft(self, mock_rss, mock_collect, mock_sleep):
+        """Admission waits under hard pressure and resumes below the soft threshold"""
+        readings = [250 * MB, 250 * MB, 150 * MB, 150 * MB, 80 * MB]
+        mock_rss.side_effect = lambda: readings.pop(0) if len(readings) > 1 else readings[0]
+        governor = self._governor()
+        governor.work_started()
+
+        self.assertTrue(governor.wait_for_admission(poll_interval=0))
+        self.assertTrue(self.shrinks)
+        self.assertEqual(governor.get_stats()['admission_pauses'], 1)
+
+    @patch('src.core.logic.memory_governor.time.sleep')
+    @patch('src.core.logic.memory_governor.gc.collect')
+    @patch('src.core.logic.memory_governor.read_rss_bytes', return_value=250 * MB)
+    def test_hard_pressure_without_work_in_flight_does_not_wait(self, mock_rss, mock_collect, mock_sleep):
+        """With nothing running to free memory, caches shrink and the work is admitted at once"""
+        governor = self._governor()
+
+        self.assertTrue(governor.wait_for_admission(poll_interval=0))
+        self.assertTrue(self.shrinks)
+        mock_sleep.assert_not_called()
+        self.assertEqual(governor.get_stats()['admission_pauses'], 0)
+        self.assertEqual(governor.get_stats()['admission_skips'], 1)
+
+    @patch('src.core.logic.memory_governor.time.sleep')
+    @patch('src.core.logic.memory_governor.gc.collect')
+    @patch('src.core.logic.memory_governor.read_rss_bytes', return_value=250 * MB)
+    def test_pause_ends_when_last_work_finishes(self, mock_rss, mock_collect, mock_sleep):
+        """A paused admission resumes as soon as the work in flight finishes"""
+        governor = self._governor()
+        governor.work_started()
+        mock_sleep.side_effect = lambda seconds: governor.work_finished()
+
+        self.assertTrue(governor.wait_for_admission(poll_interval=0))
+        self.assertEqual(mock_sleep.call_count, 1)
+        self.assertEqual(governor.in_flight, 0)
+
+
+class TestPeakRss(unittest.TestCase):
+    """Test cases for peak RSS measurement"""
+
+    def test_peak_covers_memory_allocated_after_reset(self):
+        """The peak includes a buffer touched after the reset, even once it is freed"""
+        reset_peak_rss()
+        before = read_rss_bytes()
+        buffer = bytearray(64 * 1024 * 1024)
+        del buffer
+
+        self.assertGreaterEqual(read_peak_rss_bytes(), before + 32 * 1024 * 1024)
+
+
+if __name__ == '__main__':
+    unittest.main()
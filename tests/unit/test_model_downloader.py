@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Unit tests for ModelDownloadManager
+Tests segmented, resumable, verified downloads against a local HTTP server
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.model_downloader import ModelDownloadError, ModelDownloadManager, ModelManifest
+
+SEGMENT_SIZE = 64 * 1024
+
+
+class RangeRequestHandler(BaseHTTPRequestHandler):
+    """Serves in-memory files with HEAD and single-range GET support"""
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_HEAD(self):
+        content = self.server.files.get(self.path)
+        if content is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(content)))
+        self.send_header('Accept-Ranges', 'bytes')
+        self.end_headers()
+
+    def do_GET(self):
+        content = self.server.files.get(self.path)
+        if content is None:
+            self.send_error(404)
+            return
+        range_header = self.headers.get('Range')
+        with self.server.lock:
+            self.server.requests.append((self.path, range_header))
+        if range_header in self.server.fail_ranges:
+            self.send_error(503)
+            return
+        if range_header:
+            start, end = (int(value) for value in range_header.split('=')[1].split('-'))
+            body = content[start:end + 1]
+            self.send_response(206)
+            self.send_header('Content-Range', f"bytes {start}-{end}/{len(content)}")
+        else:
+            body = content
+            self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class TestModelDownloader(unittest.TestCase):
+    """Test cases for ModelDownloadManager"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.models_dir = Path(self.temp_dir.name) / "models"
+        self.weights = os.urandom(SEGMENT_SIZE * 4 + 123)
+        self.config = b'{"num_mel_bins": 128}'
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), RangeRequestHandler)
+        self.server.files = {'/model.bin': self.weights, '/config.json': self.config}
+        self.server.requests = []
+        self.server.fail_ranges = set()
+        self.server.lock = threading.Lock()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+        self.manifest = ModelManifest.from_dict({
+            'model_name': 'ivrit-ai/test-ct2',
+            'files': [
+                {'path': 'model.bin', 'url': f"{base_url}/model.bin", 'size': len(self.weights),
+                 'sha256': hashlib.sha256(self.weights).hexdigest()},
+                {'path': 'config.json', 'url': f"{base_url}/config.json"}
+            ]
+        })
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.temp_dir.cleanup()
+
+    def _manager(self, max_retries=1):
+        return ModelDownloadManager(str(self.models_dir), max_workers=4, segment_size=SEGMENT_SIZE,
+                                    timeout=5, max_retries=max_retries)
+
+    def _weight_ranges(self):
+        return sorted(header for path, header in self.server.requests if path == '/model.bin')
+
+    def test_segmented_download_is_verified_and_installed(self):
+        """Weights arrive as parallel range segments and the model directory appears complete"""
+        install_path = self._manager().download(self.manifest)
+
+        self.assertEqual(install_path, self.models_dir / 'ivrit-ai' / 'test-ct2')
+        self.assertEqual((install_path / 'model.bin').read_bytes(), self.weights)
+        self.assertEqual((install_path / 'config.json').read_bytes(), self.config)
+        self.assertEqual(len(self._weight_ranges()), 5)
+        self.assertEqual(sorted(os.listdir(install_path)), ['config.json', 'model.bin'])
+        self.assertFalse((self.models_dir / '.downloads' / 'ivrit-ai' / 'test-ct2').exists())
+
+    def test_interrupted_download_resumes_missing_segments_only(self):
+        """A failed run installs nothing, and the next run fetches only what is missing"""
+        failing_range = f"bytes={SEGMENT_SIZE * 2}-{SEGMENT_SIZE * 3 - 1}"
+        self.server.fail_ranges.add(failing_range)
+        with self.assertRaises(ModelDownloadError):
+            self._manager().download(self.manifest)
+        self.assertFalse((self.models_dir / 'ivrit-ai' / 'test-ct2').exists())
+
+        self.server.fail_ranges.clear()
+        self.server.requests.clear()
+        manager = self._manager()
+        install_path = manager.download(self.manifest)
+
+        self.assertEqual(self.server.requests, [('/model.bin', failing_range)])
+        self.assertEqual(manager.stats['segments_resumed'], 5)
+        self.assertEqual((install_path / 'model.bin').read_bytes(), self.weights)
+
+    def test_checksum_mismatch_is_rejected(self):
+        """Corrupted weights are discarded instead of installed"""
+        self.manifest.files[0].sha256 = hashlib.sha256(b'other').hexdigest()
+
+        with self.assertRaises(ModelDownloadError):
+            self._manager().download(self.manifest)
+
+        self.assertFalse((self.models_dir / 'ivrit-ai' / 'test-ct2').exists())
+        staging = self.models_dir / '.downloads' / 'ivrit-ai' / 'test-ct2'
+        self.assertFalse((staging / 'model.bin.part').exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Unit tests for cold-start model loading
+Tests page-cache prefetch and parallel model/processor load
+"""
+
+import tempfile
+import time
+import types
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.engines.utilities.model_prefetch import PageCachePrefetch
+from src.core.engines.utilities.model_manager import ModelManager
+
+LOAD_SECONDS = 0.3
+
+
+class FakeWhisper:
+    """Stand-in for ctranslate2.models.Whisper with a fixed load time"""
+
+    def __init__(self, model_path, device, compute_type, **kwargs):
+        time.sleep(LOAD_SECONDS)
+        self.model_path = model_path
+
+
+class TestModelLoad(unittest.TestCase):
+    """Test cases for prefetch and parallel model loading"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.model_name = "ivrit-test-ct2"
+        model_dir = Path(self.temp_dir.name) / "models" / self.model_name
+        model_dir.mkdir(parents=True)
+        self.model_bin = model_dir / "model.bin"
+        self.model_bin.write_bytes(b"\0" * 65536)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_prefetch_issues_hints_and_releases_file(self):
+        """Readahead hints cover the whole file and the descriptor is closed afterwards"""
+        with PageCachePrefetch(str(self.model_bin)) as prefetch:
+            self.assertEqual(prefetch.stats['bytes'], 65536)
+            self.assertIsNotNone(prefetch._fd)
+        self.assertIsNone(prefetch._fd)
+        self.assertIsNone(prefetch._mapping)
+
+    def test_model_and_processor_load_in_parallel(self):
+        """The processor loads while CTranslate2 loads the weights, and phases are timed"""
+        config_manager = Mock()
+        config_manager.config_dir = Path(self.temp_dir.name) / "config"
+        config_manager.config.transcription.ctranslate2_optimization.device = "cpu"
+        config_manager.config.transcription.ctranslate2_optimization.compute_type = "int8"
+        manager = ModelManager(config_manager)
+
+        ctranslate2_models = types.ModuleType("ctranslate2.models")
+        ctranslate2_models.Whisper = FakeWhisper
+        ctranslate2 = types.ModuleType("ctranslate2")
+        ctranslate2.models = ctranslate2_models
+
+        def slow_processor(model_name, processor_source):
+            time.sleep(LOAD_SECONDS)
+            return "processor"
+
+        with patch.dict(sys.modules, {"ctranslate2": ctranslate2, "ctranslate2.models": ctranslate2_models}), \
+                patch.object(manager, "_load_processor", side_effect=slow_processor):
+            started = time.time()
+            processor, model = manager.get_or_load_model(self.model_name)
+            elapsed = time.time() - started
+
+        self.assertEqual(processor, "processor")
+        self.assertIsInstance(model, FakeWhisper)
+        self.assertLess(elapsed, LOAD_SECONDS * 1.8)
+
+        timings = manager.get_cache_info()["load_timings"][self.model_name]
+        for phase in ("prefetch_issue", "ct2_model", "processor", "processor_wait", "total"):
+            self.assertIn(phase, timings)
+
+
+if __name__ == '__main__':
+    unittest.main()
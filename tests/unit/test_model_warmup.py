@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Unit tests for ModelWarmup
+Tests background warm-up and waiting on its future
+"""
+
+import threading
+import unittest
+from pathlib import Path
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.engines.utilities.model_warmup import ModelWarmup
+
+
+class TestModelWarmup(unittest.TestCase):
+    """Test cases for ModelWarmup"""
+
+    def test_warmup_runs_in_background_and_can_be_awaited(self):
+        """The warm-up runs off the calling thread and wait() blocks until it is done"""
+        release = threading.Event()
+        calls = []
+
+        def warm_up(model_name):
+            calls.append((model_name, threading.current_thread().name))
+            release.wait(5)
+            return 0.1
+
+        warmup = ModelWarmup("ivrit-ct2", warm_up)
+        warmup.start()
+        warmup.start()
+        self.assertEqual(warmup.get_status()['state'], 'running')
+        self.assertFalse(warmup.wait(timeout=0.05))
+
+        release.set()
+        self.assertTrue(warmup.wait(timeout=5))
+        self.assertEqual(calls, [("ivrit-ct2", "model-warmup")])
+        self.assertEqual(warmup.get_status()['state'], 'completed')
+
+    def test_failed_warmup_does_not_raise_for_waiters(self):
+        """A failing warm-up is reported, and the caller falls back to a regular load"""
+        def warm_up(model_name):
+            raise FileNotFoundError("model.bin missing")
+
+        warmup = ModelWarmup("ivrit-ct2", warm_up)
+        self.assertFalse(warmup.wait())
+        warmup.start()
+        self.assertFalse(warmup.wait(timeout=5))
+        self.assertEqual(warmup.get_status()['state'], 'failed')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Unit tests for PartialTranscriptService
+Tests incremental deduplication and atomic partial output flushing
+"""
+
+import json
+import shutil
+import tempfile
+import unittest
+from unittest.mock import Mock
+from pathlib import Path
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.engines.strategies.output_strategy import OverlappingTextDeduplicator
+from src.core.services.partial_transcript_service import PartialTranscriptService
+
+
+class TestPartialTranscriptService(unittest.TestCase):
+    """Test cases for PartialTranscriptService"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_manager = Mock()
+        self.config_manager.config.chunking.partial_output_enabled = True
+        self.config_manager.config.chunking.partial_flush_interval_seconds = 0
+        self.deduplicator = OverlappingTextDeduplicator(self.config_manager)
+        self.service = PartialTranscriptService(self.config_manager, self.deduplicator, output_dir=self.temp_dir)
+
+        shared = "והמשכנו לדבר על הפרויקט החדש"
+        self.chunks = [
+            [{'start': 0.0, 'end': 14.0, 'text': 'שלום לכולם'},
+             {'start': 14.0, 'end': 30.0, 'text': f'אנחנו מתחילים {shared}'}],
+            [{'start': 25.0, 'end': 40.0, 'text': f'{shared} שלנו היום'},
+             {'start': 40.0, 'end': 55.0, 'text': 'ואז הלכנו הביתה'}],
+            [{'start': 50.0, 'end': 60.0, 'text': 'סוף'}]
+        ]
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_incremental_prefix_matches_full_deduplication(self):
+        """Incremental merging yields the same result as one full pass"""
+        self.service.start_job("meeting.wav", len(self.chunks))
+        for index, segments in enumerate(self.chunks):
+            self.service.add_chunk_result(index, segments, segments[-1]['end'])
+
+        all_segments = [segment for chunk in self.chunks for segment in chunk]
+        expected = self.deduplicator.deduplicate_segments(sorted(all_segments, key=lambda x: x['start']))
+        self.assertEqual(self.service.get_segments(), expected)
+
+    def test_out_of_order_chunks_wait_for_contiguous_prefix(self):
+        """A later chunk is not merged until earlier chunks complete"""
+        self.service.start_job("meeting.wav", len(self.chunks))
+        self.assertFalse(self.service.add_chunk_result(1, self.chunks[1]))
+        self.assertEqual(self.service.get_segments(), [])
+        self.assertTrue(self.service.add_chunk_result(0, self.chunks[0]))
+        self.assertEqual(self.service.completed_prefix_chunks, 2)
+
+    def test_flush_writes_partial_outputs(self):
+        """Partial TXT and JSON reflect the contiguous prefix"""
+        self.service.start_job("meeting.wav", len(self.chunks))
+        self.service.add_chunk_result(0, self.chunks[0], 30.0)
+        paths = self.service.maybe_flush()
+
+        self.assertIn('שלום לכולם', paths['txt'].read_text(encoding='utf-8'))
+        data = json.loads(paths['json'].read_text(encoding='utf-8'))
+        self.assertFalse(data['complete'])
+        self.assertEqual(data['chunks_completed'], 1)
+        self.assertEqual(data['covered_until_seconds'], 30.0)
+        self.assertIsNone(self.service.maybe_flush())
+
+        for index in (1, 2):
+            self.service.add_chunk_result(index, self.chunks[index])
+        data = json.loads(self.service.finalize()['json'].read_text(encoding='utf-8'))
+        self.assertTrue(data['complete'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,6 +8,7 @@ from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 import tempfile
 import shutil
+import threading
 from datetime import datetime
 
 from src.core.processors.processing_pipeline import (
@@ -19,8 +20,10 @@ from src.core.processors.processing_pipeline import (
 )
 from src.core.factories.pipeline_factory import PipelineFactory, PipelineType
 from src.core.logic.error_handler import ErrorHandler
+from src.core.logic.shared_work_queue import ENQUEUE_BATCH_SIZE
 from src.core.logic.result_builder import ResultBuilder
 from src.utils.config_manager import ConfigManager
+from src.utils.lazy_provider import LazyProvider
 from src.output_data import OutputManager
 
 
@@ -321,6 +324,231 @@ class TestBatchProcessingPipeline(unittest.TestCase):
         self.assertIn('processing_queue', result)
         self.assertEqual(len(result['processing_queue']), 3)
 
+    def test_file_pipelines_share_one_orchestrator(self):
+        """Every file pipeline of a batch reuses one orchestrator, so the engine and model load once"""
+        orchestrator = Mock()
+        create_orchestrator = Mock(return_value=orchestrator)
+        pipeline = BatchProcessingPipeline(self.config_manager, self.output_manager,
+                                           LazyProvider(create_orchestrator))
+
+        first = pipeline._create_file_pipeline(None)
+        second = pipeline._create_file_pipeline(None)
+
+        self.assertIs(first.transcription_orchestrator, orchestrator)
+        self.assertIs(second.transcription_orchestrator, orchestrator)
+        create_orchestrator.assert_called_once()
+
+    def test_streamed_files_follow_the_scheduling_policy_by_default(self):
+        """Without a discovery_order_window, LPT still submits the longest streamed file first"""
+        self.config_manager.config.batch.discovery_order_window = 0
+        self.config_manager.config.batch.scheduling_policy = "lpt"
+        for i, size in enumerate((16000, 32000, 64000)):
+            (self.test_audio_dir / f"test_audio_{i}.wav").write_bytes(b"\0" * size)
+        pipeline = BatchProcessingPipeline(self.config_manager, self.output_manager)
+
+        with patch.object(pipeline, '_get_batch_workers', return_value=2):
+            files = list(pipeline._stream_files(self.test_audio_dir))
+
+        self.assertEqual([Path(f).name for f in files], ["test_audio_2.wav", "test_audio_1.wav", "test_audio_0.wav"])
+
+    def _enable_retries(self):
+        """Allow two retries without backoff"""
+        self.config_manager.config.system.retry_attempts = 2
+        self.config_manager.config.system.constants = Mock(exponential_backoff_base=2, max_backoff_seconds=0)
+
+    def _file_contexts(self, *names):
+        return [ProcessingContext(session_id="test_session", file_path=name, operation_type="single_file_processing")
+                for name in names]
+
+    def test_sequential_queue_retries_transient_failures(self):
+        """A file that timed out is processed again; a missing file is reported after one attempt"""
+        self._enable_retries()
+        pipeline = BatchProcessingPipeline(self.config_manager, self.output_manager)
+        attempts = []
+
+        def process(file_context):
+            attempts.append(file_context.file_path)
+            if file_context.file_path == 'missing.wav':
+                return ProcessingResult(success=False, context=file_context,
+                                        errors=[{'error': 'No such file', 'error_type': 'FileNotFoundError'}])
+            if file_context.file_path == 'flaky.wav' and attempts.count('flaky.wav') == 1:
+                return ProcessingResult(success=False, context=file_context,
+                                        errors=[{'error': 'Connection timed out', 'error_type': 'TimeoutError'}])
+            return ProcessingResult(success=True, context=file_context)
+
+        file_pipeline = Mock()
+        file_pipeline.process.side_effect = process
+        with patch.object(pipeline, '_create_file_pipeline', return_value=file_pipeline):
+            results = list(pipeline._process_queue(self._file_contexts('flaky.wav', 'missing.wav', 'ok.wav')))
+
+        outcomes = {result.context.file_path: result for result in results}
+        self.assertEqual(len(results), 3)
+        self.assertTrue(outcomes['flaky.wav'].success)
+        self.assertEqual(outcomes['flaky.wav'].performance_metrics['attempts'], 2)
+        self.assertFalse(outcomes['missing.wav'].success)
+        self.assertEqual(attempts.count('missing.wav'), 1)
+
+    def test_cross_file_queue_retries_transient_failures(self):
+        """Files that failed in a mixed-file pass are transcribed again in a later pass"""
+        self._enable_retries()
+        self.config_manager.config.batch.cross_file_batching = True
+        pipeline = BatchProcessingPipeline(self.config_manager, self.output_manager)
+        passes = []
+
+        def transcribe(files):
+            passes.append(list(files))
+            for index, file_path in enumerate(passes[-1]):
+                if file_path == 'flaky.wav' and len(passes) == 1:
+                    yield index, file_path, {'success': False, 'error': 'CUDA out of memory'}
+                else:
+                    yield index, file_path, {'success': True, 'transcription': 'שלום'}
+
+        file_pipeline = Mock()
+        file_pipeline._postprocess.side_effect = lambda file_context, data: {'success': True, 'data': data}
+        file_pipeline._build_success_result.side_effect = (
+            lambda file_context, data, started: ProcessingResult(success=True, context=file_context, data=data))
+        transcriber = Mock()
+        transcriber.transcribe.side_effect = transcribe
+        with patch.object(pipeline, '_create_file_pipeline', return_value=file_pipeline), \
+                patch('src.core.services.cross_file_batch_service.create_cross_file_transcriber',
+                      return_value=transcriber):
+            results = list(pipeline._process_queue(self._file_contexts('flaky.wav', 'ok.wav'), 'model'))
+
+        self.assertEqual(passes, [['flaky.wav', 'ok.wav'], ['flaky.wav']])
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual([result.performance_metrics['attempts'] for result in results], [1, 2])
+
+    def test_worker_summaries_use_the_same_retry_policy(self):
+        """Batch worker failures are retried only when transient and attempts remain"""
+        self._enable_retries()
+        pipeline = BatchProcessingPipeline(self.config_manager, self.output_manager)
+        timeout = {'file_path': 'a.wav', 'errors': [{'error': 'timed out', 'error_type': 'TimeoutError'}]}
+        missing = {'file_path': 'b.wav', 'errors': [{'error': 'No such file', 'error_type': 'FileNotFoundError'}]}
+
+        self.assertEqual(pipeline._summary_retry_delay(timeout, 1), 0)
+        self.assertIsNone(pipeline._summary_retry_delay(timeout, 3))
+        self.assertIsNone(pipeline._summary_retry_delay(missing, 1))
+
+    def test_adaptive_process_pool_is_sized_to_adaptive_max_workers(self):
+        """The process pool holds adaptive_max_workers and the controller starts below it"""
+        batch = self.config_manager.config.batch
+        batch.execution_backend = 'process'
+        batch.adaptive_concurrency = True
+        batch.adaptive_max_workers = 6
+        batch.memory_admission = False
+        batch.max_tasks_per_child = 0
+        batch.process_start_method = None
+        self.config_manager.config.system.memory_soft_limit_mb = None
+        self.config_manager.config.system.memory_hard_limit_mb = None
+        self.config_manager.config.system.memory_admission_timeout_seconds = None
+        pipeline = BatchProcessingPipeline(self.config_manager, self.output_manager)
+        layout = Mock(batch_workers=4, total_cores=8)
+
+        with patch('src.core.logic.thread_budget.get_thread_layout', return_value=layout), \
+                patch('src.core.logic.cpu_placement.plan_worker_placements', return_value=None):
+            executor = pipeline._create_process_executor(None)
+            self.assertEqual(executor.max_workers, 6)
+            self.assertEqual(executor.concurrency.max_limit, 6)
+            self.assertEqual(executor.concurrency.limit, 3)
+
+            batch.adaptive_concurrency = False
+            executor = pipeline._create_process_executor(None)
+            self.assertEqual(executor.max_workers, 4)
+            self.assertIsNone(executor.concurrency)
+
+    def _use_shared_queue(self):
+        self.config_manager.config.batch.work_queue_path = str(Path(self.temp_dir) / 'queue.sqlite')
+        self.config_manager.config.batch.work_queue_lease_seconds = 60
+
+    def _run_batch(self, pipeline, process, files):
+        file_pipeline = Mock()
+        file_pipeline.process.side_effect = process
+        with patch.object(pipeline, '_create_file_pipeline', return_value=file_pipeline):
+            return list(pipeline._process_queue(self._file_contexts(*files)))
+
+    def test_pipelines_sharing_a_work_queue_process_each_file_once(self):
+        """Two batch pipelines on one shared queue split the batch without duplicates"""
+        self._use_shared_queue()
+        files = [str(self.test_audio_dir / f"shared_{i}.wav") for i in range(8)]
+        processed = []
+        lock = threading.Lock()
+        # Both hosts hold a file before either finishes, so they work in the same run
+        both_started = threading.Barrier(2, timeout=10)
+        started_hosts = set()
+
+        def process(file_context):
+            with lock:
+                processed.append(file_context.file_path)
+                first_file = threading.get_ident() not in started_hosts
+                started_hosts.add(threading.get_ident())
+            if first_file:
+                both_started.wait()
+            return ProcessingResult(success=True, context=file_context)
+
+        results = {}
+
+        def run_host(name):
+            pipeline = BatchProcessingPipeline(self.config_manager, self.output_manager)
+            results[name] = self._run_batch(pipeline, process, files)
+
+        hosts = [threading.Thread(target=run_host, args=(name,)) for name in ('a', 'b')]
+        for host in hosts:
+            host.start()
+        for host in hosts:
+            host.join(timeout=30)
+
+        self.assertEqual(sorted(processed), sorted(files))
+        completed = [result.context.file_path for host_results in results.values() for result in host_results]
+        self.assertEqual(sorted(completed), sorted(files))
+
+    def test_shared_queue_claims_before_discovery_finishes(self):
+        """Files are enqueued in bounded batches, so the first file runs before the whole list is read"""
+        self._use_shared_queue()
+        pulled = []
+        first_pulled = []
+
+        def discovered():
+            for file_context in self._file_contexts(*(str(self.test_audio_dir / f"f{i}.wav") for i in range(150))):
+                pulled.append(file_context.file_path)
+                yield file_context
+
+        def process(file_context):
+            if not first_pulled:
+                first_pulled.append(len(pulled))
+            return ProcessingResult(success=True, context=file_context)
+
+        pipeline = BatchProcessingPipeline(self.config_manager, self.output_manager)
+        file_pipeline = Mock()
+        file_pipeline.process.side_effect = process
+        with patch.object(pipeline, '_create_file_pipeline', return_value=file_pipeline):
+            results = list(pipeline._process_queue(discovered()))
+
+        self.assertEqual(len(results), 150)
+        self.assertLessEqual(first_pulled[0], ENQUEUE_BATCH_SIZE)
+
+    def test_shared_queue_retries_transient_failures_through_the_queue(self):
+        """A transient failure returns to the shared queue and is claimed again"""
+        self._enable_retries()
+        self._use_shared_queue()
+        files = [str(self.test_audio_dir / name) for name in ('flaky.wav', 'ok.wav')]
+        attempts = []
+
+        def process(file_context):
+            attempts.append(Path(file_context.file_path).name)
+            if attempts.count('flaky.wav') == 1 and file_context.file_path.endswith('flaky.wav'):
+                return ProcessingResult(success=False, context=file_context,
+                                        errors=[{'error': 'Connection timed out', 'error_type': 'TimeoutError'}])
+            return ProcessingResult(success=True, context=file_context)
+
+        pipeline = BatchProcessingPipeline(self.config_manager, self.output_manager)
+        results = self._run_batch(pipeline, process, files)
+
+        self.assertEqual(len(results), 2)
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual(attempts.count('flaky.wav'), 2)
+        flaky = next(result for result in results if result.context.file_path.endswith('flaky.wav'))
+        self.assertEqual(flaky.performance_metrics['attempts'], 2)
+
 
 class TestPipelineFactory(unittest.TestCase):
     """Test cases for PipelineFactory"""
@@ -358,7 +586,19 @@ class TestPipelineFactory(unittest.TestCase):
         )
         
         self.assertIsInstance(pipeline, BatchProcessingPipeline)
-    
+
+    def test_batch_pipeline_reuses_injected_orchestrator(self):
+        """A batch pipeline built with the application's orchestrator transcribes with it"""
+        orchestrator = Mock()
+        pipeline = PipelineFactory.create_pipeline(
+            PipelineType.BATCH,
+            self.config_manager,
+            self.output_manager,
+            LazyProvider.of(orchestrator)
+        )
+
+        self.assertIs(pipeline._create_file_pipeline(None).transcription_orchestrator, orchestrator)
+
     def test_create_pipeline_from_operation(self):
         """Test creating pipeline from operation type"""
         pipeline = PipelineFactory.create_pipeline_from_operation(
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the progress event bus and event-driven progress monitor
+"""
+
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.logging.progress_events import ProgressEvent, ProgressEventBus, ProgressEventType
+from src.logging.progress_monitor import (
+    ProgressMonitor, ProgressMetricsExporter, StatusFileWriter, TerminalProgressRenderer
+)
+
+
+class TestProgressEventBus(unittest.TestCase):
+    """Test cases for ProgressEventBus"""
+
+    def test_publish_respects_event_type_filter(self):
+        """Subscribers only receive the event types they asked for"""
+        bus = ProgressEventBus()
+        received = []
+        bus.subscribe(received.append, [ProgressEventType.CHUNK_COMPLETED])
+
+        bus.publish(ProgressEvent(ProgressEventType.CHUNK_STARTED, "job", chunk_number=1))
+        bus.publish(ProgressEvent(ProgressEventType.CHUNK_COMPLETED, "job", chunk_number=1))
+
+        self.assertEqual([event.event_type for event in received], [ProgressEventType.CHUNK_COMPLETED])
+
+    def test_failing_subscriber_does_not_break_publish(self):
+        """A raising subscriber must not stop delivery to others"""
+        bus = ProgressEventBus()
+        received = []
+
+        def broken(event):
+            raise RuntimeError("boom")
+
+        bus.subscribe(broken)
+        bus.subscribe(received.append)
+        bus.publish(ProgressEvent(ProgressEventType.JOB_STARTED, "job", total_chunks=2))
+
+        self.assertEqual(len(received), 1)
+
+    def test_unsubscribe(self):
+        """Unsubscribed callbacks receive nothing"""
+        bus = ProgressEventBus()
+        received = []
+        bus.subscribe(received.append)
+        bus.unsubscribe(received.append)
+        bus.publish(ProgressEvent(ProgressEventType.JOB_STARTED, "job"))
+        self.assertEqual(received, [])
+
+
+class TestProgressMonitor(unittest.TestCase):
+    """Test cases for the event-driven ProgressMonitor and its subscribers"""
+
+    def setUp(self):
+        self.bus = ProgressEventBus()
+        self.temp_dir = tempfile.mkdtemp()
+
+    def _publish_job(self):
+        self.bus.publish(ProgressEvent(ProgressEventType.JOB_STARTED, "job.wav", total_chunks=2))
+        for chunk_number in (1, 2):
+            self.bus.publish(ProgressEvent(ProgressEventType.CHUNK_STARTED, "job.wav",
+                                           chunk_number=chunk_number, start_time=0.0, end_time=30.0))
+        self.bus.publish(ProgressEvent(ProgressEventType.CHUNK_COMPLETED, "job.wav", chunk_number=1,
+                                       start_time=0.0, end_time=30.0, text="שלום עולם", processing_time=3.0))
+        self.bus.publish(ProgressEvent(ProgressEventType.CHUNK_FAILED, "job.wav", chunk_number=2,
+                                       error_message="decode error"))
+        self.bus.publish(ProgressEvent(ProgressEventType.JOB_COMPLETED, "job.wav", success=False))
+
+    def test_monitor_aggregates_events(self):
+        """Monitor counts completed and failed chunks from events"""
+        monitor = ProgressMonitor(event_bus=self.bus)
+        monitor.start_monitoring("job.wav")
+        self._publish_job()
+        monitor.stop()
+
+        summary = monitor.get_progress_summary()
+        self.assertEqual(summary['total_chunks'], 2)
+        self.assertEqual(summary['completed_chunks'], 1)
+        self.assertEqual(summary['failed_chunks'], 1)
+        self.assertEqual(summary['overall_progress'], 50.0)
+        self.assertFalse(self.bus.has_subscribers())
+
+    def test_concurrent_jobs_keep_separate_progress(self):
+        """Interleaved events of two files are aggregated per job"""
+        monitor = ProgressMonitor(event_bus=self.bus)
+        monitor.start_monitoring("a.wav")
+        self.bus.publish(ProgressEvent(ProgressEventType.JOB_STARTED, "a.wav", total_chunks=4))
+        self.bus.publish(ProgressEvent(ProgressEventType.JOB_STARTED, "b.wav", total_chunks=2))
+        for job_id in ("a.wav", "b.wav"):
+            self.bus.publish(ProgressEvent(ProgressEventType.CHUNK_COMPLETED, job_id, chunk_number=1, text="x"))
+        self.bus.publish(ProgressEvent(ProgressEventType.CHUNK_COMPLETED, "b.wav", chunk_number=2, text="y"))
+        monitor.stop()
+
+        self.assertEqual(monitor.get_progress_summary()['total_chunks'], 4)
+        self.assertEqual(monitor.get_progress_summary()['completed_chunks'], 1)
+        self.assertEqual(monitor.jobs["b.wav"].overall_progress, 100.0)
+
+    def test_subscribers_render_and_export(self):
+        """Renderer, status writer and metrics exporter all consume the same events"""
+        stream = io.StringIO()
+        status_file = Path(self.temp_dir) / "status.json"
+        exporter = ProgressMetricsExporter()
+        monitor = ProgressMonitor(event_bus=self.bus, subscribers=[
+            TerminalProgressRenderer(stream=stream),
+            StatusFileWriter(str(status_file)),
+            exporter
+        ])
+        monitor.start_monitoring("job.wav")
+        self._publish_job()
+        monitor.stop()
+
+        self.assertIn("50.0%", stream.getvalue())
+        status = json.loads(status_file.read_text(encoding='utf-8'))
+        self.assertEqual(status['status'], 'completed')
+        self.assertEqual(status['completed_chunks'], 1)
+        metrics = exporter.get_metrics()
+        self.assertEqual(metrics['chunks_completed'], 1)
+        self.assertEqual(metrics['chunks_failed'], 1)
+        self.assertAlmostEqual(metrics['realtime_factor'], 10.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Unit tests for DelayedRetryQueue and error classification
+Tests jittered due times and which errors are retried
+"""
+
+import random
+import unittest
+from pathlib import Path
+from unittest.mock import Mock
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.logic.error_handler import ErrorHandler
+from src.core.logic.retry_queue import DelayedRetryQueue
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestDelayedRetryQueue(unittest.TestCase):
+    """Test cases for DelayedRetryQueue"""
+
+    def test_items_become_due_after_their_jittered_delay(self):
+        """Items are held until their delay expires, earliest first, within the jitter range"""
+        clock = FakeClock()
+        queue = DelayedRetryQueue(jitter=0.5, clock=clock, rng=random.Random(7))
+        slow = queue.schedule('slow', 8.0)
+        fast = queue.schedule('fast', 2.0)
+        self.assertTrue(4.0 <= slow <= 8.0)
+        self.assertTrue(1.0 <= fast <= 2.0)
+
+        self.assertEqual(queue.pop_due(), [])
+        self.assertAlmostEqual(queue.seconds_until_due(), fast)
+        clock.now = 8.0
+        self.assertEqual(queue.pop_due(), ['fast', 'slow'])
+        self.assertEqual(len(queue), 0)
+        self.assertIsNone(queue.seconds_until_due())
+
+
+class TestErrorClassification(unittest.TestCase):
+    """Test cases for ErrorHandler.is_retryable"""
+
+    def setUp(self):
+        self.error_handler = ErrorHandler(Mock())
+
+    def test_permanent_and_transient_errors(self):
+        """Missing files and validation errors are permanent; timeouts and unknown failures are not"""
+        self.assertFalse(self.error_handler.is_retryable(FileNotFoundError("missing.wav")))
+        self.assertFalse(self.error_handler.is_retryable(ValueError("bad parameter")))
+        self.assertTrue(self.error_handler.is_retryable(TimeoutError("server busy")))
+        self.assertFalse(self.error_handler.is_retryable({'success': False, 'error': 'x', 'category': 'validation'}))
+        self.assertTrue(self.error_handler.is_retryable({'success': False, 'error': 'model returned nothing'}))
+
+
+if __name__ == '__main__':
+    unittest.main()
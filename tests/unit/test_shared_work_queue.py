@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Unit tests for SharedWorkQueue
+Tests disjoint claims across workers, lease expiry and heartbeats,
+at-most-once completion and runs
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.logic.shared_work_queue import DONE, FAILED, LEASED, PENDING, SharedWorkQueue
+
+
+class FakeClock:
+    """Manually advanced wall clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestSharedWorkQueue(unittest.TestCase):
+    """Test cases for SharedWorkQueue"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, 'queue.sqlite')
+        self.clock = FakeClock()
+        self.files = [os.path.join(self.temp_dir, f"f{i}.wav") for i in range(4)]
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def create_queue(self, worker_id, **kwargs):
+        work_queue = SharedWorkQueue(self.db_path, worker_id=worker_id, lease_seconds=60, poll_seconds=0.01,
+                                     clock=self.clock, **kwargs)
+        self.addCleanup(work_queue.close)
+        return work_queue
+
+    def test_hosts_claim_disjoint_files_in_order(self):
+        """Enqueueing twice adds nothing, and two hosts never claim the same file"""
+        host_a = self.create_queue('a')
+        host_b = self.create_queue('b')
+        self.assertEqual(host_a.enqueue((path, 0) for path in self.files), 4)
+        self.assertEqual(host_b.enqueue((path, 0) for path in self.files), 0)
+
+        claimed = [host_a.claim(), host_b.claim(), host_a.claim(), host_b.claim()]
+        self.assertEqual([lease.file_path for lease in claimed], self.files)
+        self.assertIsNone(host_a.claim())
+        for lease, host in zip(claimed, [host_a, host_b, host_a, host_b]):
+            self.assertTrue(host.complete(lease))
+        self.assertTrue(host_a.is_drained())
+        self.assertEqual(host_b.counts()[DONE], 4)
+
+    def test_expired_lease_is_reclaimed_and_stale_holder_cannot_complete(self):
+        """A crashed host's file is taken over after its lease expires; a heartbeat prevents that"""
+        host_a = self.create_queue('a')
+        host_b = self.create_queue('b')
+        host_a.enqueue([(self.files[0], 0), (self.files[1], 0)])
+        first = host_a.claim()
+        second = host_a.claim()
+
+        self.clock.now += 45
+        self.assertTrue(host_a.heartbeat(second))
+        self.clock.now += 30
+        # Only the lease without a heartbeat expired
+        taken_over = host_b.claim()
+        self.assertEqual(taken_over.file_path, first.file_path)
+        self.assertEqual(taken_over.attempt, 2)
+        self.assertIsNone(host_b.claim())
+
+        self.assertFalse(host_a.complete(first))
+        self.assertTrue(host_b.complete(taken_over))
+        self.assertTrue(host_a.complete(second))
+        self.assertEqual(host_a.counts()[DONE], 2)
+
+    def test_failures_return_to_queue_until_attempts_run_out(self):
+        """Transient failures are retried up to max_attempts; permanent ones fail at once"""
+        work_queue = self.create_queue('a', max_attempts=2)
+        work_queue.enqueue([(self.files[0], 0), (self.files[1], 0)])
+
+        lease = work_queue.claim()
+        self.assertEqual(work_queue.fail(lease, 'timeout'), PENDING)
+        lease = work_queue.claim()
+        self.assertEqual(lease.file_path, self.files[0])
+        self.assertEqual(work_queue.fail(lease, 'timeout'), FAILED)
+
+        lease = work_queue.claim()
+        self.assertEqual(work_queue.fail(lease, 'missing', retry=False), FAILED)
+        self.assertEqual(work_queue.counts()[FAILED], 2)
+        self.assertIsNone(work_queue.next_lease())
+
+    def test_new_run_queues_finished_files_again(self):
+        """A run that starts after the last one finished processes failed and done files again"""
+        first_run = self.create_queue('a', max_attempts=1)
+        first_run.enqueue((path, 0) for path in self.files[:2])
+        self.assertTrue(first_run.complete(first_run.claim()))
+        self.assertEqual(first_run.fail(first_run.claim(), 'timeout'), FAILED)
+        self.assertTrue(first_run.is_drained())
+
+        second_run = self.create_queue('b')
+        self.assertEqual(second_run.enqueue((path, 0) for path in self.files[:2]), 2)
+        self.assertNotEqual(second_run.run_id, first_run.run_id)
+        lease = second_run.claim()
+        self.assertEqual((lease.file_path, lease.attempt), (self.files[0], 1))
+        # A host joining while the run is in progress keeps its finished files
+        self.assertTrue(second_run.complete(lease))
+        joining = self.create_queue('c')
+        self.assertEqual(joining.enqueue((path, 0) for path in self.files[:2]), 0)
+        self.assertEqual(joining.run_id, second_run.run_id)
+        self.assertEqual(joining.counts(), {PENDING: 1, LEASED: 0, DONE: 1, FAILED: 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the thread budget
+Tests core allocation across workers, CTranslate2 and native thread pools
+"""
+
+import os
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.logic import thread_budget
+from src.core.logic.thread_budget import ThreadBudgetAllocator, apply_native_thread_limits, layout_from_config
+
+
+class TestThreadBudget(unittest.TestCase):
+    """Test cases for ThreadBudgetAllocator and native limits"""
+
+    def test_thread_backend_shares_cores_between_parallel_decodes(self):
+        """Four batch workers on 16 cores share one model as 4 batches of 4 threads"""
+        allocator = ThreadBudgetAllocator(total_cores=16)
+        layout = allocator.allocate(batch_workers=4)
+
+        self.assertEqual((layout.ct2_inter_threads, layout.ct2_intra_threads), (4, 4))
+        self.assertEqual(layout.native_threads, 4)
+
+        oversubscribed = allocator.allocate(batch_workers=4, chunk_workers=8)
+        self.assertEqual(oversubscribed.chunk_workers, 4)
+        self.assertEqual(oversubscribed.compute_threads, 16)
+        self.assertEqual(oversubscribed.native_threads, 1)
+
+    def test_process_backend_gives_each_worker_its_share(self):
+        """Each worker process holds a model with an equal share of the cores"""
+        layout = ThreadBudgetAllocator(total_cores=16).allocate(chunk_workers=4, chunk_backend='process')
+
+        self.assertEqual(layout.model_instances, 4)
+        self.assertEqual((layout.ct2_inter_threads, layout.ct2_intra_threads), (1, 4))
+        self.assertEqual(layout.worker_native_threads, 4)
+        self.assertEqual(layout.compute_threads, 16)
+
+    def test_process_batch_backend_gives_each_file_worker_its_share(self):
+        """File worker processes each hold a model and run their chunks on threads"""
+        layout = ThreadBudgetAllocator(total_cores=16).allocate(batch_workers=4, chunk_workers=2,
+                                                                chunk_backend='process', batch_backend='process')
+
+        self.assertEqual(layout.chunk_backend, 'thread')
+        self.assertEqual(layout.model_instances, 4)
+        self.assertEqual((layout.ct2_inter_threads, layout.ct2_intra_threads), (2, 2))
+        self.assertEqual(layout.worker_native_threads, 2)
+        self.assertEqual(layout.compute_threads, 16)
+
+    def test_config_overrides_and_caps(self):
+        """Explicit CTranslate2 settings win, cpu_threads caps intra threads, workers never exceed cores"""
+        config_manager = SimpleNamespace(config=SimpleNamespace(
+            batch=SimpleNamespace(parallel_processing=True, max_workers=16),
+            chunking=SimpleNamespace(max_chunk_workers=1, execution_backend='thread'),
+            system=SimpleNamespace(thread_budget_cores=8),
+            transcription=SimpleNamespace(ctranslate2_optimization={'cpu_threads': 8, 'inter_threads': 2})
+        ))
+
+        layout = layout_from_config(config_manager)
+
+        self.assertEqual(layout.batch_workers, 8)
+        self.assertEqual(layout.ct2_inter_threads, 2)
+        self.assertEqual(layout.ct2_intra_threads, 1)
+
+    def test_native_limits_respect_user_environment(self):
+        """Budgeted limits are exported, but variables set by the user are kept"""
+        with patch.dict(os.environ, {'MKL_NUM_THREADS': '3'}), \
+                patch.object(thread_budget, '_USER_THREAD_ENV', {'MKL_NUM_THREADS': '3'}):
+            applied = apply_native_thread_limits(2)
+
+            self.assertEqual(applied['OMP_NUM_THREADS'], '2')
+            self.assertEqual(applied['OPENBLAS_NUM_THREADS'], '2')
+            self.assertEqual(applied['MKL_NUM_THREADS'], '3')
+            self.assertEqual(os.environ[thread_budget.MANAGED_MARKER_ENV_VAR], 'MKL_NUM_THREADS')
+
+
+if __name__ == '__main__':
+    unittest.main()